@@ -0,0 +1,55 @@
+"""
+Session Broker Entry Point
+
+Runs the process that owns every robot SSH session so the API can run with
+several workers. Start it before the API, with the same SESSION_BROKER_SOCKET:
+
+    SESSION_BROKER_SOCKET=/run/wemo/broker.sock python -m App.broker
+    SESSION_BROKER_SOCKET=/run/wemo/broker.sock uvicorn App.main:app --workers 4
+
+On SIGTERM / SIGINT every session is released before the process exits.
+"""
+
+import asyncio
+import logging
+import signal
+import sys
+
+from App.core.config import BROKER_MAX_WORKERS, JOB_CANCEL_TIMEOUT, SESSION_BROKER_SOCKET, SHUTDOWN_DEADLINE
+from App.utils.teleop_CLI_session_broker import SessionBroker
+from App.utils.teleop_CLI_SSH_helper import create_ssh_client
+
+logger = logging.getLogger(__name__)
+
+
+async def serve(broker: SessionBroker) -> None:
+    """Serve until SIGTERM / SIGINT."""
+    task = asyncio.ensure_future(broker.serve_forever())
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, task.cancel)
+    await task
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    if not SESSION_BROKER_SOCKET:
+        logger.error("SESSION_BROKER_SOCKET is not set")
+        return 1
+
+    ssh_client = create_ssh_client()
+    broker = SessionBroker(ssh_client, SESSION_BROKER_SOCKET, max_workers=BROKER_MAX_WORKERS)
+    try:
+        asyncio.run(serve(broker))
+    finally:
+        # Start jobs first, so none grabs a bot after release_all has run
+        broker.stop(job_timeout=JOB_CANCEL_TIMEOUT)
+        summary = ssh_client.release_all(SHUTDOWN_DEADLINE)
+        ssh_client.close()
+        logger.info(f"Broker stopped: released cleanly {summary['released']}, "
+                    f"unclean {summary['unclean']}, timed out {summary['timed_out']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -17,4 +18,111 @@ WEMOPORT = os.getenv('WEMOPORT')
 if not WEMOIP:
     raise ValueError("WEMOIP environment variable is not set")
 if not WEMOPORT:
-    raise ValueError("WEMOPORT environment variable is not set")
\ No newline at end of file
+    raise ValueError("WEMOPORT environment variable is not set")
+
+# API logging: records go to the console and LOG_FILE through a queue and a
+# background writer (LOG_ASYNC=0 writes them on the logging thread instead);
+# LOG_FORMAT is 'text' or 'json' (one object per line)
+LOG_FILE = os.getenv('LOG_FILE', 'api_requests.log')
+LOG_ASYNC = os.getenv('LOG_ASYNC', '1') == '1'
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')
+# Records the queue holds before new ones are dropped, and most written at once
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+LOG_BATCH_SIZE = int(os.getenv('LOG_BATCH_SIZE', '256'))
+# Rotate the log file past this size or after this many seconds (0 disables
+# either), keeping LOG_BACKUP_COUNT old files
+LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', str(10 * 1024 * 1024)))
+LOG_ROTATE_INTERVAL = float(os.getenv('LOG_ROTATE_INTERVAL', '86400'))
+LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '5'))
+# Sampling of move/rotate request logs per level: 'INFO=10' keeps the INFO
+# records of 1 in 10 requests; unlisted levels are always kept
+LOG_MOTION_SAMPLING = os.getenv('LOG_MOTION_SAMPLING', '')
+
+# Upper bound on how many bots a batch start/end drives at once
+BATCH_MAX_CONCURRENCY = int(os.getenv('BATCH_MAX_CONCURRENCY', '8'))
+
+# Warm session pool: bots kept logged in with the console up (comma separated)
+WARM_POOL_BOTS = [int(b) for b in os.getenv('WARM_POOL_BOTS', '').split(',') if b.strip()]
+WARM_POOL_SIZE = int(os.getenv('WARM_POOL_SIZE', '10'))
+WARM_POOL_IDLE_TIMEOUT = float(os.getenv('WARM_POOL_IDLE_TIMEOUT', '1800'))
+WARM_POOL_HEALTH_INTERVAL = float(os.getenv('WARM_POOL_HEALTH_INTERVAL', '30'))
+
+# OpenSSH connection multiplexing (ControlMaster); not available on Windows
+SSH_MULTIPLEX = os.getenv('SSH_MULTIPLEX', '0' if os.name == 'nt' else '1') == '1'
+SSH_CONTROL_PERSIST = float(os.getenv('SSH_CONTROL_PERSIST', '300'))
+SSH_CONTROL_DIR = os.getenv('SSH_CONTROL_DIR', os.path.join(tempfile.gettempdir(), 'wemo-ssh-mux'))
+
+# SSH port on the bots, and whether their host keys must already be known;
+# point both at a simulated fleet with SSH_PORT=2222 SSH_STRICT_HOST_KEYS=0
+# (see App/simulator.py)
+SSH_PORT = int(os.getenv('SSH_PORT', '22'))
+SSH_STRICT_HOST_KEYS = os.getenv('SSH_STRICT_HOST_KEYS', '1') == '1'
+
+# Session transport: 'process' runs an ssh child per session, 'channel' opens
+# shell channels in-process over one paramiko connection per bot
+SSH_TRANSPORT = os.getenv('SSH_TRANSPORT', 'process')
+
+# Per-session keystroke writer: queued writes before new ones are dropped,
+# and how long a request that asks to wait for its write may wait
+WRITER_QUEUE_DEPTH = int(os.getenv('WRITER_QUEUE_DEPTH', '64'))
+WRITE_TIMEOUT = float(os.getenv('WRITE_TIMEOUT', '5'))
+
+# Movement (move/rotate) waiting longer than this many seconds is dropped, not sent
+MOVE_STALE_AFTER = float(os.getenv('MOVE_STALE_AFTER', '1.0'))
+
+# Bytes of recent console output kept per session by the background drain
+CONSOLE_BUFFER_SIZE = int(os.getenv('CONSOLE_BUFFER_SIZE', str(64 * 1024)))
+
+# Telemetry stream: events a subscriber may fall behind by before it is sent
+# a fresh snapshot, and seconds between keepalive comments on an idle stream
+TELEMETRY_QUEUE_DEPTH = int(os.getenv('TELEMETRY_QUEUE_DEPTH', '256'))
+TELEMETRY_KEEPALIVE = float(os.getenv('TELEMETRY_KEEPALIVE', '15'))
+
+# Seconds between background liveness checks of active sessions, and status
+# transitions kept for /api/sessions/events
+LIVENESS_INTERVAL = float(os.getenv('LIVENESS_INTERVAL', '2'))
+LIVENESS_HISTORY = int(os.getenv('LIVENESS_HISTORY', '256'))
+
+# Session start attempts (with per-phase timings) kept per bot
+PHASE_HISTORY_SIZE = int(os.getenv('PHASE_HISTORY_SIZE', '200'))
+
+# Reconnect sessions whose console dies: attempts per loss, and the delay
+# before the second attempt, doubling up to the maximum
+RECONNECT_ENABLED = os.getenv('RECONNECT_ENABLED', '1') == '1'
+RECONNECT_MAX_ATTEMPTS = int(os.getenv('RECONNECT_MAX_ATTEMPTS', '5'))
+RECONNECT_BACKOFF_INITIAL = float(os.getenv('RECONNECT_BACKOFF_INITIAL', '1'))
+RECONNECT_BACKOFF_MAX = float(os.getenv('RECONNECT_BACKOFF_MAX', '30'))
+
+# Seconds the app waits on shutdown for every session to be released
+SHUTDOWN_DEADLINE = float(os.getenv('SHUTDOWN_DEADLINE', '10'))
+
+# Seconds an emergency stop waits for every console to confirm the release
+ESTOP_ACK_TIMEOUT = float(os.getenv('ESTOP_ACK_TIMEOUT', '1'))
+
+# How long a command sent with ack=true waits for the console to redraw
+# with its effect before the request fails
+ACK_TIMEOUT = float(os.getenv('ACK_TIMEOUT', '2'))
+
+# Idempotency-Key on command endpoints: seconds a key's result is replayed
+# to retries, and the approximate memory the cached results may use.  The
+# cache is per API process, so with several workers a retry only hits it
+# when it reaches the same worker
+IDEMPOTENCY_TTL = float(os.getenv('IDEMPOTENCY_TTL', '300'))
+IDEMPOTENCY_MAX_BYTES = int(os.getenv('IDEMPOTENCY_MAX_BYTES', str(1024 * 1024)))
+
+# Background session starts (POST /api/startsession with background=true):
+# starts run at once, finished jobs kept for GET /api/jobs/{id}, and how long
+# DELETE /api/jobs/{id} waits for a cancelled start to wind down.  Jobs are
+# kept by the session broker when SESSION_BROKER_SOCKET is set (so any worker
+# can follow them), otherwise in the single API process
+JOB_MAX_CONCURRENCY = int(os.getenv('JOB_MAX_CONCURRENCY', '8'))
+JOB_HISTORY = int(os.getenv('JOB_HISTORY', '256'))
+JOB_CANCEL_TIMEOUT = float(os.getenv('JOB_CANCEL_TIMEOUT', '5'))
+
+# Out-of-process session broker: when set, API workers forward every session
+# call over this Unix socket to `python -m App.broker`, which owns the SSH
+# sessions (needed to run uvicorn with more than one worker)
+SESSION_BROKER_SOCKET = os.getenv('SESSION_BROKER_SOCKET', '')
+# Broker calls run at once in the broker, and how long a worker waits on one
+BROKER_MAX_WORKERS = int(os.getenv('BROKER_MAX_WORKERS', '32'))
+BROKER_CALL_TIMEOUT = float(os.getenv('BROKER_CALL_TIMEOUT', '120'))
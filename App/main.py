@@ -6,15 +6,37 @@ teleoperation interface. It sets up routing and provides the main application in
 """
 
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
-from App.routers import teleop_CLI_endpoints, wemo_API_endpoints
+from App.core.config import SHUTDOWN_DEADLINE
+from App.routers import teleop_CLI_endpoints
 
 # Get logger (configuration handled in router module)
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Release every robot on shutdown.
+
+    Without this, grabbed bots stay grabbed until their SSH connections time
+    out. All sessions are released in parallel within SHUTDOWN_DEADLINE seconds,
+    then the queued log records are written out.
+    """
+    yield
+    summary = await run_in_threadpool(teleop_CLI_endpoints.teleop_service_singleton.shutdown, SHUTDOWN_DEADLINE)
+    logger.info(f"Shutdown summary: released cleanly {summary['released']}, "
+                f"unclean {summary['unclean']}, timed out {summary['timed_out']} "
+                f"in {summary['duration_s']:.2f}s")
+    if teleop_CLI_endpoints.log_pipeline is not None:
+        await run_in_threadpool(teleop_CLI_endpoints.log_pipeline.stop)
+
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application instance.
@@ -26,7 +48,8 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="WeMo Interface Backend API",
         description="REST API for WeMo robot teleoperation control",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=lifespan
     )
 
     #middleware
@@ -38,8 +61,14 @@ def create_app() -> FastAPI:
         allow_headers=["*"],  # Allow all headers
     )
 
+    # Request latency for /metrics
+    app.add_middleware(teleop_CLI_endpoints.HTTPMetricsMiddleware)
+    # Outermost, so move/rotate log sampling covers the whole request
+    app.add_middleware(teleop_CLI_endpoints.LogSamplingMiddleware)
+
     # Register routers
     app.include_router(teleop_CLI_endpoints.router)
+    app.include_router(teleop_CLI_endpoints.metrics_router)
     #app.include_router(wemo_API_endpoints.router)
     logger.info("FastAPI application initialized successfully")
     return app
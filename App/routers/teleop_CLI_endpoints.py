@@ -6,19 +6,31 @@ This module provides REST API endpoints for robot teleoperation control.
 Handles HTTP requests for session management, movement commands, and status monitoring.
 """
 
+import asyncio
 import json
 import logging
-from datetime import datetime
+import math
+import time
 from functools import wraps
 from typing import Dict, Any, Optional, List
 
-from fastapi import FastAPI, APIRouter, status, Depends, HTTPException, Request, Response, Query, Path
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi import (FastAPI, APIRouter, status, Depends, Header, HTTPException, Request, Response, Query, Path,
+                     WebSocket, WebSocketDisconnect)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
-from App.schemas.teleop_CLI_models import BotId, SpeedChangeReq, MoveReq, RotateReq
-from App.services.teleop_CLI_services import TeleopService
-from App.utils.teleop_CLI_SSH_helper import SSHClient, SSHClientError
+from App.core.config import (BROKER_CALL_TIMEOUT, LOG_ASYNC, LOG_FILE, LOG_MOTION_SAMPLING, SESSION_BROKER_SOCKET,
+                             TELEMETRY_KEEPALIVE)
+from App.schemas.teleop_CLI_models import (BotId, StartSessionReq, SpeedChangeReq, MoveReq, RotateReq, BatchSessionReq,
+                                          EstopReq)
+from App.services.teleop_CLI_services import IdempotencyKeyReused, TeleopService
+from App.utils.teleop_CLI_logging import LogPipeline, configure_logging, request_sampler
+from App.utils.teleop_CLI_metrics import REGISTRY
+from App.utils.teleop_CLI_session_broker import BrokerClient
+from App.utils.teleop_CLI_start_jobs import JobNotFound
+from App.utils.teleop_CLI_SSH_helper import (CommandNotAcknowledged, SessionRecovering, SSHClientError,
+                                             StartCancelled, create_ssh_client)
 
 
 # Response Models for Documentation
@@ -43,7 +55,10 @@ class SpeedInfoResponse(BaseModel):
         schema_extra = {
             "example": {
                 "status": "success",
-                "speed_info": {"current_speed": 5, "max_speed": 10}
+                "speed_info": {
+                    "linear_speed": 0.125, "angular_speed": 0.5,
+                    "updated_at": "2024-01-01T12:00:00+00:00", "age_s": 1.42
+                }
             }
         }
 
@@ -84,6 +99,11 @@ class DebugInfoResponse(BaseModel):
     all_active_sessions: List[int] = Field(..., description="All currently active sessions")
     process_alive: Optional[bool] = Field(None, description="Whether the process is alive (if session exists)")
     process_type: Optional[str] = Field(None, description="Type of process (if session exists)")
+    console_tail: Optional[str] = Field(None, description="Most recent console output (if session exists)")
+    console_buffer: Optional[Dict[str, int]] = Field(
+        None, description="Console ring buffer memory use (if session exists)")
+    health: Optional[Dict[str, Any]] = Field(
+        None, description="Cached liveness status, when it began and when it was last confirmed")
 
     class Config:
         schema_extra = {
@@ -93,7 +113,333 @@ class DebugInfoResponse(BaseModel):
                 "session_exists_in_sessions": True,
                 "all_active_sessions": [123, 456],
                 "process_alive": True,
-                "process_type": "Process"
+                "process_type": "Process",
+                "console_tail": "| WARNING - WATCH OUT FOR MOVING ROBOT\r\nlinear 0.125 angular 0.5",
+                "console_buffer": {
+                    "size_bytes": 65536, "capacity_bytes": 65536, "high_water_bytes": 65536,
+                    "total_read_bytes": 1843200, "dropped_bytes": 1777664
+                },
+                "health": {
+                    "status": "active", "since": "2024-01-01T12:00:00+00:00",
+                    "checked_at": "2024-01-01T12:05:58+00:00"
+                }
+            }
+        }
+
+
+class BatchResult(BaseModel):
+    """Outcome of one bot within a batch start/end."""
+    bot_id: int = Field(..., description="Bot ID")
+    ok: bool = Field(..., description="Whether the operation succeeded for this bot")
+    status: Optional[str] = Field(None, description="Operation status reported by the session layer")
+    error: Optional[str] = Field(None, description="Error message if the operation failed")
+    elapsed_s: float = Field(..., description="Time spent on this bot")
+    finished_at_s: float = Field(..., description="Completion time relative to batch start")
+
+
+class BatchSummary(BaseModel):
+    """Wall-clock statistics for a batch start/end."""
+    action: str = Field(..., description="'start' or 'end'")
+    total: int = Field(..., description="Number of distinct bots in the batch")
+    completed: int = Field(..., description="Bots that finished (successfully or not)")
+    succeeded: int = Field(..., description="Bots that succeeded")
+    failed: int = Field(..., description="Bots that failed")
+    max_concurrency: int = Field(..., description="Bots handled at once")
+    wall_clock_s: float = Field(..., description="Elapsed time for the whole batch")
+    sum_elapsed_s: float = Field(..., description="Sum of per-bot times (serial equivalent)")
+    speedup: Optional[float] = Field(None, description="sum_elapsed_s / wall_clock_s")
+
+
+class BatchSessionResponse(BaseModel):
+    """Response model for batch session start/end."""
+    status: str = Field(..., description="Operation status indicator")
+    results: List[BatchResult] = Field(..., description="Per-bot results in completion order")
+    summary: BatchSummary = Field(..., description="Overall batch statistics")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "results": [
+                    {"bot_id": 2, "ok": True, "status": "Session started successfully",
+                     "error": None, "elapsed_s": 8.1, "finished_at_s": 8.1},
+                    {"bot_id": 1, "ok": False, "status": None,
+                     "error": "BOT 1 is currently not active.", "elapsed_s": 30.0, "finished_at_s": 30.0}
+                ],
+                "summary": {"action": "start", "total": 2, "completed": 2, "succeeded": 1, "failed": 1,
+                            "max_concurrency": 2, "wall_clock_s": 30.0, "sum_elapsed_s": 38.1,
+                            "speedup": 1.27}
+            }
+        }
+
+
+class EstopResponse(BaseModel):
+    """Response model for an emergency stop."""
+    status: str = Field(..., description="Operation status indicator")
+    stopped: List[int] = Field(..., description="Bots whose console acknowledged the release")
+    unacknowledged: List[int] = Field(..., description="Bots whose console did not redraw after the release in time")
+    failed: Dict[int, str] = Field(..., description="Bots the stop could not be sent to, with the reason")
+    fanout_s: float = Field(..., description="Time to enqueue the stop for every bot")
+    duration_s: float = Field(..., description="Time until every bot confirmed or the ack timeout passed")
+    reports: List[Dict[str, Any]] = Field(..., description="Per-bot write and acknowledgement latency")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "stopped": [101, 102],
+                "unacknowledged": [103],
+                "failed": {"104": "No active session for this bot"},
+                "fanout_s": 0.0004,
+                "duration_s": 1.0012,
+                "reports": [
+                    {"bot_id": 101, "write_s": 0.0002, "ack_s": 0.0121},
+                    {"bot_id": 102, "write_s": 0.0003, "ack_s": 0.0154}
+                ]
+            }
+        }
+
+
+class StopStatsResponse(BaseModel):
+    """Response model for emergency stop latency."""
+    status: str = Field(..., description="Operation status indicator")
+    stop: Dict[str, Any] = Field(..., description="Fan-out, write and ack latency histograms")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "stop": {
+                    "fanout": {"count": 3, "sum_s": 0.0012, "max_s": 0.0005, "p50_s": 0.0004,
+                               "p95_s": 0.0005, "p99_s": 0.0005,
+                               "buckets": {"le_0.001": 3, "le_0.005": 3, "le_+Inf": 3}},
+                    "write": {"count": 30, "sum_s": 0.009, "max_s": 0.0009, "p50_s": 0.0003,
+                              "p95_s": 0.0008, "p99_s": 0.0009,
+                              "buckets": {"le_0.001": 30, "le_0.005": 30, "le_+Inf": 30}},
+                    "ack": {"count": 29, "sum_s": 0.41, "max_s": 0.031, "p50_s": 0.013,
+                            "p95_s": 0.027, "p99_s": 0.031,
+                            "buckets": {"le_0.01": 9, "le_0.05": 29, "le_+Inf": 29}}
+                }
+            }
+        }
+
+
+class AckStatsResponse(BaseModel):
+    """Response model for console acknowledgement latency."""
+    status: str = Field(..., description="Operation status indicator")
+    bots: Dict[int, Dict[str, Any]] = Field(
+        ..., description="Per bot: commands awaiting acknowledgement, and counts and latency by command kind")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "bots": {
+                    "101": {
+                        "pending": 1,
+                        "commands": {
+                            "move": {"acked": 120, "lost": 2, "p50_s": 0.012, "p95_s": 0.031,
+                                     "p99_s": 0.048, "max_s": 0.052},
+                            "speed": {"acked": 8, "lost": 0, "p50_s": 0.015, "p95_s": 0.022,
+                                      "p99_s": 0.022, "max_s": 0.022}
+                        }
+                    }
+                }
+            }
+        }
+
+
+class IdempotencyStatsResponse(BaseModel):
+    """Response model for Idempotency-Key cache metrics."""
+    status: str = Field(..., description="Operation status indicator")
+    idempotency: Dict[str, Any] = Field(..., description="Cache hit/miss counters, hit rate and size")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "idempotency": {
+                    "hits": 14, "joined": 2, "misses": 310, "conflicts": 0, "failed": 3, "expired": 280,
+                    "evicted": 0, "hit_rate": 0.0491, "entries": 27, "bytes": 10240,
+                    "max_bytes": 1048576, "ttl_s": 300.0
+                }
+            }
+        }
+
+
+class JobResponse(BaseModel):
+    """Response model for a background job."""
+    status: str = Field(..., description="Operation status indicator")
+    job: Dict[str, Any] = Field(..., description="Job state, phase in progress and result or error")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "accepted",
+                "job": {
+                    "job_id": "3f2c9d7e5b8a4c1d9e0f6a7b8c9d0e1f", "action": "start_session", "bot_id": 5,
+                    "state": "running", "phase": "teleoperables",
+                    "phases": {"connect": 0.412, "authenticate": 0.233, "console_launch": 1.87},
+                    "elapsed_s": 2.61, "status": None, "error": None, "cancel_requested": False,
+                    "created_at": 1760601600.125, "started_at": 1760601600.127, "finished_at": None
+                }
+            }
+        }
+
+
+class PoolStatsResponse(BaseModel):
+    """Response model for warm session pool metrics."""
+    status: str = Field(..., description="Operation status indicator")
+    pool: Dict[str, Any] = Field(..., description="Warm pool hit/miss counters and contents")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "pool": {
+                    "hits": 12, "misses": 3, "hit_rate": 0.8, "fills": 15, "fill_failures": 1,
+                    "evicted_idle": 2, "evicted_unhealthy": 0, "size": 4, "max_size": 10,
+                    "filling": [105], "warm_bots": {"101": 320.5}, "cold_bots": [],
+                    "configured_bots": [101, 102, 103, 104, 105]
+                }
+            }
+        }
+
+
+class MailboxStatsResponse(BaseModel):
+    """Response model for per-bot movement mailbox counters."""
+    status: str = Field(..., description="Operation status indicator")
+    mailboxes: Dict[int, Dict[str, Any]] = Field(..., description="Movement counters per bot")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "mailboxes": {
+                    "101": {
+                        "posted": 120, "delivered": 71, "coalesced": 46, "dropped_stale": 2,
+                        "dropped_ended": 1, "failed": 0, "pending": False
+                    }
+                }
+            }
+        }
+
+
+class WriterStatsResponse(BaseModel):
+    """Response model for per-bot keystroke writer metrics."""
+    status: str = Field(..., description="Operation status indicator")
+    writers: Dict[int, Dict[str, Any]] = Field(..., description="Queue depth, counters and write latency per bot")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "writers": {
+                    "101": {
+                        "depth": 0, "lanes": {"stop": 0, "speed": 0, "motion": 0}, "max_depth": 64,
+                        "submitted": 240, "written": 239, "dropped": 1, "write_errors": 0, "preempted": 0,
+                        "queue_wait": {
+                            "stop": {"count": 1, "mean_s": 0.0001, "p50_s": 0.0001, "p95_s": 0.0001},
+                            "speed": {"count": 8, "mean_s": 0.0002, "p50_s": 0.0001, "p95_s": 0.0004},
+                            "motion": {"count": 230, "mean_s": 0.0004, "p50_s": 0.0001, "p95_s": 0.0012}
+                        },
+                        "write_latency": {"count": 239, "mean_s": 0.0002, "p50_s": 0.0001, "p95_s": 0.0005}
+                    }
+                }
+            }
+        }
+
+
+class ConnectionStatsResponse(BaseModel):
+    """Response model for SSH connection multiplexing metrics."""
+    status: str = Field(..., description="Operation status indicator")
+    connections: Dict[str, Any] = Field(..., description="Connect latency (fresh vs reused) and SSH masters")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "connections": {
+                    "enabled": True, "persist_s": 300.0,
+                    "connect_latency": {
+                        "fresh": {"count": 4, "mean_s": 0.412, "p50_s": 0.398, "p95_s": 0.51},
+                        "reused": {"count": 9, "mean_s": 0.021, "p50_s": 0.019, "p95_s": 0.034}
+                    },
+                    "masters_idle_s": {"hive@10.0.0.101": 42.0}
+                }
+            }
+        }
+
+
+class SessionEventsResponse(BaseModel):
+    """Response model for session status transitions."""
+    status: str = Field(..., description="Operation status indicator")
+    events: List[Dict[str, Any]] = Field(..., description="Status transitions, oldest first")
+    monitor: Dict[str, Any] = Field(..., description="Liveness check interval and counters")
+    recovery: Dict[str, Any] = Field(..., description="Automatic reconnect counters and attempts in progress")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "events": [
+                    {"bot_id": 5, "from": None, "to": "active", "reason": "session started",
+                     "at": "2024-01-01T12:00:00+00:00"},
+                    {"bot_id": 5, "from": "active", "to": "terminated", "reason": "process exited",
+                     "at": "2024-01-01T12:03:10+00:00"}
+                ],
+                "monitor": {"interval_s": 2.0, "checks": 95, "statuses": {"terminated": 1}},
+                "recovery": {"started": 1, "recovered": 0, "gave_up": 1, "cancelled": 0, "recovering": {}}
+            }
+        }
+
+
+class PhaseSummaryResponse(BaseModel):
+    """Response model for session-start phase percentiles."""
+    status: str = Field(..., description="Operation status indicator")
+    per_bot_capacity: int = Field(..., description="Start attempts kept per bot")
+    phases: Dict[str, Dict[str, Any]] = Field(..., description="Fleet-wide percentiles and slowest bots per phase")
+    bots: Dict[int, Dict[str, Any]] = Field(..., description="Attempts, failures and phase percentiles per bot")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "per_bot_capacity": 200,
+                "phases": {
+                    "connect": {"count": 12, "p50_s": 0.41, "p95_s": 2.9, "p99_s": 3.1, "max_s": 3.1,
+                                "slowest_bots": [{"bot_id": 7, "p50_s": 2.8}, {"bot_id": 3, "p50_s": 0.44}]},
+                    "teleoperables": {"count": 11, "p50_s": 21.5, "p95_s": 38.0, "p99_s": 41.2, "max_s": 41.2,
+                                      "slowest_bots": [{"bot_id": 3, "p50_s": 35.1}, {"bot_id": 7, "p50_s": 20.9}]}
+                },
+                "bots": {
+                    "7": {"attempts": 6, "failures": 1, "failed_in": {"teleoperables": 1},
+                          "last_started_at": "2024-01-01T12:00:00+00:00",
+                          "phases": {"connect": {"count": 6, "p50_s": 2.8, "p95_s": 3.1, "p99_s": 3.1,
+                                                 "max_s": 3.1}}}
+                }
+            }
+        }
+
+
+class PhaseHistoryResponse(BaseModel):
+    """Response model for a bot's recorded session-start attempts."""
+    status: str = Field(..., description="Operation status indicator")
+    bot_id: int = Field(..., description="Bot ID")
+    attempts: List[Dict[str, Any]] = Field(..., description="Start attempts, oldest first")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "status": "success",
+                "bot_id": 7,
+                "attempts": [
+                    {"started_at": "2024-01-01T12:00:00+00:00", "source": "start", "outcome": "failed",
+                     "total_s": 33.4, "error": "Grabbing failed: Another operator is probably using the bot",
+                     "phases": [{"phase": "connect", "start_s": 0.0, "duration_s": 2.8},
+                                {"phase": "authenticate", "start_s": 2.8, "duration_s": 0.6},
+                                {"phase": "grab", "start_s": 23.4, "duration_s": 10.0}]}
+                ]
             }
         }
 
@@ -114,17 +460,14 @@ def setup_logging() -> logging.Logger:
     """
     Configure logging for the API module.
 
+    Records go to the console and LOG_FILE through a queue and a background
+    writer unless LOG_ASYNC=0 (see App/utils/teleop_CLI_logging.py).
+
     Returns:
         Configured logger instance
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),  # Log to console
-            logging.FileHandler("api_requests.log")  # Log to file
-        ]
-    )
+    global log_pipeline
+    log_pipeline = configure_logging(LOG_FILE, use_queue=LOG_ASYNC, sampling=LOG_MOTION_SAMPLING)
     return logging.getLogger("API")
 
 
@@ -132,6 +475,10 @@ def handle_endpoint_errors(operation_name: str):
     """
     Decorator to handle errors consistently across all endpoint functions.
 
+    The wrapper is a coroutine, so FastAPI no longer runs a plain function
+    endpoint in its threadpool; the wrapper does, keeping blocking session
+    calls off the event loop.
+
     Args:
         operation_name: Name of the operation for logging purposes
     """
@@ -139,8 +486,27 @@ def handle_endpoint_errors(operation_name: str):
         @wraps(func)
         async def wrapper(*args, **kwargs):
             try:
-                result = await func(*args, **kwargs) if hasattr(func, '__code__') and 'await' in func.__code__.co_names else func(*args, **kwargs)
+                if asyncio.iscoroutinefunction(func):
+                    result = await func(*args, **kwargs)
+                else:
+                    result = await run_in_threadpool(func, *args, **kwargs)
                 return result
+            except SessionRecovering as e:
+                logger.warning(f"{operation_name} deferred: {str(e)}")
+                raise HTTPException(status_code=503, detail=str(e),
+                                    headers={"Retry-After": str(math.ceil(e.retry_after))})
+            except CommandNotAcknowledged as e:
+                logger.warning(f"{operation_name} not acknowledged: {str(e)}")
+                raise HTTPException(status_code=504, detail=str(e))
+            except IdempotencyKeyReused as e:
+                logger.warning(f"{operation_name} rejected: {str(e)}")
+                raise HTTPException(status_code=422, detail=str(e))
+            except JobNotFound as e:
+                logger.warning(f"{operation_name} failed: {str(e)}")
+                raise HTTPException(status_code=404, detail=str(e))
+            except StartCancelled as e:
+                logger.warning(f"{operation_name} cancelled: {str(e)}")
+                raise HTTPException(status_code=409, detail=str(e))
             except SSHClientError as e:
                 logger.error(f"{operation_name} failed: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
@@ -151,7 +517,8 @@ def handle_endpoint_errors(operation_name: str):
     return decorator
 
 
-
+# Background log writer; None when logging was configured elsewhere or LOG_ASYNC=0
+log_pipeline: Optional[LogPipeline] = None
 logger = setup_logging()
 
 app = FastAPI(
@@ -200,9 +567,19 @@ app = FastAPI(
 )
 
 router = APIRouter(prefix="/api", tags=["teleop"])
+# Served at the root so scrapers find it at the conventional /metrics
+metrics_router = APIRouter(tags=["status"])
+
+_IDEMPOTENCY_KEY_DOC = "Unique key per command; retries with the same key return the first result"
+# How often a job event stream looks for a change of state or phase
+_JOB_EVENTS_POLL = 0.25
 
 # Create singleton instances for dependency injection
-ssh_client_singleton = SSHClient()
+if SESSION_BROKER_SOCKET:
+    # Sessions are owned by the broker process, shared by every worker
+    ssh_client_singleton = BrokerClient(SESSION_BROKER_SOCKET, timeout=BROKER_CALL_TIMEOUT)
+else:
+    ssh_client_singleton = create_ssh_client()
 teleop_service_singleton = TeleopService(ssh_client_singleton)
 
 
@@ -266,7 +643,7 @@ async def log_requests(request: Request, call_next):
     Returns:
         HTTP response
     """
-    start_time = datetime.now()
+    start_time = time.monotonic()
     path = request.url.path
 
     # Skip logging for utility endpoints
@@ -276,14 +653,14 @@ async def log_requests(request: Request, call_next):
     try:
         response = await call_next(request)
     except Exception as e:
-        process_time = (datetime.now() - start_time).total_seconds() * 1000
+        process_time = (time.monotonic() - start_time) * 1000
         logger.error(
             f"Request failed: {request.method} {path} - {str(e)} - {process_time:.2f}ms"
         )
         raise e
 
     # Calculate processing time
-    process_time = (datetime.now() - start_time).total_seconds() * 1000
+    process_time = (time.monotonic() - start_time) * 1000
 
     # Prepare log data
     log_data = {
@@ -297,18 +674,86 @@ async def log_requests(request: Request, call_next):
     # Add request body for POST requests
     log_data.update(_extract_request_body(request))
 
-    # Log based on status code severity
-    log_message = f"API Request: {json.dumps(log_data)}"
+    # Log based on status code severity; the fields are serialised by the log writer
+    log_fields = {"fields": log_data}
     if response.status_code >= 500:
-        logger.error(log_message)
+        logger.error("API Request:", extra=log_fields)
     elif response.status_code >= 400:
-        logger.warning(log_message)
+        logger.warning("API Request:", extra=log_fields)
     else:
-        logger.info(log_message)
+        logger.info("API Request:", extra=log_fields)
 
     return response
 
 
+_HTTP_LATENCY = REGISTRY.histogram(
+    "wemo_http_request_duration_seconds", "Time to handle an HTTP request", ("method", "route", "status"))
+
+
+class HTTPMetricsMiddleware:
+    """
+    Times every HTTP request into wemo_http_request_duration_seconds.
+
+    Plain ASGI rather than @app.middleware("http"), so recording adds no
+    extra task or response wrapping to the request path. Requests are
+    labelled with the matched route template, not the raw path.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.monotonic()
+        status_code = 500
+
+        async def send_with_status(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            _HTTP_LATENCY.observe(time.monotonic() - started, scope["method"], route, status_code)
+
+
+app.add_middleware(HTTPMetricsMiddleware)
+
+
+class LogSamplingMiddleware:
+    """
+    Applies LOG_MOTION_SAMPLING to the records of move / rotate requests.
+
+    Plain ASGI and added last, so the sampling decision is made before the
+    other middleware, the router and the service log anything for the
+    request; it follows the request into the threadpool with its context.
+    """
+
+    # High-rate motion commands
+    SAMPLED_PATHS = {"/api/move", "/api/rotate"}
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.SAMPLED_PATHS or not request_sampler.rates:
+            await self.app(scope, receive, send)
+            return
+        token = request_sampler.sample()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_sampler.reset(token)
+
+
+app.add_middleware(LogSamplingMiddleware)
+
+
 @app.exception_handler(SSHClientError)
 async def ssh_client_exception_handler(request: Request, exc: SSHClientError) -> JSONResponse:
     """
@@ -322,6 +767,20 @@ async def ssh_client_exception_handler(request: Request, exc: SSHClientError) ->
         JSON response with error details
     """
     logger.error(f"SSH Client Error: {exc}")
+    if isinstance(exc, SessionRecovering):
+        return JSONResponse(
+            status_code=503,
+            content={"error": str(exc)},
+            headers={"Retry-After": str(math.ceil(exc.retry_after))}
+        )
+    if isinstance(exc, CommandNotAcknowledged):
+        return JSONResponse(status_code=504, content={"error": str(exc)})
+    if isinstance(exc, IdempotencyKeyReused):
+        return JSONResponse(status_code=422, content={"error": str(exc)})
+    if isinstance(exc, JobNotFound):
+        return JSONResponse(status_code=404, content={"error": str(exc)})
+    if isinstance(exc, StartCancelled):
+        return JSONResponse(status_code=409, content={"error": str(exc)})
     return JSONResponse(
         status_code=500,
         content={"error": str(exc)}
@@ -372,12 +831,25 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         "status": "session_started"
     }
     ```
+
+    With `"background": true` the start runs as a job instead: the answer
+    is `202 Accepted` with the job and a `Location` header to poll
+    (`GET /api/jobs/{job_id}`), follow (`/events`) or cancel (`DELETE`).
+    A bot whose start is already queued or running gets that job back.
     """,
     responses={
         200: {
             "description": "Session started successfully",
             "model": OperationResponse
         },
+        202: {
+            "description": "Session start running in the background",
+            "model": JobResponse
+        },
+        409: {
+            "description": "Session start cancelled while in progress",
+            "model": ErrorResponse
+        },
         500: {
             "description": "Internal server error or SSH connection failed",
             "model": ErrorResponse
@@ -386,25 +858,187 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
 )
 @handle_endpoint_errors("start session")
 def start_session(
-        req: BotId,
+        req: StartSessionReq,
         teleop_service: TeleopService = Depends(get_teleop_service)
 ) -> OperationResponse:
     """
     Start a teleoperation session for the specified bot.
 
     Args:
-        req: Request containing bot ID
+        req: Request containing bot ID and whether to start in the background
         teleop_service: Injected teleop service instance
 
     Returns:
-        Dictionary containing operation status
+        Dictionary containing operation status, or a 202 response with the
+        job when started in the background
     """
+    if req.background:
+        result = teleop_service.start_session_job(req.bot_id)
+        job_id = result["job"]["job_id"]
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=result,
+                            headers={"Location": f"/api/jobs/{job_id}"})
     logger.info(f"Starting session for bot {req.bot_id}")
     result = teleop_service.start_session(req.bot_id)
     logger.info(f"Session started for bot {req.bot_id}: {result}")
     return result
 
 
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Background Job",
+    description="""
+    State of a background job: `queued`, `running` (with the `phase` the
+    session start is in and the `phases` completed so far), then
+    `succeeded`, `failed` or `cancelled` with its `status` or `error`.
+
+    Finished jobs are kept for the last `JOB_HISTORY` jobs.
+    """,
+    responses={
+        200: {
+            "description": "Job retrieved successfully",
+            "model": JobResponse
+        },
+        404: {
+            "description": "No such job",
+            "model": ErrorResponse
+        }
+    }
+)
+@handle_endpoint_errors("get job")
+async def get_job(
+        job_id: str = Path(..., description="ID of the job"),
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> JobResponse:
+    """
+    Get a background job.
+
+    Args:
+        job_id: ID of the job
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing status and the job
+    """
+    return await run_in_threadpool(teleop_service.get_job, job_id)
+
+
+@router.get(
+    "/jobs/{job_id}/events",
+    status_code=status.HTTP_200_OK,
+    summary="Stream Background Job Progress",
+    description="""
+    Server-sent event stream of a background job: a `progress` event with
+    the job whenever its state or phase changes, then a final `done` event
+    once it has finished, after which the stream ends. An idle stream sends
+    a `: keepalive` comment every `TELEMETRY_KEEPALIVE` seconds.
+
+    **Example Stream:**
+    ```
+    event: progress
+    data: {"job_id": "3f2c...", "state": "running", "phase": "authenticate", ...}
+
+    event: done
+    data: {"job_id": "3f2c...", "state": "succeeded", "status": "Session started successfully", ...}
+    ```
+    """,
+    responses={
+        200: {
+            "description": "Event stream opened",
+            "content": {"text/event-stream": {}}
+        },
+        404: {
+            "description": "No such job",
+            "model": ErrorResponse
+        }
+    }
+)
+@handle_endpoint_errors("stream job")
+async def job_events(
+        job_id: str = Path(..., description="ID of the job"),
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> StreamingResponse:
+    """
+    Stream a job's progress as server-sent events.
+
+    Args:
+        job_id: ID of the job
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        text/event-stream response
+    """
+    first = (await run_in_threadpool(teleop_service.get_job, job_id))["job"]
+
+    async def sse():
+        job, last, idle = first, None, 0.0
+        while True:
+            finished = job["state"] in ("succeeded", "failed", "cancelled")
+            if finished:
+                yield f"event: done\ndata: {json.dumps(job)}\n\n"
+                return
+            if (job["state"], job["phase"]) != last:
+                last, idle = (job["state"], job["phase"]), 0.0
+                yield f"event: progress\ndata: {json.dumps(job)}\n\n"
+            elif idle >= TELEMETRY_KEEPALIVE:
+                idle = 0.0
+                yield ": keepalive\n\n"
+            await asyncio.sleep(_JOB_EVENTS_POLL)
+            idle += _JOB_EVENTS_POLL
+            try:
+                job = (await run_in_threadpool(teleop_service.get_job, job_id))["job"]
+            except JobNotFound:
+                # Forgotten to make room for newer jobs
+                return
+
+    return StreamingResponse(sse(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@router.delete(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Cancel Background Job",
+    description="""
+    Cancel a background job. A queued start never runs; a running start is
+    aborted at its current phase and its console closed; a start that got
+    as far as grabbing control anyway has its session ended again.
+
+    Waits up to `JOB_CANCEL_TIMEOUT` seconds for the job to finish and
+    returns it. Cancelling a finished job returns it unchanged.
+    """,
+    responses={
+        200: {
+            "description": "Job cancelled",
+            "model": JobResponse
+        },
+        404: {
+            "description": "No such job",
+            "model": ErrorResponse
+        }
+    }
+)
+@handle_endpoint_errors("cancel job")
+async def cancel_job(
+        job_id: str = Path(..., description="ID of the job"),
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> JobResponse:
+    """
+    Cancel a background job.
+
+    Args:
+        job_id: ID of the job
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing status and the job
+    """
+    # Waits for the start to wind down, so keep it off the event loop
+    return await run_in_threadpool(teleop_service.cancel_job, job_id)
+
+
 @router.post(
     "/endsession",
     response_model=OperationResponse,
@@ -443,7 +1077,7 @@ def start_session(
     }
 )
 @handle_endpoint_errors("end session")
-def end_session(
+async def end_session(
         req: BotId,
         teleop_service: TeleopService = Depends(get_teleop_service)
 ) -> OperationResponse:
@@ -458,39 +1092,226 @@ def end_session(
         Dictionary containing operation status
     """
     logger.info(f"Ending session for bot {req.bot_id}")
-    result = teleop_service.end_session(req.bot_id)
+    # Off the event loop: teardown waits on the console's acknowledgements
+    result = await run_in_threadpool(teleop_service.end_session, req.bot_id)
     logger.info(f"Session ended for bot {req.bot_id}: {result}")
     return result
 
 
 @router.post(
-    "/speed",
-    response_model=OperationResponse,
+    "/sessions/batch",
+    response_model=BatchSessionResponse,
     status_code=status.HTTP_200_OK,
-    summary="Change Robot Speed",
+    summary="Start or End Sessions for Many Robots",
     description="""
-    Modify the movement speed of the specified robot.
+    Start or end teleoperation sessions for several robots concurrently.
 
-    This endpoint allows you to increase or decrease the robot's movement 
-    speed. The robot must have an active teleoperation session for this 
-    command to work.
+    Bots are processed in parallel, at most `max_concurrency` at a time
+    (capped by the server's `BATCH_MAX_CONCURRENCY`). A failure on one bot
+    does not affect the others; each bot gets its own result.
 
-    **Valid Actions:**
-    - `increase`: Increase the robot's movement speed
-    - `decrease`: Decrease the robot's movement speed
+    With `?stream=true` the response is newline-delimited JSON: one result
+    object per bot as soon as it finishes, followed by a final
+    `{"summary": {...}}` line.
 
     **Example Usage:**
     ```
     {
-        "bot_id": 123,
-        "action": "increase"
+        "action": "start",
+        "bot_ids": [101, 102, 103],
+        "max_concurrency": 3
     }
     ```
-
-    **Success Response:**
-    ```
-    {
-        "status": "speed_changed"
+    """,
+    responses={
+        200: {
+            "description": "Batch completed (inspect per-bot results for failures)",
+            "model": BatchSessionResponse
+        },
+        500: {
+            "description": "Internal server error or invalid batch request",
+            "model": ErrorResponse
+        }
+    }
+)
+@handle_endpoint_errors("batch sessions")
+async def batch_sessions(
+        req: BatchSessionReq,
+        stream: bool = Query(False, description="Stream per-bot results as NDJSON as they finish"),
+        teleop_service: TeleopService = Depends(get_teleop_service)
+):
+    """
+    Start or end sessions for several bots with bounded parallelism.
+
+    Args:
+        req: Request containing action, bot IDs and optional concurrency cap
+        stream: Whether to stream results as NDJSON
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Per-bot results in completion order plus summary statistics
+    """
+    logger.info(f"Batch {req.action} for bots {req.bot_ids}")
+    batch = teleop_service.batch_sessions(req.action, req.bot_ids, req.max_concurrency)
+
+    if stream:
+        def ndjson():
+            for result in batch:
+                yield json.dumps(result) + "\n"
+            yield json.dumps({"summary": batch.summary()}) + "\n"
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    results = await run_in_threadpool(list, batch)
+    summary = batch.summary()
+    logger.info(f"Batch {req.action} done: {summary}")
+    return {"status": "success", "results": results, "summary": summary}
+
+
+@router.post(
+    "/estop",
+    response_model=EstopResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Emergency Stop",
+    description="""
+    Release control of every active robot at once, or of the listed ones.
+
+    Pending movements are dropped and the release keystroke jumps ahead of
+    any queued speed or motion keystrokes on each session. The stop is sent
+    to every bot before any acknowledgement is awaited; the call then waits
+    up to `ESTOP_ACK_TIMEOUT` seconds for each console to acknowledge the
+    release by redrawing after it. Sessions stay open with control
+    released, so a bot can be re-grabbed without a new session.
+
+    **Example Usage:**
+    ```
+    {}
+    {"bot_ids": [101, 102]}
+    ```
+    """,
+    responses={
+        200: {
+            "description": "Stop sent (inspect unacknowledged / failed bots)",
+            "model": EstopResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    }
+)
+@handle_endpoint_errors("emergency stop")
+async def emergency_stop(
+        req: Optional[EstopReq] = None,
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> EstopResponse:
+    """
+    Release control of all active bots, or of the requested ones.
+
+    Args:
+        req: Optional request listing the bots to stop
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing the stopped, unacknowledged and failed bots
+    """
+    bot_ids = req.bot_ids if req is not None else None
+    # Off the event loop: waits on every console's acknowledgement
+    result = await run_in_threadpool(teleop_service.emergency_stop, bot_ids)
+    logger.warning(f"Emergency stop done: stopped={result['stopped']} "
+                   f"unacknowledged={result['unacknowledged']} failed={list(result['failed'])}")
+    return result
+
+
+@router.websocket("/ws/teleop/{bot_id}")
+async def teleop_stream(
+        websocket: WebSocket,
+        bot_id: int = Path(..., gt=0, description="The ID of the robot to control"),
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> None:
+    """
+    Persistent teleop channel for streaming keystrokes at joystick rates.
+
+    Each text frame is ``<operation> <argument> [<id>]``, e.g. ``move up``,
+    ``rotate left`` or ``speed increase 42``. Frames map onto the same key
+    tables as /move, /rotate and /speed (movement is latest-wins) without
+    the per-request HTTP, validation and logging overhead.
+
+    A frame carrying an ``id`` is acknowledged with
+    ``{"id": 42, "ok": true, "status": "..."}``; frames without one are not.
+    Failures are always reported as ``{"id": ..., "ok": false, "error": "..."}``,
+    with a ``retry_after`` (seconds) while the session is reconnecting.
+
+    Args:
+        websocket: Client connection
+        bot_id: ID of the bot the frames are sent to
+        teleop_service: Injected teleop service instance
+    """
+    await websocket.accept()
+    logger.info(f"Teleop stream opened for bot {bot_id}")
+    frames = 0
+    try:
+        while True:
+            parts = (await websocket.receive_text()).split()
+            frames += 1
+            frame_id = parts[2] if len(parts) == 3 else None
+            if len(parts) not in (2, 3):
+                await websocket.send_json({"id": None, "ok": False,
+                                           "error": "Frame must be '<operation> <argument> [<id>]'"})
+                continue
+            try:
+                result = await run_in_threadpool(teleop_service.stream_command, bot_id, parts[0], parts[1])
+            except SessionRecovering as e:
+                await websocket.send_json({"id": frame_id, "ok": False, "error": str(e),
+                                           "retry_after": e.retry_after})
+                continue
+            except SSHClientError as e:
+                await websocket.send_json({"id": frame_id, "ok": False, "error": str(e)})
+                continue
+            if frame_id is not None:
+                await websocket.send_json({"id": frame_id, "ok": True, "status": result})
+    except WebSocketDisconnect:
+        logger.info(f"Teleop stream closed for bot {bot_id} after {frames} frames")
+
+
+@router.post(
+    "/speed",
+    response_model=OperationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Change Robot Speed",
+    description="""
+    Modify the movement speed of the specified robot.
+
+    This endpoint allows you to increase or decrease the robot's movement 
+    speed. The robot must have an active teleoperation session for this 
+    command to work.
+
+    Keystrokes are queued on the session's writer and the call returns
+    immediately; set `wait` to `true` to return only once they have been
+    written to the console, or `ack` to `true` to return only once the
+    console shows the new speed limits (`504` if it does not within
+    `ACK_TIMEOUT` seconds).
+
+    Send an `Idempotency-Key` header (any unique string, e.g. a UUID) to
+    make retries safe: a repeat with the same key within `IDEMPOTENCY_TTL`
+    seconds returns the first result without sending keys again, and
+    reusing a key for a different command is rejected with `422`.
+
+    **Valid Actions:**
+    - `increase`: Increase the robot's movement speed
+    - `decrease`: Decrease the robot's movement speed
+
+    **Example Usage:**
+    ```
+    {
+        "bot_id": 123,
+        "action": "increase"
+    }
+    ```
+
+    **Success Response:**
+    ```
+    {
+        "status": "speed_changed"
     }
     ```
     """,
@@ -499,15 +1320,24 @@ def end_session(
             "description": "Speed changed successfully",
             "model": OperationResponse
         },
+        422: {
+            "description": "Invalid request, or Idempotency-Key reused for a different command",
+            "model": ErrorResponse
+        },
         500: {
             "description": "Internal server error or invalid speed action",
             "model": ErrorResponse
+        },
+        504: {
+            "description": "Console did not acknowledge the command (ack=true)",
+            "model": ErrorResponse
         }
     }
 )
 @handle_endpoint_errors("change speed")
-def change_speed(
+async def change_speed(
         req: SpeedChangeReq,
+        idempotency_key: Optional[str] = Header(None, max_length=255, description=_IDEMPOTENCY_KEY_DOC),
         teleop_service: TeleopService = Depends(get_teleop_service)
 ) -> OperationResponse:
     """
@@ -515,13 +1345,16 @@ def change_speed(
 
     Args:
         req: Request containing bot ID and speed action
+        idempotency_key: Optional key making retries of this command safe
         teleop_service: Injected teleop service instance
 
     Returns:
         Dictionary containing operation status
     """
     logger.info(f"Changing speed for bot {req.bot_id}: {req.action}")
-    result = teleop_service.change_speed(req.bot_id, req.action)
+    # Off the event loop: with wait or ack this blocks until the write lands or is acknowledged
+    result = await run_in_threadpool(teleop_service.change_speed, req.bot_id, req.action, wait=req.wait,
+                                    ack=req.ack, idempotency_key=idempotency_key)
     logger.info(f"Speed changed for bot {req.bot_id}: {result}")
     return result
 
@@ -537,6 +1370,19 @@ def change_speed(
     This endpoint sends movement commands to the robot. The robot must have 
     an active teleoperation session for this command to work.
 
+    Movement is "latest wins": if a newer move/rotate for the bot arrives
+    before this one is written, this one is discarded, and one left waiting
+    longer than `MOVE_STALE_AFTER` seconds is dropped. The call returns
+    `Movement queued` immediately; set `wait` to `true` to get the outcome
+    (written, superseded or dropped), or `ack` to `true` to wait until the
+    console has redrawn after it (`504` if it does not within
+    `ACK_TIMEOUT` seconds).
+
+    Send an `Idempotency-Key` header (any unique string, e.g. a UUID) to
+    make retries safe: a repeat with the same key within `IDEMPOTENCY_TTL`
+    seconds returns the first result without sending keys again, and
+    reusing a key for a different command is rejected with `422`.
+
     **Valid Directions:**
     - `up`: Move forward
     - `down`: Move backward
@@ -563,15 +1409,24 @@ def change_speed(
             "description": "Robot moved successfully",
             "model": OperationResponse
         },
+        422: {
+            "description": "Invalid request, or Idempotency-Key reused for a different command",
+            "model": ErrorResponse
+        },
         500: {
             "description": "Internal server error or invalid direction",
             "model": ErrorResponse
+        },
+        504: {
+            "description": "Console did not acknowledge the command (ack=true)",
+            "model": ErrorResponse
         }
     }
 )
 @handle_endpoint_errors("move bot")
-def move_bot(
+async def move_bot(
         req: MoveReq,
+        idempotency_key: Optional[str] = Header(None, max_length=255, description=_IDEMPOTENCY_KEY_DOC),
         teleop_service: TeleopService = Depends(get_teleop_service)
 ) -> OperationResponse:
     """
@@ -579,13 +1434,16 @@ def move_bot(
 
     Args:
         req: Request containing bot ID and movement direction
+        idempotency_key: Optional key making retries of this command safe
         teleop_service: Injected teleop service instance
 
     Returns:
         Dictionary containing operation status
     """
     logger.info(f"Moving bot {req.bot_id}: {req.direction}")
-    result = teleop_service.move(req.bot_id, req.direction)
+    # Off the event loop: with wait or ack this blocks until the write lands or is acknowledged
+    result = await run_in_threadpool(teleop_service.move, req.bot_id, req.direction, wait=req.wait, ack=req.ack,
+                                    idempotency_key=idempotency_key)
     logger.info(f"Moved bot {req.bot_id}: {result}")
     return result
 
@@ -601,6 +1459,19 @@ def move_bot(
     This endpoint sends rotation commands to the robot. The robot must have 
     an active teleoperation session for this command to work.
 
+    Movement is "latest wins": if a newer move/rotate for the bot arrives
+    before this one is written, this one is discarded, and one left waiting
+    longer than `MOVE_STALE_AFTER` seconds is dropped. The call returns
+    `Movement queued` immediately; set `wait` to `true` to get the outcome
+    (written, superseded or dropped), or `ack` to `true` to wait until the
+    console has redrawn after it (`504` if it does not within
+    `ACK_TIMEOUT` seconds).
+
+    Send an `Idempotency-Key` header (any unique string, e.g. a UUID) to
+    make retries safe: a repeat with the same key within `IDEMPOTENCY_TTL`
+    seconds returns the first result without sending keys again, and
+    reusing a key for a different command is rejected with `422`.
+
     **Valid Directions:**
     - `left`: Rotate counterclockwise
     - `right`: Rotate clockwise
@@ -625,15 +1496,24 @@ def move_bot(
             "description": "Robot rotated successfully",
             "model": OperationResponse
         },
+        422: {
+            "description": "Invalid request, or Idempotency-Key reused for a different command",
+            "model": ErrorResponse
+        },
         500: {
             "description": "Internal server error or invalid rotation direction",
             "model": ErrorResponse
+        },
+        504: {
+            "description": "Console did not acknowledge the command (ack=true)",
+            "model": ErrorResponse
         }
     }
 )
 @handle_endpoint_errors("rotate bot")
-def rotate_bot(
+async def rotate_bot(
         req: RotateReq,
+        idempotency_key: Optional[str] = Header(None, max_length=255, description=_IDEMPOTENCY_KEY_DOC),
         teleop_service: TeleopService = Depends(get_teleop_service)
 ) -> OperationResponse:
     """
@@ -641,13 +1521,16 @@ def rotate_bot(
 
     Args:
         req: Request containing bot ID and rotation direction
+        idempotency_key: Optional key making retries of this command safe
         teleop_service: Injected teleop service instance
 
     Returns:
         Dictionary containing operation status
     """
     logger.info(f"Rotating bot {req.bot_id}: {req.direction}")
-    result = teleop_service.rotate(req.bot_id, req.direction)
+    # Off the event loop: with wait or ack this blocks until the write lands or is acknowledged
+    result = await run_in_threadpool(teleop_service.rotate, req.bot_id, req.direction, wait=req.wait, ack=req.ack,
+                                    idempotency_key=idempotency_key)
     logger.info(f"Rotated bot {req.bot_id}: {result}")
     return result
 
@@ -660,17 +1543,23 @@ def rotate_bot(
     description="""
     Retrieve the current speed information for a robot.
 
-    This endpoint returns detailed information about the robot's current 
-    movement speed settings. The robot must have an active session.
+    This endpoint returns the linear and angular speed limits currently
+    shown on the robot's teleop console. The robot must have an active session.
+
+    The values are parsed from the console screen as its output is drained
+    in the background and cached, so this is an in-memory read. `age_s` is
+    how many seconds ago the console last displayed them; all fields are
+    `null` until it has.
 
     **Example Response:**
     ```
     {
         "status": "success",
         "speed_info": {
-            "current_speed": 5,
-            "max_speed": 10,
-            "min_speed": 1
+            "linear_speed": 0.125,
+            "angular_speed": 0.5,
+            "updated_at": "2024-01-01T12:00:00+00:00",
+            "age_s": 1.42
         }
     }
     ```
@@ -719,6 +1608,10 @@ def get_speed(
     This endpoint returns information about whether a session is active, 
     inactive, or in an error state for the specified robot.
 
+    The status is read from a table kept by a background liveness check
+    (every `LIVENESS_INTERVAL` seconds), so it never probes the session
+    process itself and may lag a crash by up to one interval.
+
     **Possible Status Values:**
     - `active`: Session is running and ready for commands
     - `inactive`: No session is currently active
@@ -766,6 +1659,146 @@ def get_session_status(
     return result
 
 
+@router.get(
+    "/sessions/events",
+    response_model=SessionEventsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Session Status Transitions",
+    description="""
+    Retrieve recent session status transitions with timestamps.
+
+    A session becomes `active` when it starts, `ended` when it is ended
+    through the API, and `terminated` when its process dies on its own
+    (found by the background liveness check or a failed write). The most
+    recent `LIVENESS_HISTORY` transitions are kept.
+
+    A session whose process dies is `recovering` while it is reconnected in
+    the background (see `RECONNECT_*`), then `active` again, or
+    `terminated` once every attempt failed. `recovery` reports attempts in
+    progress and how many recoveries succeeded or gave up.
+    """,
+    responses={
+        200: {
+            "description": "Session events retrieved successfully",
+            "model": SessionEventsResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("get session events")
+def get_session_events(
+        limit: Optional[int] = Query(None, gt=0, description="Return only the most recent transitions"),
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> SessionEventsResponse:
+    """
+    Get recent session status transitions.
+
+    Args:
+        limit: Maximum number of transitions to return
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing transitions and liveness monitor counters
+    """
+    return teleop_service.get_session_events(limit)
+
+
+@router.get(
+    "/sessions/phases",
+    response_model=PhaseSummaryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Session Start Phase Percentiles",
+    description="""
+    Retrieve percentile summaries of how long each phase of a session
+    start takes, across the fleet and per bot.
+
+    Phases: `connect`, `authenticate`, `console_launch`, `teleoperables`,
+    `platform_ready` and `grab` (or `pool_checkout` and `grab` when a warm
+    console was used). Starts, background reconnects and warm-pool fills
+    are recorded; the last `PHASE_HISTORY_SIZE` attempts per bot are kept.
+    A failed attempt contributes the phases it finished plus the phase it
+    failed in, timed until the failure, and is counted under `failed_in`.
+
+    Each phase lists its slowest bots by median, so a slow robot or
+    network segment stands out from the fleet.
+    """,
+    responses={
+        200: {
+            "description": "Phase summary retrieved successfully",
+            "model": PhaseSummaryResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("get phase summary")
+def get_phase_summary(
+        bot_id: Optional[int] = Query(None, gt=0, description="Summarise only this robot"),
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> PhaseSummaryResponse:
+    """
+    Get session-start phase percentiles.
+
+    Args:
+        bot_id: Optional robot to restrict the summary to
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing per-phase and per-bot percentiles
+    """
+    return teleop_service.get_phase_summary(bot_id)
+
+
+@router.get(
+    "/sessions/phases/history",
+    response_model=PhaseHistoryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Session Start Attempts of a Robot",
+    description="""
+    Retrieve the recorded session-start attempts of one robot, oldest
+    first: when each began, what made it (`start`, `reconnect`,
+    `pool_fill`), its outcome and every phase with its start offset and
+    duration.
+    """,
+    responses={
+        200: {
+            "description": "Phase history retrieved successfully",
+            "model": PhaseHistoryResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("get phase history")
+def get_phase_history(
+        bot_id: int = Query(..., gt=0, description="The ID of the robot"),
+        limit: Optional[int] = Query(None, gt=0, description="Return only the most recent attempts"),
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> PhaseHistoryResponse:
+    """
+    Get the recorded session-start attempts of a robot.
+
+    Args:
+        bot_id: The robot to report on
+        limit: Maximum number of attempts to return
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing the attempts, oldest first
+    """
+    return teleop_service.get_phase_history(bot_id, limit)
+
+
 @router.get(
     "/sessions",
     response_model=ActiveSessionsResponse,
@@ -816,6 +1849,374 @@ def list_active_sessions(
     return result
 
 
+@router.get(
+    "/pool/stats",
+    response_model=PoolStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Warm Session Pool Statistics",
+    description="""
+    Retrieve metrics for the pre-warmed session pool.
+
+    Bots listed in `WARM_POOL_BOTS` are kept logged in with the teleop
+    console up (but not grabbed), so starting a session on them only has
+    to grab control. This endpoint reports pool hits and misses, fills,
+    evictions and which bots are currently warm (with their age in seconds).
+    """,
+    responses={
+        200: {
+            "description": "Pool statistics retrieved successfully",
+            "model": PoolStatsResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("get pool stats")
+def get_pool_stats(
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> PoolStatsResponse:
+    """
+    Get warm session pool statistics.
+
+    Args:
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing pool metrics
+    """
+    return teleop_service.get_pool_stats()
+
+
+@router.get(
+    "/mailbox/stats",
+    response_model=MailboxStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Movement Mailbox Statistics",
+    description="""
+    Retrieve per-bot counters for the latest-wins movement mailbox.
+
+    Move and rotate requests are delivered one at a time per bot; a newer
+    movement replaces one still waiting (`coalesced`), and one that waited
+    longer than `MOVE_STALE_AFTER` seconds is dropped (`dropped_stale`).
+    Movements pending when a session ends are dropped (`dropped_ended`).
+    Speed changes and session lifecycle commands bypass the mailbox.
+    """,
+    responses={
+        200: {
+            "description": "Mailbox statistics retrieved successfully",
+            "model": MailboxStatsResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("get mailbox stats")
+def get_mailbox_stats(
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> MailboxStatsResponse:
+    """
+    Get per-bot movement mailbox statistics.
+
+    Args:
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing mailbox counters per bot
+    """
+    return teleop_service.get_mailbox_stats()
+
+
+@router.get(
+    "/writers/stats",
+    response_model=WriterStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Keystroke Writer Statistics",
+    description="""
+    Retrieve per-bot metrics for the session keystroke writers.
+
+    Every active session owns a writer thread with bounded priority lanes
+    (`WRITER_QUEUE_DEPTH` each): stop/release, then speed, then motion.
+    Command endpoints enqueue keystrokes and return, so a stalled console
+    never blocks the request path; when a lane is full the new keystroke is
+    dropped and counted. For each bot this endpoint reports the queue depth
+    per lane, submitted/written/dropped/preempted counters, write errors,
+    and per-lane queue-wait and write latency summaries.
+    """,
+    responses={
+        200: {
+            "description": "Writer statistics retrieved successfully",
+            "model": WriterStatsResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("get writer stats")
+def get_writer_stats(
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> WriterStatsResponse:
+    """
+    Get per-bot keystroke writer statistics.
+
+    Args:
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing writer metrics per bot
+    """
+    return teleop_service.get_writer_stats()
+
+
+@router.get(
+    "/connections/stats",
+    response_model=ConnectionStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get SSH Connection Statistics",
+    description="""
+    Retrieve connect-phase latency and SSH master connection metrics.
+
+    With `SSH_MULTIPLEX` enabled, the first session to a bot leaves an
+    authenticated master connection behind for `SSH_CONTROL_PERSIST`
+    seconds, and later sessions to that bot reuse it instead of repeating
+    the TCP connect, key exchange and password login. This endpoint reports
+    connect + authentication latency separately for fresh and reused
+    connections, and how long each tracked master has been idle.
+    """,
+    responses={
+        200: {
+            "description": "Connection statistics retrieved successfully",
+            "model": ConnectionStatsResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("get connection stats")
+def get_connection_stats(
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> ConnectionStatsResponse:
+    """
+    Get SSH connection multiplexing statistics.
+
+    Args:
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing connect latency and master connection metrics
+    """
+    return teleop_service.get_connection_stats()
+
+
+@router.get(
+    "/estop/stats",
+    response_model=StopStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Emergency Stop Latency",
+    description="""
+    Retrieve latency histograms of the emergency stop path.
+
+    `fanout` is the time to enqueue the stop for every bot, `write` the
+    time per bot until the release keystroke reached the session, and
+    `ack` the time per bot until its console redrew after the release.
+    Each reports count, sum, max, p50/p95/p99 and cumulative buckets.
+    """,
+    responses={
+        200: {
+            "description": "Stop latency retrieved successfully",
+            "model": StopStatsResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("get stop stats")
+def get_stop_stats(
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> StopStatsResponse:
+    """
+    Get emergency stop latency histograms.
+
+    Args:
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing fan-out, write and ack latency
+    """
+    return teleop_service.get_stop_stats()
+
+
+@router.get(
+    "/acks/stats",
+    response_model=AckStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Console Acknowledgement Latency",
+    description="""
+    Retrieve, per bot, how long commands took from being queued until the
+    console redrew showing their effect.
+
+    Every command is tracked, whether or not it was sent with `ack`.
+    `acked` and `lost` count commands the console did and did not
+    acknowledge within the ack window. Latency percentiles are in seconds,
+    by command kind (`move`, `rotate`, `speed`, `grab`). `pending` is how
+    many commands of a live session are still awaiting a redraw.
+    """,
+    responses={
+        200: {
+            "description": "Acknowledgement latency retrieved successfully",
+            "model": AckStatsResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("get ack stats")
+def get_ack_stats(
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> AckStatsResponse:
+    """
+    Get per-bot console acknowledgement latency.
+
+    Args:
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing per-bot acknowledgement counts and latency
+    """
+    return teleop_service.get_ack_stats()
+
+
+@router.get(
+    "/idempotency/stats",
+    response_model=IdempotencyStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Idempotency-Key Cache Stats",
+    description="""
+    Retrieve how often command retries were answered from the
+    Idempotency-Key cache instead of being sent to the robot.
+
+    `hits` are retries of a completed command and `joined` retries that
+    arrived while the original was still running; `misses` are first
+    requests. `failed` commands are not cached, so their retries run again.
+    `conflicts` count keys reused for a different command. Results expire
+    after `ttl_s` seconds, and the oldest are `evicted` once the cache
+    holds more than about `max_bytes`.
+    """,
+    responses={
+        200: {
+            "description": "Idempotency cache stats retrieved successfully",
+            "model": IdempotencyStatsResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("get idempotency stats")
+def get_idempotency_stats(
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> IdempotencyStatsResponse:
+    """
+    Get Idempotency-Key cache metrics.
+
+    Args:
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Dictionary containing cache hits, misses, hit rate and size
+    """
+    return teleop_service.get_idempotency_stats()
+
+
+@router.get(
+    "/telemetry/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream Robot Console Telemetry",
+    description="""
+    Server-sent event stream of robot state parsed from the teleop consoles:
+    speed limits, whether control is grabbed, the latest warning line and
+    the session lifecycle.
+
+    The first event is a `snapshot` of every requested bot. After that each
+    `state` event carries a bot ID and only the fields that changed. A
+    client that falls too far behind gets a new `snapshot` instead of the
+    events it missed. An idle stream sends a `: keepalive` comment every
+    `TELEMETRY_KEEPALIVE` seconds.
+
+    Repeat `bot_ids` to follow a subset of bots; omit it to follow all.
+
+    **Example Stream:**
+    ```
+    event: snapshot
+    data: {"5": {"session": "active", "grabbed": true, "linear_speed": 0.125}}
+
+    event: state
+    data: {"bot_id": 5, "linear_speed": 0.15}
+    ```
+    """,
+    responses={
+        200: {
+            "description": "Event stream opened",
+            "content": {"text/event-stream": {}}
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    },
+    tags=["status"]
+)
+@handle_endpoint_errors("stream telemetry")
+async def telemetry_stream(
+        bot_ids: Optional[List[int]] = Query(None, description="Bots to follow (repeatable); all bots if omitted"),
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> StreamingResponse:
+    """
+    Stream console state changes as server-sent events.
+
+    Args:
+        bot_ids: Optional subset of bots to follow
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        text/event-stream response
+    """
+    subscription = teleop_service.subscribe_telemetry(bot_ids)
+
+    async def sse():
+        try:
+            async for event in subscription.events(keepalive=TELEMETRY_KEEPALIVE):
+                if event is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+        finally:
+            subscription.close()
+            logger.info(f"Telemetry stream for bots {bot_ids or 'all'} closed")
+
+    return StreamingResponse(sse(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
 @router.get(
     "/debug",
     response_model=DebugInfoResponse,
@@ -836,9 +2237,15 @@ def list_active_sessions(
         "session_exists_in_sessions": true,
         "all_active_sessions": ,
         "process_alive": true,
-        "process_type": "Process"
+        "process_type": "Process",
+        "console_tail": "...",
+        "console_buffer": {"size_bytes": 65536, "capacity_bytes": 65536, ...}
     }
     ```
+
+    `console_tail` is the most recent output of the bot's console, kept
+    by the session's background drain; `console_buffer` reports that
+    drain's ring buffer memory use.
     """,
     responses={
         200: {
@@ -874,7 +2281,8 @@ def debug_session(
     # Gather debug information
     session_status = ssh_client.get_session_status(bot_id)
     active_sessions = ssh_client.list_active_sessions()
-    session_exists = bot_id in ssh_client._sessions
+    process_type = ssh_client.get_session_process_type(bot_id)
+    session_exists = process_type is not None
 
     debug_info = {
         "bot_id": bot_id,
@@ -885,15 +2293,65 @@ def debug_session(
 
     # Add process-specific debug info if session exists
     if session_exists:
-        child_process = ssh_client._sessions[bot_id]
+        health = ssh_client.get_session_health(bot_id)
         debug_info.update({
-            "process_alive": ssh_client._is_alive(child_process),
-            "process_type": type(child_process).__name__
+            "process_alive": health is not None and health["status"] == "active",
+            "health": health,
+            "process_type": process_type,
+            "console_tail": ssh_client.get_console_tail(bot_id),
+            "console_buffer": ssh_client.get_console_buffer_stats()["sessions"].get(bot_id)
         })
 
     logger.info(f"Debug info for bot {bot_id}: {debug_info}")
     return debug_info
 
 
-# Register router with app
+@metrics_router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Prometheus Metrics",
+    description="""
+    Metrics in the Prometheus text exposition format, for scraping.
+
+    * `wemo_http_request_duration_seconds{method, route, status}`: HTTP handling
+    * `wemo_service_duration_seconds{operation, bot, outcome}`: service layer
+    * `wemo_ssh_write_duration_seconds{bot, command}`: queueing until the
+      keystrokes are written to the console
+    * `wemo_console_ack_duration_seconds{bot, command}`: queueing until the
+      console shows the effect (speed changes and grab/release)
+    * `wemo_ssh_commands_total{bot, command}`: commands queued; use `rate()`
+      for command rates
+    * `wemo_sessions{state}`: sessions by state
+    * `wemo_session_start_phase_duration_seconds{bot, phase}`: start-session phases
+    * `wemo_estop_duration_seconds{stage}`: emergency stop path
+
+    With the session broker, the session-layer metrics come from the broker
+    and the HTTP / service metrics from the worker answering the scrape.
+    """,
+    responses={
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        }
+    }
+)
+@handle_endpoint_errors("get metrics")
+def get_metrics(
+        teleop_service: TeleopService = Depends(get_teleop_service)
+) -> PlainTextResponse:
+    """
+    Render metrics for a Prometheus scrape.
+
+    Args:
+        teleop_service: Injected teleop service instance
+
+    Returns:
+        Plain-text Prometheus exposition
+    """
+    return PlainTextResponse(teleop_service.get_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+# Register routers with app
 app.include_router(router)
+app.include_router(metrics_router)
@@ -5,14 +5,34 @@
 Defines expected structures for HTTP payloads related to bot control.
 """
 
-from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, conint
 
 
 class BotId(BaseModel):
     bot_id: int = Field(..., gt=0, description="Bot ID to control")
 
 
-class SpeedChangeReq(BotId):
+class StartSessionReq(BotId):
+    background: bool = Field(
+        False,
+        description="Start in the background and answer 202 with a job to poll instead of waiting for the session"
+    )
+
+
+class KeystrokeReq(BotId):
+    wait: bool = Field(
+        False,
+        description="Wait until the keystrokes are written to the console instead of returning once queued"
+    )
+    ack: bool = Field(
+        False,
+        description="Wait until the console redraws showing the command took effect (implies wait)"
+    )
+
+
+class SpeedChangeReq(KeystrokeReq):
     action: str = Field(
         ...,
         pattern="^(increase|decrease)$",
@@ -20,7 +40,7 @@ class SpeedChangeReq(BotId):
     )
 
 
-class MoveReq(BotId):
+class MoveReq(KeystrokeReq):
     direction: str = Field(
         ...,
         pattern="^(up|down|left|right)$",
@@ -28,9 +48,29 @@ class MoveReq(BotId):
     )
 
 
-class RotateReq(BotId):
+class RotateReq(KeystrokeReq):
     direction: str = Field(
         ...,
         pattern="^(left|right)$",
         description="Rotate direction"
     )
+
+
+class BatchSessionReq(BaseModel):
+    action: str = Field(
+        ...,
+        pattern="^(start|end)$",
+        description="Lifecycle operation applied to every bot: 'start' or 'end'"
+    )
+    bot_ids: List[conint(gt=0)] = Field(..., min_length=1, description="Bot IDs to start or end")
+    max_concurrency: Optional[conint(gt=0)] = Field(
+        None,
+        description="How many bots to handle at once (capped by BATCH_MAX_CONCURRENCY)"
+    )
+
+
+class EstopReq(BaseModel):
+    bot_ids: Optional[List[conint(gt=0)]] = Field(
+        None,
+        description="Bot IDs to stop; every active bot when omitted"
+    )
@@ -7,13 +7,30 @@ Handles session management, movement commands, and status monitoring.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeout
 from functools import wraps
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
+from App.core.config import (ACK_TIMEOUT, BATCH_MAX_CONCURRENCY, IDEMPOTENCY_MAX_BYTES, IDEMPOTENCY_TTL,
+                             JOB_CANCEL_TIMEOUT, JOB_HISTORY, JOB_MAX_CONCURRENCY, MOVE_STALE_AFTER,
+                             WRITE_TIMEOUT)
+from App.utils.teleop_CLI_console import teardown_summary
+from App.utils.teleop_CLI_metrics import REGISTRY
 from App.utils.teleop_CLI_SSH_helper import SSHClient, SSHClientError
+from App.utils.teleop_CLI_start_jobs import StartJobs
+from App.utils.teleop_CLI_telemetry import TelemetrySubscription
 
 logger = logging.getLogger(__name__)
 
+_SERVICE_LATENCY = REGISTRY.histogram(
+    "wemo_service_duration_seconds", "Time spent in a service-layer operation", ("operation", "bot", "outcome"))
+_IDEMPOTENCY_REQUESTS = REGISTRY.counter(
+    "wemo_idempotency_requests", "Commands sent with an Idempotency-Key", ("outcome",))
+
 
 def handle_ssh_errors(operation_name: str):
     """
@@ -25,18 +42,322 @@ def handle_ssh_errors(operation_name: str):
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            started = time.monotonic()
+            bot = args[0] if args and isinstance(args[0], int) else ""
+            outcome = "error"
             try:
-                return func(self, *args, **kwargs)
+                result = func(self, *args, **kwargs)
+                outcome = "ok"
+                return result
             except SSHClientError as e:
                 logger.error(f"SSH error during {operation_name}: {e}")
                 raise
             except Exception as e:
                 logger.error(f"Unexpected error during {operation_name}: {e}")
                 raise SSHClientError(f"Failed to {operation_name}: {str(e)}")
+            finally:
+                _SERVICE_LATENCY.observe(time.monotonic() - started, operation_name, bot, outcome)
         return wrapper
     return decorator
 
 
+class SessionBatch:
+    """
+    One lifecycle operation applied to many bots with bounded parallelism.
+
+    Iterating runs the batch and yields a per-bot result as each bot finishes
+    (completion order, not request order).  summary() reports wall-clock
+    stats once iteration is complete.
+    """
+
+    def __init__(self, action: str, operation: Callable[[int], Dict[str, str]],
+                 bot_ids: List[int], max_concurrency: int):
+        # Duplicates would race each other on the same session.
+        self.action = action
+        self.bot_ids = list(dict.fromkeys(bot_ids))
+        self.max_concurrency = max(1, min(max_concurrency, len(self.bot_ids)))
+        self._operation = operation
+        self._results: List[Dict[str, Any]] = []
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def _run_one(self, bot_id: int) -> Dict[str, Any]:
+        started = time.monotonic()
+        try:
+            result: Dict[str, Any] = {"bot_id": bot_id, "ok": True,
+                                      "status": self._operation(bot_id)["status"], "error": None}
+        except Exception as e:
+            result = {"bot_id": bot_id, "ok": False, "status": None, "error": str(e)}
+        finished = time.monotonic()
+        result["elapsed_s"] = round(finished - started, 3)
+        result["finished_at_s"] = round(finished - self._started, 3)
+        return result
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self._started = time.monotonic()
+        logger.info(f"Batch {self.action} for bots {self.bot_ids} (max {self.max_concurrency} at once)")
+        with ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                thread_name_prefix=f"batch-{self.action}") as pool:
+            futures = [pool.submit(self._run_one, bot_id) for bot_id in self.bot_ids]
+            for future in as_completed(futures):
+                result = future.result()
+                self._results.append(result)
+                yield result
+        self._finished = time.monotonic()
+        logger.info(f"Batch {self.action} finished: {self.summary()}")
+
+    def summary(self) -> Dict[str, Any]:
+        """Overall stats for the batch (complete once iteration has finished)."""
+        end = self._finished if self._finished is not None else time.monotonic()
+        wall_clock = end - self._started if self._started is not None else 0.0
+        busy = sum(r["elapsed_s"] for r in self._results)
+        succeeded = sum(1 for r in self._results if r["ok"])
+        return {
+            "action": self.action,
+            "total": len(self.bot_ids),
+            "completed": len(self._results),
+            "succeeded": succeeded,
+            "failed": len(self._results) - succeeded,
+            "max_concurrency": self.max_concurrency,
+            "wall_clock_s": round(wall_clock, 3),
+            "sum_elapsed_s": round(busy, 3),
+            "speedup": round(busy / wall_clock, 2) if wall_clock > 0 else None,
+        }
+
+
+class _BotMailbox:
+    """Mailbox state for one bot: at most one pending movement."""
+
+    def __init__(self) -> None:
+        self.cond = threading.Condition()
+        # (kind, direction, posted_at, future, options) of the newest undelivered intent
+        self.pending: Optional[tuple] = None
+        self.thread: Optional[threading.Thread] = None
+        # Bumped by discard(); a dispatcher exits once its generation is stale
+        self.generation = 0
+        self.counters = {"posted": 0, "delivered": 0, "coalesced": 0,
+                         "dropped_stale": 0, "dropped_ended": 0, "failed": 0}
+
+
+class MovementMailbox:
+    """
+    Per-bot "latest wins" mailbox for movement (move/rotate) intents.
+
+    A dispatcher thread per bot delivers one movement at a time and waits
+    for it to be written before taking the next.  A movement posted while
+    an older one is still waiting replaces it (coalesced), and one that has
+    waited longer than *stale_after* seconds is dropped rather than sent,
+    so a slow console never replays a backlog of key presses.
+    """
+
+    SUPERSEDED = "Superseded by newer movement"
+    STALE = "Dropped stale movement"
+    ENDED = "Dropped: session ended"
+
+    def __init__(self, deliver: Callable[..., str], stale_after: float):
+        """
+        Args:
+            deliver: Called as deliver(kind, bot_id, direction, **options) with
+                the options the movement was posted with; blocks until written
+            stale_after: Seconds after which an undelivered movement is dropped
+        """
+        self._deliver = deliver
+        self.stale_after = stale_after
+        self._lock = threading.Lock()
+        self._boxes: Dict[int, _BotMailbox] = {}
+
+    def post(self, kind: str, bot_id: int, direction: str, **options: Any) -> Future:
+        """Post a movement; the returned future resolves with the delivery
+        result or one of the SUPERSEDED / STALE / ENDED statuses."""
+        future: Future = Future()
+        with self._lock:
+            box = self._boxes.setdefault(bot_id, _BotMailbox())
+        with box.cond:
+            box.counters["posted"] += 1
+            if box.pending is not None:
+                box.counters["coalesced"] += 1
+                box.pending[3].set_result(self.SUPERSEDED)
+            box.pending = (kind, direction, time.monotonic(), future, options)
+            if box.thread is None:
+                box.thread = threading.Thread(target=self._dispatch, args=(bot_id, box, box.generation),
+                                              name=f"mailbox-bot-{bot_id}", daemon=True)
+                box.thread.start()
+            box.cond.notify()
+        return future
+
+    def discard(self, bot_id: int) -> None:
+        """Drop the pending movement for *bot_id* and stop its dispatcher."""
+        with self._lock:
+            box = self._boxes.get(bot_id)
+        if box is None:
+            return
+        with box.cond:
+            if box.pending is not None:
+                box.counters["dropped_ended"] += 1
+                box.pending[3].set_result(self.ENDED)
+                box.pending = None
+            box.generation += 1
+            box.thread = None
+            box.cond.notify_all()
+
+    def close(self) -> None:
+        """Discard everything and stop all dispatchers."""
+        with self._lock:
+            bots = list(self._boxes)
+        for bot_id in bots:
+            self.discard(bot_id)
+
+    def _dispatch(self, bot_id: int, box: _BotMailbox, generation: int) -> None:
+        while True:
+            with box.cond:
+                while box.pending is None and box.generation == generation:
+                    box.cond.wait()
+                if box.generation != generation:
+                    return
+                kind, direction, posted, future, options = box.pending
+                box.pending = None
+                if time.monotonic() - posted > self.stale_after:
+                    box.counters["dropped_stale"] += 1
+                    future.set_result(self.STALE)
+                    continue
+            try:
+                result = self._deliver(kind, bot_id, direction, **options)
+            except Exception as e:
+                with box.cond:
+                    box.counters["failed"] += 1
+                logger.warning(f"Delivering {kind} {direction} to bot {bot_id} failed: {e}")
+                future.set_exception(e)
+                continue
+            with box.cond:
+                box.counters["delivered"] += 1
+            future.set_result(result)
+
+    def stats(self) -> Dict[int, Dict[str, Any]]:
+        """Per-bot counters plus whether a movement is waiting."""
+        with self._lock:
+            boxes = list(self._boxes.items())
+        result = {}
+        for bot_id, box in boxes:
+            with box.cond:
+                result[bot_id] = {**box.counters, "pending": box.pending is not None}
+        return result
+
+
+class IdempotencyKeyReused(SSHClientError):
+    """An Idempotency-Key was sent again with a different command."""
+
+
+class IdempotencyCache:
+    """
+    Command results by Idempotency-Key, replayed to retries.
+
+    The first request with a key runs the command.  A retry with the same
+    key gets the original result without touching the session; one that
+    arrives while the original is still running waits for it instead.  A
+    command that fails is forgotten so that it can be retried.  Results
+    expire *ttl* seconds after they complete, and the oldest are evicted
+    once the cache holds more than about *max_bytes*.
+    """
+
+    # Rough size of an entry besides its key, command and result
+    ENTRY_OVERHEAD = 256
+
+    def __init__(self, ttl: float, max_bytes: int):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key -> [command, future, expires_at (None while running), size];
+        # completed entries are kept in completion (so expiry) order
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self._bytes = 0
+        self.counters = {"hits": 0, "joined": 0, "misses": 0, "conflicts": 0,
+                         "failed": 0, "expired": 0, "evicted": 0}
+
+    def run(self, key: str, command: tuple, operation: Callable[[], Any]) -> Any:
+        """Result of *operation* for the first request with *key*; the same
+        result for later ones sending the same *command*.
+
+        Raises:
+            IdempotencyKeyReused: If *key* was used for a different command
+        """
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] != command:
+                    self._count("conflicts", "conflict")
+                    raise IdempotencyKeyReused(f"Idempotency-Key {key!r} was already used for {entry[0]}")
+                if entry[1].done():
+                    self._count("hits", "hit")
+                else:
+                    self._count("joined", "joined")
+                original = entry[1]
+            else:
+                self._count("misses", "miss")
+                original = None
+                entry = [command, Future(), None, self.ENTRY_OVERHEAD + len(key) + len(repr(command))]
+                self._entries[key] = entry
+                self._bytes += entry[3]
+        if original is not None:
+            return original.result()
+
+        try:
+            result = operation()
+        except BaseException as e:
+            with self._lock:
+                self.counters["failed"] += 1
+                self._remove(key, entry)
+            entry[1].set_exception(e)
+            raise
+        with self._lock:
+            if self._entries.get(key) is entry:
+                entry[2] = time.monotonic() + self.ttl
+                entry[3] += len(repr(result))
+                self._bytes += len(repr(result))
+                self._entries.move_to_end(key)
+                self._evict()
+        entry[1].set_result(result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters, hit rate and size of the cache."""
+        with self._lock:
+            self._expire(time.monotonic())
+            counters = dict(self.counters)
+            entries, size = len(self._entries), self._bytes
+        repeated = counters["hits"] + counters["joined"]
+        total = repeated + counters["misses"]
+        return {**counters, "hit_rate": round(repeated / total, 4) if total else None,
+                "entries": entries, "bytes": size, "max_bytes": self.max_bytes, "ttl_s": self.ttl}
+
+    def _count(self, counter: str, outcome: str) -> None:
+        self.counters[counter] += 1
+        _IDEMPOTENCY_REQUESTS.inc(outcome)
+
+    def _remove(self, key: str, entry: list) -> None:
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+            self._bytes -= entry[3]
+
+    def _expire(self, now: float) -> None:
+        for key, entry in list(self._entries.items()):
+            if entry[2] is None:
+                continue
+            if entry[2] > now:
+                break
+            self._remove(key, entry)
+            self.counters["expired"] += 1
+
+    def _evict(self) -> None:
+        for key, entry in list(self._entries.items()):
+            if self._bytes <= self.max_bytes:
+                break
+            # Running commands stay so their retries still wait for them
+            if entry[2] is not None:
+                self._remove(key, entry)
+                self.counters["evicted"] += 1
+
+
 class TeleopService:
     """
     Service class for handling robot teleoperation commands.
@@ -49,6 +370,7 @@ class TeleopService:
     VALID_SPEED_ACTIONS = ["increase", "decrease"]
     VALID_MOVE_DIRECTIONS = ["up", "down", "left", "right"]
     VALID_ROTATION_DIRECTIONS = ["left", "right"]
+    VALID_BATCH_ACTIONS = ["start", "end"]
 
     def __init__(self, ssh_client: SSHClient = None):
         """
@@ -58,6 +380,37 @@ class TeleopService:
             ssh_client: Optional SSH client instance. Creates new one if not provided.
         """
         self.ssh_client = ssh_client if ssh_client else SSHClient()
+        # Movement is latest-wins; speed and lifecycle calls go straight through
+        self.mailbox = MovementMailbox(self._deliver_movement, MOVE_STALE_AFTER)
+        self.idempotency = IdempotencyCache(IDEMPOTENCY_TTL, IDEMPOTENCY_MAX_BYTES)
+        if self.ssh_client.owns_sessions:
+            self.jobs = StartJobs(self.ssh_client, JOB_MAX_CONCURRENCY, JOB_HISTORY)
+        else:
+            # Jobs are kept by the session broker, so any worker can follow them
+            self.jobs = self.ssh_client.jobs
+
+    def _once(self, idempotency_key: Optional[str], command: tuple, operation: Callable[[], str]) -> str:
+        """Run *operation*, or replay its result when *idempotency_key* was seen."""
+        if idempotency_key is None:
+            return operation()
+        return self.idempotency.run(idempotency_key, command, operation)
+
+    def _deliver_movement(self, kind: str, bot_id: int, direction: str, ack: bool = False) -> str:
+        # Wait for the write (or the console's acknowledgement) so newer
+        # intents coalesce while the console is busy
+        return getattr(self.ssh_client, kind)(bot_id, direction, wait=True, ack=ack)
+
+    def _post_movement(self, kind: str, bot_id: int, direction: str, wait: bool, ack: bool = False) -> str:
+        """Post a movement to the mailbox; with *wait* or *ack*, return its outcome."""
+        self.ssh_client.require_session(bot_id)
+        future = self.mailbox.post(kind, bot_id, direction, ack=ack)
+        if not (wait or ack):
+            return "Movement queued"
+        timeout = WRITE_TIMEOUT + ACK_TIMEOUT if ack else WRITE_TIMEOUT
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            raise SSHClientError(f"Timed out after {timeout:.0f}s delivering {kind} to bot {bot_id}")
 
     def _validate_parameter(self, parameter: str, valid_options: List[str],
                             parameter_name: str) -> None:
@@ -94,6 +447,51 @@ class TeleopService:
         logger.info(f"Successfully started session for bot {bot_id}")
         return {"status": result}
 
+    @handle_ssh_errors("start session job")
+    def start_session_job(self, bot_id: int) -> Dict[str, object]:
+        """
+        Start a teleop session for the specified bot in the background.
+
+        Args:
+            bot_id: Unique identifier for the robot
+
+        Returns:
+            Dictionary containing status and the job, to poll with get_job;
+            the bot's queued or running start job if it already has one
+        """
+        job = self.jobs.submit(bot_id)
+        logger.info(f"Session start for bot {bot_id} running as job {job['job_id']}")
+        return {"status": "accepted", "job": job}
+
+    @handle_ssh_errors("get job")
+    def get_job(self, job_id: str) -> Dict[str, object]:
+        """
+        Get a background job with its progress.
+
+        Args:
+            job_id: ID returned by start_session_job
+
+        Returns:
+            Dictionary containing status and the job: its state, the phase
+            it is in while running, and its result or error once finished
+        """
+        return {"status": "success", "job": self.jobs.get(job_id)}
+
+    @handle_ssh_errors("cancel job")
+    def cancel_job(self, job_id: str) -> Dict[str, object]:
+        """
+        Cancel a background job, aborting its session start mid-handshake.
+
+        Args:
+            job_id: ID returned by start_session_job
+
+        Returns:
+            Dictionary containing status and the job as of when it finished
+            (or JOB_CANCEL_TIMEOUT seconds later)
+        """
+        logger.info(f"Cancelling job {job_id}")
+        return {"status": "success", "job": self.jobs.cancel(job_id, JOB_CANCEL_TIMEOUT)}
+
     @handle_ssh_errors("end session")
     def end_session(self, bot_id: int) -> Dict[str, str]:
         """
@@ -106,18 +504,103 @@ class TeleopService:
             Dictionary containing operation status
         """
         logger.info(f"Ending teleop session for bot {bot_id}")
+        self.mailbox.discard(bot_id)
         result = self.ssh_client.end_session(bot_id)
         logger.info(f"Successfully ended session for bot {bot_id}")
         return {"status": result}
 
+    @handle_ssh_errors("shut down")
+    def shutdown(self, deadline: float) -> Dict[str, object]:
+        """
+        Release every active session in parallel, then stop background work.
+
+        Session starts still running as jobs are cancelled first.
+
+        A worker using the session broker only disconnects from it: the
+        broker releases the sessions when it stops.
+
+        Args:
+            deadline: Seconds to wait for sessions to release before their
+                consoles are killed
+
+        Returns:
+            Dictionary of bots released cleanly, released without every
+            console acknowledgement, and timed out
+        """
+        self.jobs.close(JOB_CANCEL_TIMEOUT)
+        self.mailbox.close()
+        if self.ssh_client.owns_sessions:
+            logger.info(f"Shutting down: releasing all sessions within {deadline:.0f}s")
+            summary = self.ssh_client.release_all(deadline)
+        else:
+            # Sessions belong to the broker, which other workers still use
+            logger.info("Shutting down: sessions are left to the session broker")
+            summary = teardown_summary([], [], 0.0)
+        self.ssh_client.close()
+        logger.info(f"Shutdown complete: released={summary['released']} "
+                    f"unclean={summary['unclean']} timed_out={summary['timed_out']}")
+        return summary
+
+    @handle_ssh_errors("prepare session batch")
+    def batch_sessions(self, action: str, bot_ids: List[int],
+                       max_concurrency: Optional[int] = None) -> SessionBatch:
+        """
+        Prepare a batch start/end over several bots.
+
+        Args:
+            action: 'start' or 'end'
+            bot_ids: Bots to operate on
+            max_concurrency: Bots handled at once; defaults to and is capped
+                by BATCH_MAX_CONCURRENCY
+
+        Returns:
+            SessionBatch to iterate for per-bot results
+        """
+        self._validate_parameter(action, self.VALID_BATCH_ACTIONS, "batch action")
+        if not bot_ids:
+            raise SSHClientError("Batch requires at least one bot_id")
+
+        operation = self.start_session if action == "start" else self.end_session
+        cap = min(max_concurrency or BATCH_MAX_CONCURRENCY, BATCH_MAX_CONCURRENCY)
+        return SessionBatch(action, operation, bot_ids, cap)
+
+    @handle_ssh_errors("emergency stop")
+    def emergency_stop(self, bot_ids: Optional[List[int]] = None) -> Dict[str, object]:
+        """
+        Release control of every active bot, or of *bot_ids*, at once.
+
+        Pending movements are dropped first; the release then preempts
+        anything still queued on each session.
+
+        Args:
+            bot_ids: Bots to stop; all active bots when omitted
+
+        Returns:
+            Dictionary containing status, bots stopped / unacknowledged /
+            failed and the stop-path latencies
+        """
+        logger.warning(f"Emergency stop requested for {'all bots' if bot_ids is None else bot_ids}")
+        if bot_ids is None:
+            self.mailbox.close()
+        else:
+            for bot_id in bot_ids:
+                self.mailbox.discard(bot_id)
+        result = self.ssh_client.emergency_stop(bot_ids)
+        return {"status": "success", **result}
+
     @handle_ssh_errors("change speed")
-    def change_speed(self, bot_id: int, action: str) -> Dict[str, str]:
+    def change_speed(self, bot_id: int, action: str, wait: bool = False, ack: bool = False,
+                     idempotency_key: Optional[str] = None) -> Dict[str, str]:
         """
         Change the speed of the robot (increase/decrease).
 
         Args:
             bot_id: Unique identifier for the robot
             action: Speed change action ('increase' or 'decrease')
+            wait: Block until the keystrokes are written rather than queued
+            ack: Block until the console shows the new speed limits
+            idempotency_key: Retries with the same key get this result
+                instead of changing the speed again
 
         Returns:
             Dictionary containing operation status
@@ -127,18 +610,25 @@ class TeleopService:
         # Validate action parameter
         self._validate_parameter(action, self.VALID_SPEED_ACTIONS, "speed action")
 
-        result = self.ssh_client.change_speed(bot_id, action)
+        result = self._once(idempotency_key, ("speed", bot_id, action),
+                            lambda: self.ssh_client.change_speed(bot_id, action, wait=wait, ack=ack))
         logger.info(f"Successfully changed speed for bot {bot_id}: {action}")
         return {"status": result}
 
     @handle_ssh_errors("move robot")
-    def move(self, bot_id: int, direction: str) -> Dict[str, str]:
+    def move(self, bot_id: int, direction: str, wait: bool = False, ack: bool = False,
+             idempotency_key: Optional[str] = None) -> Dict[str, str]:
         """
         Move the robot in the specified direction.
 
         Args:
             bot_id: Unique identifier for the robot
             direction: Movement direction ('up', 'down', 'left', 'right')
+            wait: Block until the movement is written, superseded or dropped
+            ack: Block until the console redraws after the movement (or it
+                is superseded or dropped)
+            idempotency_key: Retries with the same key get this result
+                instead of moving the robot again
 
         Returns:
             Dictionary containing operation status
@@ -148,18 +638,25 @@ class TeleopService:
         # Validate direction parameter
         self._validate_parameter(direction, self.VALID_MOVE_DIRECTIONS, "move direction")
 
-        result = self.ssh_client.move(bot_id, direction)
+        result = self._once(idempotency_key, ("move", bot_id, direction),
+                            lambda: self._post_movement("move", bot_id, direction, wait, ack))
         logger.info(f"Successfully moved bot {bot_id} {direction}")
         return {"status": result}
 
     @handle_ssh_errors("rotate robot")
-    def rotate(self, bot_id: int, direction: str) -> Dict[str, str]:
+    def rotate(self, bot_id: int, direction: str, wait: bool = False, ack: bool = False,
+              idempotency_key: Optional[str] = None) -> Dict[str, str]:
         """
         Rotate the robot in the specified direction.
 
         Args:
             bot_id: Unique identifier for the robot
             direction: Rotation direction ('left' or 'right')
+            wait: Block until the movement is written, superseded or dropped
+            ack: Block until the console redraws after the movement (or it
+                is superseded or dropped)
+            idempotency_key: Retries with the same key get this result
+                instead of moving the robot again
 
         Returns:
             Dictionary containing operation status
@@ -169,12 +666,13 @@ class TeleopService:
         # Validate direction parameter
         self._validate_parameter(direction, self.VALID_ROTATION_DIRECTIONS, "rotation direction")
 
-        result = self.ssh_client.rotate(bot_id, direction)
+        result = self._once(idempotency_key, ("rotate", bot_id, direction),
+                            lambda: self._post_movement("rotate", bot_id, direction, wait, ack))
         logger.info(f"Successfully rotated bot {bot_id} {direction}")
         return {"status": result}
 
     @handle_ssh_errors("get speed information")
-    def get_speed(self, bot_id: int) -> Dict[str, str]:
+    def get_speed(self, bot_id: int) -> Dict[str, object]:
         """
         Get current speed information for the robot.
 
@@ -182,17 +680,58 @@ class TeleopService:
             bot_id: Unique identifier for the robot
 
         Returns:
-            Dictionary containing status and speed information
+            Dictionary containing status and the cached linear/angular speed
+            limits with their last-update time and age
         """
         logger.info(f"Getting speed information for bot {bot_id}")
         result = self.ssh_client.get_speed(bot_id)
         logger.info(f"Successfully retrieved speed for bot {bot_id}")
-        
-        # Return speed info as a dictionary to match API expectations
-        if result == "Speed information not available":
-            return {"status": "success", "speed_info": {"error": result}}
+        return {"status": "success", "speed_info": result}
+
+    @handle_ssh_errors("stream command")
+    def stream_command(self, bot_id: int, operation: str, argument: str) -> str:
+        """
+        Dispatch one streamed (WebSocket) frame: move, rotate or speed.
+
+        Same validation and routing as move/rotate/change_speed without
+        waiting, but only logs at debug level since frames arrive at
+        joystick rates.
+
+        Args:
+            bot_id: Unique identifier for the robot
+            operation: 'move', 'rotate' or 'speed'
+            argument: Direction or speed action for the operation
+
+        Returns:
+            Status of the queued command
+        """
+        if operation == "speed":
+            self._validate_parameter(argument, self.VALID_SPEED_ACTIONS, "speed action")
+            result = self.ssh_client.change_speed(bot_id, argument)
+        elif operation in ("move", "rotate"):
+            valid = self.VALID_MOVE_DIRECTIONS if operation == "move" else self.VALID_ROTATION_DIRECTIONS
+            self._validate_parameter(argument, valid, f"{operation} direction")
+            result = self._post_movement(operation, bot_id, argument, wait=False)
         else:
-            return {"status": "success", "speed_info": {"linear_speed": result}}
+            raise SSHClientError(f"Invalid operation: {operation}. Valid options: ['move', 'rotate', 'speed']")
+        logger.debug(f"Streamed {operation} {argument} for bot {bot_id}: {result}")
+        return result
+
+    @handle_ssh_errors("subscribe to telemetry")
+    def subscribe_telemetry(self, bot_ids: Optional[List[int]] = None) -> TelemetrySubscription:
+        """
+        Subscribe to console state changes (speed limits, control grabbed,
+        warnings, session lifecycle). Must be called on the event loop that
+        will read the subscription.
+
+        Args:
+            bot_ids: Bots to receive events for; all bots if empty
+
+        Returns:
+            Subscription yielding a snapshot, then per-bot deltas
+        """
+        logger.info(f"Telemetry subscriber added for bots {bot_ids or 'all'}")
+        return self.ssh_client.subscribe_telemetry(bot_ids)
 
     @handle_ssh_errors("get session status")
     def get_session_status(self, bot_id: int) -> Dict[str, str]:
@@ -210,6 +749,140 @@ class TeleopService:
         logger.info(f"Session status for bot {bot_id}: {result}")
         return {"status": "success", "session_status": result}
 
+    @handle_ssh_errors("get session events")
+    def get_session_events(self, limit: Optional[int] = None) -> Dict[str, object]:
+        """
+        Get recent session status transitions recorded by the liveness monitor.
+
+        Args:
+            limit: Maximum number of (most recent) transitions to return
+
+        Returns:
+            Dictionary containing status, the transitions and monitor counters
+        """
+        result = self.ssh_client.get_session_events(limit)
+        return {"status": "success", **result}
+
+    @handle_ssh_errors("get phase summary")
+    def get_phase_summary(self, bot_id: Optional[int] = None) -> Dict[str, object]:
+        """
+        Get session-start phase percentiles across the fleet and per bot.
+
+        Args:
+            bot_id: Restrict the summary to this bot
+
+        Returns:
+            Dictionary containing status, per-phase percentiles with the
+            slowest bots, and per-bot attempt counts and percentiles
+        """
+        result = self.ssh_client.get_phase_summary(None if bot_id is None else [bot_id])
+        return {"status": "success", **result}
+
+    @handle_ssh_errors("get phase history")
+    def get_phase_history(self, bot_id: int, limit: Optional[int] = None) -> Dict[str, object]:
+        """
+        Get the recorded session-start attempts of a bot.
+
+        Args:
+            bot_id: Unique identifier for the robot
+            limit: Return only the most recent attempts
+
+        Returns:
+            Dictionary containing status and attempts, oldest first
+        """
+        attempts = self.ssh_client.get_phase_history(bot_id, limit)
+        return {"status": "success", "bot_id": bot_id, "attempts": attempts}
+
+    @handle_ssh_errors("get warm pool stats")
+    def get_pool_stats(self) -> Dict[str, object]:
+        """
+        Get warm session pool metrics.
+
+        Returns:
+            Dictionary containing status and pool hit/miss statistics
+        """
+        result = self.ssh_client.get_pool_stats()
+        return {"status": "success", "pool": result}
+
+    @handle_ssh_errors("get mailbox stats")
+    def get_mailbox_stats(self) -> Dict[str, object]:
+        """
+        Get per-bot movement mailbox counters.
+
+        Returns:
+            Dictionary containing status and posted/delivered/coalesced/dropped
+            movement counts per bot
+        """
+        return {"status": "success", "mailboxes": self.mailbox.stats()}
+
+    @handle_ssh_errors("get writer stats")
+    def get_writer_stats(self) -> Dict[str, object]:
+        """
+        Get per-bot keystroke writer metrics.
+
+        Returns:
+            Dictionary containing status and queue depth, drop counters and
+            write latency per bot
+        """
+        result = self.ssh_client.get_writer_stats()
+        return {"status": "success", "writers": result}
+
+    @handle_ssh_errors("get stop stats")
+    def get_stop_stats(self) -> Dict[str, object]:
+        """
+        Get emergency stop latency histograms.
+
+        Returns:
+            Dictionary containing status and fan-out, write and ack latency
+        """
+        result = self.ssh_client.get_stop_stats()
+        return {"status": "success", "stop": result}
+
+    @handle_ssh_errors("get ack stats")
+    def get_ack_stats(self) -> Dict[str, object]:
+        """
+        Get per-bot console acknowledgement counts and latency.
+
+        Returns:
+            Dictionary containing status and, per bot, acknowledged and lost
+            commands with latency percentiles by command kind
+        """
+        return {"status": "success", "bots": self.ssh_client.get_ack_stats()}
+
+    @handle_ssh_errors("get idempotency stats")
+    def get_idempotency_stats(self) -> Dict[str, object]:
+        """
+        Get Idempotency-Key cache metrics.
+
+        Returns:
+            Dictionary containing status and cache hits, misses, hit rate
+            and size
+        """
+        return {"status": "success", "idempotency": self.idempotency.stats()}
+
+    @handle_ssh_errors("get metrics")
+    def get_metrics(self) -> str:
+        """
+        Get metrics of this process and of the session layer.
+
+        Returns:
+            Prometheus text exposition of HTTP and service-layer latency,
+            and of the session layer (command counts, write and console
+            acknowledgement latency, sessions by state, start phases)
+        """
+        return REGISTRY.render() + self.ssh_client.get_metrics()
+
+    @handle_ssh_errors("get connection stats")
+    def get_connection_stats(self) -> Dict[str, object]:
+        """
+        Get SSH connect-phase latency and multiplexed master statistics.
+
+        Returns:
+            Dictionary containing status and connection statistics
+        """
+        result = self.ssh_client.get_connection_stats()
+        return {"status": "success", "connections": result}
+
     @handle_ssh_errors("list active sessions")
     def list_active_sessions(self) -> Dict[str, str]:
         """
@@ -0,0 +1,77 @@
+"""
+Simulated Fleet Entry Point
+
+Serves simulated bots (App/utils/teleop_CLI_simulator.py) so the API can be
+load tested without robots. Each bot listens where the API expects it,
+``<ip-prefix>.<bot_id + 100>:<port>``; on Linux all of 127.0.0.0/8 is
+loopback, so the default prefix needs no setup:
+
+    python -m App.simulator --bots 1-50 --port 2222 --load-delay 2 --jitter 0.3
+    WEMOIP=127.0.0 WEMOPORT=22 SSH_PORT=2222 SSH_STRICT_HOST_KEYS=0 uvicorn App.main:app
+
+Delays and failure rates default to the SIM_* environment variables (see
+ConsoleProfile.ENV); the flags override them. Keystroke counters of every
+bot are logged on SIGTERM / SIGINT before the process exits.
+"""
+
+import argparse
+import json
+import logging
+import signal
+import sys
+import threading
+from typing import List
+
+from App.utils.teleop_CLI_simulator import ConsoleProfile, SimulatedBot
+
+logger = logging.getLogger(__name__)
+
+
+def parse_bots(spec: str) -> List[int]:
+    """Bot ids from '5', '1-20' or '1,3,10-12'."""
+    bots: List[int] = []
+    for part in spec.split(","):
+        first, _, last = part.strip().partition("-")
+        bots.extend(range(int(first), int(last or first) + 1))
+    return bots
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve simulated bots for load testing")
+    parser.add_argument("--bots", default="1-10", help="bot ids: '1-20', '1,3,10-12' (default: 1-10)")
+    parser.add_argument("--port", type=int, default=2222, help="SSH port of every bot (default: 2222)")
+    parser.add_argument("--ip-prefix", default="127.0.0", help="first three octets, as WEMOIP (default: 127.0.0)")
+    for field in ConsoleProfile.ENV:
+        parser.add_argument(f"--{field.replace('_', '-')}", type=float, dest=field,
+                            help=f"overrides {ConsoleProfile.ENV[field]}")
+    parser.add_argument("--seed", type=int, help="seed for delays and failures, overrides SIM_SEED")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    profile = ConsoleProfile.from_env(**{field: getattr(args, field) for field in (*ConsoleProfile.ENV, "seed")})
+    bots = []
+    try:
+        for bot_id in parse_bots(args.bots):
+            bots.append(SimulatedBot(bot_id, f"{args.ip_prefix}.{bot_id + 100}", args.port, profile).__enter__())
+    except OSError as e:
+        logger.error(f"Could not listen for bot {bot_id}: {e}")
+        for bot in bots:
+            bot.__exit__(None, None, None)
+        return 1
+
+    logger.info(f"Serving {len(bots)} simulated bots on port {args.port} with {profile.as_dict()}")
+    logger.info(f"Point the API at them with WEMOIP={args.ip_prefix} SSH_PORT={args.port} SSH_STRICT_HOST_KEYS=0")
+
+    stop = threading.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda *_: stop.set())
+    stop.wait()
+
+    for bot in bots:
+        bot.__exit__(None, None, None)
+    logger.info("Simulator stopped: " + json.dumps({bot.bot_id: bot.stats() for bot in bots}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
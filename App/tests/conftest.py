@@ -0,0 +1,8 @@
+"""Shared pytest configuration for the App test suite."""
+
+import os
+
+# App.core.config refuses to import without these; give the suite harmless
+# defaults so it also runs without a local .env file.
+os.environ.setdefault("WEMOIP", "10.0.0")
+os.environ.setdefault("WEMOPORT", "22")
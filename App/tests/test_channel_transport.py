@@ -0,0 +1,214 @@
+"""
+Tests for the in-process channel transport.
+
+Sessions run against the paramiko stand-in server used by the benchmarks,
+which emulates the shell and the teleop console.
+"""
+
+import time
+
+import pytest
+
+paramiko = pytest.importorskip("paramiko")
+
+from App.utils.teleop_CLI_channel_SSH_helper import ChannelSSHClient  # noqa: E402
+from App.utils.teleop_CLI_simulator import ConsoleProfile, SimulatedBot  # noqa: E402
+from App.utils.teleop_CLI_SSH_helper import SSHClientError, create_ssh_client  # noqa: E402
+from benchmarks.ssh_standin import SSHStandIn  # noqa: E402
+
+
+def _client(ports, password="robohive", **kwargs):
+    class Client(ChannelSSHClient):
+        def _address(self, bot_id):
+            return "127.0.0.1", ports[bot_id]
+
+    kwargs.setdefault("strict_host_keys", False)
+    return Client(password=password, connect_timeout=5, **kwargs)
+
+
+@pytest.fixture
+def standins():
+    with SSHStandIn(bot_id=1) as first, SSHStandIn(bot_id=2) as second:
+        yield {1: first, 2: second}
+
+
+class TestChannelSSHClient:
+    """Session lifecycle over shell channels."""
+
+    def test_start_send_and_end_session(self, standins):
+        client = _client({bot_id: server.port for bot_id, server in standins.items()})
+        try:
+            assert client.start_session(1) == "Session started successfully"
+            assert client.get_session_status(1) == "Active"
+
+            client.change_speed(1, "increase", wait=True)
+            deadline = time.monotonic() + 5
+            while client.get_speed(1)["linear_speed"] != 0.15 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert client.get_speed(1)["linear_speed"] == 0.15
+
+            report = client._release(1)
+            assert report["released"] and report["exited"]
+            assert client.get_session_status(1) == "No session"
+        finally:
+            client.close()
+
+    def test_teardown_without_a_release_line(self):
+        with SimulatedBot(1, profile=ConsoleProfile(release_line_rate=0)) as bot:
+            client = _client({1: bot.port})
+            try:
+                client.start_session(1)
+
+                report = client._release(1)
+
+                # Confirmed by the shell prompt, within the old 0.9 s of sleeps
+                assert report["released"] and report["exited"]
+                assert report["duration_s"] < 0.9
+                assert bot.stats()["releases"] == 1
+            finally:
+                client.close()
+
+    def test_sessions_to_a_bot_share_one_connection(self, standins):
+        client = _client({bot_id: server.port for bot_id, server in standins.items()})
+        try:
+            client.start_session(1)
+            client.end_session(1)
+            client.start_session(1)
+            client.start_session(2)
+
+            assert standins[1].connections == 1
+            assert standins[2].connections == 1
+            latency = client.get_connection_stats()["connect_latency"]
+            assert latency["fresh"]["count"] == 2
+            assert latency["reused"]["count"] == 1
+        finally:
+            client.close()
+
+    def test_wrong_password_is_reported(self, standins):
+        client = _client({1: standins[1].port}, password="wrong")
+        try:
+            with pytest.raises(SSHClientError, match="Authentication failed"):
+                client.start_session(1)
+            assert client.get_session_status(1) == "No session"
+        finally:
+            client.close()
+
+    def test_lost_channel_is_noticed(self, standins):
+        client = _client({1: standins[1].port})
+        try:
+            client.start_session(1)
+            client._sessions[1].channel.close()
+
+            assert not client._session_alive(1)
+        finally:
+            client.close()
+
+    def test_emergency_stop_releases_every_bot(self, standins):
+        client = _client({bot_id: server.port for bot_id, server in standins.items()})
+        try:
+            client.start_session(1)
+            client.start_session(2)
+            for _ in range(20):
+                client.move(1, "up")
+
+            result = client.emergency_stop(timeout=5)
+
+            assert result["stopped"] == [1, 2]
+            assert result["unacknowledged"] == [] and result["failed"] == {}
+            assert client._monitors[1].wait_for("grabbed", False, timeout=2) is not None
+            assert client.get_session_status(1) == "Active"
+            assert client.get_stop_stats()["ack"]["count"] == 2
+            # Already released: not toggled back on
+            assert client.emergency_stop([1], timeout=1)["stopped"] == [1]
+            assert client.get_stop_stats()["ack"]["count"] == 2
+        finally:
+            client.close()
+
+    def test_emergency_stop_without_a_release_line(self):
+        profile = ConsoleProfile(release_line_rate=0)
+        with SimulatedBot(1, profile=profile) as bot:
+            client = _client({1: bot.port})
+            try:
+                client.start_session(1)
+
+                result = client.emergency_stop(timeout=2)
+
+                assert result["stopped"] == [1] and result["unacknowledged"] == []
+                assert client._monitors[1].state()["grabbed"] is False
+                # Not toggled back on by a second stop
+                assert client.emergency_stop([1], timeout=1)["stopped"] == [1]
+                time.sleep(0.1)
+                assert (bot.stats()["grabs"], bot.stats()["releases"]) == (1, 1)
+            finally:
+                client.close()
+
+    def test_strict_host_keys_checks_known_hosts(self, standins, tmp_path):
+        known_hosts = tmp_path / "known_hosts"
+        name = f"[127.0.0.1]:{standins[1].port}"
+        key = SimulatedBot._shared_host_key
+
+        client = _client({1: standins[1].port}, strict_host_keys=True, known_hosts=str(known_hosts))
+        try:
+            # Unknown host
+            with pytest.raises(SSHClientError, match="not in"):
+                client.start_session(1)
+
+            # Changed key
+            host_keys = paramiko.HostKeys()
+            host_keys.add(name, key.get_name(), paramiko.RSAKey.generate(1024))
+            host_keys.save(str(known_hosts))
+            with pytest.raises(SSHClientError, match="verification failed"):
+                client.start_session(1)
+
+            host_keys = paramiko.HostKeys()
+            host_keys.add(name, key.get_name(), key)
+            host_keys.save(str(known_hosts))
+            assert client.start_session(1) == "Session started successfully"
+        finally:
+            client.close()
+
+    def test_metrics_cover_commands_writes_and_acks(self, standins):
+        client = _client({1: standins[1].port})
+        try:
+            client.start_session(1)
+            client.move(1, "up", wait=True)
+            client.change_speed(1, "increase", wait=True)
+            deadline = time.monotonic() + 5
+            while not client._ack_latency.labels(1, "speed").cumulative()[0][-1] and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            text = client.get_metrics()
+
+            assert 'wemo_ssh_commands_total{bot="1",command="move"} 1' in text
+            assert 'wemo_ssh_write_duration_seconds_count{bot="1",command="speed"} 1' in text
+            assert 'wemo_console_ack_duration_seconds_count{bot="1",command="speed"} 1' in text
+            assert 'wemo_sessions{state="active"} 1' in text
+            assert 'wemo_session_start_phase_duration_seconds_count{bot="1",phase="total"} 1' in text
+        finally:
+            client.close()
+
+    def test_start_attempts_are_kept_in_the_phase_history(self, standins):
+        client = _client({1: standins[1].port})
+        failing = _client({1: standins[1].port}, password="wrong")
+        try:
+            client.start_session(1)
+            with pytest.raises(SSHClientError):
+                failing.start_session(1)
+
+            attempt = client.get_phase_history(1)[-1]
+            assert attempt["outcome"] == "ok" and attempt["source"] == "start"
+            assert [phase["phase"] for phase in attempt["phases"]] == [
+                "connect", "authenticate", "console_launch", "teleoperables", "platform_ready", "grab"]
+            assert client.get_phase_summary()["phases"]["grab"]["count"] == 1
+            assert failing.get_phase_summary()["bots"][1]["failed_in"] == {"connect": 1}
+        finally:
+            client.close()
+            failing.close()
+
+
+class TestCreateSSHClient:
+    """Transport selection from SSH_TRANSPORT."""
+
+    def test_unknown_transport_is_rejected(self):
+        with pytest.raises(ValueError, match="chanel"):
+            create_ssh_client("chanel")
@@ -0,0 +1,249 @@
+"""
+Unit tests for the teleop console output helpers.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from App.utils.teleop_CLI_console import (
+    AckLost, CommandAcks, ConsoleReadiness, ConsoleStateMonitor, PhaseTimer, VirtualScreen,
+)
+
+
+class TestConsoleReadiness:
+    """Incremental detection of the console startup milestones."""
+
+    def test_header_alone_does_not_mean_loaded(self):
+        readiness = ConsoleReadiness()
+        readiness.feed("Available teleoperables:\r\n")
+
+        assert readiness.header_seen
+        assert not readiness.teleoperables_loaded
+
+    def test_entries_split_across_chunks_are_collected(self):
+        readiness = ConsoleReadiness()
+        readiness.feed("Available tele")
+        readiness.feed("operables:\r\n  [0] wemo01")
+        assert not readiness.teleoperables_loaded
+
+        readiness.feed("23\r\n  [1] wemo0124\r\n")
+
+        assert readiness.teleoperables == ["wemo0123", "wemo0124"]
+        assert readiness.teleoperables_loaded
+
+    def test_entries_before_header_are_ignored(self):
+        readiness = ConsoleReadiness()
+        readiness.feed("[0] stale\r\nAvailable teleoperables\r\n")
+
+        assert readiness.teleoperables == []
+
+    def test_platform_ready_marker_without_newline(self):
+        readiness = ConsoleReadiness()
+        readiness.feed("\x1b[2J\x1b[HPlatform ready")
+
+        assert readiness.platform_ready
+
+    def test_press_g_prompt_counts_as_ready(self):
+        readiness = ConsoleReadiness()
+        readiness.feed("Press 'g' to grab control\n")
+
+        assert readiness.platform_ready
+
+
+class TestPhaseTimer:
+    """Per-phase wall-clock accounting."""
+
+    def test_phases_sum_to_total(self):
+        timer = PhaseTimer()
+        time.sleep(0.01)
+        timer.mark("connect")
+        time.sleep(0.02)
+        timer.mark("grab")
+
+        timings = timer.as_dict()
+
+        assert list(timings) == ["connect", "grab", "total"]
+        assert timings["grab"] >= 0.02
+        assert abs(timings["connect"] + timings["grab"] - timings["total"]) < 0.002
+
+
+class TestVirtualScreen:
+    """Screen model driven by console output."""
+
+    def test_text_and_line_breaks(self):
+        screen = VirtualScreen(rows=3, cols=10)
+        screen.feed("one\r\ntwo\r\nthree")
+
+        assert screen.display() == ["one", "two", "three"]
+
+    def test_scrolls_at_bottom(self):
+        screen = VirtualScreen(rows=2, cols=10)
+        screen.feed("a\r\nb\r\nc")
+
+        assert screen.display() == ["b", "c"]
+
+    def test_cursor_positioning_and_erase_in_line(self):
+        screen = VirtualScreen(rows=3, cols=20)
+        screen.feed("status: old value")
+        screen.feed("\x1b[1;9H\x1b[Knew")
+
+        assert screen.line(0) == "status: new"
+
+    def test_relative_moves_save_restore_and_clear(self):
+        screen = VirtualScreen(rows=3, cols=20)
+        screen.feed("ab\x1b7\x1b[2B\x1b[3Cx\x1b8c")
+
+        assert screen.display() == ["abc", "", "     x"]
+
+        screen.feed("\x1b[2J")
+        assert screen.display() == ["", "", ""]
+
+    def test_sequences_split_across_chunks(self):
+        screen = VirtualScreen(rows=3, cols=20)
+        screen.feed("\x1b[")
+        screen.feed("2;")
+        screen.feed("4Hx\x1b[1m\x1b[?25ly")
+
+        assert screen.line(1) == "   xy"
+
+    def test_take_dirty_reports_changed_rows_once(self):
+        screen = VirtualScreen(rows=4, cols=10)
+        screen.feed("\x1b[3;1Hhello")
+
+        assert screen.take_dirty() == [2]
+        assert screen.take_dirty() == []
+
+
+class TestConsoleStateMonitor:
+    """Console state read from the screen and cached."""
+
+    STATUS = "\x1b7\x1b[1;1H\x1b[2KLinear speed limit: {:.3f} m/s   Angular speed limit: {:.3f} rad/s\x1b8"
+
+    def test_unknown_until_displayed(self):
+        snapshot = ConsoleStateMonitor().speed()
+
+        assert snapshot == {"linear_speed": None, "angular_speed": None, "updated_at": None, "age_s": None}
+
+    def test_reads_values_redrawn_in_place(self):
+        monitor = ConsoleStateMonitor()
+        monitor.feed("| WARNING - WATCH OUT FOR MOVING ROBOT\r\n")
+        monitor.feed(self.STATUS.format(0.125, 0.5))
+        monitor.feed(self.STATUS.format(0.15, 0.5))
+
+        snapshot = monitor.speed()
+        assert snapshot["linear_speed"] == 0.15
+        assert snapshot["angular_speed"] == 0.5
+        assert snapshot["updated_at"] is not None
+        assert 0 <= snapshot["age_s"] < 1
+
+    def test_age_grows_while_values_are_not_redrawn(self):
+        monitor = ConsoleStateMonitor()
+        monitor.feed(self.STATUS.format(0.125, 0.5))
+        time.sleep(0.05)
+        monitor.feed("\x1b[5;1Hunrelated output\r\n")
+
+        assert monitor.speed()["age_s"] >= 0.05
+
+    def test_grab_release_and_warnings_are_tracked(self):
+        changes = []
+        monitor = ConsoleStateMonitor(on_change=changes.append)
+
+        monitor.feed("| WARNING - WATCH OUT FOR MOVING ROBOT\r\n")
+        monitor.feed("[WARN] battery low\r\n")
+        monitor.feed("Control released\r\n")
+
+        assert changes == [{"grabbed": True}, {"warning": "[WARN] battery low"}, {"grabbed": False}]
+        assert monitor.state()["grabbed"] is False
+
+    def test_on_change_only_reports_changed_fields(self):
+        changes = []
+        monitor = ConsoleStateMonitor(on_change=changes.append)
+
+        monitor.feed(self.STATUS.format(0.125, 0.5))
+        monitor.feed(self.STATUS.format(0.15, 0.5))
+        monitor.feed(self.STATUS.format(0.15, 0.5))
+
+        assert changes == [{"linear_speed": 0.125, "angular_speed": 0.5}, {"linear_speed": 0.15}]
+
+    def test_wait_for_returns_when_the_value_shows(self):
+        monitor = ConsoleStateMonitor()
+        monitor.feed("| WARNING - WATCH OUT FOR MOVING ROBOT\r\n")
+        timer = threading.Timer(0.05, monitor.feed, args=("Control released\r\n",))
+        timer.start()
+
+        changed_at = monitor.wait_for("grabbed", False, timeout=5)
+
+        assert changed_at is not None and changed_at <= time.monotonic()
+        assert monitor.wait_for("grabbed", True, timeout=0.05) is None
+
+
+def _written():
+    future = Future()
+    future.set_result(None)
+    return future
+
+
+class TestCommandAcks:
+    """Acknowledgement of written commands by console redraws."""
+
+    def test_redraw_after_the_write_acknowledges(self):
+        acks = CommandAcks()
+        write = Future()
+        ack = acks.track(write)
+
+        acks.redrawn({})
+        assert not ack.done()
+
+        write.set_result(None)
+        acks.redrawn({})
+        assert ack.result(timeout=0) >= 0
+        assert acks.pending() == 0
+
+    def test_field_commands_wait_for_their_field(self):
+        acks = CommandAcks()
+        ack = acks.track(_written(), ("linear_speed", "angular_speed"))
+
+        acks.redrawn({"grabbed": True})
+        assert not ack.done()
+
+        acks.redrawn({"angular_speed": 0.5})
+        assert ack.done() and ack.exception() is None
+
+    def test_failed_write_window_and_close_lose_the_ack(self):
+        acks = CommandAcks(window=0)
+        write = Future()
+        failed = acks.track(write)
+        write.set_exception(OSError("broken pipe"))
+        with pytest.raises(AckLost, match="write failed"):
+            failed.result(timeout=0)
+
+        expired = acks.track(Future(), ("grabbed",))
+        acks.redrawn({})
+        with pytest.raises(AckLost, match="no redraw"):
+            expired.result(timeout=0)
+
+        acks = CommandAcks()
+        pending = acks.track(_written(), ("grabbed",))
+        acks.close()
+        for ack in (pending, acks.track(_written())):
+            with pytest.raises(AckLost, match="session closed"):
+                ack.result(timeout=0)
+
+    def test_oldest_commands_are_pushed_out(self):
+        acks = CommandAcks(max_pending=2)
+        first, second, third = (acks.track(_written(), ("grabbed",)) for _ in range(3))
+
+        with pytest.raises(AckLost, match="pushed out"):
+            first.result(timeout=0)
+        assert not second.done() and not third.done()
+
+    def test_monitor_redraws_acknowledge(self):
+        monitor = ConsoleStateMonitor()
+        ack = monitor.acks.track(_written(), ("linear_speed",))
+
+        monitor.feed(TestConsoleStateMonitor.STATUS.format(0.125, 0.5))
+
+        assert ack.done() and ack.exception() is None
@@ -0,0 +1,87 @@
+"""
+Unit tests for the background console drain and its ring buffer.
+"""
+
+import time
+
+import pexpect
+
+from App.utils.teleop_CLI_console_drain import ConsoleDrain, ConsoleRingBuffer
+from App.utils.teleop_CLI_SSH_helper import SSHClient
+
+
+class TestConsoleRingBuffer:
+    """Capacity, accounting and tail formatting."""
+
+    def test_keeps_only_the_most_recent_bytes(self):
+        buffer = ConsoleRingBuffer(capacity=10)
+
+        buffer.append("0123456789")
+        buffer.append("abcde")
+
+        assert buffer.tail(raw=True) == "56789abcde"
+        assert buffer.stats() == {
+            "size_bytes": 10,
+            "capacity_bytes": 10,
+            "high_water_bytes": 10,
+            "total_read_bytes": 15,
+            "dropped_bytes": 5,
+        }
+
+    def test_tail_strips_escape_codes_unless_raw(self):
+        buffer = ConsoleRingBuffer()
+        buffer.append("\x1b[2J\x1b[Hlinear 0.125")
+
+        assert buffer.tail() == "linear 0.125"
+        assert buffer.tail(raw=True).startswith("\x1b[2J")
+        assert buffer.tail(5) == "0.125"
+
+
+class TestConsoleDrain:
+    """The reader thread's lifecycle."""
+
+    def test_reads_until_console_closes(self):
+        chunks = iter(["one ", "", "two", None])
+        drain = ConsoleDrain(1, lambda: next(chunks))
+
+        deadline = time.monotonic() + 5
+        while drain.running and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert not drain.running
+        assert drain.buffer.tail() == "one two"
+
+    def test_stop_ends_the_reader(self):
+        def idle():
+            time.sleep(0.01)
+            return ""
+
+        drain = ConsoleDrain(1, idle)
+        drain.stop()
+
+        assert not drain.running
+
+    def test_read_errors_stop_the_reader(self):
+        def broken():
+            raise OSError("pty gone")
+
+        drain = ConsoleDrain(1, broken)
+        drain.stop()
+
+        assert not drain.running
+
+    def test_drains_a_chatty_console_into_bounded_memory(self):
+        child = pexpect.spawn("yes teleop", encoding="utf-8")
+        drain = ConsoleDrain(1, lambda: SSHClient._read_available(child), capacity=4096)
+        try:
+            deadline = time.monotonic() + 10
+            while drain.buffer.stats()["total_read_bytes"] < 64 * 1024 and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            drain.stop()
+            child.terminate(force=True)
+
+        stats = drain.buffer.stats()
+        assert stats["total_read_bytes"] >= 64 * 1024
+        assert stats["size_bytes"] == 4096
+        assert "teleop\r\nteleop" in drain.buffer.tail(100)
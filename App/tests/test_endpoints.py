@@ -7,19 +7,24 @@ Tests cover successful operations, error handling, and input validation while mo
 all external dependencies including SSH connections.
 """
 
+import asyncio
 import json
+import time
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, Any
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import HTTPException
 
 # Import the FastAPI app and dependencies
 from App.routers.teleop_CLI_endpoints import app, get_teleop_service
-from App.services.teleop_CLI_services import TeleopService
-from App.utils.teleop_CLI_SSH_helper import SSHClientError
+from App.services.teleop_CLI_services import IdempotencyKeyReused, TeleopService, SessionBatch
+from App.utils.teleop_CLI_metrics import REGISTRY
+from App.utils.teleop_CLI_SSH_helper import CommandNotAcknowledged, SessionRecovering, SSHClientError
+from App.utils.teleop_CLI_start_jobs import JobNotFound
 
 
 class TestTeleopEndpointsSuccessful(unittest.TestCase):
@@ -99,7 +104,8 @@ class TestTeleopEndpointsSuccessful(unittest.TestCase):
         json_data = response.json()
         self.assertEqual(json_data, expected_response)
         self.assertIn("status", json_data)
-        self.mock_teleop_service.change_speed.assert_called_once_with(789, "increase")
+        self.mock_teleop_service.change_speed.assert_called_once_with(789, "increase", wait=False, ack=False,
+                                                                      idempotency_key=None)
 
     def test_move_bot_with_valid_direction_succeeds(self):
         """Move bot endpoint should call service with correct direction."""
@@ -118,7 +124,7 @@ class TestTeleopEndpointsSuccessful(unittest.TestCase):
         json_data = response.json()
         self.assertEqual(json_data, expected_response)
         self.assertIn("status", json_data)
-        self.mock_teleop_service.move.assert_called_once_with(111, "up")
+        self.mock_teleop_service.move.assert_called_once_with(111, "up", wait=False, ack=False, idempotency_key=None)
 
     def test_rotate_bot_with_valid_direction_succeeds(self):
         """Rotate bot endpoint should call service with correct direction."""
@@ -137,7 +143,8 @@ class TestTeleopEndpointsSuccessful(unittest.TestCase):
         json_data = response.json()
         self.assertEqual(json_data, expected_response)
         self.assertIn("status", json_data)
-        self.mock_teleop_service.rotate.assert_called_once_with(222, "left")
+        self.mock_teleop_service.rotate.assert_called_once_with(222, "left", wait=False, ack=False,
+                                                                idempotency_key=None)
 
     def test_get_speed_returns_speed_information(self):
         """Get speed endpoint should return speed information."""
@@ -190,14 +197,194 @@ class TestTeleopEndpointsSuccessful(unittest.TestCase):
         self.assertIsInstance(json_data["active_sessions"], list)
         self.mock_teleop_service.list_active_sessions.assert_called_once()
 
+    def test_get_pool_stats_returns_pool_metrics(self):
+        """Pool stats endpoint should return warm pool metrics."""
+        # Arrange
+        expected_response = {"status": "success", "pool": {"hits": 3, "misses": 1, "size": 2}}
+        self.mock_teleop_service.get_pool_stats.return_value = expected_response
+
+        # Act
+        response = self.client.get("/api/pool/stats")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), expected_response)
+        self.mock_teleop_service.get_pool_stats.assert_called_once()
+
+    def test_move_with_wait_passes_wait_to_service(self):
+        """Move endpoint should forward the wait flag to the service."""
+        # Arrange
+        self.mock_teleop_service.move.return_value = {"status": "Command sent successfully"}
+
+        # Act
+        response = self.client.post("/api/move", json={"bot_id": 111, "direction": "up", "wait": True})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.mock_teleop_service.move.assert_called_once_with(111, "up", wait=True, ack=False, idempotency_key=None)
+
+    def test_idempotency_key_header_is_passed_to_service(self):
+        """Move endpoint should forward the Idempotency-Key header to the service."""
+        # Arrange
+        self.mock_teleop_service.move.return_value = {"status": "Movement queued"}
+
+        # Act
+        response = self.client.post("/api/move", json={"bot_id": 111, "direction": "up"},
+                                    headers={"Idempotency-Key": "f3b1c2"})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.mock_teleop_service.move.assert_called_once_with(111, "up", wait=False, ack=False,
+                                                              idempotency_key="f3b1c2")
+
+    def test_get_mailbox_stats_returns_movement_counters(self):
+        """Mailbox stats endpoint should return coalesced/dropped counts per bot."""
+        # Arrange
+        expected_response = {"status": "success", "mailboxes": {"101": {"coalesced": 4, "dropped_stale": 1}}}
+        self.mock_teleop_service.get_mailbox_stats.return_value = expected_response
+
+        # Act
+        response = self.client.get("/api/mailbox/stats")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), expected_response)
+        self.mock_teleop_service.get_mailbox_stats.assert_called_once()
+
+    def test_get_writer_stats_returns_per_bot_metrics(self):
+        """Writer stats endpoint should return queue metrics keyed by bot."""
+        # Arrange
+        expected_response = {"status": "success", "writers": {"101": {"depth": 0, "dropped": 2}}}
+        self.mock_teleop_service.get_writer_stats.return_value = expected_response
+
+        # Act
+        response = self.client.get("/api/writers/stats")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), expected_response)
+        self.mock_teleop_service.get_writer_stats.assert_called_once()
+
+    def test_estop_stops_all_bots_or_the_listed_ones(self):
+        """Estop endpoint should stop every bot without a body, else the listed ones."""
+        # Arrange
+        expected_response = {
+            "status": "success", "stopped": [101], "unacknowledged": [], "failed": {102: "No active session"},
+            "fanout_s": 0.0003, "duration_s": 0.02, "reports": [{"bot_id": 101, "write_s": 0.0001, "ack_s": 0.02}]
+        }
+        self.mock_teleop_service.emergency_stop.return_value = expected_response
+
+        # Act
+        response = self.client.post("/api/estop")
+        listed = self.client.post("/api/estop", json={"bot_ids": [101, 102]})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["stopped"], [101])
+        self.assertEqual(listed.json()["failed"], {"102": "No active session"})
+        self.assertEqual([c.args for c in self.mock_teleop_service.emergency_stop.call_args_list],
+                         [(None,), ([101, 102],)])
+
+    def test_metrics_are_served_as_prometheus_text(self):
+        """Metrics endpoint should serve the exposition text with its content type."""
+        # Arrange
+        self.mock_teleop_service.get_metrics.return_value = 'wemo_sessions{state="active"} 2\n'
+
+        # Act
+        response = self.client.get("/metrics")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        self.assertEqual(response.text, 'wemo_sessions{state="active"} 2\n')
+
+    def test_requests_are_timed_by_route_template(self):
+        """HTTP latency should be labelled with the matched route, not the raw path."""
+        # Arrange
+        self.mock_teleop_service.get_writer_stats.return_value = {"status": "success", "writers": {}}
+
+        # Act
+        self.client.get("/api/writers/stats")
+        self.client.get("/api/no-such-endpoint")
+
+        # Assert
+        text = REGISTRY.render()
+        self.assertIn('wemo_http_request_duration_seconds_count{method="GET",route="/api/writers/stats",status="200"}',
+                      text)
+        self.assertIn('route="unmatched",status="404"', text)
+
+    def test_phase_summary_and_history(self):
+        """Phase endpoints should pass the bot filter and limit through."""
+        # Arrange
+        self.mock_teleop_service.get_phase_summary.return_value = {
+            "status": "success", "per_bot_capacity": 200,
+            "phases": {"connect": {"count": 1, "p50_s": 0.4, "slowest_bots": [{"bot_id": 7, "p50_s": 0.4}]}},
+            "bots": {7: {"attempts": 1, "failures": 0}}
+        }
+        self.mock_teleop_service.get_phase_history.return_value = {"status": "success", "bot_id": 7, "attempts": []}
+
+        # Act
+        summary = self.client.get("/api/sessions/phases?bot_id=7")
+        history = self.client.get("/api/sessions/phases/history?bot_id=7&limit=5")
+
+        # Assert
+        self.assertEqual(summary.status_code, 200)
+        self.assertEqual(summary.json()["bots"], {"7": {"attempts": 1, "failures": 0}})
+        self.mock_teleop_service.get_phase_summary.assert_called_once_with(7)
+        self.assertEqual(history.status_code, 200)
+        self.mock_teleop_service.get_phase_history.assert_called_once_with(7, 5)
+
+    def test_get_connection_stats_returns_connect_latency(self):
+        """Connection stats endpoint should return multiplexing metrics."""
+        # Arrange
+        expected_response = {
+            "status": "success",
+            "connections": {"enabled": True, "connect_latency": {"fresh": {"count": 1}, "reused": {"count": 2}}}
+        }
+        self.mock_teleop_service.get_connection_stats.return_value = expected_response
+
+        # Act
+        response = self.client.get("/api/connections/stats")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), expected_response)
+        self.mock_teleop_service.get_connection_stats.assert_called_once()
+
+    def test_get_session_events_returns_transitions(self):
+        """Session events endpoint should return recorded status transitions."""
+        # Arrange
+        expected_response = {
+            "status": "success",
+            "events": [{"bot_id": 5, "from": "active", "to": "terminated", "reason": "process exited",
+                        "at": "2024-01-01T12:03:10+00:00"}],
+            "monitor": {"interval_s": 2.0, "checks": 12, "statuses": {"terminated": 1}},
+            "recovery": {"started": 1, "recovered": 0, "gave_up": 1, "cancelled": 0, "recovering": {}}
+        }
+        self.mock_teleop_service.get_session_events.return_value = expected_response
+
+        # Act
+        response = self.client.get("/api/sessions/events?limit=1")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), expected_response)
+        self.mock_teleop_service.get_session_events.assert_called_once_with(1)
+
     def test_debug_session_returns_debug_information(self):
         """Debug session endpoint should return comprehensive debug info."""
         # Arrange
         mock_ssh_client = Mock()
         mock_ssh_client.get_session_status.return_value = "active"
         mock_ssh_client.list_active_sessions.return_value = [555]
-        mock_ssh_client._sessions = {555: Mock()}
-        mock_ssh_client._is_alive.return_value = True
+        mock_ssh_client.get_session_process_type.return_value = "spawn"
+        mock_ssh_client.get_session_health.return_value = {
+            "status": "active", "since": "2024-01-01T12:00:00+00:00", "checked_at": "2024-01-01T12:00:02+00:00"
+        }
+        mock_ssh_client.get_console_tail.return_value = "linear 0.125"
+        mock_ssh_client.get_console_buffer_stats.return_value = {
+            "sessions": {555: {"size_bytes": 12, "capacity_bytes": 65536}}, "total_bytes": 12
+        }
 
         self.mock_teleop_service.ssh_client = mock_ssh_client
 
@@ -215,6 +402,10 @@ class TestTeleopEndpointsSuccessful(unittest.TestCase):
         self.assertIn("session_exists_in_sessions", debug_info)
         self.assertIn("all_active_sessions", debug_info)
         self.assertIsInstance(debug_info["all_active_sessions"], list)
+        self.assertEqual(debug_info["console_tail"], "linear 0.125")
+        self.assertEqual(debug_info["console_buffer"]["size_bytes"], 12)
+        self.assertTrue(debug_info["process_alive"])
+        self.assertEqual(debug_info["health"]["status"], "active")
 
 
 class TestTeleopEndpointsErrorHandling(unittest.TestCase):
@@ -246,6 +437,45 @@ class TestTeleopEndpointsErrorHandling(unittest.TestCase):
         self.assertIn("error", json_data)  # Updated for new ErrorResponse model
         self.assertIn("SSH connection failed", json_data["error"])
 
+    def test_commands_during_reconnect_get_retry_after(self):
+        """A session being reconnected should yield 503 with a Retry-After header."""
+        # Arrange
+        self.mock_teleop_service.move.side_effect = SessionRecovering(123, 4.2)
+
+        # Act
+        response = self.client.post("/api/move", json={"bot_id": 123, "direction": "up"})
+
+        # Assert
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "5")
+        self.assertIn("reconnecting", response.text)
+
+    def test_unacknowledged_command_returns_gateway_timeout(self):
+        """A command the console never acknowledged should yield 504."""
+        # Arrange
+        self.mock_teleop_service.rotate.side_effect = CommandNotAcknowledged("no redraw within 2s")
+
+        # Act
+        response = self.client.post("/api/rotate", json={"bot_id": 123, "direction": "left", "ack": True})
+
+        # Assert
+        self.assertEqual(response.status_code, 504)
+        self.assertIn("no redraw", response.text)
+        self.mock_teleop_service.rotate.assert_called_once_with(123, "left", wait=False, ack=True, idempotency_key=None)
+
+    def test_reused_idempotency_key_returns_unprocessable(self):
+        """An Idempotency-Key reused for a different command should yield 422."""
+        # Arrange
+        self.mock_teleop_service.change_speed.side_effect = IdempotencyKeyReused("key already used")
+
+        # Act
+        response = self.client.post("/api/speed", json={"bot_id": 123, "action": "decrease"},
+                                    headers={"Idempotency-Key": "f3b1c2"})
+
+        # Assert
+        self.assertEqual(response.status_code, 422)
+        self.assertIn("already used", response.text)
+
     def test_end_session_handles_generic_exception(self):
         """End session should handle generic exceptions gracefully."""
         # Arrange
@@ -396,6 +626,277 @@ class TestTeleopEndpointsInputValidation(unittest.TestCase):
         self.assertIn(response.status_code, [422, 500])
 
 
+class TestBatchSessionEndpoint(unittest.TestCase):
+    """Test the batch start/end endpoint."""
+
+    def setUp(self):
+        """Set up test client and a service returning a real SessionBatch."""
+        self.client = TestClient(app)
+        self.mock_teleop_service = Mock(spec=TeleopService)
+
+        def operation(bot_id):
+            if bot_id == 13:
+                raise SSHClientError("BOT 13 is currently not active.")
+            return {"status": "Session started successfully"}
+
+        self.mock_teleop_service.batch_sessions.side_effect = \
+            lambda action, bot_ids, cap: SessionBatch(action, operation, bot_ids, cap or 4)
+        app.dependency_overrides[get_teleop_service] = lambda: self.mock_teleop_service
+
+    def tearDown(self):
+        """Clean up dependency overrides."""
+        app.dependency_overrides.clear()
+
+    def test_batch_start_returns_per_bot_results_and_summary(self):
+        """Batch endpoint should report every bot and aggregate stats."""
+        response = self.client.post("/api/sessions/batch", json={
+            "action": "start", "bot_ids": [11, 12, 13], "max_concurrency": 2
+        })
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(sorted(r["bot_id"] for r in data["results"]), [11, 12, 13])
+        failed = [r for r in data["results"] if not r["ok"]]
+        self.assertEqual([r["bot_id"] for r in failed], [13])
+        self.assertIn("not active", failed[0]["error"])
+        self.assertEqual(data["summary"]["succeeded"], 2)
+        self.assertEqual(data["summary"]["failed"], 1)
+        self.assertEqual(data["summary"]["max_concurrency"], 2)
+        self.mock_teleop_service.batch_sessions.assert_called_once_with("start", [11, 12, 13], 2)
+
+    def test_batch_stream_emits_ndjson_results_then_summary(self):
+        """Streaming batch should emit one line per bot then a summary line."""
+        response = self.client.post("/api/sessions/batch?stream=true", json={
+            "action": "end", "bot_ids": [1, 2]
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(sorted(line["bot_id"] for line in lines[:2]), [1, 2])
+        self.assertEqual(lines[2]["summary"]["completed"], 2)
+
+    def test_batch_rejects_invalid_action_and_empty_list(self):
+        """Batch endpoint should validate action and bot_ids."""
+        response = self.client.post("/api/sessions/batch", json={"action": "grab", "bot_ids": [1]})
+        self.assertEqual(response.status_code, 422)
+
+        response = self.client.post("/api/sessions/batch", json={"action": "start", "bot_ids": []})
+        self.assertEqual(response.status_code, 422)
+
+
+class TestTeleopStreamEndpoint(unittest.TestCase):
+    """Test the WebSocket teleop channel."""
+
+    def setUp(self):
+        """Set up test client and mock dependencies."""
+        self.client = TestClient(app)
+        self.mock_teleop_service = Mock(spec=TeleopService)
+        self.mock_teleop_service.stream_command.return_value = "Movement queued"
+        app.dependency_overrides[get_teleop_service] = lambda: self.mock_teleop_service
+
+    def tearDown(self):
+        """Clean up dependency overrides."""
+        app.dependency_overrides.clear()
+
+    def test_frames_with_id_are_acknowledged(self):
+        """Frames carrying an id should get an ack; others should not."""
+        with self.client.websocket_connect("/api/ws/teleop/7") as ws:
+            ws.send_text("move up")
+            ws.send_text("speed increase 2")
+            ack = ws.receive_json()
+
+        self.assertEqual(ack, {"id": "2", "ok": True, "status": "Movement queued"})
+        self.mock_teleop_service.stream_command.assert_any_call(7, "move", "up")
+        self.mock_teleop_service.stream_command.assert_any_call(7, "speed", "increase")
+
+    def test_errors_are_reported_without_closing_the_stream(self):
+        """A failing frame should yield an error frame and keep the socket open."""
+        self.mock_teleop_service.stream_command.side_effect = [
+            SSHClientError("No active session for this bot"), "Movement queued"
+        ]
+
+        with self.client.websocket_connect("/api/ws/teleop/7") as ws:
+            ws.send_text("rotate left")
+            error = ws.receive_json()
+            ws.send_text("rotate left 5")
+            ack = ws.receive_json()
+
+        self.assertEqual(error, {"id": None, "ok": False, "error": "No active session for this bot"})
+        self.assertTrue(ack["ok"])
+
+    def test_reconnecting_session_reports_retry_after(self):
+        """Frames sent while the session reconnects should say when to retry."""
+        self.mock_teleop_service.stream_command.side_effect = SessionRecovering(7, 3.0)
+
+        with self.client.websocket_connect("/api/ws/teleop/7") as ws:
+            ws.send_text("move up 1")
+            error = ws.receive_json()
+
+        self.assertEqual(error["id"], "1")
+        self.assertFalse(error["ok"])
+        self.assertEqual(error["retry_after"], 3.0)
+
+    def test_malformed_frame_is_rejected(self):
+        """Frames that are not '<operation> <argument> [<id>]' should be rejected."""
+        with self.client.websocket_connect("/api/ws/teleop/7") as ws:
+            ws.send_text("up")
+            error = ws.receive_json()
+
+        self.assertFalse(error["ok"])
+        self.mock_teleop_service.stream_command.assert_not_called()
+
+
+class TestTelemetryStreamEndpoint(unittest.TestCase):
+    """Test the server-sent telemetry stream."""
+
+    def setUp(self):
+        """Set up test client and mock dependencies."""
+        self.client = TestClient(app)
+        self.mock_teleop_service = Mock(spec=TeleopService)
+        app.dependency_overrides[get_teleop_service] = lambda: self.mock_teleop_service
+
+    def tearDown(self):
+        """Clean up dependency overrides."""
+        app.dependency_overrides.clear()
+
+    def test_events_are_sent_as_sse(self):
+        """Events should be framed as SSE, with keepalive comments when idle."""
+        subscription = Mock()
+
+        async def events(keepalive=None):
+            yield {"event": "snapshot", "data": {5: {"session": "active"}}}
+            yield None
+            yield {"event": "state", "data": {"bot_id": 5, "linear_speed": 0.15}}
+
+        subscription.events = events
+        self.mock_teleop_service.subscribe_telemetry.return_value = subscription
+
+        response = self.client.get("/api/telemetry/stream?bot_ids=5&bot_ids=6")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        self.assertEqual(response.text,
+                         'event: snapshot\ndata: {"5": {"session": "active"}}\n\n'
+                         ': keepalive\n\n'
+                         'event: state\ndata: {"bot_id": 5, "linear_speed": 0.15}\n\n')
+        self.mock_teleop_service.subscribe_telemetry.assert_called_once_with([5, 6])
+        subscription.close.assert_called_once()
+
+
+class TestJobEndpoints(unittest.TestCase):
+    """Test session starts run as background jobs."""
+
+    def setUp(self):
+        """Set up test client and mock dependencies."""
+        self.client = TestClient(app)
+        self.mock_teleop_service = Mock(spec=TeleopService)
+        app.dependency_overrides[get_teleop_service] = lambda: self.mock_teleop_service
+
+    def tearDown(self):
+        """Clean up dependency overrides."""
+        app.dependency_overrides.clear()
+
+    @staticmethod
+    def _job(state, phase=None):
+        return {"job_id": "abc123", "action": "start_session", "bot_id": 5, "state": state, "phase": phase}
+
+    def test_background_start_is_accepted_with_location(self):
+        """A background start should answer 202 with the job to poll."""
+        self.mock_teleop_service.start_session_job.return_value = {"status": "accepted", "job": self._job("queued")}
+
+        response = self.client.post("/api/startsession", json={"bot_id": 5, "background": True})
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.headers["location"], "/api/jobs/abc123")
+        self.assertEqual(response.json()["job"]["state"], "queued")
+        self.mock_teleop_service.start_session_job.assert_called_once_with(5)
+        self.mock_teleop_service.start_session.assert_not_called()
+
+    def test_get_and_cancel_job(self):
+        """Jobs can be polled and cancelled; unknown jobs are 404."""
+        self.mock_teleop_service.get_job.return_value = {"status": "success", "job": self._job("running", "grab")}
+        self.mock_teleop_service.cancel_job.return_value = {"status": "success", "job": self._job("cancelled")}
+
+        response = self.client.get("/api/jobs/abc123")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["job"]["phase"], "grab")
+
+        response = self.client.delete("/api/jobs/abc123")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["job"]["state"], "cancelled")
+        self.mock_teleop_service.cancel_job.assert_called_once_with("abc123")
+
+        self.mock_teleop_service.get_job.side_effect = JobNotFound("No job nope")
+        response = self.client.get("/api/jobs/nope")
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("No job nope", response.text)
+
+    def test_cancel_does_not_block_other_requests(self):
+        """A cancel waiting on its start should leave the event loop free."""
+        def cancel_job(job_id):
+            time.sleep(0.5)
+            return {"status": "success", "job": self._job("cancelled")}
+
+        self.mock_teleop_service.cancel_job.side_effect = cancel_job
+        self.mock_teleop_service.list_active_sessions.return_value = {"status": "success", "active_sessions": []}
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                cancel = asyncio.ensure_future(client.delete("/api/jobs/abc123"))
+                await asyncio.sleep(0.05)
+                started = time.perf_counter()
+                listed = await client.get("/api/sessions")
+                elapsed = time.perf_counter() - started
+                return (await cancel).status_code, listed.status_code, elapsed
+
+        cancelled, listed, elapsed = asyncio.run(scenario())
+
+        self.assertEqual((cancelled, listed), (200, 200))
+        self.assertLess(elapsed, 0.3)
+
+    def test_foreground_start_does_not_block_other_requests(self):
+        """A start run in the request should leave the event loop free."""
+        def start_session(bot_id):
+            time.sleep(0.5)
+            return {"status": "success", "message": "Session started successfully"}
+
+        self.mock_teleop_service.start_session.side_effect = start_session
+        self.mock_teleop_service.list_active_sessions.return_value = {"status": "success", "active_sessions": []}
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                start = asyncio.ensure_future(client.post("/api/startsession", json={"bot_id": 5}))
+                await asyncio.sleep(0.05)
+                started = time.perf_counter()
+                listed = await client.get("/api/sessions")
+                elapsed = time.perf_counter() - started
+                return (await start).status_code, listed.status_code, elapsed
+
+        started, listed, elapsed = asyncio.run(scenario())
+
+        self.assertEqual((started, listed), (200, 200))
+        self.assertLess(elapsed, 0.3)
+
+    @patch("App.routers.teleop_CLI_endpoints._JOB_EVENTS_POLL", 0)
+    def test_job_events_stream_until_done(self):
+        """Progress events are sent on each change of phase, then a final done event."""
+        self.mock_teleop_service.get_job.side_effect = [
+            {"status": "success", "job": job} for job in (
+                self._job("running", "connect"), self._job("running", "connect"),
+                self._job("running", "grab"), self._job("succeeded"))]
+
+        response = self.client.get("/api/jobs/abc123/events")
+
+        self.assertEqual(response.status_code, 200)
+        events = [block.split("\n")[0] for block in response.text.strip().split("\n\n")]
+        self.assertEqual(events, ["event: progress", "event: progress", "event: done"])
+        self.assertIn('"state": "succeeded"', response.text.strip().split("\n\n")[-1])
+
+
 class TestMainAppConfiguration(unittest.TestCase):
     """Test main application configuration."""
 
@@ -422,6 +923,21 @@ class TestMainAppConfiguration(unittest.TestCase):
         self.assertNotEqual(response.status_code, 404)
 
 
+    def test_main_app_releases_sessions_on_shutdown(self):
+        """Main app lifespan should release every session when the app stops."""
+        from App.main import app as main_app
+        from App.routers import teleop_CLI_endpoints
+        summary = {"released": [1, 2], "unclean": [], "timed_out": [3], "duration_s": 10.0, "reports": []}
+
+        with patch.object(teleop_CLI_endpoints.teleop_service_singleton, "shutdown",
+                          return_value=summary) as shutdown:
+            with TestClient(main_app) as client:
+                client.get("/")
+                shutdown.assert_not_called()
+
+        shutdown.assert_called_once()
+
+
 class TestMiddlewareLogging(unittest.TestCase):
     """Test request logging middleware functionality."""
 
@@ -478,6 +994,7 @@ if __name__ == '__main__':
         TestTeleopEndpointsSuccessful,
         TestTeleopEndpointsErrorHandling,
         TestTeleopEndpointsInputValidation,
+        TestBatchSessionEndpoint,
         TestMainAppConfiguration,
         TestMiddlewareLogging
     ]
@@ -0,0 +1,121 @@
+"""
+Unit tests for Idempotency-Key handling of command retries in TeleopService.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from App.services.teleop_CLI_services import IdempotencyCache, IdempotencyKeyReused, TeleopService
+from App.utils.teleop_CLI_metrics import REGISTRY
+from App.utils.teleop_CLI_SSH_helper import SSHClient, SSHClientError
+
+
+class TestIdempotencyCache:
+    """Replay, expiry and the memory cap."""
+
+    def test_retry_replays_the_first_result(self):
+        cache = IdempotencyCache(ttl=60, max_bytes=1 << 20)
+        operation = Mock(side_effect=["first", "second"])
+
+        assert cache.run("k", ("move", 1, "up"), operation) == "first"
+        assert cache.run("k", ("move", 1, "up"), operation) == "first"
+
+        operation.assert_called_once()
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_key_reused_for_another_command_is_rejected(self):
+        cache = IdempotencyCache(ttl=60, max_bytes=1 << 20)
+        cache.run("k", ("move", 1, "up"), lambda: "ok")
+
+        with pytest.raises(IdempotencyKeyReused):
+            cache.run("k", ("move", 1, "down"), lambda: "ok")
+        assert cache.stats()["conflicts"] == 1
+
+    def test_retry_during_the_original_waits_for_it(self):
+        cache = IdempotencyCache(ttl=60, max_bytes=1 << 20)
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return "written"
+
+        original = threading.Thread(target=cache.run, args=("k", ("speed", 1, "increase"), slow))
+        original.start()
+        while not calls:
+            time.sleep(0.01)
+        threading.Timer(0.05, release.set).start()
+
+        assert cache.run("k", ("speed", 1, "increase"), slow) == "written"
+        original.join(5)
+        assert len(calls) == 1
+        assert cache.stats()["joined"] == 1
+
+    def test_failures_are_not_cached(self):
+        cache = IdempotencyCache(ttl=60, max_bytes=1 << 20)
+        operation = Mock(side_effect=[SSHClientError("broken pipe"), "ok"])
+
+        with pytest.raises(SSHClientError):
+            cache.run("k", ("move", 1, "up"), operation)
+        assert cache.run("k", ("move", 1, "up"), operation) == "ok"
+        assert cache.stats()["failed"] == 1
+
+    def test_entries_expire_and_oldest_are_evicted(self):
+        cache = IdempotencyCache(ttl=0, max_bytes=1 << 20)
+        cache.run("k", ("move", 1, "up"), lambda: "ok")
+        assert cache.stats()["entries"] == 0
+
+        cache = IdempotencyCache(ttl=60, max_bytes=2 * IdempotencyCache.ENTRY_OVERHEAD + 100)
+        for key in ("a", "b", "c"):
+            cache.run(key, ("move", 1, "up"), lambda: "ok")
+
+        stats = cache.stats()
+        assert stats["entries"] == 2 and stats["evicted"] == 1
+        assert stats["bytes"] <= stats["max_bytes"]
+
+
+class TestTeleopServiceIdempotency:
+    """Retried commands do not reach the session again."""
+
+    def test_retried_speed_change_is_sent_once(self):
+        ssh_client = Mock(spec=SSHClient)
+        ssh_client.change_speed.return_value = "Command queued"
+        service = TeleopService(ssh_client)
+
+        for _ in range(3):
+            assert service.change_speed(5, "increase", idempotency_key="abc") == {"status": "Command queued"}
+        service.change_speed(5, "increase")
+
+        assert ssh_client.change_speed.call_count == 2
+        assert service.get_idempotency_stats()["idempotency"]["hits"] == 2
+
+    def test_retried_move_skips_the_session(self):
+        ssh_client = Mock(spec=SSHClient)
+        ssh_client.move.return_value = "Command sent successfully"
+        service = TeleopService(ssh_client)
+
+        assert service.move(5, "up", wait=True, idempotency_key="abc") == {"status": "Command sent successfully"}
+        assert service.move(5, "up", wait=True, idempotency_key="abc") == {"status": "Command sent successfully"}
+
+        ssh_client.move.assert_called_once()
+        ssh_client.require_session.assert_called_once_with(5)
+        with pytest.raises(IdempotencyKeyReused):
+            service.rotate(5, "left", idempotency_key="abc")
+        service.mailbox.close()
+
+    def test_requests_are_counted_once_suffixed(self):
+        ssh_client = Mock(spec=SSHClient)
+        ssh_client.change_speed.return_value = "Command queued"
+        service = TeleopService(ssh_client)
+
+        service.change_speed(5, "increase", idempotency_key="counted")
+
+        exposition = REGISTRY.render()
+        assert "wemo_idempotency_requests_total{" in exposition
+        assert "_total_total" not in exposition
+        service.mailbox.close()
@@ -98,7 +98,7 @@ class TestRouterServiceIntegration:
         assert response_data["status"] == "speed_increased"
 
         # Verify service validation and SSH call
-        self.mock_ssh_client.change_speed.assert_called_once_with(789, "increase")
+        self.mock_ssh_client.change_speed.assert_called_once_with(789, "increase", wait=False, ack=False)
 
     def test_router_service_validation_integration(self):
         """Test that service-layer validation integrates with router error handling."""
@@ -108,7 +108,8 @@ class TestRouterServiceIntegration:
         # Act - This should pass router validation but fail at service level
         response = self.client.post("/api/move", json={
             "bot_id": 111,
-            "direction": "up"  # Valid for router, but service will throw error
+            "direction": "up",  # Valid for router, but service will throw error
+            "wait": True
         })
 
         # Assert
@@ -160,14 +161,14 @@ class TestServiceSSHIntegration:
         self.mock_ssh_client.rotate.return_value = "rotation_executed"
 
         # Act & Assert - Move command
-        move_result = self.teleop_service.move(bot_id, "up")
+        move_result = self.teleop_service.move(bot_id, "up", wait=True)
         assert move_result["status"] == "movement_executed"
-        self.mock_ssh_client.move.assert_called_once_with(bot_id, "up")
+        self.mock_ssh_client.move.assert_called_once_with(bot_id, "up", wait=True, ack=False)
 
         # Act & Assert - Rotate command
-        rotate_result = self.teleop_service.rotate(bot_id, "left")
+        rotate_result = self.teleop_service.rotate(bot_id, "left", wait=True)
         assert rotate_result["status"] == "rotation_executed"
-        self.mock_ssh_client.rotate.assert_called_once_with(bot_id, "left")
+        self.mock_ssh_client.rotate.assert_called_once_with(bot_id, "left", wait=True, ack=False)
 
     def test_service_ssh_error_handling_integration(self):
         """Test error handling integration between service and SSH layers."""
@@ -180,7 +181,7 @@ class TestServiceSSHIntegration:
             self.teleop_service.change_speed(bot_id, "increase")
 
         assert "Robot not responding" in str(exc_info.value)
-        self.mock_ssh_client.change_speed.assert_called_once_with(bot_id, "increase")
+        self.mock_ssh_client.change_speed.assert_called_once_with(bot_id, "increase", wait=False, ack=False)
 
     def test_service_ssh_debug_information_integration(self):
         """Test debug information flow between service and SSH components."""
@@ -189,8 +190,12 @@ class TestServiceSSHIntegration:
         mock_process = Mock()
         self.mock_ssh_client.get_session_status.return_value = "active"
         self.mock_ssh_client.list_active_sessions.return_value = [999, 1000]
-        self.mock_ssh_client._sessions = {999: mock_process}
-        self.mock_ssh_client._is_alive.return_value = True
+        self.mock_ssh_client.get_session_process_type.return_value = type(mock_process).__name__
+        self.mock_ssh_client.get_session_health.return_value = {
+            "status": "active", "since": "2024-01-01T12:00:00+00:00", "checked_at": "2024-01-01T12:00:02+00:00"
+        }
+        self.mock_ssh_client.get_console_tail.return_value = "linear 0.125"
+        self.mock_ssh_client.get_console_buffer_stats.return_value = {"sessions": {}, "total_bytes": 0}
 
         # Create test client with this service
         client = TestClient(router_app)
@@ -209,11 +214,58 @@ class TestServiceSSHIntegration:
             assert debug_data["session_exists_in_sessions"] is True
             assert debug_data["all_active_sessions"] == [999, 1000]
             assert debug_data["process_alive"] is True
+            assert debug_data["console_tail"] == "linear 0.125"
 
         finally:
             router_app.dependency_overrides.clear()
 
 
+class TestBatchSessionIntegration:
+    """
+    Test batch start/end through the real service with a slow mocked SSH client.
+    Verifies bounded parallelism and per-bot error isolation.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_batch_testing(self):
+        """Set up service whose SSH starts take a fixed amount of time."""
+        self.mock_ssh_client = Mock(spec=SSHClient)
+        self.teleop_service = TeleopService(self.mock_ssh_client)
+
+        def slow_start(bot_id):
+            time.sleep(0.2)
+            if bot_id == 4:
+                raise SSHClientError("BOT 4 is currently not active.")
+            return "Session started successfully"
+
+        self.mock_ssh_client.start_session.side_effect = slow_start
+
+    def test_batch_runs_bots_concurrently_up_to_cap(self):
+        """Eight bots with a cap of four should take about two rounds."""
+        batch = self.teleop_service.batch_sessions("start", list(range(1, 9)), max_concurrency=4)
+        results = list(batch)
+        summary = batch.summary()
+
+        assert len(results) == 8
+        assert summary["succeeded"] == 7
+        assert summary["failed"] == 1
+        assert summary["max_concurrency"] == 4
+        assert 0.35 <= summary["wall_clock_s"] < 0.8
+        assert self.mock_ssh_client.start_session.call_count == 8
+
+    def test_batch_deduplicates_bot_ids(self):
+        """The same bot listed twice must only be started once."""
+        results = list(self.teleop_service.batch_sessions("start", [1, 1, 2]))
+
+        assert sorted(r["bot_id"] for r in results) == [1, 2]
+        assert self.mock_ssh_client.start_session.call_count == 2
+
+    def test_batch_rejects_unknown_action(self):
+        """Service validation should reject unknown batch actions."""
+        with pytest.raises(SSHClientError, match="Invalid batch action"):
+            self.teleop_service.batch_sessions("grab", [1])
+
+
 class TestEndToEndWorkflowIntegration:
     """
     Test complete end-to-end workflows that span multiple components.
@@ -262,12 +314,12 @@ class TestEndToEndWorkflowIntegration:
         assert response.json()["status"] == "speed_increased"
 
         # Step 4: Move robot
-        response = self.client.post("/api/move", json={"bot_id": bot_id, "direction": "up"})
+        response = self.client.post("/api/move", json={"bot_id": bot_id, "direction": "up", "wait": True})
         assert response.status_code == 200
         assert response.json()["status"] == "moved_up"
 
         # Step 5: Rotate robot
-        response = self.client.post("/api/rotate", json={"bot_id": bot_id, "direction": "left"})
+        response = self.client.post("/api/rotate", json={"bot_id": bot_id, "direction": "left", "wait": True})
         assert response.status_code == 200
         assert response.json()["status"] == "rotated_left"
 
@@ -316,7 +368,7 @@ class TestEndToEndWorkflowIntegration:
         self.mock_ssh_client.move.side_effect = SSHClientError("Connection timeout")
 
         # Attempt movement - should fail
-        response = self.client.post("/api/move", json={"bot_id": bot_id, "direction": "up"})
+        response = self.client.post("/api/move", json={"bot_id": bot_id, "direction": "up", "wait": True})
         assert response.status_code == 500
         assert "Connection timeout" in response.json()["error"]
 
@@ -463,7 +515,8 @@ class TestDataFlowIntegration:
         # Act
         response = self.client.post("/api/rotate", json={
             "bot_id": 456,
-            "direction": "right"
+            "direction": "right",
+            "wait": True
         })
 
         # Assert
@@ -0,0 +1,197 @@
+"""
+Tests for session starts run as background jobs: lifecycle, progress and
+cancellation, against a mocked SSH client and against a simulated bot.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from App.services.teleop_CLI_services import TeleopService
+from App.utils.teleop_CLI_SSH_helper import SSHClient, SSHClientError, StartCancelled
+from App.utils.teleop_CLI_start_jobs import JobNotFound, StartJobs
+
+
+def _wait_for(jobs, job_id, *states, timeout=5):
+    deadline = time.monotonic() + timeout
+    job = jobs.get(job_id)
+    while job["state"] not in states and time.monotonic() < deadline:
+        time.sleep(0.01)
+        job = jobs.get(job_id)
+    return job
+
+
+def _ssh_client():
+    ssh_client = Mock(spec=SSHClient)
+    ssh_client.get_start_progress.return_value = None
+    ssh_client.get_phase_history.return_value = []
+    return ssh_client
+
+
+class TestStartJobs:
+    """Job states, deduplication and history."""
+
+    def test_job_runs_the_start_and_keeps_its_result(self):
+        ssh_client = _ssh_client()
+        ssh_client.start_session.return_value = "Session started successfully"
+        ssh_client.get_phase_history.return_value = [
+            {"source": "start", "phases": [{"phase": "connect", "start_s": 0.0, "duration_s": 0.2}]}]
+        jobs = StartJobs(ssh_client, max_concurrency=2, history=10)
+
+        job = _wait_for(jobs, jobs.submit(5)["job_id"], "succeeded")
+
+        assert job["status"] == "Session started successfully" and job["error"] is None
+        assert job["phases"] == {"connect": 0.2}
+        ssh_client.start_session.assert_called_once_with(5)
+        jobs.close()
+
+    def test_running_job_reports_its_phase_and_is_reused(self):
+        ssh_client = _ssh_client()
+        release = threading.Event()
+        ssh_client.start_session.side_effect = lambda bot_id: release.wait(5) and "Session started successfully"
+        ssh_client.get_start_progress.return_value = {"phase": "authenticate", "phases": {"connect": 0.1},
+                                                      "elapsed_s": 0.3, "cancelled": False}
+        jobs = StartJobs(ssh_client, max_concurrency=2, history=10)
+        try:
+            first = jobs.submit(5)
+            job = _wait_for(jobs, first["job_id"], "running")
+
+            assert (job["phase"], job["phases"]) == ("authenticate", {"connect": 0.1})
+            assert jobs.submit(5)["job_id"] == first["job_id"]
+        finally:
+            release.set()
+        assert _wait_for(jobs, first["job_id"], "succeeded")["state"] == "succeeded"
+        assert jobs.submit(5)["job_id"] != first["job_id"]
+        jobs.close()
+
+    def test_failed_start_and_forgotten_jobs(self):
+        ssh_client = _ssh_client()
+        ssh_client.start_session.side_effect = SSHClientError("Failed to grab control")
+        jobs = StartJobs(ssh_client, max_concurrency=1, history=1)
+
+        first = _wait_for(jobs, jobs.submit(1)["job_id"], "failed")
+        _wait_for(jobs, jobs.submit(2)["job_id"], "failed")
+
+        assert first["error"] == "Failed to grab control"
+        with pytest.raises(JobNotFound):
+            jobs.get(first["job_id"])
+        jobs.close()
+
+    def test_cancel_queued_and_running_jobs(self):
+        ssh_client = _ssh_client()
+        started, cancelled = threading.Event(), threading.Event()
+
+        def start_session(bot_id):
+            started.set()
+            cancelled.wait(5)
+            raise StartCancelled(f"Session start for bot {bot_id} cancelled")
+
+        ssh_client.start_session.side_effect = start_session
+        ssh_client.cancel_start.side_effect = lambda bot_id: cancelled.set() or True
+        jobs = StartJobs(ssh_client, max_concurrency=1, history=10)
+        running = jobs.submit(1)
+        started.wait(5)
+        queued = jobs.submit(2)
+
+        assert jobs.cancel(queued["job_id"], timeout=5)["state"] == "cancelled"
+        job = jobs.cancel(running["job_id"], timeout=5)
+
+        assert job["state"] == "cancelled" and "cancelled" in job["error"]
+        ssh_client.cancel_start.assert_called_once_with(1)
+        assert ssh_client.start_session.call_count == 1
+        jobs.close()
+
+    def test_start_that_finished_anyway_is_ended(self):
+        ssh_client = _ssh_client()
+        release = threading.Event()
+        ssh_client.start_session.side_effect = lambda bot_id: release.wait(5) and "Session started successfully"
+        ssh_client.cancel_start.side_effect = lambda bot_id: release.set() or False
+        jobs = StartJobs(ssh_client, max_concurrency=1, history=10)
+        job_id = jobs.submit(3)["job_id"]
+        _wait_for(jobs, job_id, "running")
+
+        assert jobs.cancel(job_id, timeout=5)["state"] == "cancelled"
+        ssh_client.end_session.assert_called_once_with(3)
+        jobs.close()
+
+    def test_cancel_leaves_an_already_active_session(self):
+        ssh_client = _ssh_client()
+        release = threading.Event()
+        ssh_client.start_session.side_effect = lambda bot_id: release.wait(5) and "Session already active"
+        ssh_client.cancel_start.side_effect = lambda bot_id: release.set() or False
+        jobs = StartJobs(ssh_client, max_concurrency=1, history=10)
+        job_id = jobs.submit(3)["job_id"]
+        _wait_for(jobs, job_id, "running")
+
+        assert jobs.cancel(job_id, timeout=5)["state"] == "cancelled"
+        ssh_client.end_session.assert_not_called()
+        jobs.close()
+
+    def test_close_waits_for_running_starts(self):
+        ssh_client = _ssh_client()
+        ssh_client.start_session.side_effect = lambda bot_id: time.sleep(0.2) or "Session started successfully"
+        ssh_client.cancel_start.return_value = False
+        jobs = StartJobs(ssh_client, max_concurrency=1, history=10)
+        job_id = jobs.submit(3)["job_id"]
+        _wait_for(jobs, job_id, "running")
+
+        jobs.close(timeout=5)
+
+        # The session the start opened anyway is ended before close returns
+        ssh_client.end_session.assert_called_once_with(3)
+        assert jobs.get(job_id)["state"] == "cancelled"
+
+
+class TestTeleopServiceJobs:
+    """Service entry points for background starts."""
+
+    def test_start_session_job_and_unknown_job(self):
+        ssh_client = _ssh_client()
+        ssh_client.start_session.return_value = "Session started successfully"
+        service = TeleopService(ssh_client)
+
+        result = service.start_session_job(4)
+
+        assert result["status"] == "accepted" and result["job"]["bot_id"] == 4
+        with pytest.raises(JobNotFound):
+            service.get_job("missing")
+        with pytest.raises(JobNotFound):
+            service.cancel_job("missing")
+        service.jobs.close()
+        service.mailbox.close()
+
+
+class TestCancelAgainstSimulatedBot:
+    """A cancelled start closes its console mid-handshake."""
+
+    def test_cancel_during_console_launch(self):
+        pytest.importorskip("paramiko")
+        from App.utils.teleop_CLI_channel_SSH_helper import ChannelSSHClient
+        from App.utils.teleop_CLI_simulator import ConsoleProfile, SimulatedBot
+
+        with SimulatedBot(1, profile=ConsoleProfile(load_delay=3)) as bot:
+            class Client(ChannelSSHClient):
+                def _address(self, bot_id):
+                    return bot.host, bot.port
+
+            client = Client(connect_timeout=5, strict_host_keys=False)
+            service = TeleopService(client)
+            try:
+                job_id = service.start_session_job(1)["job"]["job_id"]
+                deadline = time.monotonic() + 5
+                while service.get_job(job_id)["job"]["phase"] != "teleoperables" and time.monotonic() < deadline:
+                    time.sleep(0.02)
+
+                started = time.monotonic()
+                job = service.cancel_job(job_id)["job"]
+
+                assert job["state"] == "cancelled"
+                assert time.monotonic() - started < 2
+                assert client.get_phase_history(1)[-1]["error"].endswith("cancelled")
+                assert client.list_active_sessions() == {}
+            finally:
+                service.jobs.close()
+                service.mailbox.close()
+                client.close()
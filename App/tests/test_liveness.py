@@ -0,0 +1,88 @@
+"""
+Unit tests for the background session liveness monitor.
+
+Process liveness is a plain dict the tests flip, so checks are driven
+directly with check() except where the monitor thread itself is tested.
+"""
+
+import time
+
+from App.utils.teleop_CLI_liveness import SessionLivenessMonitor
+
+
+class FakeProcesses:
+    def __init__(self):
+        self.alive = {}
+        self.checks = 0
+
+    def is_alive(self, bot_id):
+        self.checks += 1
+        return self.alive.get(bot_id, False)
+
+
+class TestSessionLivenessMonitor:
+    """Cached status, transitions and background checking."""
+
+    def test_status_reads_do_not_check_the_process(self):
+        processes = FakeProcesses()
+        processes.alive[1] = True
+        monitor = SessionLivenessMonitor(processes.is_alive)
+        monitor.mark(1, SessionLivenessMonitor.ACTIVE, "session started")
+
+        for _ in range(100):
+            assert monitor.status(1) == "active"
+
+        assert processes.checks == 0
+        assert monitor.status(2) is None
+
+    def test_dead_session_is_marked_terminated_and_reported(self):
+        processes = FakeProcesses()
+        processes.alive.update({1: True, 2: True})
+        terminated = []
+        transitions = []
+        monitor = SessionLivenessMonitor(processes.is_alive, on_terminated=terminated.append,
+                                         on_transition=lambda bot_id, status: transitions.append((bot_id, status)))
+        monitor.mark(1, SessionLivenessMonitor.ACTIVE, "session started")
+        monitor.mark(2, SessionLivenessMonitor.ACTIVE, "session started")
+
+        processes.alive[2] = False
+        monitor.check()
+        monitor.check()  # terminated sessions are not checked again
+
+        assert monitor.statuses() == {1: "active", 2: "terminated"}
+        assert terminated == [2]
+        assert transitions == [(1, "active"), (2, "active"), (2, "terminated")]
+        assert processes.checks == 3
+        assert monitor.stats()["statuses"] == {"active": 1, "terminated": 1}
+
+    def test_transitions_are_recorded_with_timestamps(self):
+        monitor = SessionLivenessMonitor(lambda bot_id: True, history=2)
+
+        assert monitor.mark(1, SessionLivenessMonitor.ACTIVE, "session started")
+        assert not monitor.mark(1, SessionLivenessMonitor.ACTIVE, "session started")
+        assert monitor.mark(1, SessionLivenessMonitor.ENDED, "session ended")
+        assert not monitor.mark(9, SessionLivenessMonitor.ENDED, "never started")
+        monitor.mark(1, SessionLivenessMonitor.ACTIVE, "session started")
+
+        events = monitor.events()
+        assert [(e["from"], e["to"]) for e in events] == [("active", "ended"), ("ended", "active")]
+        assert events[0]["reason"] == "session ended"
+        assert events[0]["at"].endswith("+00:00")
+        assert monitor.events(limit=1) == events[-1:]
+
+    def test_background_thread_finds_dead_sessions(self):
+        processes = FakeProcesses()
+        processes.alive[1] = True
+        monitor = SessionLivenessMonitor(processes.is_alive, interval=0.01)
+        monitor.mark(1, SessionLivenessMonitor.ACTIVE, "session started")
+        monitor.start()
+        try:
+            processes.alive[1] = False
+            deadline = time.monotonic() + 5
+            while monitor.status(1) == "active" and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            monitor.stop()
+
+        assert monitor.status(1) == "terminated"
+        assert monitor.health(1)["status"] == "terminated"
@@ -0,0 +1,175 @@
+"""
+Unit tests for the queued logging pipeline: formatting, batching, dropping
+when full, file rotation and per-request sampling.
+"""
+
+import contextvars
+import io
+import json
+import logging
+import os
+import threading
+from unittest.mock import Mock
+
+from fastapi.testclient import TestClient
+
+from App.routers.teleop_CLI_endpoints import app, get_teleop_service
+from App.services.teleop_CLI_services import TeleopService
+from App.utils.teleop_CLI_logging import (JSONFormatter, LogPipeline, RequestSampler, RotatingFile, TextFormatter,
+                                          parse_sampling, request_sampler)
+
+
+def _record(message, level=logging.INFO, fields=None):
+    record = logging.LogRecord("API", level, __file__, 1, message, None, None)
+    if fields is not None:
+        record.fields = fields
+    return record
+
+
+class TestFormatters:
+    """Fields are serialised by the formatter, not by the caller."""
+
+    def test_text_appends_fields_as_json(self):
+        line = TextFormatter().format(_record("API Request:", fields={"path": "/api/move", "status_code": 200}))
+
+        assert line.endswith(' - API - INFO - API Request: {"path": "/api/move", "status_code": 200}')
+
+    def test_json_is_one_object_per_record(self):
+        entry = json.loads(JSONFormatter().format(_record("API Request:", logging.WARNING, {"status_code": 404})))
+
+        assert entry["level"] == "WARNING" and entry["logger"] == "API"
+        assert entry["message"] == "API Request:" and entry["status_code"] == 404
+
+
+class TestLogPipeline:
+    """Records are written by the background writer."""
+
+    def test_records_reach_file_and_console_in_order(self, tmp_path):
+        console = io.StringIO()
+        pipeline = LogPipeline(str(tmp_path / "api.log"), TextFormatter(), console).start()
+        logger = logging.getLogger("test.pipeline")
+        logger.addHandler(pipeline.handler)
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        try:
+            for i in range(50):
+                logger.info("move %d", i)
+        finally:
+            pipeline.stop()
+            logger.removeHandler(pipeline.handler)
+
+        lines = (tmp_path / "api.log").read_text().splitlines()
+        assert [line.rsplit(" ", 1)[1] for line in lines] == [str(i) for i in range(50)]
+        assert console.getvalue().splitlines() == lines
+        assert pipeline.stats()["written"] == 50
+
+    def test_full_queue_drops_without_blocking_and_reports_it(self, tmp_path):
+        pipeline = LogPipeline(str(tmp_path / "api.log"), TextFormatter(), queue_size=2)
+        for i in range(5):
+            pipeline.handler.handle(_record(f"move {i}"))
+        pipeline.start().stop()
+
+        text = (tmp_path / "api.log").read_text()
+        assert "3 log records dropped" in text
+        assert "move 1" in text and "move 2" not in text
+        assert pipeline.stats()["dropped"] == 3
+
+
+class TestRotatingFile:
+    """Size and age based rotation with numbered backups."""
+
+    def test_rotates_by_size_keeping_backups(self, tmp_path):
+        path = str(tmp_path / "api.log")
+        log = RotatingFile(path, max_bytes=10, backup_count=2)
+        for text in ("first-line\n", "second-line\n", "third-line\n", "fourth-line\n"):
+            log.write(text)
+        log.close()
+
+        assert open(path).read() == "fourth-line\n"
+        assert open(path + ".1").read() == "third-line\n"
+        assert open(path + ".2").read() == "second-line\n"
+        assert not os.path.exists(path + ".3")
+        assert log.rotations == 3
+
+    def test_rotates_by_age(self, tmp_path):
+        path = str(tmp_path / "api.log")
+        log = RotatingFile(path, interval=1e-6)
+        log.write("old\n")
+        log.write("new\n")
+        log.close()
+
+        assert open(path).read() == "new\n"
+        assert open(path + ".1").read() == "old\n"
+
+
+class TestRequestSampler:
+    """1 in N requests keep their records of a sampled level."""
+
+    def test_parse_sampling(self):
+        assert parse_sampling("INFO=10, debug=0") == {logging.INFO: 10, logging.DEBUG: 0}
+        assert parse_sampling("") == {}
+
+    def test_keeps_every_nth_request_per_level(self):
+        sampler = RequestSampler({logging.INFO: 3})
+        kept = []
+        for i in range(6):
+            token = sampler.sample()
+            kept.append((sampler.filter(_record("move")), sampler.filter(_record("slow", logging.WARNING))))
+            sampler.reset(token)
+
+        assert kept == [(True, True), (False, True), (False, True)] * 2
+        assert sampler.filter(_record("outside a request"))
+        assert sampler.sampled_out == 4
+
+    def test_decision_follows_the_request_into_threads(self):
+        sampler = RequestSampler({logging.INFO: 2})
+        sampler.reset(sampler.sample())
+        token = sampler.sample()
+        context = contextvars.copy_context()
+        sampler.reset(token)
+        result = []
+        thread = threading.Thread(target=context.run,
+                                  args=(lambda: result.append(sampler.filter(_record("move"))),))
+        thread.start()
+        thread.join()
+
+        assert result == [False]
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestLogSamplingMiddleware:
+    """Move requests are sampled as a whole; other requests are not."""
+
+    def test_sampled_out_move_logs_nothing_at_info(self):
+        service = Mock(spec=TeleopService)
+        service.move.return_value = {"status": "Movement queued"}
+        service.list_active_sessions.return_value = {"status": "success", "active_sessions": []}
+        app.dependency_overrides[get_teleop_service] = lambda: service
+        collect = _Collect()
+        collect.addFilter(request_sampler)
+        api = logging.getLogger("API")
+        api.addHandler(collect)
+        level, api.level = api.level, logging.INFO
+        rates, request_sampler.rates = request_sampler.rates, {logging.INFO: 0}
+        try:
+            client = TestClient(app)
+            client.post("/api/move", json={"bot_id": 1, "direction": "up"})
+            moves = len(collect.records)
+            client.get("/api/sessions")
+        finally:
+            request_sampler.rates = rates
+            api.removeHandler(collect)
+            api.setLevel(level)
+            app.dependency_overrides.clear()
+
+        assert moves == 0
+        assert any(record.getMessage() == "API Request:" and record.fields["path"] == "/api/sessions"
+                   for record in collect.records)
@@ -0,0 +1,158 @@
+"""
+Unit tests for the latest-wins movement mailbox in TeleopService.
+
+Delivery is a recording function that can be held on an event to simulate
+a console that is slow to accept writes.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from App.services.teleop_CLI_services import MovementMailbox, TeleopService
+from App.utils.teleop_CLI_SSH_helper import SSHClient, SSHClientError
+
+
+class SlowConsole:
+    def __init__(self):
+        self.delivered = []
+        self.release = threading.Event()
+        self.release.set()
+        self.busy = threading.Event()
+
+    def deliver(self, kind, bot_id, direction):
+        self.busy.set()
+        self.release.wait(5)
+        self.delivered.append((kind, bot_id, direction))
+        return "Command sent successfully"
+
+
+class TestMovementMailbox:
+    """Coalescing, stale dropping and per-bot counters."""
+
+    def test_newer_movement_replaces_one_still_waiting(self):
+        console = SlowConsole()
+        console.release.clear()
+        mailbox = MovementMailbox(console.deliver, stale_after=5)
+
+        first = mailbox.post("move", 1, "up")
+        console.busy.wait(1)  # "up" is being written
+        second = mailbox.post("move", 1, "left")
+        third = mailbox.post("rotate", 1, "right")
+        console.release.set()
+
+        assert first.result(timeout=5) == "Command sent successfully"
+        assert second.result(timeout=5) == MovementMailbox.SUPERSEDED
+        assert third.result(timeout=5) == "Command sent successfully"
+        assert console.delivered == [("move", 1, "up"), ("rotate", 1, "right")]
+        stats = mailbox.stats()[1]
+        assert stats["posted"] == 3
+        assert stats["delivered"] == 2
+        assert stats["coalesced"] == 1
+        mailbox.close()
+
+    def test_movement_waiting_past_stale_after_is_dropped(self):
+        console = SlowConsole()
+        console.release.clear()
+        mailbox = MovementMailbox(console.deliver, stale_after=0.05)
+
+        mailbox.post("move", 1, "up")
+        console.busy.wait(1)
+        stale = mailbox.post("move", 1, "down")
+        time.sleep(0.1)
+        console.release.set()
+
+        assert stale.result(timeout=5) == MovementMailbox.STALE
+        assert console.delivered == [("move", 1, "up")]
+        assert mailbox.stats()[1]["dropped_stale"] == 1
+        mailbox.close()
+
+    def test_bots_are_independent(self):
+        console = SlowConsole()
+        mailbox = MovementMailbox(console.deliver, stale_after=5)
+
+        futures = [mailbox.post("move", bot, "up") for bot in (1, 2, 3)]
+        for future in futures:
+            future.result(timeout=5)
+
+        assert sorted(bot for _, bot, _ in console.delivered) == [1, 2, 3]
+        assert mailbox.stats()[2]["coalesced"] == 0
+        mailbox.close()
+
+    def test_discard_drops_pending_movement(self):
+        console = SlowConsole()
+        console.release.clear()
+        mailbox = MovementMailbox(console.deliver, stale_after=5)
+
+        mailbox.post("move", 1, "up")
+        console.busy.wait(1)
+        pending = mailbox.post("move", 1, "down")
+        mailbox.discard(1)
+        console.release.set()
+
+        assert pending.result(timeout=5) == MovementMailbox.ENDED
+        assert mailbox.stats()[1]["dropped_ended"] == 1
+
+    def test_delivery_errors_fail_the_future(self):
+        def broken(kind, bot_id, direction):
+            raise RuntimeError("console gone")
+
+        mailbox = MovementMailbox(broken, stale_after=5)
+
+        future = mailbox.post("move", 1, "up")
+
+        assert isinstance(future.exception(timeout=5), RuntimeError)
+        assert mailbox.stats()[1]["failed"] == 1
+        mailbox.close()
+
+
+class TestTeleopServiceMovement:
+    """Movement goes through the mailbox; speed changes do not."""
+
+    def test_move_without_wait_returns_once_queued(self):
+        ssh_client = Mock(spec=SSHClient)
+        ssh_client.move.return_value = "Command sent successfully"
+        service = TeleopService(ssh_client)
+
+        assert service.move(5, "up") == {"status": "Movement queued"}
+
+        deadline = time.monotonic() + 5
+        while not ssh_client.move.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        ssh_client.move.assert_called_once_with(5, "up", wait=True, ack=False)
+        service.mailbox.close()
+
+    def test_move_without_session_is_rejected(self):
+        ssh_client = Mock(spec=SSHClient)
+        ssh_client.require_session.side_effect = SSHClientError("No active session for this bot")
+        service = TeleopService(ssh_client)
+
+        with pytest.raises(SSHClientError, match="No active session"):
+            service.move(5, "up")
+        ssh_client.move.assert_not_called()
+
+    def test_change_speed_bypasses_mailbox(self):
+        ssh_client = Mock(spec=SSHClient)
+        ssh_client.change_speed.return_value = "Command queued"
+        service = TeleopService(ssh_client)
+
+        assert service.change_speed(5, "increase") == {"status": "Command queued"}
+        ssh_client.change_speed.assert_called_once_with(5, "increase", wait=False, ack=False)
+        assert service.mailbox.stats() == {}
+
+    def test_stream_command_routes_frames(self):
+        ssh_client = Mock(spec=SSHClient)
+        ssh_client.change_speed.return_value = "Command queued"
+        service = TeleopService(ssh_client)
+
+        assert service.stream_command(5, "rotate", "left") == "Movement queued"
+        assert service.stream_command(5, "speed", "decrease") == "Command queued"
+        with pytest.raises(SSHClientError, match="Invalid operation"):
+            service.stream_command(5, "grab", "now")
+        with pytest.raises(SSHClientError, match="Invalid move direction"):
+            service.stream_command(5, "move", "sideways")
+
+        assert service.mailbox.stats()[5]["posted"] == 1
+        service.mailbox.close()
@@ -0,0 +1,60 @@
+"""
+Unit tests for the bounded session-start phase history.
+"""
+
+import time
+
+from App.utils.teleop_CLI_phase_history import PhaseHistory
+
+PHASES = {"connect": 0.5, "authenticate": 0.25, "console_launch": 1.0, "teleoperables": 20.0,
+          "platform_ready": 2.0, "grab": 0.5}
+
+
+class TestPhaseHistory:
+    """Recording, bounds and percentile summaries."""
+
+    def test_history_keeps_phase_offsets_and_is_bounded(self):
+        history = PhaseHistory(per_bot=3)
+        started = time.time()
+        for attempt in range(5):
+            history.record(1, started + attempt, PHASES)
+
+        attempts = history.history(1)
+
+        assert len(attempts) == 3
+        phases = attempts[-1]["phases"]
+        assert [phase["phase"] for phase in phases] == list(PHASES)
+        assert [phase["start_s"] for phase in phases] == [0.0, 0.5, 0.75, 1.75, 21.75, 23.75]
+        assert attempts[-1]["total_s"] == 24.25
+        assert attempts[-1]["outcome"] == "ok"
+        assert history.history(1, limit=1) == attempts[-1:]
+        assert history.history(2) == []
+
+    def test_summary_ranks_slow_bots_per_phase(self):
+        history = PhaseHistory()
+        for _ in range(4):
+            history.record(1, time.time(), PHASES)
+            history.record(2, time.time(), {**PHASES, "connect": 3.0})
+
+        summary = history.summary()
+
+        connect = summary["phases"]["connect"]
+        assert connect["count"] == 8
+        assert connect["max_s"] == 3.0
+        assert connect["slowest_bots"][0] == {"bot_id": 2, "p50_s": 3.0}
+        assert summary["bots"][1]["phases"]["total"]["p50_s"] == 24.25
+        assert list(history.summary([2])["bots"]) == [2]
+
+    def test_failed_attempts_count_their_failing_phase(self):
+        history = PhaseHistory()
+        history.record(1, time.time(), {"connect": 0.5, "authenticate": 0.25, "console_launch": 15.0},
+                       error="Timeout during session setup")
+        history.record(1, time.time(), PHASES)
+
+        bot = history.summary()["bots"][1]
+
+        assert bot["attempts"] == 2 and bot["failures"] == 1
+        assert bot["failed_in"] == {"console_launch": 1}
+        # Failed attempts do not count towards the total
+        assert bot["phases"]["total"]["count"] == 1
+        assert history.history(1)[0]["error"] == "Timeout during session setup"
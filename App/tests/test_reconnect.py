@@ -0,0 +1,91 @@
+"""
+Unit tests for the background session reconnect supervisor.
+
+Attempts are plain functions that fail a set number of times; backoff is
+kept in the tens of milliseconds so the tests run quickly.
+"""
+
+import threading
+import time
+
+from App.utils.teleop_CLI_reconnect import ReconnectSupervisor
+
+
+class FlakyConnect:
+    def __init__(self, failures):
+        self.failures = failures
+        self.attempted_at = []
+        self.connected = threading.Event()
+
+    def attempt(self, cancelled):
+        self.attempted_at.append(time.monotonic())
+        if len(self.attempted_at) <= self.failures:
+            raise OSError("connection refused")
+        self.connected.set()
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestReconnectSupervisor:
+    """Backoff, giving up, cancellation and retry-after estimates."""
+
+    def test_retries_with_growing_backoff_until_connected(self):
+        supervisor = ReconnectSupervisor(max_attempts=5, initial_backoff=0.05, max_backoff=1)
+        connect = FlakyConnect(failures=2)
+
+        assert supervisor.recover(1, connect.attempt)
+        assert not supervisor.recover(1, connect.attempt)  # already recovering
+        assert connect.connected.wait(5)
+
+        first_gap = connect.attempted_at[1] - connect.attempted_at[0]
+        second_gap = connect.attempted_at[2] - connect.attempted_at[1]
+        assert first_gap >= 0.04
+        assert second_gap > first_gap
+        assert wait_until(lambda: not supervisor.recovering(1))
+        stats = supervisor.stats()
+        assert stats["recovered"] == 1
+        assert stats["recovering"] == {}
+
+    def test_gives_up_after_max_attempts(self):
+        gave_up = []
+        supervisor = ReconnectSupervisor(on_gave_up=lambda bot_id, error: gave_up.append((bot_id, error)),
+                                         max_attempts=3, initial_backoff=0.01)
+        connect = FlakyConnect(failures=10)
+
+        supervisor.recover(2, connect.attempt)
+
+        assert wait_until(lambda: gave_up)
+        assert gave_up == [(2, "connection refused")]
+        assert len(connect.attempted_at) == 3
+        assert supervisor.stats()["gave_up"] == 1
+
+    def test_cancel_stops_further_attempts(self):
+        supervisor = ReconnectSupervisor(max_attempts=5, initial_backoff=10)
+        connect = FlakyConnect(failures=10)
+
+        supervisor.recover(3, connect.attempt)
+        assert wait_until(lambda: connect.attempted_at)
+        assert supervisor.cancel(3)
+        time.sleep(0.05)
+
+        assert len(connect.attempted_at) == 1
+        assert not supervisor.recovering(3)
+        assert supervisor.retry_after(3) is None
+        assert supervisor.stats()["cancelled"] == 1
+
+    def test_retry_after_covers_backoff_and_expected_duration(self):
+        supervisor = ReconnectSupervisor(max_attempts=5, initial_backoff=10, expected_duration=2)
+        connect = FlakyConnect(failures=10)
+
+        supervisor.recover(4, connect.attempt)
+        assert wait_until(lambda: connect.attempted_at)
+        time.sleep(0.02)
+
+        # 10 s backoff (+-20% jitter) plus the expected 2 s attempt
+        assert 9 < supervisor.retry_after(4) <= 14.1
+        supervisor.stop()
@@ -0,0 +1,205 @@
+"""
+Tests for the session broker and the worker-side BrokerClient.
+
+The broker serves a stand-in client over a real Unix socket in a temporary
+directory, so framing, concurrency and error mapping are exercised end to end.
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import httpx
+import pytest
+
+from App.routers.teleop_CLI_endpoints import app, get_teleop_service
+from App.services.teleop_CLI_services import TeleopService
+from App.utils.teleop_CLI_session_broker import BrokerClient, BrokerUnavailable, SessionBroker
+from App.utils.teleop_CLI_SSH_helper import SessionRecovering, SSHClientError
+from App.utils.teleop_CLI_start_jobs import JobNotFound
+from App.utils.teleop_CLI_telemetry import TelemetryHub
+
+
+class StandInClient:
+    """The few SSHClient methods the tests call, with recorded calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.telemetry = TelemetryHub()
+        self.release_start = threading.Event()
+        self.release_status = threading.Event()
+
+    def start_session(self, bot_id):
+        self.release_start.wait(5)
+        return "Session started successfully"
+
+    def get_start_progress(self, bot_id):
+        return None
+
+    def get_phase_history(self, bot_id, limit=None):
+        return []
+
+    def move(self, bot_id, direction, wait=False, ack=False):
+        self.calls.append(("move", bot_id, direction, wait))
+        return "Command sent successfully"
+
+    def list_active_sessions(self):
+        return {1: "Active", 12: "Recovering"}
+
+    def get_session_status(self, bot_id):
+        self.release_status.wait(5)
+        return "active"
+
+    def require_session(self, bot_id):
+        if bot_id == 7:
+            raise SessionRecovering(7, 4.0)
+        raise SSHClientError("No active session for this bot")
+
+    def subscribe_telemetry(self, bot_ids=None):
+        return self.telemetry.subscribe(bot_ids)
+
+
+@pytest.fixture
+def broker(tmp_path):
+    broker = SessionBroker(StandInClient(), str(tmp_path / "broker.sock"), max_workers=4)
+    broker.start()
+    yield broker
+    broker.client.release_start.set()
+    broker.client.release_status.set()
+    broker.stop()
+
+
+class TestSessionBroker:
+    """Calls, errors and streams across the socket."""
+
+    def test_calls_are_forwarded_with_their_arguments(self, broker):
+        client = BrokerClient(broker.path)
+        try:
+            assert client.move(3, "forward", wait=True) == "Command sent successfully"
+            assert broker.client.calls == [("move", 3, "forward", True)]
+            # Bot ids survive the trip as int keys
+            assert client.list_active_sessions() == {1: "Active", 12: "Recovering"}
+        finally:
+            client.close()
+
+    def test_errors_keep_their_type(self, broker):
+        client = BrokerClient(broker.path)
+        try:
+            with pytest.raises(SessionRecovering) as recovering:
+                client.require_session(7)
+            assert recovering.value.retry_after == 4.0
+            with pytest.raises(SSHClientError, match="No active session"):
+                client.require_session(1)
+        finally:
+            client.close()
+
+    def test_socket_is_created_private(self, tmp_path, monkeypatch):
+        # Without the chmod, only the umask at creation keeps other users out
+        monkeypatch.setattr(os, "chmod", lambda *args, **kwargs: None)
+        broker = SessionBroker(StandInClient(), str(tmp_path / "broker.sock"), max_workers=1)
+        broker.start()
+        try:
+            assert os.stat(broker.path).st_mode & 0o077 == 0
+        finally:
+            broker.stop()
+
+    def test_only_public_session_calls_are_served(self, broker):
+        client = BrokerClient(broker.path)
+        try:
+            with pytest.raises(SSHClientError, match="not supported"):
+                client._call("close")
+        finally:
+            client.close()
+
+    def test_slow_call_does_not_hold_up_others(self, broker):
+        client = BrokerClient(broker.path)
+        started = []
+        slow = threading.Thread(target=lambda: started.append(client.start_session(1)))
+        try:
+            slow.start()
+            began = time.monotonic()
+            client.move(2, "left")
+            assert time.monotonic() - began < 1
+            assert started == []
+
+            broker.client.release_start.set()
+            slow.join(5)
+            assert started == ["Session started successfully"]
+        finally:
+            client.close()
+
+    def test_slow_call_does_not_stall_the_api(self, broker):
+        client = BrokerClient(broker.path)
+        app.dependency_overrides[get_teleop_service] = lambda: TeleopService(client)
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                began = time.monotonic()
+                status = asyncio.ensure_future(http.get("/api/session/status", params={"bot_id": 1}))
+                await asyncio.sleep(0.05)
+                root = await http.get("/")
+                elapsed = time.monotonic() - began
+                broker.client.release_status.set()
+                return (await status).json(), root.status_code, elapsed
+
+        try:
+            status, root, elapsed = asyncio.run(scenario())
+        finally:
+            app.dependency_overrides.clear()
+            client.close()
+
+        assert status == {"status": "success", "session_status": "active"}
+        assert root == 200
+        assert elapsed < 0.5
+
+    def test_telemetry_is_relayed(self, broker):
+        client = BrokerClient(broker.path)
+
+        async def first_events():
+            events = client.subscribe_telemetry([4]).events(keepalive=5)
+            snapshot = await events.__anext__()
+            broker.client.telemetry.publish(4, {"grabbed": True})
+            change = await events.__anext__()
+            await events.aclose()
+            return snapshot, change
+
+        snapshot, change = asyncio.run(asyncio.wait_for(first_events(), 5))
+
+        assert snapshot == {"event": "snapshot", "data": {4: {}}}
+        assert change == {"event": "state", "data": {"bot_id": 4, "grabbed": True}}
+
+    def test_unreachable_broker(self, tmp_path):
+        client = BrokerClient(str(tmp_path / "missing.sock"))
+
+        with pytest.raises(BrokerUnavailable):
+            client.move(1, "forward")
+
+    def test_worker_shutdown_leaves_sessions_to_the_broker(self, broker):
+        client = BrokerClient(broker.path)
+        service = TeleopService(client)
+
+        summary = service.shutdown(deadline=1)
+
+        assert summary["released"] == [] and summary["timed_out"] == []
+        assert broker.stats()["calls"] == 0
+
+    def test_jobs_are_shared_by_every_worker(self, broker):
+        first, second = BrokerClient(broker.path), BrokerClient(broker.path)
+        try:
+            job = TeleopService(first).start_session_job(3)["job"]
+            service = TeleopService(second)
+            assert service.get_job(job["job_id"])["job"]["state"] in ("queued", "running")
+
+            broker.client.release_start.set()
+            deadline = time.monotonic() + 5
+            while service.get_job(job["job_id"])["job"]["state"] != "succeeded" and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            assert service.get_job(job["job_id"])["job"]["status"] == "Session started successfully"
+            with pytest.raises(JobNotFound):
+                service.get_job("missing")
+        finally:
+            first.close()
+            second.close()
@@ -0,0 +1,155 @@
+"""
+Unit tests for the warm session pool.
+
+Consoles are plain fake objects so the pool's bookkeeping (hits, misses,
+eviction, health replacement, size cap) is tested without SSH.
+"""
+
+import threading
+import time
+
+from App.utils.teleop_CLI_session_pool import WarmSessionPool
+
+
+class FakeConsole:
+    def __init__(self, bot_id):
+        self.bot_id = bot_id
+        self.healthy = True
+        self.closed = False
+
+
+class ConsoleFactory:
+    def __init__(self, fail_for=()):
+        self.opened = []
+        self.fail_for = set(fail_for)
+        self.lock = threading.Lock()
+
+    def open(self, bot_id):
+        if bot_id in self.fail_for:
+            raise RuntimeError(f"bot {bot_id} unreachable")
+        console = FakeConsole(bot_id)
+        with self.lock:
+            self.opened.append(console)
+        return console
+
+
+def make_pool(factory, bots, **kwargs):
+    return WarmSessionPool(
+        open_console=factory.open,
+        is_healthy=lambda console: console.healthy,
+        close=lambda console: setattr(console, "closed", True),
+        bots=bots,
+        **kwargs,
+    )
+
+
+def fill(pool):
+    """Run a maintenance pass and wait for the scheduled fills."""
+    pool.maintain()
+    deadline = time.monotonic() + 5
+    while pool.stats()["filling"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestWarmSessionPool:
+    """Hit/miss accounting and pool maintenance."""
+
+    def test_checkout_hits_warm_console_and_misses_cold_bot(self):
+        factory = ConsoleFactory()
+        pool = make_pool(factory, [1, 2])
+        fill(pool)
+
+        console = pool.checkout(1)
+        assert console is not None and console.bot_id == 1
+        assert pool.checkout(3) is None
+
+        stats = pool.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert list(stats["warm_bots"]) == [2]
+
+    def test_active_bot_is_not_rewarmed_until_released(self):
+        factory = ConsoleFactory()
+        pool = make_pool(factory, [1])
+        fill(pool)
+        pool.checkout(1)
+
+        fill(pool)
+        assert pool.stats()["size"] == 0
+
+        pool.release(1)
+        fill(pool)
+        assert pool.stats()["size"] == 1
+        assert len(factory.opened) == 2
+
+    def test_size_limit_caps_warm_consoles(self):
+        factory = ConsoleFactory()
+        pool = make_pool(factory, [1, 2, 3, 4], max_size=2)
+        fill(pool)
+
+        assert pool.stats()["size"] == 2
+        assert sorted(c.bot_id for c in factory.opened) == [1, 2]
+
+    def test_idle_consoles_are_evicted_and_stay_cold(self):
+        factory = ConsoleFactory()
+        pool = make_pool(factory, [1], idle_timeout=0.05)
+        fill(pool)
+        time.sleep(0.1)
+
+        fill(pool)
+
+        stats = pool.stats()
+        assert stats["evicted_idle"] == 1
+        assert stats["cold_bots"] == [1]
+        assert stats["size"] == 0
+        assert factory.opened[0].closed
+
+        # Demand re-arms a cold bot.
+        pool.release(1)
+        fill(pool)
+        assert pool.stats()["size"] == 1
+
+    def test_unhealthy_console_is_replaced(self):
+        factory = ConsoleFactory()
+        pool = make_pool(factory, [1])
+        fill(pool)
+        factory.opened[0].healthy = False
+
+        fill(pool)
+
+        assert pool.stats()["evicted_unhealthy"] == 1
+        assert factory.opened[0].closed
+        assert pool.checkout(1) is factory.opened[1]
+
+    def test_unhealthy_console_at_checkout_is_a_miss(self):
+        factory = ConsoleFactory()
+        pool = make_pool(factory, [1])
+        fill(pool)
+        factory.opened[0].healthy = False
+
+        assert pool.checkout(1) is None
+        assert factory.opened[0].closed
+        assert pool.stats()["misses"] == 1
+
+    def test_fill_failures_are_counted(self):
+        factory = ConsoleFactory(fail_for={2})
+        pool = make_pool(factory, [1, 2])
+        fill(pool)
+
+        stats = pool.stats()
+        assert stats["fills"] == 1
+        assert stats["fill_failures"] == 1
+
+    def test_stop_closes_warm_consoles(self):
+        factory = ConsoleFactory()
+        pool = make_pool(factory, [1, 2], health_interval=0.01)
+        pool.start()
+        deadline = time.monotonic() + 5
+        while pool.stats()["size"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        pool.stop()
+
+        assert pool.stats()["size"] == 0
+        assert all(console.closed for console in factory.opened)
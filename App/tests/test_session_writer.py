@@ -0,0 +1,153 @@
+"""
+Unit tests for the per-session keystroke writer.
+
+The console is a plain recording function, optionally blocked on an event
+to simulate a stalled pty.
+"""
+
+import threading
+import time
+
+import pytest
+
+from App.utils.teleop_CLI_session_writer import (LANE_MOTION, LANE_SPEED, LANE_STOP, SessionWriter, WritePreempted,
+                                                 WriterClosed, WriterQueueFull)
+
+
+class RecordingConsole:
+    def __init__(self):
+        self.written = []
+        self.unblocked = threading.Event()
+        self.unblocked.set()
+
+    def write(self, data):
+        self.unblocked.wait(5)
+        self.written.append(data)
+
+
+class TestSessionWriter:
+    """Ordering, back-pressure and accounting."""
+
+    def test_writes_in_submission_order(self):
+        console = RecordingConsole()
+        writer = SessionWriter(1, console.write)
+
+        futures = [writer.submit(str(i)) for i in range(50)]
+        for future in futures:
+            future.result(timeout=5)
+
+        assert console.written == [str(i) for i in range(50)]
+        stats = writer.stats()
+        assert stats["submitted"] == stats["written"] == 50
+        assert stats["write_latency"]["count"] == 50
+        writer.close()
+
+    def test_concurrent_submitters_never_interleave(self):
+        console = RecordingConsole()
+        writer = SessionWriter(1, console.write)
+
+        def submit_many(key):
+            for _ in range(20):
+                writer.submit(key * 5).result(timeout=5)
+
+        threads = [threading.Thread(target=submit_many, args=(k,)) for k in "<>+-"]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(console.written) == 80
+        assert all(len(set(chunk)) == 1 and len(chunk) == 5 for chunk in console.written)
+        writer.close()
+
+    def test_stalled_console_does_not_block_submit_and_drops_when_full(self):
+        console = RecordingConsole()
+        console.unblocked.clear()
+        writer = SessionWriter(1, console.write, max_depth=3)
+
+        first = writer.submit("a")
+        time.sleep(0.05)  # "a" is now stuck in the write
+        started = time.monotonic()
+        for key in "bcd":
+            writer.submit(key)
+        with pytest.raises(WriterQueueFull):
+            writer.submit("e")
+
+        assert time.monotonic() - started < 0.5
+        assert not first.done()
+        stats = writer.stats()
+        assert stats["depth"] == 3
+        assert stats["dropped"] == 1
+
+        console.unblocked.set()
+        first.result(timeout=5)
+        writer.close()
+        assert console.written == ["a", "b", "c", "d"]
+
+    def test_write_errors_fail_the_future_and_are_counted(self):
+        def broken(data):
+            raise OSError("pty closed")
+
+        writer = SessionWriter(1, broken)
+
+        with pytest.raises(OSError):
+            writer.submit("g").result(timeout=5)
+        assert writer.stats()["write_errors"] == 1
+        writer.close()
+
+    def test_close_rejects_new_writes_and_fails_stuck_ones(self):
+        console = RecordingConsole()
+        console.unblocked.clear()
+        writer = SessionWriter(1, console.write)
+        writer.submit("a")
+        time.sleep(0.05)
+        queued = writer.submit("b")
+
+        writer.close(timeout=0.05)
+
+        with pytest.raises(WriterClosed):
+            queued.result(timeout=1)
+        with pytest.raises(WriterClosed):
+            writer.submit("c")
+        console.unblocked.set()
+
+    def test_higher_lanes_are_written_first(self):
+        console = RecordingConsole()
+        console.unblocked.clear()
+        writer = SessionWriter(1, console.write)
+        writer.submit("a")
+        time.sleep(0.05)  # "a" is now stuck in the write
+        writer.submit("m1", lane=LANE_MOTION)
+        writer.submit("s1", lane=LANE_SPEED)
+        writer.submit("m2", lane=LANE_MOTION)
+        last = writer.submit("g", lane=LANE_STOP)
+
+        console.unblocked.set()
+        last.result(timeout=5)
+        writer.close()
+
+        assert console.written == ["a", "g", "s1", "m1", "m2"]
+        assert writer.stats()["queue_wait"][LANE_STOP]["count"] == 1
+
+    def test_preempt_drops_queued_lower_lanes(self):
+        console = RecordingConsole()
+        console.unblocked.clear()
+        writer = SessionWriter(1, console.write, max_depth=2)
+        writer.submit("a")
+        time.sleep(0.05)
+        motion = [writer.submit(key, lane=LANE_MOTION) for key in "ij"]
+        speed = writer.submit("q", lane=LANE_SPEED)
+
+        stop = writer.submit("g", lane=LANE_STOP, preempt=True)
+        # The motion lane was full; the preempt emptied it
+        writer.submit("k", lane=LANE_MOTION)
+        console.unblocked.set()
+
+        stop.result(timeout=5)
+        for future in motion + [speed]:
+            with pytest.raises(WritePreempted):
+                future.result(timeout=5)
+        writer.close()
+
+        assert console.written == ["a", "g", "k"]
+        assert writer.stats()["preempted"] == 3
@@ -0,0 +1,137 @@
+"""
+Tests for the simulated bots used for local load testing.
+
+Sessions are started with the channel transport against SimulatedBot, so
+the console emulation, its profile and its counters are exercised end to end.
+"""
+
+import time
+
+import pytest
+
+pytest.importorskip("paramiko")
+
+from App.simulator import parse_bots  # noqa: E402
+from App.utils.teleop_CLI_channel_SSH_helper import ChannelSSHClient  # noqa: E402
+from App.utils.teleop_CLI_simulator import ConsoleProfile, SimulatedBot  # noqa: E402
+from App.utils.teleop_CLI_SSH_helper import SSHClientError  # noqa: E402
+
+
+def _client(bot):
+    class Client(ChannelSSHClient):
+        def _address(self, bot_id):
+            return bot.host, bot.port
+
+    return Client(connect_timeout=5, strict_host_keys=False)
+
+
+def _wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+
+class TestConsoleProfile:
+    """Profile settings from the environment."""
+
+    def test_from_env_with_overrides(self):
+        profile = ConsoleProfile.from_env({"SIM_LOAD_DELAY": "2", "SIM_DROP_RATE": "0.1", "SIM_SEED": "7"},
+                                          drop_rate=0.5, hang_rate=None)
+
+        assert profile.load_delay == 2.0
+        assert profile.drop_rate == 0.5
+        assert profile.hang_rate == 0.0
+
+    def test_jitter_stays_in_bounds_and_is_repeatable(self):
+        first = ConsoleProfile(jitter=0.2, seed=1)
+        second = ConsoleProfile(jitter=0.2, seed=1)
+
+        delays = [first.delay(1.0) for _ in range(100)]
+
+        assert all(0.8 <= delay <= 1.2 for delay in delays)
+        assert delays == [second.delay(1.0) for _ in range(100)]
+
+    def test_parse_bots(self):
+        assert parse_bots("3") == [3]
+        assert parse_bots("1-3,7") == [1, 2, 3, 7]
+
+
+class TestSimulatedBot:
+    """Sessions against simulated consoles."""
+
+    def test_load_delay_shows_in_the_phase_timings(self):
+        with SimulatedBot(1, profile=ConsoleProfile(load_delay=0.3)) as bot:
+            client = _client(bot)
+            try:
+                assert client.start_session(1) == "Session started successfully"
+                phases = {phase["phase"]: phase["duration_s"]
+                          for phase in client.get_phase_history(1)[-1]["phases"]}
+                assert phases["teleoperables"] >= 0.25
+                assert phases["connect"] < 0.25
+            finally:
+                client.close()
+
+    def test_keystrokes_are_counted(self):
+        with SimulatedBot(1) as bot:
+            client = _client(bot)
+            try:
+                client.start_session(1)
+                client.move(1, "up", wait=True)
+                client.rotate(1, "left", wait=True)
+                client.change_speed(1, "increase", wait=True)
+
+                assert _wait_until(lambda: bot.stats()["speed_changes"] == 1)
+                assert bot.stats()["grabs"] == 1
+                # A move or rotation is five keystrokes
+                assert bot.stats()["moves"] == 5
+                assert bot.stats()["rotations"] == 5
+            finally:
+                client.close()
+
+    def test_grab_failure(self):
+        with SimulatedBot(1, profile=ConsoleProfile(grab_failure_rate=1)) as bot:
+            client = _client(bot)
+            try:
+                with pytest.raises(SSHClientError):
+                    client.start_session(1)
+                assert bot.stats()["grab_failures"] == 1
+            finally:
+                client.close()
+
+    def test_rejected_and_unauthenticated_connections_fail_the_start(self):
+        for profile, counter in ((ConsoleProfile(reject_rate=1), "rejected"),
+                                 (ConsoleProfile(auth_failure_rate=1), None)):
+            with SimulatedBot(1, profile=profile) as bot:
+                client = _client(bot)
+                try:
+                    with pytest.raises(SSHClientError):
+                        client.start_session(1)
+                    assert client.get_phase_summary([1])["bots"][1]["failures"] == 1
+                    if counter:
+                        assert bot.stats()[counter] == 1
+                finally:
+                    client.close()
+
+    def test_dropped_connection(self):
+        with SimulatedBot(1, profile=ConsoleProfile(drop_rate=1, drop_after=0.2)) as bot:
+            client = _client(bot)
+            try:
+                client.start_session(1)
+                assert _wait_until(lambda: bot.stats()["dropped"] == 1)
+            finally:
+                client.close()
+
+    def test_commands_are_acknowledged_by_redraws(self):
+        with SimulatedBot(1) as bot:
+            client = _client(bot)
+            try:
+                client.start_session(1)
+
+                assert client.move(1, "up", ack=True) == "Command acknowledged"
+                assert client.change_speed(1, "increase", ack=True) == "Command acknowledged"
+                commands = client.get_ack_stats()[1]["commands"]
+                assert commands["move"]["acked"] == 1
+                assert commands["speed"]["acked"] == 1
+            finally:
+                client.close()
@@ -0,0 +1,79 @@
+"""
+Unit tests for SSH connection multiplexing.
+
+Master control commands (``ssh -O ...``) are pointed at ``true``/``false``
+so bookkeeping and cleanup are tested without a real SSH server.
+"""
+
+import shlex
+import time
+
+from App.utils.teleop_CLI_ssh_mux import SSHMultiplexer
+
+
+class TestSSHMultiplexer:
+    """Command construction, cleanup and latency statistics."""
+
+    def test_command_enables_control_master(self, tmp_path):
+        mux = SSHMultiplexer(str(tmp_path / "mux"), persist=120)
+
+        argv = shlex.split(mux.command("hive@10.0.0.101"))
+
+        assert argv[:2] == ["ssh", "-tt"]
+        assert argv[-1] == "hive@10.0.0.101"
+        assert "ControlMaster=auto" in argv
+        assert f"ControlPath={tmp_path / 'mux'}/%C" in argv
+        assert "ControlPersist=120" in argv
+        assert (tmp_path / "mux").is_dir()
+
+    def test_disabled_builds_plain_ssh_command(self, tmp_path):
+        mux = SSHMultiplexer(str(tmp_path / "mux"), enabled=False)
+
+        assert mux.command("hive@10.0.0.101") == "ssh -tt hive@10.0.0.101"
+        assert not (tmp_path / "mux").exists()
+        assert mux.master_alive("hive@10.0.0.101") is False
+
+    def test_extra_options_precede_destination(self, tmp_path):
+        mux = SSHMultiplexer(str(tmp_path), enabled=False)
+
+        command = mux.command("hive@host", extra=["-p", "2222"])
+
+        assert command == "ssh -tt -p 2222 hive@host"
+
+    def test_master_alive_reflects_control_check(self, tmp_path):
+        assert SSHMultiplexer(str(tmp_path), ssh_binary="true").master_alive("hive@host")
+        assert not SSHMultiplexer(str(tmp_path), ssh_binary="false").master_alive("hive@host")
+
+    def test_cleanup_closes_only_stale_unused_masters(self, tmp_path):
+        mux = SSHMultiplexer(str(tmp_path), persist=0.05, ssh_binary="true")
+        mux.command("hive@stale")
+        mux.command("hive@busy")
+        time.sleep(0.1)
+        mux.command("hive@fresh")
+
+        closed = mux.cleanup(in_use=["hive@busy"])
+
+        assert closed == ["hive@stale"]
+        assert sorted(mux.stats()["masters_idle_s"]) == ["hive@busy", "hive@fresh"]
+
+    def test_stop_forgets_all_masters(self, tmp_path):
+        mux = SSHMultiplexer(str(tmp_path), ssh_binary="true")
+        mux.start(in_use=lambda: [], interval=0.01)
+        mux.command("hive@a")
+        mux.command("hive@b")
+
+        mux.stop()
+
+        assert mux.stats()["masters_idle_s"] == {}
+
+    def test_stats_split_fresh_and_reused_latency(self, tmp_path):
+        mux = SSHMultiplexer(str(tmp_path))
+        for seconds in (0.4, 0.5, 0.6):
+            mux.record_connect("hive@host", seconds, reused=False)
+        mux.record_connect("hive@host", 0.02, reused=True)
+
+        latency = mux.stats()["connect_latency"]
+
+        assert latency["fresh"] == {"count": 3, "mean_s": 0.5, "p50_s": 0.5, "p95_s": 0.6}
+        assert latency["reused"]["count"] == 1
+        assert latency["reused"]["p50_s"] == 0.02
@@ -0,0 +1,109 @@
+"""
+Unit tests for the telemetry hub that fans console state out to subscribers.
+
+Each test runs its own event loop; publishing happens from the test thread,
+as it does from session drain threads in the service.
+"""
+
+import asyncio
+import threading
+
+from App.utils.teleop_CLI_telemetry import TelemetryHub
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 5))
+
+
+class TestTelemetryHub:
+    """Snapshots, deltas, filtering and lag recovery."""
+
+    def test_snapshot_first_then_only_changed_fields(self):
+        hub = TelemetryHub()
+        hub.publish(1, {"session": "active", "linear_speed": 0.125})
+
+        async def scenario():
+            subscription = hub.subscribe()
+            first = await subscription.get()
+            hub.publish(1, {"linear_speed": 0.125, "angular_speed": 0.5})
+            hub.publish(1, {"linear_speed": 0.125})  # unchanged: no event
+            hub.publish(1, {"linear_speed": 0.15})
+            second = await subscription.get()
+            third = await subscription.get()
+            idle = await subscription.get(timeout=0.05)
+            subscription.close()
+            return first, second, third, idle
+
+        first, second, third, idle = run(scenario())
+
+        assert first == {"event": "snapshot", "data": {1: {"session": "active", "linear_speed": 0.125}}}
+        assert second == {"event": "state", "data": {"bot_id": 1, "angular_speed": 0.5}}
+        assert third == {"event": "state", "data": {"bot_id": 1, "linear_speed": 0.15}}
+        assert idle is None
+
+    def test_subscribers_only_get_the_bots_they_asked_for(self):
+        hub = TelemetryHub()
+
+        async def scenario():
+            subscription = hub.subscribe([2])
+            snapshot = await subscription.get()
+            hub.publish(1, {"grabbed": True})
+            hub.publish(2, {"grabbed": True})
+            event = await subscription.get()
+            subscription.close()
+            return snapshot, event
+
+        snapshot, event = run(scenario())
+
+        assert snapshot["data"] == {2: {}}
+        assert event["data"] == {"bot_id": 2, "grabbed": True}
+
+    def test_publishing_from_another_thread(self):
+        hub = TelemetryHub()
+
+        async def scenario():
+            subscription = hub.subscribe()
+            await subscription.get()
+            threading.Thread(target=hub.publish, args=(3, {"warning": "[WARN] battery low"})).start()
+            event = await subscription.get(timeout=2)
+            subscription.close()
+            return event
+
+        assert run(scenario())["data"] == {"bot_id": 3, "warning": "[WARN] battery low"}
+
+    def test_lagging_subscriber_is_resent_a_snapshot(self):
+        hub = TelemetryHub(max_queue=2)
+
+        async def scenario():
+            subscription = hub.subscribe()
+            for speed in range(10):
+                hub.publish(1, {"linear_speed": speed})
+            await asyncio.sleep(0)  # let the queued hand-offs run
+            event = await subscription.get()
+            subscription.close()
+            return event, subscription.dropped
+
+        event, dropped = run(scenario())
+
+        assert event == {"event": "snapshot", "data": {1: {"linear_speed": 9}}}
+        assert dropped == 1
+
+    def test_close_ends_every_event_stream(self):
+        hub = TelemetryHub()
+
+        async def scenario():
+            subscription = hub.subscribe()
+            received = []
+
+            async def consume():
+                async for event in subscription.events(keepalive=1):
+                    received.append(event)
+
+            consumer = asyncio.ensure_future(consume())
+            await asyncio.sleep(0.01)
+            hub.close()
+            await consumer
+            return received
+
+        assert [event["event"] for event in run(scenario())] == ["snapshot"]
+        assert hub.stats()["subscribers"] == 0
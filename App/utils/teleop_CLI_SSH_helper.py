@@ -4,47 +4,244 @@ It starts an SSH connection, types the password, launches the tele-op
 console, grabs control, and lets other parts of the app send single-
 character commands to move / rotate / change speed.
 
-Uses wexpect for proper interactive terminal handling on Windows.
+Uses wexpect for proper interactive terminal handling on Windows; on POSIX
+hosts the API-compatible pexpect is used instead.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from typing import Dict
-import wexpect
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Dict, Iterable, List, Optional
 
+try:
+    import wexpect
+except ImportError:  # wexpect is Windows-only; pexpect is the POSIX original
+    import pexpect as wexpect  # type: ignore
+
+from App.utils.teleop_CLI_console import AckLost, ConsoleReadiness, ConsoleStateMonitor, PhaseTimer, teardown_summary
+from App.utils.teleop_CLI_console_drain import ConsoleDrain
+from App.utils.teleop_CLI_liveness import SessionLivenessMonitor
+from App.utils.teleop_CLI_metrics import MetricsRegistry
+from App.utils.teleop_CLI_phase_history import PhaseHistory
+from App.utils.teleop_CLI_reconnect import ReconnectSupervisor
+from App.utils.teleop_CLI_session_pool import WarmSessionPool
+from App.utils.teleop_CLI_session_writer import (LANE_MOTION, LANE_SPEED, LANE_STOP, SessionWriter, WritePreempted,
+                                                 WriterClosed, WriterQueueFull)
+from App.utils.teleop_CLI_ssh_mux import SSHMultiplexer
+from App.utils.teleop_CLI_telemetry import TelemetryHub, TelemetrySubscription
 
 try:
     from App.core.config import WEMOIP, WEMOPORT  # type: ignore
 except ImportError as exc:
     raise RuntimeError("Failed to import WEMOIP / WEMOPORT from App.core.config") from exc
 
+from App.core.config import (ACK_TIMEOUT, CONSOLE_BUFFER_SIZE, ESTOP_ACK_TIMEOUT, LIVENESS_HISTORY, LIVENESS_INTERVAL,
+                             PHASE_HISTORY_SIZE, RECONNECT_BACKOFF_INITIAL, RECONNECT_BACKOFF_MAX, RECONNECT_ENABLED,
+                             RECONNECT_MAX_ATTEMPTS, SSH_CONTROL_DIR, SSH_CONTROL_PERSIST, SSH_MULTIPLEX, SSH_PORT,
+                             SSH_STRICT_HOST_KEYS, SSH_TRANSPORT, TELEMETRY_QUEUE_DEPTH, WARM_POOL_BOTS,
+                             WARM_POOL_HEALTH_INTERVAL, WARM_POOL_IDLE_TIMEOUT, WARM_POOL_SIZE, WRITE_TIMEOUT,
+                             WRITER_QUEUE_DEPTH)
+
 logger = logging.getLogger("SSH")
 
+# Upper bounds (seconds) of the start-session phase histogram buckets
+_PHASE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Matches whatever output is currently buffered; used to read incrementally.
+_ANY_OUTPUT = r"[\s\S]+"
+
+
+def _ssh_options() -> List[str]:
+    """ssh arguments for the configured port and host key checking."""
+    options = [] if SSH_PORT == 22 else ["-p", str(SSH_PORT)]
+    if not SSH_STRICT_HOST_KEYS:
+        options += ["-o", "StrictHostKeyChecking=no", "-o", "UserKnownHostsFile=/dev/null", "-o", "LogLevel=ERROR"]
+    return options
+
 
 class SSHClientError(Exception):
     """Errors raised by SSHClient."""
 
 
+class CommandNotAcknowledged(SSHClientError):
+    """The console did not show that a command took effect in time."""
+
+
+class StartCancelled(SSHClientError):
+    """A session start was cancelled before it completed."""
+
+
+class _StartAttempt(PhaseTimer):
+    """
+    Phase timer of a start_session in flight, which can be cancelled.
+
+    cancel() closes the console being set up, so a handshake blocked on the
+    bot fails at once; a cancel before the console exists takes effect as
+    soon as it is attached.  Once complete() has run the start can no
+    longer be cancelled.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancelled = False
+        self._done = False
+        self._child: Optional[wexpect.spawn] = None
+        self._lock = threading.Lock()
+
+    def attach(self, child: wexpect.spawn) -> None:
+        """Register the console being set up (closing it if already cancelled)."""
+        with self._lock:
+            self._child = child
+            cancelled = self.cancelled
+        if cancelled:
+            SSHClient._close_child(child)
+            raise StartCancelled("Session start cancelled")
+
+    def cancel(self) -> bool:
+        """Stop the start; False if it already completed."""
+        with self._lock:
+            if self._done:
+                return False
+            self.cancelled = True
+            child = self._child
+        if child is not None:
+            SSHClient._close_child(child)
+        return True
+
+    def complete(self) -> bool:
+        """Make the start uncancellable; False if it was cancelled first."""
+        with self._lock:
+            self._done = True
+            return not self.cancelled
+
+
+class SessionRecovering(SSHClientError):
+    """The bot's session was lost and is being reconnected; retry later."""
+
+    def __init__(self, bot_id: int, retry_after: float) -> None:
+        super().__init__(f"Session for bot {bot_id} is reconnecting; retry in {retry_after:.0f}s")
+        self.bot_id = bot_id
+        self.retry_after = retry_after
+
+
 class SSHClient:
     """SSH client wrapper using wexpect for interactive sessions."""
 
+    # Upper bounds for the console readiness waits (formerly fixed sleeps).
+    TELEOPERABLE_LOAD_TIMEOUT = 10.0
+    PLATFORM_READY_TIMEOUT = 5.0
+    # Upper bound for each teardown step's acknowledgement: the 0.3 s each
+    # step used to sleep, so teardown is never slower than it was
+    TEARDOWN_STEP_TIMEOUT = 0.3
+    # Release line some consoles print (not seen in captured output, so it
+    # only ends the release step early; the shell prompt also confirms it)
+    RELEASE_ACK = "Control released"
+    # Sessions live in this process (a BrokerClient forwards to the broker's)
+    owns_sessions = True
+
     def __init__(self) -> None:
         if not WEMOIP or not WEMOPORT:
             raise SSHClientError("WEMOIP / WEMOPORT not configured")
 
         # bot_id -> wexpect spawn object
         self._sessions: Dict[int, wexpect.spawn] = {}
+        # bot_id -> writer thread owning all keystrokes sent to that session
+        self._writers: Dict[int, SessionWriter] = {}
+        # bot_id -> reader keeping the console's pty drained
+        self._drains: Dict[int, ConsoleDrain] = {}
+        # bot_id -> state parsed from the drained console screen
+        self._monitors: Dict[int, ConsoleStateMonitor] = {}
+        # bot_id -> phase durations (seconds) of the last successful start
+        self._phase_timings: Dict[int, Dict[str, float]] = {}
+        # Every start, reconnect and warm-pool fill attempt, failed ones included
+        self._phase_history = PhaseHistory(per_bot=PHASE_HISTORY_SIZE)
+        # bot_id -> start_session in progress, for progress reports and cancellation
+        self._starts: Dict[int, _StartAttempt] = {}
+        self._starts_lock = threading.Lock()
+        # Session-layer metrics in the Prometheus format, served by /metrics
+        self.metrics = MetricsRegistry()
+        self._commands = self.metrics.counter(
+            "wemo_ssh_commands", "Commands queued to bot consoles", ("bot", "command"))
+        self._write_latency = self.metrics.histogram(
+            "wemo_ssh_write_duration_seconds", "Time from queueing a command until it is written to the console",
+            ("bot", "command"))
+        self._ack_latency = self.metrics.histogram(
+            "wemo_console_ack_duration_seconds", "Time from queueing a command until the console shows its effect",
+            ("bot", "command"))
+        self._acks = self.metrics.counter(
+            "wemo_console_acks", "Commands acknowledged by the console, or whose acknowledgement was lost",
+            ("bot", "command", "outcome"))
+        self._start_phases = self.metrics.histogram(
+            "wemo_session_start_phase_duration_seconds", "Duration of each phase of a session start",
+            ("bot", "phase"), buckets=_PHASE_BUCKETS)
+        # Emergency stop path: enqueueing the stop for every bot, and per bot
+        # the time until the stop is written and until the release shows
+        self._stop_latency = self.metrics.histogram(
+            "wemo_estop_duration_seconds", "Emergency stop fan-out, write and acknowledgement time", ("stage",))
+        self.metrics.gauge("wemo_sessions", "Sessions by state", ("state",), self._session_counts)
+        # Console state changes, fanned out to telemetry subscribers
+        self.telemetry = TelemetryHub(max_queue=TELEMETRY_QUEUE_DEPTH)
+        # Reconnects sessions whose console died; the lock keeps a cancelled
+        # recovery from installing a session after end_session
+        self._recovery = ReconnectSupervisor(
+            on_gave_up=self._recovery_gave_up,
+            max_attempts=RECONNECT_MAX_ATTEMPTS,
+            initial_backoff=RECONNECT_BACKOFF_INITIAL,
+            max_backoff=RECONNECT_BACKOFF_MAX,
+        )
+        self._recovery_lock = threading.Lock()
+        # Cached session status, refreshed in the background instead of per request
+        self._liveness = SessionLivenessMonitor(
+            is_alive=self._session_alive,
+            on_terminated=lambda bot_id: self._session_lost(bot_id, "process exited"),
+            on_transition=lambda bot_id, status: self.telemetry.publish(bot_id, {"session": status}),
+            interval=LIVENESS_INTERVAL,
+            history=LIVENESS_HISTORY,
+        )
+        self._liveness.start()
+
+        # Reuses authenticated master connections across sessions to a bot
+        self._mux = SSHMultiplexer(SSH_CONTROL_DIR, persist=SSH_CONTROL_PERSIST, enabled=SSH_MULTIPLEX,
+                                   ssh_options=_ssh_options())
+        self._mux.start(in_use=self._destinations_in_use)
+
+        # Consoles kept logged in and platform-ready for configured bots
+        self._pool = WarmSessionPool(
+            open_console=self._fill_console,
+            is_healthy=self._console_healthy,
+            close=self._close_child,
+            bots=WARM_POOL_BOTS,
+            max_size=WARM_POOL_SIZE,
+            idle_timeout=WARM_POOL_IDLE_TIMEOUT,
+            health_interval=WARM_POOL_HEALTH_INTERVAL,
+        )
+        self._pool.start()
 
     # --------------------------------------------------------------
     # Internal helpers
     # --------------------------------------------------------------
+    @staticmethod
+    def _destination(bot_id: int) -> str:
+        return f"hive@{WEMOIP}.{bot_id + 100}"
+
+    def _destinations_in_use(self):
+        """Destinations with a live session or warm console on their master."""
+        bots = set(self._sessions) | set(self._pool.warm_bots())
+        return [self._destination(bot_id) for bot_id in bots]
+
     @staticmethod
     def _is_alive(child: wexpect.spawn) -> bool:
         """Check if the wexpect session is still running."""
         return child.isalive()
 
+    def _session_alive(self, bot_id: int) -> bool:
+        child = self._sessions.get(bot_id)
+        return child is not None and self._is_alive(child)
+
     @staticmethod
     def _safe_write(child: wexpect.spawn, data: str) -> None:
         """Write data to the session."""
@@ -53,133 +250,588 @@ class SSHClient:
         except Exception as exc:
             raise SSHClientError(f"Failed to send data: {exc}")
 
-    # --------------------------------------------------------------
-    # Public API
-    # --------------------------------------------------------------
-    def start_session(self, bot_id: int) -> str:
-        if bot_id in self._sessions and self._is_alive(self._sessions[bot_id]):
-            return "Session already active"
+    @staticmethod
+    def _await_console(child: wexpect.spawn, readiness: ConsoleReadiness, condition, timeout: float) -> bool:
+        """Feed console output into *readiness* until *condition()* holds.
 
-        ssh_cmd = f"ssh -tt hive@{WEMOIP}.{bot_id + 100}"
-        logger.info("Starting SSH for bot %s: %s", bot_id, ssh_cmd)
+        Returns False when *timeout* expires first; callers then carry on as
+        the old fixed sleeps did.
+        """
+        deadline = time.monotonic() + timeout
+        while not condition():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            index = child.expect([_ANY_OUTPUT, wexpect.TIMEOUT], timeout=min(remaining, 0.5))
+            if index == 0:
+                readiness.feed(child.after)
+        return True
 
+    @staticmethod
+    def _read_available(child: wexpect.spawn, timeout: float = 0.2):
+        """Whatever output arrives within *timeout* ("" if none); None at EOF."""
         try:
-            child = wexpect.spawn(ssh_cmd, timeout=30)
-            logger.debug(f"SSH session spawned for bot {bot_id}")
+            index = child.expect([_ANY_OUTPUT, wexpect.TIMEOUT], timeout=timeout)
+        except wexpect.EOF:
+            return None
+        return child.after if index == 0 else ""
+
+    def _spawn_console(self, bot_id: int, destination: str) -> wexpect.spawn:
+        """Start an interactive login to *destination*: one ssh child per session."""
+        ssh_cmd = self._mux.command(destination)
+        logger.info("Starting SSH for bot %s: %s", bot_id, ssh_cmd)
+        return wexpect.spawn(ssh_cmd, timeout=30, encoding="utf-8")
+
+    def _open_console(self, bot_id: int, timer: PhaseTimer) -> wexpect.spawn:
+        """Log in to *bot_id* and bring the teleop console up to platform-ready.
+
+        Everything start_session does short of grabbing control; also used to
+        fill the warm pool.  The child is terminated if any step fails.
 
+        When the multiplexed master for the bot is still up, ssh lands
+        straight at the shell prompt and the password step is skipped.
+        """
+        destination = self._destination(bot_id)
+        shell_prompt = f"hive@wemo{bot_id:04d}:~"
+
+        readiness = ConsoleReadiness()
+        child = self._spawn_console(bot_id, destination)
+        logger.debug(f"SSH session spawned for bot {bot_id}")
+        try:
+            if isinstance(timer, _StartAttempt):
+                timer.attach(child)
             # Wait for password prompt
             patterns = [
-                f"hive@{WEMOIP}.{bot_id + 100}'s password: ",
+                f"{destination}'s password: ",
                 "Permission denied",
-                wexpect.TIMEOUT
+                wexpect.TIMEOUT,
+                shell_prompt,
             ]
             index = child.expect(patterns, timeout=30)
             if index == 1:
                 raise SSHClientError("SSH connection rejected - permission denied before password")
             elif index == 2:
                 logger.error(f"Timeout waiting for password prompt for bot {bot_id}")
-                if child.isalive():
-                    child.terminate()
                 raise SSHClientError(f"BOT {bot_id} is currently not active.")
+            reused = index == 3
+            timer.mark("connect")
 
-            # Send password
-            child.sendline("robohive")
+            if not reused:
+                # Send password
+                child.sendline("robohive")
 
-            # Wait for authentication result
-            index = child.expect([
-                "Permission denied, please try again.",
-                "Welcome to Ubuntu",
-                f"hive@wemo{bot_id:04d}:~"
-            ], timeout=10)
+                # Wait for authentication result
+                index = child.expect([
+                    "Permission denied, please try again.",
+                    "Welcome to Ubuntu",
+                    shell_prompt
+                ], timeout=10)
 
-            if index == 0:
-                raise SSHClientError("Authentication failed - incorrect password")
-            elif index == 1:
-                # Got welcome message, now wait for shell prompt
-                child.expect(f"hive@wemo{bot_id:04d}:~", timeout=10)
+                if index == 0:
+                    raise SSHClientError("Authentication failed - incorrect password")
+                elif index == 1:
+                    # Got welcome message, now wait for shell prompt
+                    child.expect(shell_prompt, timeout=10)
+            timer.mark("authenticate")
+            self._mux.record_connect(destination, timer.total, reused)
 
             # Launch teleop console
             child.sendline("robohive_keyboard_teleop_console")
 
             # Wait for teleop interface
             child.expect("Available teleoperables", timeout=15)
+            readiness.feed(child.after)
+            timer.mark("console_launch")
 
             # Wait for robots to load before selecting
-            time.sleep(10)
+            if not self._await_console(child, readiness, lambda: readiness.teleoperables_loaded,
+                                       self.TELEOPERABLE_LOAD_TIMEOUT):
+                logger.warning("Bot %s: teleoperables list not seen after %.0fs, selecting anyway",
+                               bot_id, self.TELEOPERABLE_LOAD_TIMEOUT)
+            timer.mark("teleoperables")
 
             # Select default robot (press ENTER)
             child.sendline("")
 
             # Wait for platform to be ready
-            time.sleep(5)
+            if not self._await_console(child, readiness, lambda: readiness.platform_ready,
+                                       self.PLATFORM_READY_TIMEOUT):
+                logger.warning("Bot %s: no platform-ready marker after %.0fs, grabbing anyway",
+                               bot_id, self.PLATFORM_READY_TIMEOUT)
+            timer.mark("platform_ready")
+        except BaseException:
+            if child.isalive():
+                child.terminate()
+            raise
+        return child
 
-            # Grab control
-            child.send("g")
+    @staticmethod
+    def _grab(child: wexpect.spawn) -> None:
+        """Grab control on a platform-ready console."""
+        child.send("g")
 
-            # Wait for control to be grabbed and final warning
-            try:
-                child.expect(r"| WARNING - WATCH OUT FOR MOVING ROBOT", timeout=10)
-            except wexpect.TIMEOUT:
-                logger.error("Grabbing failed: Another operator is probably using the bot")
-                if child.isalive():
-                    child.terminate()
-                raise SSHClientError("Grabbing failed: Another operator is probably using the bot")
+        # Wait for control to be grabbed and final warning
+        try:
+            child.expect(r"\| WARNING - WATCH OUT FOR MOVING ROBOT", timeout=10)
+        except wexpect.TIMEOUT:
+            logger.error("Grabbing failed: Another operator is probably using the bot")
+            raise SSHClientError("Grabbing failed: Another operator is probably using the bot")
+
+    def _console_healthy(self, child: wexpect.spawn) -> bool:
+        """Health check for a warm console: alive, and its pending output drained."""
+        if not child.isalive():
+            return False
+        try:
+            child.expect([_ANY_OUTPUT, wexpect.TIMEOUT], timeout=0)
+        except wexpect.EOF:
+            return False
+        return True
+
+    @staticmethod
+    def _close_child(child: wexpect.spawn) -> None:
+        if child.isalive():
+            child.terminate()
+
+    def _connect_and_grab(self, bot_id: int, timer: PhaseTimer) -> wexpect.spawn:
+        """Take a warm console for *bot_id* (or open one) and grab control."""
+        child = self._pool.checkout(bot_id)
+        try:
+            if child is not None:
+                timer.mark("pool_checkout")
+                if isinstance(timer, _StartAttempt):
+                    timer.attach(child)
+            else:
+                child = self._open_console(bot_id, timer)
+
+            # Grab control
+            self._grab(child)
+            timer.mark("grab")
 
         except wexpect.TIMEOUT as e:
             logger.error(f"Timeout during SSH setup: {e}")
-            if 'child' in locals() and child.isalive():
+            if child is not None and child.isalive():
                 child.terminate()
+            self._pool.release(bot_id)
             raise SSHClientError(f"Timeout during session setup for bot {bot_id}: {e}")
         except wexpect.EOF as e:
             logger.error(f"SSH connection closed unexpectedly: {e}")
+            self._pool.release(bot_id)
             raise SSHClientError(f"SSH connection failed for bot {bot_id}: {e}")
         except Exception as e:
             logger.error(f"Error during session setup: {e}")
-            if 'child' in locals() and child.isalive():
+            if child is not None and child.isalive():
                 child.terminate()
+            self._pool.release(bot_id)
             raise SSHClientError(f"Failed to start session for bot {bot_id}: {e}")
+        return child
 
+    def _install_session(self, bot_id: int, child: wexpect.spawn, timer: PhaseTimer, reason: str) -> None:
+        """Make a grabbed console *bot_id*'s session: writer, drain and state monitor."""
+        self._drop_session(bot_id, "replaced by new session")
         self._sessions[bot_id] = child
-        logger.info("Session successfully started for bot %s", bot_id)
+        self._writers[bot_id] = SessionWriter(bot_id, lambda data: self._safe_write(child, data),
+                                              max_depth=WRITER_QUEUE_DEPTH)
+        self._liveness.mark(bot_id, SessionLivenessMonitor.ACTIVE, reason)
+        monitor = ConsoleStateMonitor(on_change=lambda changes: self.telemetry.publish(bot_id, changes),
+                                      ack_window=self._ACK_WINDOW)
+        # Output consumed by the grab already holds the first screen draw
+        monitor.feed(child.before + child.after)
+        self._monitors[bot_id] = monitor
+        self._drains[bot_id] = ConsoleDrain(bot_id, lambda: self._read_available(child),
+                                            capacity=CONSOLE_BUFFER_SIZE, on_output=monitor.feed)
+        self._phase_timings[bot_id] = timer.as_dict()
+        for phase, duration in timer.phases.items():
+            self._start_phases.observe(duration, bot_id, phase)
+        self._start_phases.observe(timer.total, bot_id, "total")
+
+    # Phase that follows each phase of a start; names the phase an attempt failed in
+    _NEXT_PHASE = {None: "connect", "connect": "authenticate", "authenticate": "console_launch",
+                   "console_launch": "teleoperables", "teleoperables": "platform_ready",
+                   "platform_ready": "grab", "pool_checkout": "grab", "grab": "install"}
+
+    def _record_attempt(self, bot_id: int, timer: PhaseTimer, source: str,
+                        error: Optional[BaseException] = None) -> None:
+        """Add a start attempt to the phase history; a failed one gets its
+        unfinished phase, timed up to now."""
+        phases = dict(timer.phases)
+        if error is not None:
+            phases[self._NEXT_PHASE.get(next(reversed(phases), None), "unknown")] = timer.pending
+        self._phase_history.record(bot_id, timer.started_at, phases, source,
+                                   None if error is None else str(error) or type(error).__name__)
+
+    def _fill_console(self, bot_id: int) -> wexpect.spawn:
+        """Open a console for the warm pool, recording its phases."""
+        timer = PhaseTimer()
+        try:
+            child = self._open_console(bot_id, timer)
+        except Exception as e:
+            self._record_attempt(bot_id, timer, "pool_fill", e)
+            raise
+        self._record_attempt(bot_id, timer, "pool_fill")
+        return child
+
+    def _acked(self, bot_id: int, command: str, ack: Future) -> None:
+        if ack.exception() is None:
+            self._ack_latency.observe(ack.result(), bot_id, command)
+            self._acks.inc(bot_id, command, "acked")
+        else:
+            self._acks.inc(bot_id, command, "lost")
+
+    def _forget_monitor(self, bot_id: int) -> Optional[ConsoleStateMonitor]:
+        """Drop *bot_id*'s state monitor, failing the acknowledgements it still owed."""
+        monitor = self._monitors.pop(bot_id, None)
+        if monitor is not None:
+            monitor.acks.close()
+        return monitor
+
+    def _written(self, bot_id: int, command: str, queued: float, future: Future) -> None:
+        if future.exception() is None:
+            self._write_latency.observe(time.monotonic() - queued, bot_id, command)
+
+    def _session_counts(self) -> Dict[tuple, int]:
+        counts = {(state,): 0 for state in (SessionLivenessMonitor.ACTIVE, SessionLivenessMonitor.RECOVERING,
+                                            SessionLivenessMonitor.TERMINATED, SessionLivenessMonitor.ENDED)}
+        for status in self._liveness.statuses().values():
+            counts[(status,)] = counts.get((status,), 0) + 1
+        return counts
+
+    def _session_lost(self, bot_id: int, reason: str) -> bool:
+        """Drop a session whose console died and start recovering it.
+
+        Returns:
+            Whether a recovery was started
+        """
+        monitor = self._monitors.get(bot_id)
+        last_linear = monitor.state()["linear_speed"] if monitor else None
+        self._drop_session(bot_id, reason)
+        self._pool.release(bot_id)
+        if not RECONNECT_ENABLED:
+            return False
+        started = self._recovery.recover(bot_id, lambda cancelled: self._reconnect(bot_id, last_linear, cancelled))
+        if started:
+            self._liveness.mark(bot_id, SessionLivenessMonitor.RECOVERING, reason)
+        return started
+
+    def _reconnect(self, bot_id: int, last_linear: Optional[float], cancelled: threading.Event) -> None:
+        """One recovery attempt: reconnect, re-grab and restore the speed limit."""
+        timer = PhaseTimer()
+        try:
+            child = self._connect_and_grab(bot_id, timer)
+        except SSHClientError as e:
+            self._record_attempt(bot_id, timer, "reconnect", e)
+            raise
+        self._record_attempt(bot_id, timer, "reconnect")
+        with self._recovery_lock:
+            if cancelled.is_set():
+                self._close_child(child)
+                self._pool.release(bot_id)
+                return
+            self._install_session(bot_id, child, timer, "reconnected")
+        logger.info("Session for bot %s reconnected in %.2fs", bot_id, timer.total)
+        if last_linear is not None:
+            self._restore_linear_speed(bot_id, last_linear)
+
+    def _recovery_gave_up(self, bot_id: int, error: str) -> None:
+        self._liveness.mark(bot_id, SessionLivenessMonitor.TERMINATED, f"reconnect failed: {error}")
+
+    # Presses of +/- tried while stepping the speed limit back
+    SPEED_RESTORE_MAX_STEPS = 40
+
+    def _restore_linear_speed(self, bot_id: int, target: float) -> None:
+        """Press +/- until the console shows the linear speed limit *target*
+        again, or the limit stops moving towards it."""
+        monitor = self._monitors.get(bot_id)
+        if monitor is None:
+            return
+        current = self._await_linear_change(monitor, None, timeout=2.0)
+        for _ in range(self.SPEED_RESTORE_MAX_STEPS):
+            if current is None or abs(current - target) < 1e-6:
+                break
+            key = self._SPEED_KEYS["increase" if current < target else "decrease"]
+            try:
+                self.send_command(bot_id, key, wait=True, lane=LANE_SPEED)
+            except SSHClientError as e:
+                logger.warning("Could not restore speed for bot %s: %s", bot_id, e)
+                return
+            stepped = self._await_linear_change(monitor, current, timeout=1.0)
+            if stepped is None or stepped == current or abs(stepped - target) > abs(current - target):
+                break
+            current = stepped
+        logger.info("Bot %s linear speed limit restored to %s (was %s)", bot_id, current, target)
+
+    @staticmethod
+    def _await_linear_change(monitor: ConsoleStateMonitor, previous: Optional[float],
+                             timeout: float) -> Optional[float]:
+        """The monitor's linear speed limit once it differs from *previous*
+        (or its current value after *timeout*)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            value = monitor.state()["linear_speed"]
+            if value != previous or time.monotonic() >= deadline:
+                return value
+            time.sleep(0.02)
+
+    def _raise_if_recovering(self, bot_id: int) -> None:
+        retry_after = self._recovery.retry_after(bot_id)
+        if retry_after is not None:
+            raise SessionRecovering(bot_id, retry_after)
+
+    # --------------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------------
+    def start_session(self, bot_id: int) -> str:
+        if bot_id in self._sessions and self._is_alive(self._sessions[bot_id]):
+            return "Session already active"
+        self._raise_if_recovering(bot_id)
+
+        timer = _StartAttempt()
+        with self._starts_lock:
+            self._starts[bot_id] = timer
+        try:
+            try:
+                child = self._connect_and_grab(bot_id, timer)
+            except SSHClientError as e:
+                if timer.cancelled:
+                    e = StartCancelled(f"Session start for bot {bot_id} cancelled")
+                self._record_attempt(bot_id, timer, "start", e)
+                raise e
+            if not timer.complete():
+                self._close_child(child)
+                error = StartCancelled(f"Session start for bot {bot_id} cancelled")
+                self._record_attempt(bot_id, timer, "start", error)
+                raise error
+        finally:
+            with self._starts_lock:
+                if self._starts.get(bot_id) is timer:
+                    del self._starts[bot_id]
+        self._install_session(bot_id, child, timer, "session started")
+        self._record_attempt(bot_id, timer, "start")
+        logger.info("Session successfully started for bot %s in %.2fs: %s",
+                    bot_id, timer.total, self._phase_timings[bot_id])
         return "Session started successfully"
 
+    def get_start_progress(self, bot_id: int) -> Optional[Dict[str, object]]:
+        """Phase a start_session for *bot_id* is in, or None if none is running.
+
+        Returns:
+            ``phase`` in progress, ``phases`` completed so far (seconds),
+            ``elapsed_s`` and whether it was ``cancelled``
+        """
+        with self._starts_lock:
+            timer = self._starts.get(bot_id)
+        if timer is None:
+            return None
+        phases = dict(timer.phases)
+        return {
+            "phase": self._NEXT_PHASE.get(next(reversed(phases), None), "unknown"),
+            "phases": {phase: round(duration, 3) for phase, duration in phases.items()},
+            "elapsed_s": round(timer.total + timer.pending, 3),
+            "cancelled": timer.cancelled,
+        }
+
+    def cancel_start(self, bot_id: int) -> bool:
+        """Abort a start_session for *bot_id* mid-handshake, closing its console.
+
+        The start then fails with StartCancelled.  Returns False if no start
+        was running or it had already got past grabbing control.
+        """
+        with self._starts_lock:
+            timer = self._starts.get(bot_id)
+        if timer is None or not timer.cancel():
+            return False
+        logger.info("Session start for bot %s cancelled during %s", bot_id,
+                    self._NEXT_PHASE.get(next(reversed(dict(timer.phases)), None), "unknown"))
+        return True
+
     # --------------------------------------------------------------
     def end_session(self, bot_id: int) -> str:
+        """Release control and leave the console, waiting on its acknowledgements."""
+        report = self._release(bot_id)
+        return "No active session" if report is None else "Session ended successfully"
+
+    def _release(self, bot_id: int) -> Optional[Dict[str, object]]:
+        """Tear *bot_id*'s session down.
+
+        Each step waits for the console to acknowledge it (at most
+        TEARDOWN_STEP_TIMEOUT seconds) instead of sleeping a fixed time.
+        Control counts as released once the console shows a release line
+        or, after Ctrl+C, the shell prompt: leaving the console gives up
+        control.
+
+        Returns:
+            Teardown report, or None if the bot had no session
+        """
+        with self._recovery_lock:
+            if self._recovery.cancel(bot_id):
+                self._liveness.mark(bot_id, SessionLivenessMonitor.ENDED, "session ended during recovery")
+                # Nothing is grabbed while reconnecting
+                return {"bot_id": bot_id, "released": True, "exited": True, "duration_s": 0.0}
         child = self._sessions.get(bot_id)
         if not child:
-            return "No active session"
+            return None
+
+        started = time.monotonic()
+        # Marked first so the liveness check doesn't report the exit as a crash
+        self._liveness.mark(bot_id, SessionLivenessMonitor.ENDED, "session ended")
+        writer = self._writers.pop(bot_id, None)
+        if writer is not None:
+            # Let queued keystrokes land before releasing control
+            writer.close()
+        # Stop draining so the acknowledgements below are left for us to read
+        drain = self._drains.pop(bot_id, None)
+        if drain is not None:
+            drain.stop()
 
+        released = exited = False
         try:
-            # Release control, Ctrl+C, exit
             child.send("g")  # Release control
-            time.sleep(0.3)
+            released = self._await_ack(child, self.RELEASE_ACK)
             child.send("\x03")  # Ctrl+C
-            time.sleep(0.3)
+            at_prompt = self._await_ack(child, f"hive@wemo{bot_id:04d}:~")
+            released = released or at_prompt
             child.sendline("exit")
-            time.sleep(0.3)
+            exited = self._await_ack(child, wexpect.EOF)
+        except Exception as e:
+            logger.warning("Bot %s went away during teardown: %s", bot_id, e)
         finally:
+            self._forget_monitor(bot_id)
             if child.isalive():
                 child.terminate()
             self._sessions.pop(bot_id, None)
-            logger.info("Session ended for bot %s", bot_id)
+            self._pool.release(bot_id)
+            self.telemetry.publish(bot_id, {"grabbed": False})
+
+        report = {"bot_id": bot_id, "released": released, "exited": exited,
+                  "duration_s": round(time.monotonic() - started, 3)}
+        logger.info("Session ended for bot %s: %s", bot_id, report)
+        return report
+
+    @classmethod
+    def _await_ack(cls, child: wexpect.spawn, pattern) -> bool:
+        """Whether *pattern* (or EOF) shows up within TEARDOWN_STEP_TIMEOUT."""
+        if pattern is wexpect.EOF:
+            patterns = [wexpect.EOF, wexpect.TIMEOUT]
+        else:
+            patterns = [pattern, wexpect.EOF, wexpect.TIMEOUT]
+        return child.expect(patterns, timeout=cls.TEARDOWN_STEP_TIMEOUT) == 0
+
+    def release_all(self, deadline: float) -> Dict[str, object]:
+        """Release every session in parallel, giving up after *deadline* seconds.
+
+        Consoles still tearing down at the deadline are killed, so the SSH
+        connection drops and the robot side releases control on its own.
+
+        Returns:
+            Which bots were released cleanly, released without every
+            acknowledgement, or timed out
+        """
+        started = time.monotonic()
+        bots = set(self._sessions) | set(self._recovery.stats()["recovering"])
+        if not bots:
+            return teardown_summary([], [], 0.0)
+        logger.info("Releasing %d session(s) within %.0fs", len(bots), deadline)
 
-        return "Session ended successfully"
+        executor = ThreadPoolExecutor(max_workers=len(bots), thread_name_prefix="teardown")
+        futures = {executor.submit(self._release, bot_id): bot_id for bot_id in bots}
+        done, pending = wait(futures, timeout=deadline)
+        executor.shutdown(wait=False)
+
+        reports = []
+        for future in done:
+            try:
+                report = future.result()
+            except Exception as e:
+                logger.error("Teardown of bot %s failed: %s", futures[future], e)
+                report = {"bot_id": futures[future], "released": False, "exited": False}
+            if report is not None:
+                reports.append(report)
+        timed_out = [futures[future] for future in pending]
+        for bot_id in timed_out:
+            child = self._sessions.get(bot_id)
+            if child is not None and child.isalive():
+                child.terminate(force=True)
+
+        summary = teardown_summary(reports, timed_out, time.monotonic() - started)
+        logger.info("Released %s cleanly, %s unclean, %s timed out in %.2fs",
+                    summary["released"], summary["unclean"], summary["timed_out"], summary["duration_s"])
+        return summary
 
     # --------------------------------------------------------------
-    def send_command(self, bot_id: int, command: str) -> str:
+    def send_command(self, bot_id: int, command: str, wait: bool = False, lane: str = LANE_MOTION,
+                     ack: bool = False) -> str:
+        """Queue *command* in *lane* of the session's writer.
+
+        Returns as soon as the keystrokes are queued; with *wait* it blocks
+        until they are written (at most WRITE_TIMEOUT seconds), and with
+        *ack* also until the console redraws with their effect (at most
+        ACK_TIMEOUT seconds more).  Acknowledgement latency is recorded per
+        bot either way.
+        """
         child = self._sessions.get(bot_id)
-        if not child or not self._is_alive(child):
+        writer = self._writers.get(bot_id)
+        if not child or not writer or not self._is_alive(child):
+            self._raise_if_recovering(bot_id)
             raise SSHClientError("No active session for this bot")
 
-        logger.info(f"Sending command {repr(command)} to bot {bot_id}")
+        logger.debug(f"Sending command {repr(command)} to bot {bot_id}")
+        kind = self._COMMAND_KINDS.get(command, "other")
+        queued = time.monotonic()
         try:
-            self._safe_write(child, command)
-            return "Command sent successfully"
+            future = writer.submit(command, lane=lane)
+        except WriterQueueFull as e:
+            logger.warning(str(e))
+            raise SSHClientError(str(e)) from e
+        except WriterClosed as e:
+            raise SSHClientError(f"Session for bot {bot_id} is no longer active") from e
+        self._commands.inc(bot_id, kind)
+        future.add_done_callback(lambda done: self._written(bot_id, kind, queued, done))
+        monitor = self._monitors.get(bot_id)
+        acked = None
+        if monitor is not None:
+            acked = monitor.acks.track(future, self._ACK_FIELDS.get(kind, ()))
+            acked.add_done_callback(lambda done: self._acked(bot_id, kind, done))
+        if not wait and not ack:
+            return "Command queued"
+
+        try:
+            future.result(timeout=WRITE_TIMEOUT)
+        except FutureTimeout as e:
+            raise SSHClientError(f"Timed out after {WRITE_TIMEOUT:.0f}s writing to bot {bot_id}") from e
+        except WritePreempted as e:
+            raise SSHClientError(f"Command for bot {bot_id} dropped by an emergency stop") from e
         except Exception as e:
             if not self._is_alive(child):
-                self._sessions.pop(bot_id, None)
+                if self._session_lost(bot_id, "write failed"):
+                    raise SessionRecovering(bot_id, self._recovery.retry_after(bot_id) or 0) from e
                 raise SSHClientError(f"Session for bot {bot_id} is no longer active") from e
             raise SSHClientError(f"Failed to send command: {e}") from e
+        if not ack:
+            return "Command sent successfully"
+
+        if acked is None:
+            raise CommandNotAcknowledged(f"Bot {bot_id} has no console monitor to acknowledge commands")
+        try:
+            acked.result(timeout=ACK_TIMEOUT)
+            return "Command acknowledged"
+        except FutureTimeout as e:
+            raise CommandNotAcknowledged(
+                f"Bot {bot_id} console did not acknowledge the command within {ACK_TIMEOUT:g}s") from e
+        except AckLost as e:
+            raise CommandNotAcknowledged(f"Bot {bot_id} console did not acknowledge the command: {e}") from e
+
+    def _drop_session(self, bot_id: int, reason: str = "session dropped") -> None:
+        """Forget a session whose console died."""
+        if self._liveness.status(bot_id) == SessionLivenessMonitor.ACTIVE:
+            self._liveness.mark(bot_id, SessionLivenessMonitor.TERMINATED, reason)
+        self._sessions.pop(bot_id, None)
+        writer = self._writers.pop(bot_id, None)
+        if writer is not None:
+            writer.close(timeout=0)
+        drain = self._drains.pop(bot_id, None)
+        if drain is not None:
+            drain.stop(timeout=0)
+        if self._forget_monitor(bot_id) is not None:
+            self.telemetry.publish(bot_id, {"grabbed": False})
 
 
     _ROTATE_KEYS = {"left": "<" * 5, "right": ">" * 5}
@@ -192,49 +844,273 @@ class SSHClient:
         "left":  "\x1bOD" * 5,    # Numpad 4
     }
 
+    # Command type of each keystroke sequence, as labelled in the metrics
+    _COMMAND_KINDS = {**{keys: "move" for keys in _NUMPAD_KEYS.values()},
+                      **{keys: "rotate" for keys in _ROTATE_KEYS.values()},
+                      **{keys: "speed" for keys in _SPEED_KEYS.values()},
+                      "g": "grab"}
+    # Console fields whose redraw acknowledges a command; any redraw
+    # acknowledges the other kinds.  Commands the console does not redraw
+    # for within _ACK_WINDOW seconds count as lost.
+    _ACK_FIELDS = {"speed": ("linear_speed", "angular_speed"), "grab": ("grabbed",)}
+    _ACK_WINDOW = 5.0
+
 
-    def move(self, bot_id: int, direction: str) -> str:
+    def move(self, bot_id: int, direction: str, wait: bool = False, ack: bool = False) -> str:
         if direction not in self._NUMPAD_KEYS:
             raise SSHClientError(f"Invalid move direction: {direction}. Valid directions: {list(self._NUMPAD_KEYS.keys())}")
 
         command = self._NUMPAD_KEYS[direction]
-        return self.send_command(bot_id, command)
+        return self.send_command(bot_id, command, wait=wait, ack=ack)
 
 
-    def rotate(self, bot_id: int, direction: str) -> str:
+    def rotate(self, bot_id: int, direction: str, wait: bool = False, ack: bool = False) -> str:
         if direction not in self._ROTATE_KEYS:
             raise SSHClientError(f"Invalid rotation direction: {direction}. Valid directions: {list(self._ROTATE_KEYS.keys())}")
 
         command = self._ROTATE_KEYS[direction]
-        return self.send_command(bot_id, command)
+        return self.send_command(bot_id, command, wait=wait, ack=ack)
 
-    def change_speed(self, bot_id: int, action: str) -> str:
+    def change_speed(self, bot_id: int, action: str, wait: bool = False, ack: bool = False) -> str:
         if action not in self._SPEED_KEYS:
             raise SSHClientError(f"Invalid speed action: {action}. Valid actions: {list(self._SPEED_KEYS.keys())}")
 
         command = self._SPEED_KEYS[action]
-        return self.send_command(bot_id, command)
+        return self.send_command(bot_id, command, wait=wait, lane=LANE_SPEED, ack=ack)
+
+    def emergency_stop(self, bot_ids: Optional[Iterable[int]] = None, timeout: float = ESTOP_ACK_TIMEOUT) -> Dict[str, object]:
+        """Release control of every active bot (or of *bot_ids*) at once.
+
+        The release keystroke goes into each writer's stop lane and preempts
+        queued speed and motion writes, so it is the next thing each console
+        receives.  All bots are enqueued before any is waited on; then the
+        call waits up to *timeout* seconds in total for every console to
+        acknowledge the release.  Like any other command, the release is
+        acknowledged by the first redraw after it was written, so no
+        particular release text is required; the console monitor then
+        records control as released.  Sessions stay open with control
+        released.
+
+        Returns:
+            Bots stopped (release acknowledged), unacknowledged (written,
+            no redraw in time) and failed, the fan-out and total durations,
+            and per-bot write/ack latencies
+        """
+        started = time.monotonic()
+        if bot_ids is None:
+            bot_ids = [bot_id for bot_id, status in self._liveness.statuses().items()
+                       if status == SessionLivenessMonitor.ACTIVE]
+        pending: Dict[int, tuple] = {}
+        failed: Dict[int, str] = {}
+        written_at: Dict[int, float] = {}
+        for bot_id in dict.fromkeys(bot_ids):
+            writer, monitor = self._writers.get(bot_id), self._monitors.get(bot_id)
+            if writer is None or monitor is None:
+                failed[bot_id] = "No active session for this bot"
+                continue
+            if monitor.state()["grabbed"] is False:
+                # "g" toggles: pressing it again would take control back
+                pending[bot_id] = (None, None, monitor, started)
+                continue
+            try:
+                future = writer.submit("g", lane=LANE_STOP, preempt=True)
+            except (WriterClosed, WriterQueueFull) as e:
+                failed[bot_id] = str(e)
+                continue
+            self._commands.inc(bot_id, "estop")
+            future.add_done_callback(lambda _, bot_id=bot_id: written_at.setdefault(bot_id, time.monotonic()))
+            pending[bot_id] = (future, monitor.acks.track(future), monitor, time.monotonic())
+        fanout = time.monotonic() - started
+        self._stop_latency.observe(fanout, "fanout")
+
+        deadline = started + timeout
+        stopped, unacknowledged, reports = [], [], []
+        for bot_id, (future, acked, monitor, submitted) in pending.items():
+            ack = 0.0
+            if future is not None:
+                try:
+                    future.result(max(0.0, deadline - time.monotonic()))
+                except FutureTimeout:
+                    unacknowledged.append(bot_id)
+                    continue
+                except Exception as e:
+                    failed[bot_id] = str(e)
+                    continue
+                self._stop_latency.observe(written_at[bot_id] - submitted, "write")
+                try:
+                    ack = acked.result(max(0.0, deadline - time.monotonic()))
+                except (FutureTimeout, AckLost):
+                    unacknowledged.append(bot_id)
+                    continue
+                self._stop_latency.observe(ack, "ack")
+            stopped.append(bot_id)
+            reports.append({"bot_id": bot_id, "ack_s": round(ack, 4),
+                            "write_s": round(written_at[bot_id] - submitted, 4) if future is not None else 0.0})
+            # Also when the console shows no release line, so a second stop
+            # doesn't press "g" again and take control back
+            monitor.assume("grabbed", False)
+
+        result = {
+            "stopped": sorted(stopped),
+            "unacknowledged": sorted(unacknowledged),
+            "failed": failed,
+            "fanout_s": round(fanout, 4),
+            "duration_s": round(time.monotonic() - started, 4),
+            "reports": sorted(reports, key=lambda report: report["bot_id"]),
+        }
+        logger.warning("Emergency stop: %s", {key: result[key] for key in ("stopped", "unacknowledged", "failed",
+                                                                            "fanout_s", "duration_s")})
+        return result
+
+    def get_stop_stats(self) -> Dict[str, object]:
+        """Latency histograms of the emergency stop path (fan-out, write, ack)."""
+        return {stage: self._stop_latency.labels(stage).summary() for stage in ("fanout", "write", "ack")}
 
-    def get_speed(self, bot_id: int) -> str:
-        """Get current linear speed limit value from the teleop console display."""
+    def get_ack_stats(self) -> Dict[int, Dict[str, object]]:
+        """Per-bot console acknowledgements: counts and latency by command
+        kind, and how many commands of live sessions still await one."""
+        stats: Dict[int, Dict[str, object]] = {}
+
+        def entry(bot_id: int, command: str) -> Dict[str, object]:
+            bot = stats.setdefault(bot_id, {"pending": 0, "commands": {}})
+            return bot["commands"].setdefault(command, {"acked": 0, "lost": 0, "p50_s": None, "p95_s": None,
+                                                        "p99_s": None, "max_s": None})
+
+        for (bot_id, command, outcome), count in self._acks.values().items():
+            entry(bot_id, command)[outcome] = int(count)
+        for (bot_id, command), histogram in self._ack_latency.children().items():
+            summary = histogram.summary()
+            entry(bot_id, command).update({key: summary[key] for key in ("p50_s", "p95_s", "p99_s", "max_s")})
+        for bot_id, monitor in list(self._monitors.items()):
+            stats.setdefault(bot_id, {"pending": 0, "commands": {}})["pending"] = monitor.acks.pending()
+        return stats
+
+    def get_metrics(self) -> str:
+        """Session-layer metrics in the Prometheus text exposition format."""
+        return self.metrics.render()
+
+    def get_speed(self, bot_id: int) -> Dict[str, object]:
+        """Get the speed limits last shown on the teleop console display.
+
+        Values come from the session's screen model, updated as output is
+        drained, so this never touches the console.  ``age_s`` is how long
+        ago they were last displayed; all fields are None until the console
+        has shown them.
+        """
         child = self._sessions.get(bot_id)
-        if not child or not self._is_alive(child):
+        monitor = self._monitors.get(bot_id)
+        if not child or not monitor or not self._is_alive(child):
             raise SSHClientError("No active session for this bot")
+        return monitor.speed()
+
+    def subscribe_telemetry(self, bot_ids: Optional[Iterable[int]] = None) -> TelemetrySubscription:
+        """Subscribe the running event loop to console state changes of
+        *bot_ids* (all bots by default)."""
+        return self.telemetry.subscribe(bot_ids)
+
+    def get_pool_stats(self) -> Dict[str, object]:
+        """Warm pool hit/miss counters and contents."""
+        return self._pool.stats()
+
+    def get_writer_stats(self) -> Dict[int, Dict[str, object]]:
+        """Per-bot write queue depth, drop counters and write latency."""
+        return {bot_id: writer.stats() for bot_id, writer in list(self._writers.items())}
+
+    def get_console_tail(self, bot_id: int, size: int = 2000) -> Optional[str]:
+        """Last *size* bytes of console output drained for *bot_id* (None without a session)."""
+        drain = self._drains.get(bot_id)
+        return drain.buffer.tail(size) if drain else None
+
+    def get_console_buffer_stats(self) -> Dict[str, object]:
+        """Per-bot ring buffer memory use and the total across sessions."""
+        per_bot = {bot_id: drain.buffer.stats() for bot_id, drain in list(self._drains.items())}
+        return {
+            "sessions": per_bot,
+            "total_bytes": sum(stats["size_bytes"] for stats in per_bot.values()),
+        }
 
-        # TODO: Implement proper speed detection from teleop console
-        # For now, return a reasonable default value
-        return "0.125"
+    def get_connection_stats(self) -> Dict[str, object]:
+        """Connect-phase latency (fresh vs reused master) and tracked masters."""
+        return self._mux.stats()
+
+    def close(self) -> None:
+        """Stop writers, drains and the warm pool, end telemetry streams and
+        close every SSH master connection."""
+        self._liveness.stop()
+        self._recovery.stop()
+        for bot_id in list(self._sessions):
+            self._liveness.mark(bot_id, SessionLivenessMonitor.ENDED, "client closed")
+            self._drop_session(bot_id)
+        self.telemetry.close()
+        self._pool.stop()
+        self._mux.stop()
+
+    def get_phase_timings(self, bot_id: int) -> Dict[str, float]:
+        """Phase durations (seconds) recorded by the last successful start of *bot_id*."""
+        return dict(self._phase_timings.get(bot_id, {}))
+
+    def get_phase_summary(self, bot_ids: Optional[Iterable[int]] = None) -> Dict[str, object]:
+        """Start-phase percentiles across the fleet and per bot (all recorded bots by default)."""
+        return self._phase_history.summary(bot_ids)
+
+    def get_phase_history(self, bot_id: int, limit: Optional[int] = None) -> List[Dict[str, object]]:
+        """Recorded start attempts of *bot_id*, oldest first, with per-phase offsets."""
+        return self._phase_history.history(bot_id, limit)
 
     # --------------------------------------------------------------
+    _STATUS_LABELS = {SessionLivenessMonitor.ACTIVE: "Active", SessionLivenessMonitor.TERMINATED: "Terminated",
+                      SessionLivenessMonitor.RECOVERING: "Recovering"}
+
     def get_session_status(self, bot_id: int) -> str:
-        child = self._sessions.get(bot_id)
-        if not child:
-            return "No session"
-        if self._is_alive(child):
+        """Cached session status, as of the last liveness check."""
+        status = self._liveness.status(bot_id)
+        if status == SessionLivenessMonitor.ACTIVE:
             return "Active"
-        else:
-            self._sessions.pop(bot_id, None)
+        if status == SessionLivenessMonitor.TERMINATED:
             return "Session terminated"
+        if status == SessionLivenessMonitor.RECOVERING:
+            return "Recovering"
+        return "No session"
+
+    def has_active_session(self, bot_id: int) -> bool:
+        return self._liveness.status(bot_id) == SessionLivenessMonitor.ACTIVE
+
+    def require_session(self, bot_id: int) -> None:
+        """Raise unless *bot_id* has an active session.
+
+        Raises:
+            SessionRecovering: The session is being reconnected
+            SSHClientError: There is no session
+        """
+        if not self.has_active_session(bot_id):
+            self._raise_if_recovering(bot_id)
+            raise SSHClientError("No active session for this bot")
 
     def list_active_sessions(self):
-        return {bid: ("Active" if self._is_alive(p) else "Terminated") for bid, p in list(self._sessions.items())}
+        return {bid: self._STATUS_LABELS[status] for bid, status in self._liveness.statuses().items()
+                if status in self._STATUS_LABELS}
+
+    def get_session_process_type(self, bot_id: int) -> Optional[str]:
+        """Type of the console object behind *bot_id*'s session, or None without one."""
+        child = self._sessions.get(bot_id)
+        return type(child).__name__ if child is not None else None
+
+    def get_session_health(self, bot_id: int) -> Optional[Dict[str, object]]:
+        """Cached status of *bot_id* with when it began and was last confirmed."""
+        return self._liveness.health(bot_id)
+
+    def get_session_events(self, limit: Optional[int] = None) -> Dict[str, object]:
+        """Recent session status transitions and liveness check counters."""
+        return {"events": self._liveness.events(limit), "monitor": self._liveness.stats(),
+                "recovery": self._recovery.stats()}
+
+
+def create_ssh_client(transport: str = SSH_TRANSPORT) -> SSHClient:
+    """SSHClient for the configured session transport ('process' or 'channel')."""
+    if transport == "channel":
+        # Imported only when selected: the channel transport needs paramiko
+        from App.utils.teleop_CLI_channel_SSH_helper import ChannelSSHClient
+        return ChannelSSHClient()
+    if transport == "process":
+        return SSHClient()
+    raise ValueError(f"Unknown SSH transport: {transport!r} (expected 'process' or 'channel')")
@@ -0,0 +1,237 @@
+"""Session transport hosting every console in-process on SSH channels.
+
+SSHClient runs one ``ssh`` child process (and pty) per session.  Each of
+those costs several megabytes of resident memory and a process slot, which
+is what caps how many bots one host can drive.  ChannelSSHClient keeps the
+same public API but opens each console as an interactive shell channel
+(``get_pty`` + ``invoke_shell``, as the old paramiko helper did) on one
+authenticated paramiko transport per bot, so a session is a channel and a
+couple of threads instead of a process.
+
+ChannelSpawn wraps a channel in the pexpect interface SSHClient already
+drives (expect / send / isalive / terminate), so login, grab, draining,
+teardown and reconnects are shared with the process transport.
+
+With SSH_STRICT_HOST_KEYS on (the default), a bot's host key must match
+its entry in known_hosts, as the ssh command line requires; connections to
+bots with an unknown or changed key are refused.
+
+Requires paramiko.  Selected with ``SSH_TRANSPORT=channel``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import select
+import socket
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import paramiko
+from pexpect import EOF, TIMEOUT
+from pexpect.spawnbase import SpawnBase
+
+from App.core.config import SSH_CONTROL_PERSIST, SSH_PORT, SSH_STRICT_HOST_KEYS, WEMOIP
+from App.utils.teleop_CLI_metrics import LatencyWindow
+from App.utils.teleop_CLI_SSH_helper import SSHClient, SSHClientError
+
+logger = logging.getLogger("SSH.channel")
+
+
+class ChannelSpawn(SpawnBase):
+    """pexpect-compatible child reading and writing a paramiko channel."""
+
+    def __init__(self, channel: paramiko.Channel, timeout: float = 30, encoding: str = "utf-8") -> None:
+        super().__init__(timeout=timeout, encoding=encoding)
+        self.channel = channel
+        # Keystrokes go straight onto the channel; no pty to let settle
+        self.delaybeforesend = None
+        self.closed = False
+
+    def read_nonblocking(self, size: int = 1, timeout=-1) -> str:
+        if timeout == -1:
+            timeout = self.timeout
+        # select() rather than channel.settimeout(): the timeout would also
+        # apply to sends made from the session's writer thread.
+        channel = self.channel
+        if not (channel.recv_ready() or channel.closed or channel.eof_received):
+            readable, _, _ = select.select([channel], [], [], timeout)
+            if not readable:
+                raise TIMEOUT("Timeout exceeded.")
+        data = channel.recv(size)
+        if not data:
+            self.flag_eof = True
+            raise EOF("End Of File (EOF). Channel closed.")
+        text = self._decoder.decode(data, final=False)
+        self._log(text, "read")
+        return text
+
+    def send(self, s) -> int:
+        s = self._coerce_send_string(s)
+        self._log(s, "send")
+        data = self._encoder.encode(s, final=False)
+        self.channel.sendall(data)
+        return len(data)
+
+    def sendline(self, s: str = "") -> int:
+        return self.send(s + self.linesep)
+
+    def isalive(self) -> bool:
+        return not (self.channel.closed or self.channel.exit_status_ready())
+
+    def terminate(self, force: bool = False) -> bool:
+        self.close()
+        return True
+
+    def close(self, force: bool = True) -> None:
+        self.channel.close()
+        self.closed = True
+
+
+class ChannelSSHClient(SSHClient):
+    """SSHClient whose sessions are channels on a shared transport per bot."""
+
+    def __init__(self, port: int = SSH_PORT, username: str = "hive", password: str = "robohive",
+                 connect_timeout: float = 30.0, idle_timeout: float = SSH_CONTROL_PERSIST,
+                 strict_host_keys: bool = SSH_STRICT_HOST_KEYS, known_hosts: Optional[str] = None) -> None:
+        """
+        Args:
+            port: SSH port on the bots
+            username: Login user
+            password: Login password
+            connect_timeout: Seconds allowed for TCP connect, handshake and auth
+            idle_timeout: Seconds a transport without sessions is kept for reuse
+            strict_host_keys: Refuse bots whose host key is not in known_hosts
+            known_hosts: known_hosts file to check against (~/.ssh/known_hosts)
+        """
+        self.port = port
+        self.strict_host_keys = strict_host_keys
+        self.known_hosts = known_hosts or os.path.expanduser("~/.ssh/known_hosts")
+        self.username = username
+        self.password = password
+        self.connect_timeout = connect_timeout
+        self.idle_timeout = idle_timeout
+        # (host, port) -> authenticated transport, and when it last opened a channel
+        self._transports: Dict[Tuple[str, int], paramiko.Transport] = {}
+        self._transport_used: Dict[Tuple[str, int], float] = {}
+        self._transports_lock = threading.Lock()
+        # (host, port) -> lock serialising connects to that bot only
+        self._connect_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._latency = {"fresh": LatencyWindow(), "reused": LatencyWindow()}
+        super().__init__()
+
+    def _address(self, bot_id: int) -> Tuple[str, int]:
+        return f"{WEMOIP}.{bot_id + 100}", self.port
+
+    def _transport(self, bot_id: int) -> Tuple[paramiko.Transport, bool]:
+        """An authenticated transport to *bot_id*, and whether it was reused."""
+        address = self._address(bot_id)
+        with self._transports_lock:
+            connect_lock = self._connect_locks.setdefault(address, threading.Lock())
+        with connect_lock:
+            transport = self._transports.get(address)
+            if transport is not None and transport.is_active():
+                return transport, True
+
+            try:
+                sock = socket.create_connection(address, timeout=self.connect_timeout)
+            except OSError as e:
+                logger.error("Could not reach bot %s at %s:%s: %s", bot_id, *address, e)
+                raise SSHClientError(f"BOT {bot_id} is currently not active.")
+            transport = paramiko.Transport(sock)
+            try:
+                transport.start_client(timeout=self.connect_timeout)
+                self._check_host_key(bot_id, address, transport)
+                transport.auth_password(self.username, self.password)
+            except paramiko.AuthenticationException:
+                transport.close()
+                raise SSHClientError("Authentication failed - incorrect password")
+            except (paramiko.SSHException, EOFError, OSError) as e:
+                transport.close()
+                raise SSHClientError(f"SSH connection failed for bot {bot_id}: {e}")
+            transport.set_keepalive(30)
+            with self._transports_lock:
+                self._transports[address] = transport
+            return transport, False
+
+    def _check_host_key(self, bot_id: int, address: Tuple[str, int], transport: paramiko.Transport) -> None:
+        """Refuse *bot_id* unless its host key matches known_hosts (when strict).
+
+        The file is read on every fresh connect, so keys added to it are
+        picked up without a restart.
+        """
+        if not self.strict_host_keys:
+            return
+        host, port = address
+        name = host if port == 22 else f"[{host}]:{port}"
+        host_keys = paramiko.HostKeys()
+        try:
+            host_keys.load(self.known_hosts)
+        except OSError as e:
+            logger.warning("Could not read known hosts %s: %s", self.known_hosts, e)
+        key = transport.get_remote_server_key()
+        if host_keys.lookup(name) is None:
+            transport.close()
+            raise SSHClientError(f"Host key for bot {bot_id} ({name}) is not in {self.known_hosts}")
+        if not host_keys.check(name, key):
+            transport.close()
+            logger.error("Host key of bot %s (%s) does not match %s", bot_id, name, self.known_hosts)
+            raise SSHClientError(f"Host key verification failed for bot {bot_id} ({name})")
+
+    def _spawn_console(self, bot_id: int, destination: str) -> ChannelSpawn:
+        """Open a shell channel on *bot_id*'s transport; lands at the shell prompt."""
+        self._close_idle_transports()
+        started = time.monotonic()
+        transport, reused = self._transport(bot_id)
+        try:
+            channel = transport.open_session(timeout=self.connect_timeout)
+            channel.get_pty(term="xterm", width=80, height=24)
+            channel.invoke_shell()
+        except (paramiko.SSHException, EOFError, OSError) as e:
+            raise SSHClientError(f"SSH connection failed for bot {bot_id}: {e}")
+        elapsed = time.monotonic() - started
+        self._latency["reused" if reused else "fresh"].add(elapsed)
+        with self._transports_lock:
+            self._transport_used[self._address(bot_id)] = time.monotonic()
+        logger.info("Opened shell channel for bot %s in %.3fs (%s transport)",
+                    bot_id, elapsed, "reused" if reused else "fresh")
+        return ChannelSpawn(channel, timeout=30, encoding="utf-8")
+
+    def _close_idle_transports(self) -> None:
+        """Close transports no session or warm console has used for idle_timeout."""
+        now = time.monotonic()
+        in_use = {self._address(bot_id) for bot_id in set(self._sessions) | set(self._pool.warm_bots())}
+        with self._transports_lock:
+            for address in in_use:
+                self._transport_used[address] = now
+            idle = [address for address, used in self._transport_used.items()
+                    if address in self._transports and used < now - self.idle_timeout]
+            closing = [self._transports.pop(address) for address in idle]
+        for transport in closing:
+            transport.close()
+        if idle:
+            logger.info("Closed idle SSH transports: %s", idle)
+
+    def get_connection_stats(self) -> Dict[str, object]:
+        """Channel-open latency (fresh vs reused transport) and open transports."""
+        now = time.monotonic()
+        with self._transports_lock:
+            transports = {f"{host}:{port}": round(now - self._transport_used.get((host, port), now), 1)
+                          for (host, port), transport in self._transports.items() if transport.is_active()}
+        return {
+            "transport": "channel",
+            "persist_s": self.idle_timeout,
+            "connect_latency": {kind: window.summary() for kind, window in self._latency.items()},
+            "transports_idle_s": transports,
+        }
+
+    def close(self) -> None:
+        """Close every session, then every transport."""
+        super().close()
+        with self._transports_lock:
+            transports, self._transports = list(self._transports.values()), {}
+            self._transport_used.clear()
+        for transport in transports:
+            transport.close()
@@ -0,0 +1,512 @@
+"""Helpers for reading the robohive teleop console output.
+
+Shared by the SSH engines: incremental detection of the console's startup
+milestones, per-phase wall-clock timing of a session start, a virtual
+screen model from which the live speed limits are read, acknowledgement
+of commands by the console's redraws, and the summary of a teardown of
+many sessions.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]|\x1b[()][A-Za-z0-9]|\x1b[=>]")
+
+
+def strip_ansi(text: str) -> str:
+    """Remove terminal escape sequences (cursor moves, colours) from *text*."""
+    return _ANSI_RE.sub("", text)
+
+
+class ConsoleReadiness:
+    """Incremental parser for the console startup sequence.
+
+    Feed it output chunks as they arrive.  It tracks whether the
+    "Available teleoperables" header has been printed, which teleoperables
+    are listed under it, and whether the platform reported ready after
+    one was selected.
+    """
+
+    TELEOPERABLES_HEADER = "Available teleoperables"
+    # "[0] wemo0101", " 0: wemo0101", "0) wemo0101", ...
+    _ENTRY_RE = re.compile(r"^\s*(?:\[\s*\d+\s*\]|\d+\s*[:.)])\s*(\S+)")
+    _PLATFORM_READY_RE = re.compile(r"platform (?:is )?ready|press '?g'? to grab", re.IGNORECASE)
+
+    def __init__(self) -> None:
+        self.header_seen = False
+        self.platform_ready = False
+        self.teleoperables: List[str] = []
+        self._partial = ""
+
+    def feed(self, text: str) -> None:
+        """Consume a chunk of console output."""
+        self._partial += strip_ansi(text)
+        *lines, self._partial = re.split(r"\r\n|\r|\n", self._partial)
+        for line in lines:
+            self._parse_line(line)
+        # Markers may arrive without a trailing newline (prompts, redraws).
+        if self.TELEOPERABLES_HEADER in self._partial:
+            self.header_seen = True
+        if self._PLATFORM_READY_RE.search(self._partial):
+            self.platform_ready = True
+
+    def _parse_line(self, line: str) -> None:
+        if self.TELEOPERABLES_HEADER in line:
+            self.header_seen = True
+            return
+        if self._PLATFORM_READY_RE.search(line):
+            self.platform_ready = True
+            return
+        if self.header_seen:
+            match = self._ENTRY_RE.match(line)
+            if match:
+                self.teleoperables.append(match.group(1))
+
+    @property
+    def teleoperables_loaded(self) -> bool:
+        return self.header_seen and bool(self.teleoperables)
+
+
+class PhaseTimer:
+    """Records how long each named phase of an operation took."""
+
+    def __init__(self) -> None:
+        self._started = self._last = time.monotonic()
+        # Wall-clock start; phase boundaries are offsets from it
+        self.started_at = time.time()
+        self.phases: Dict[str, float] = {}
+
+    def mark(self, phase: str) -> float:
+        """Close *phase* at the current instant and return its duration."""
+        now = time.monotonic()
+        duration = now - self._last
+        self.phases[phase] = duration
+        self._last = now
+        return duration
+
+    @property
+    def total(self) -> float:
+        return self._last - self._started
+
+    @property
+    def pending(self) -> float:
+        """Time spent since the last closed phase."""
+        return time.monotonic() - self._last
+
+    def as_dict(self) -> Dict[str, float]:
+        timings = {phase: round(duration, 3) for phase, duration in self.phases.items()}
+        timings["total"] = round(self.total, 3)
+        return timings
+
+
+def teardown_summary(reports: Iterable[Dict[str, Any]], timed_out: Iterable[int],
+                     duration: float) -> Dict[str, Any]:
+    """Summarise a teardown of many sessions.
+
+    Args:
+        reports: Per-bot teardown reports with ``released`` (control release
+            acknowledged) and ``exited`` (the console's shell exited) flags
+        timed_out: Bots whose teardown did not finish within the deadline
+        duration: Seconds the whole teardown took
+
+    Returns:
+        Bots released cleanly, released without every acknowledgement, and
+        timed out, plus the per-bot reports
+    """
+    reports = sorted(reports, key=lambda report: report["bot_id"])
+    return {
+        "released": [r["bot_id"] for r in reports if r["released"] and r["exited"]],
+        "unclean": [r["bot_id"] for r in reports if not (r["released"] and r["exited"])],
+        "timed_out": sorted(timed_out),
+        "duration_s": round(duration, 3),
+        "reports": reports,
+    }
+
+
+class VirtualScreen:
+    """Minimal VT100 screen model fed incrementally with console output.
+
+    Handles printable text, CR/LF/BS/TAB, scrolling, and the CSI sequences a
+    curses-style redraw uses: cursor movement and positioning, erase in
+    display/line, insert/delete/erase characters and cursor save/restore.
+    Other sequences (colours, modes, charsets) are consumed and ignored.
+    Escape sequences split across chunks are carried over to the next feed.
+    """
+
+    def __init__(self, rows: int = 24, cols: int = 80) -> None:
+        self.rows = rows
+        self.cols = cols
+        self._lines = [[" "] * cols for _ in range(rows)]
+        self.row = self.col = 0
+        self._saved = (0, 0)
+        self._state = "ground"
+        self._params = ""
+        # Rows changed since the last take_dirty()
+        self._dirty: Set[int] = set()
+
+    # --------------------------------------------------------------
+    # Reading
+    # --------------------------------------------------------------
+    def line(self, row: int) -> str:
+        return "".join(self._lines[row]).rstrip()
+
+    def display(self) -> List[str]:
+        return [self.line(row) for row in range(self.rows)]
+
+    def take_dirty(self) -> List[int]:
+        """Rows changed since the previous call, top to bottom."""
+        dirty, self._dirty = sorted(self._dirty), set()
+        return dirty
+
+    # --------------------------------------------------------------
+    # Feeding
+    # --------------------------------------------------------------
+    def feed(self, text: str) -> None:
+        for ch in text:
+            state = self._state
+            if state == "ground":
+                if ch == "\x1b":
+                    self._state = "escape"
+                elif ch >= " " and ch != "\x7f":
+                    self._put(ch)
+                else:
+                    self._control(ch)
+            elif state == "escape":
+                self._escape(ch)
+            elif state == "csi":
+                if "@" <= ch <= "~":
+                    self._state = "ground"
+                    self._csi(ch, self._params)
+                else:
+                    self._params += ch
+            else:  # "charset": ESC ( X / ESC ) X
+                self._state = "ground"
+
+    def _put(self, ch: str) -> None:
+        if self.col >= self.cols:
+            self.col = 0
+            self._linefeed()
+        self._lines[self.row][self.col] = ch
+        self._dirty.add(self.row)
+        self.col += 1
+
+    def _control(self, ch: str) -> None:
+        if ch == "\r":
+            self.col = 0
+        elif ch == "\n":
+            self._linefeed()
+        elif ch == "\b":
+            self.col = max(0, self.col - 1)
+        elif ch == "\t":
+            self.col = min(self.cols - 1, (self.col // 8 + 1) * 8)
+
+    def _linefeed(self) -> None:
+        if self.row < self.rows - 1:
+            self.row += 1
+            return
+        self._lines.pop(0)
+        self._lines.append([" "] * self.cols)
+        self._dirty.update(range(self.rows))
+
+    def _escape(self, ch: str) -> None:
+        self._state = "ground"
+        if ch == "[":
+            self._state = "csi"
+            self._params = ""
+        elif ch in "()":
+            self._state = "charset"
+        elif ch == "7":
+            self._saved = (self.row, self.col)
+        elif ch == "8":
+            self.row, self.col = self._saved
+        elif ch == "D":
+            self._linefeed()
+        elif ch == "E":
+            self.col = 0
+            self._linefeed()
+        elif ch == "M":
+            self.row = max(0, self.row - 1)
+        elif ch == "c":
+            self.__init__(self.rows, self.cols)
+
+    def _csi(self, final: str, params: str) -> None:
+        if params.startswith("?") or final in "mhlr":
+            return  # private modes, colours, scroll region
+        args = [int(p) if p.isdigit() else 0 for p in params.split(";")] if params else []
+
+        def arg(index: int = 0, default: int = 1) -> int:
+            value = args[index] if index < len(args) else 0
+            return value or default
+
+        if final == "A":
+            self.row = max(0, self.row - arg())
+        elif final == "B":
+            self.row = min(self.rows - 1, self.row + arg())
+        elif final == "C":
+            self.col = min(self.cols - 1, self.col + arg())
+        elif final == "D":
+            self.col = max(0, self.col - arg())
+        elif final == "E":
+            self.row, self.col = min(self.rows - 1, self.row + arg()), 0
+        elif final == "F":
+            self.row, self.col = max(0, self.row - arg()), 0
+        elif final == "G":
+            self.col = min(self.cols - 1, arg() - 1)
+        elif final == "d":
+            self.row = min(self.rows - 1, arg() - 1)
+        elif final in "Hf":
+            self.row = min(self.rows - 1, arg(0) - 1)
+            self.col = min(self.cols - 1, arg(1) - 1)
+        elif final == "J":
+            mode = arg(0, 0)
+            if mode == 0:
+                self._erase(self.row, self.col, self.cols)
+                rows = range(self.row + 1, self.rows)
+            elif mode == 1:
+                self._erase(self.row, 0, self.col + 1)
+                rows = range(0, self.row)
+            else:
+                rows = range(self.rows)
+            for row in rows:
+                self._erase(row, 0, self.cols)
+        elif final == "K":
+            mode = arg(0, 0)
+            start, end = {0: (self.col, self.cols), 1: (0, self.col + 1)}.get(mode, (0, self.cols))
+            self._erase(self.row, start, end)
+        elif final == "X":
+            self._erase(self.row, self.col, min(self.cols, self.col + arg()))
+        elif final == "P":
+            line = self._lines[self.row]
+            del line[self.col:self.col + arg()]
+            line.extend([" "] * (self.cols - len(line)))
+            self._dirty.add(self.row)
+        elif final == "@":
+            line = self._lines[self.row]
+            line[self.col:self.col] = [" "] * arg()
+            del line[self.cols:]
+            self._dirty.add(self.row)
+        elif final == "s":
+            self._saved = (self.row, self.col)
+        elif final == "u":
+            self.row, self.col = self._saved
+
+    def _erase(self, row: int, start: int, end: int) -> None:
+        line = self._lines[row]
+        for col in range(start, end):
+            line[col] = " "
+        self._dirty.add(row)
+
+
+class AckLost(Exception):
+    """A command's acknowledgement can no longer arrive."""
+
+
+class CommandAcks:
+    """Futures resolved when the console shows that a command took effect.
+
+    A command is acknowledged by the first screen redraw after its
+    keystrokes were written.  For a command tracked with *fields* only a
+    redraw showing one of them counts (the speed readout for a speed
+    change, the grab banner for a grab); for the others any redraw does.
+    Futures resolve with the seconds from tracking to acknowledgement.
+    They fail with AckLost when the write fails, when no redraw arrives
+    within *window* seconds, when *max_pending* newer commands push them
+    out, or when the session closes.
+    """
+
+    def __init__(self, window: float = 5.0, max_pending: int = 64) -> None:
+        self.window = window
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        # (fields, tracked at, write future, ack future), oldest first
+        self._pending: Deque[Tuple[Sequence[str], float, Future, Future]] = deque()
+        self._closed = False
+
+    def track(self, written: Future, fields: Sequence[str] = ()) -> Future:
+        """Future acknowledging the command whose write *written* completes."""
+        ack: Future = Future()
+        entry = (tuple(fields), time.monotonic(), written, ack)
+        with self._lock:
+            if self._closed:
+                pushed_out = [entry]
+            else:
+                pushed_out = []
+                while len(self._pending) >= self.max_pending:
+                    pushed_out.append(self._pending.popleft())
+                self._pending.append(entry)
+        for lost in pushed_out:
+            self._fail(lost, "session closed" if lost is entry else "pushed out by newer commands")
+        written.add_done_callback(lambda done: self._written(entry, done))
+        return ack
+
+    def redrawn(self, seen: Dict[str, Any]) -> None:
+        """Acknowledge written commands matching a redraw that showed *seen*."""
+        now = time.monotonic()
+        acked, expired = [], []
+        with self._lock:
+            if not self._pending:
+                return
+            kept: Deque = deque()
+            for entry in self._pending:
+                fields, tracked, written, _ = entry
+                if written.done() and (not fields or any(field in seen for field in fields)):
+                    acked.append(entry)
+                elif now - tracked >= self.window:
+                    expired.append(entry)
+                else:
+                    kept.append(entry)
+            self._pending = kept
+        for _, tracked, _, ack in acked:
+            ack.set_result(now - tracked)
+        for entry in expired:
+            self._fail(entry, f"no redraw within {self.window:g}s")
+
+    def close(self) -> None:
+        """Fail every pending acknowledgement; later ones fail at once."""
+        with self._lock:
+            self._closed = True
+            pending, self._pending = self._pending, deque()
+        for entry in pending:
+            self._fail(entry, "session closed")
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _written(self, entry: tuple, written: Future) -> None:
+        if not written.cancelled() and written.exception() is None:
+            return
+        with self._lock:
+            try:
+                self._pending.remove(entry)
+            except ValueError:
+                return
+        self._fail(entry, "write cancelled" if written.cancelled() else f"write failed: {written.exception()}")
+
+    @staticmethod
+    def _fail(entry: tuple, reason: str) -> None:
+        ack = entry[3]
+        if not ack.done():
+            ack.set_exception(AckLost(reason))
+
+
+class ConsoleStateMonitor:
+    """Tracks the state shown on a live teleop console.
+
+    feed() runs the output through a VirtualScreen and re-reads only the
+    rows that changed, picking up the speed limits, whether control is
+    grabbed, and the latest warning.  Values are cached (the speed limits
+    with the time they were last displayed), so reads are in-memory, and
+    *on_change* is called with just the fields whose value changed.  Every
+    redraw is also passed to ``acks``, acknowledging the commands it shows.
+    """
+
+    _LINEAR_RE = re.compile(r"linear[^0-9+\-]{0,30}([+-]?\d+(?:\.\d+)?)", re.IGNORECASE)
+    _ANGULAR_RE = re.compile(r"angular[^0-9+\-]{0,30}([+-]?\d+(?:\.\d+)?)", re.IGNORECASE)
+    _GRABBED_RE = re.compile(r"WATCH OUT FOR MOVING ROBOT")
+    _RELEASED_RE = re.compile(r"control released", re.IGNORECASE)
+    _WARNING_RE = re.compile(r"\b(?:WARN(?:ING)?|ERROR)\b")
+
+    def __init__(self, rows: int = 24, cols: int = 80,
+                 on_change: Optional[Callable[[Dict[str, Any]], None]] = None, ack_window: float = 5.0) -> None:
+        self.screen = VirtualScreen(rows, cols)
+        self._on_change = on_change
+        self.acks = CommandAcks(window=ack_window)
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._fields: Dict[str, Any] = {
+            "linear_speed": None,
+            "angular_speed": None,
+            "grabbed": None,
+            "warning": None,
+        }
+        # field -> monotonic time its value last changed
+        self._changed_at: Dict[str, float] = {}
+        self._speed_seen_at: Optional[float] = None
+        self._speed_seen_wall: Optional[float] = None
+
+    def feed(self, text: str) -> None:
+        """Consume a chunk of console output."""
+        self.screen.feed(text)
+        seen: Dict[str, Any] = {}
+        redrawn = self.screen.take_dirty()
+        for row in redrawn:
+            line = self.screen.line(row)
+            match = self._LINEAR_RE.search(line)
+            if match:
+                seen["linear_speed"] = float(match.group(1))
+            match = self._ANGULAR_RE.search(line)
+            if match:
+                seen["angular_speed"] = float(match.group(1))
+            if self._GRABBED_RE.search(line):
+                seen["grabbed"] = True
+            elif self._RELEASED_RE.search(line):
+                seen["grabbed"] = False
+            elif self._WARNING_RE.search(line):
+                seen["warning"] = line.strip()
+        if not seen:
+            if redrawn:
+                self.acks.redrawn(seen)
+            return
+        with self._lock:
+            if "linear_speed" in seen or "angular_speed" in seen:
+                self._speed_seen_at = time.monotonic()
+                self._speed_seen_wall = time.time()
+            changed = {key: value for key, value in seen.items() if self._fields[key] != value}
+            if changed:
+                self._fields.update(changed)
+                now = time.monotonic()
+                self._changed_at.update((key, now) for key in changed)
+                self._changed.notify_all()
+        if changed and self._on_change is not None:
+            self._on_change(changed)
+        self.acks.redrawn(seen)
+
+    def assume(self, field: str, value: Any) -> None:
+        """Record *value* for *field* without the console displaying it, for
+        an effect known from an acknowledged command (control released by
+        an emergency stop on a console that prints no release line)."""
+        with self._lock:
+            changed = self._fields[field] != value
+            if changed:
+                self._fields[field] = value
+                self._changed_at[field] = time.monotonic()
+                self._changed.notify_all()
+        if changed and self._on_change is not None:
+            self._on_change({field: value})
+
+    def state(self) -> Dict[str, Any]:
+        """All tracked fields."""
+        with self._lock:
+            return dict(self._fields)
+
+    def wait_for(self, field: str, value: Any, timeout: float) -> Optional[float]:
+        """Block until *field* shows *value*.
+
+        Returns:
+            When (monotonic) it changed to *value*, or None after *timeout*
+        """
+        with self._changed:
+            if not self._changed.wait_for(lambda: self._fields[field] == value, timeout):
+                return None
+            return self._changed_at.get(field, time.monotonic())
+
+    def speed(self) -> Dict[str, Any]:
+        """Last-known speed limits, when they were last shown and how old that is."""
+        with self._lock:
+            seen_at, seen_wall = self._speed_seen_at, self._speed_seen_wall
+            linear, angular = self._fields["linear_speed"], self._fields["angular_speed"]
+        return {
+            "linear_speed": linear,
+            "angular_speed": angular,
+            "updated_at": (datetime.fromtimestamp(seen_wall, timezone.utc).isoformat()
+                           if seen_wall is not None else None),
+            "age_s": round(time.monotonic() - seen_at, 3) if seen_at is not None else None,
+        }
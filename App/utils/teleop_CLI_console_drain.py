@@ -0,0 +1,110 @@
+"""Background draining of a live console's output.
+
+Once a session is grabbed nothing else reads from the console, but the
+teleop console keeps redrawing its screen.  Unread output fills the pty
+buffer until writes stall.  ConsoleDrain keeps reading on its own thread
+and keeps only the most recent output in a fixed-size ConsoleRingBuffer,
+whose memory use is reported per session.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+from App.utils.teleop_CLI_console import strip_ansi
+
+logger = logging.getLogger("SSH.drain")
+
+
+class ConsoleRingBuffer:
+    """Keeps the last *capacity* bytes of console output."""
+
+    def __init__(self, capacity: int = 64 * 1024) -> None:
+        self.capacity = capacity
+        self._data = bytearray()
+        self._lock = threading.Lock()
+        self._total = 0
+        self._dropped = 0
+        self._high_water = 0
+
+    def append(self, text: str) -> None:
+        chunk = text.encode("utf-8", errors="replace")
+        with self._lock:
+            self._total += len(chunk)
+            self._data += chunk
+            excess = len(self._data) - self.capacity
+            if excess > 0:
+                del self._data[:excess]
+                self._dropped += excess
+            self._high_water = max(self._high_water, len(self._data))
+
+    def tail(self, size: Optional[int] = None, raw: bool = False) -> str:
+        """The last *size* bytes (all by default) as text, escape codes
+        stripped unless *raw*."""
+        with self._lock:
+            data = bytes(self._data if size is None else self._data[-size:])
+        text = data.decode("utf-8", errors="replace")
+        return text if raw else strip_ansi(text)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size_bytes": len(self._data),
+                "capacity_bytes": self.capacity,
+                "high_water_bytes": self._high_water,
+                "total_read_bytes": self._total,
+                "dropped_bytes": self._dropped,
+            }
+
+
+class ConsoleDrain:
+    """Thread reading a console into a ConsoleRingBuffer until stopped."""
+
+    def __init__(self, bot_id: int, read: Callable[[], Optional[str]], capacity: int = 64 * 1024,
+                 on_output: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Args:
+            bot_id: Bot the console belongs to (thread name and logs)
+            read: Returns output read within a short timeout ("" if none),
+                or None once the console has closed
+            capacity: Ring buffer size in bytes
+            on_output: Also called with every chunk read (e.g. a screen parser)
+        """
+        self.bot_id = bot_id
+        self.buffer = ConsoleRingBuffer(capacity)
+        self._read = read
+        self._on_output = on_output
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"drain-bot-{bot_id}", daemon=True)
+        self._thread.start()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop reading; returns once the reader is out of its current read."""
+        self._stop.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                text = self._read()
+            except Exception as e:
+                if not self._stop.is_set():
+                    logger.warning("Console drain for bot %s stopped: %s", self.bot_id, e)
+                return
+            if text is None:
+                logger.info("Console for bot %s closed", self.bot_id)
+                return
+            if text:
+                self.buffer.append(text)
+                if self._on_output is not None:
+                    try:
+                        self._on_output(text)
+                    except Exception:
+                        logger.exception("Console output handler for bot %s failed", self.bot_id)
@@ -0,0 +1,171 @@
+"""Background liveness checks and a cached session status table.
+
+Status reads used to call isalive() on the session's process on every
+request, so many pollers watching many bots meant a steady flood of
+process checks.  SessionLivenessMonitor checks every active session once
+per interval on its own thread and keeps the result in a table that
+status reads look up directly.  Every status transition is kept, with
+timestamps, in a bounded event history.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("SSH.liveness")
+
+
+def _iso(wall: float) -> str:
+    return datetime.fromtimestamp(wall, timezone.utc).isoformat()
+
+
+class _Health:
+    __slots__ = ("status", "since", "checked_at")
+
+    def __init__(self, status: str) -> None:
+        self.status = status
+        self.since = time.time()
+        self.checked_at = self.since
+
+
+class SessionLivenessMonitor:
+    """Cached per-bot session status, refreshed by a periodic check."""
+
+    ACTIVE = "active"
+    TERMINATED = "terminated"
+    RECOVERING = "recovering"
+    ENDED = "ended"
+
+    def __init__(self,
+                 is_alive: Callable[[int], bool],
+                 on_terminated: Optional[Callable[[int], None]] = None,
+                 on_transition: Optional[Callable[[int, str], None]] = None,
+                 interval: float = 2.0,
+                 history: int = 256) -> None:
+        """
+        Args:
+            is_alive: Checks whether a bot's session process is still running
+            on_terminated: Called (on the monitor thread) for a session found dead
+            on_transition: Called with the bot and its new status on every change
+            interval: Seconds between checks of every active session
+            history: Status transitions kept for events()
+        """
+        self._is_alive = is_alive
+        self._on_terminated = on_terminated
+        self._on_transition = on_transition
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._table: Dict[int, _Health] = {}
+        self._events: "deque[Dict[str, Any]]" = deque(maxlen=history)
+        self._checks = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Status transitions
+    # ------------------------------------------------------------------
+    def mark(self, bot_id: int, status: str, reason: str = "") -> bool:
+        """Record *bot_id* as *status*.
+
+        Returns:
+            Whether this was a change (marking a bot that never had a session
+            as ended or terminated is not)
+        """
+        with self._lock:
+            health = self._table.get(bot_id)
+            previous = health.status if health else None
+            if previous == status or (previous is None and status != self.ACTIVE):
+                return False
+            self._table[bot_id] = _Health(status)
+            self._events.append({
+                "bot_id": bot_id,
+                "from": previous,
+                "to": status,
+                "reason": reason,
+                "at": _iso(self._table[bot_id].since),
+            })
+        logger.info("Session for bot %s: %s -> %s (%s)", bot_id, previous, status, reason)
+        if self._on_transition is not None:
+            self._on_transition(bot_id, status)
+        return True
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def status(self, bot_id: int) -> Optional[str]:
+        """Cached status of *bot_id*, or None if it never had a session."""
+        health = self._table.get(bot_id)
+        return health.status if health else None
+
+    def health(self, bot_id: int) -> Optional[Dict[str, Any]]:
+        """Cached status of *bot_id* with when it began and when it was last confirmed."""
+        with self._lock:
+            health = self._table.get(bot_id)
+            if health is None:
+                return None
+            return {"status": health.status, "since": _iso(health.since),
+                    "checked_at": _iso(health.checked_at)}
+
+    def statuses(self) -> Dict[int, str]:
+        with self._lock:
+            return {bot_id: health.status for bot_id, health in self._table.items()}
+
+    def events(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Recorded transitions, oldest first (the last *limit* of them)."""
+        with self._lock:
+            events = list(self._events)
+        return events[-limit:] if limit else events
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for health in self._table.values():
+                counts[health.status] = counts.get(health.status, 0) + 1
+            return {"interval_s": self.interval, "checks": self._checks, "statuses": counts}
+
+    # ------------------------------------------------------------------
+    # Checking
+    # ------------------------------------------------------------------
+    def check(self) -> None:
+        """Check every active session once."""
+        with self._lock:
+            active = [bot_id for bot_id, health in self._table.items() if health.status == self.ACTIVE]
+        for bot_id in active:
+            try:
+                alive = self._is_alive(bot_id)
+            except Exception:
+                logger.exception("Liveness check for bot %s failed", bot_id)
+                continue
+            with self._lock:
+                self._checks += 1
+                health = self._table.get(bot_id)
+                if health is not None and alive:
+                    health.checked_at = time.time()
+            if not alive and self.mark(bot_id, self.TERMINATED, "process exited"):
+                if self._on_terminated is not None:
+                    self._on_terminated(bot_id)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="liveness-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Liveness pass failed")
@@ -0,0 +1,339 @@
+"""
+Logging Pipeline
+
+Log records are put on a bounded queue by the thread that logs them and
+written by one background thread, so a request never waits on the disk or
+the console.  The writer takes every record waiting on the queue at once
+and writes the batch with a single write and flush per destination.
+
+- The log file is rotated by size and by age, keeping numbered backups
+  (``api_requests.log.1`` is the newest) like RotatingFileHandler.
+- Records render as text lines or, with ``fmt="json"``, as one JSON
+  object per line.  Structured data passed as ``extra={"fields": {...}}``
+  is serialised by the writer, not by the caller.
+- When the queue is full, records are dropped rather than blocking the
+  caller.  The writer logs how many were lost once it catches up.
+- Records of high-rate requests (move / rotate) can be sampled per level
+  with RequestSampler: only 1 in N of those requests keeps its records of
+  that level.  Either all the records of a request are kept or none are.
+"""
+
+import atexit
+import contextvars
+import itertools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, List, Optional, TextIO
+
+from App.core.config import (LOG_BACKUP_COUNT, LOG_BATCH_SIZE, LOG_FORMAT, LOG_MAX_BYTES, LOG_QUEUE_SIZE,
+                             LOG_ROTATE_INTERVAL)
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Levels whose records the current request drops (see RequestSampler)
+_DROPPED_LEVELS: contextvars.ContextVar[FrozenSet[int]] = contextvars.ContextVar("log_dropped_levels",
+                                                                                 default=frozenset())
+
+
+def parse_sampling(spec: str) -> Dict[int, int]:
+    """Levels and rates from 'INFO=10,DEBUG=100' (keep 1 in N requests)."""
+    rates: Dict[int, int] = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, every = part.partition("=")
+        level = logging.getLevelName(name.strip().upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown log level in sampling spec: {name!r}")
+        rates[level] = int(every)
+    return rates
+
+
+class TextFormatter(logging.Formatter):
+    """The usual text line, followed by the record's fields as JSON."""
+
+    def __init__(self) -> None:
+        super().__init__(TEXT_FORMAT)
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        line = super().formatMessage(record)
+        fields = getattr(record, "fields", None)
+        return f"{line} {json.dumps(fields, default=str)}" if fields else line
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message and fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+def make_formatter(fmt: str) -> logging.Formatter:
+    """Formatter for LOG_FORMAT ('text' or 'json')."""
+    if fmt == "json":
+        return JSONFormatter()
+    if fmt == "text":
+        return TextFormatter()
+    raise ValueError(f"Unknown log format: {fmt!r} (expected 'text' or 'json')")
+
+
+class RequestSampler(logging.Filter):
+    """
+    Keeps the records of 1 in N sampled requests, per level.
+
+    A request calls sample() when it starts and reset() when it is done;
+    with rates {INFO: 10} the records it logs at INFO (from any thread
+    that inherits its context) are kept for every tenth request only.
+    Levels without a rate are always kept; a rate of 0 drops the level.
+    """
+
+    def __init__(self, rates: Optional[Dict[int, int]] = None) -> None:
+        super().__init__()
+        self.rates: Dict[int, int] = dict(rates or {})
+        self._requests = itertools.count()
+        self.sampled_out = 0
+
+    def sample(self) -> contextvars.Token:
+        """Decide which levels the current request keeps."""
+        n = next(self._requests)
+        dropped = frozenset(level for level, every in self.rates.items() if every <= 0 or n % every)
+        return _DROPPED_LEVELS.set(dropped)
+
+    @staticmethod
+    def reset(token: contextvars.Token) -> None:
+        _DROPPED_LEVELS.reset(token)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno in _DROPPED_LEVELS.get():
+            self.sampled_out += 1
+            return False
+        return True
+
+
+# Shared by the request middleware and the handlers configure_logging installs
+request_sampler = RequestSampler()
+
+
+class RotatingFile:
+    """
+    Append-only file rotated when it would grow past *max_bytes* or is
+    older than *interval* seconds (0 disables either), keeping
+    *backup_count* numbered backups.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 0, interval: float = 0, backup_count: int = 5) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.backup_count = backup_count
+        self.rotations = 0
+        self._open()
+
+    def _open(self) -> None:
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        self._rotate_at = time.time() + self.interval if self.interval else None
+
+    def write(self, text: str) -> None:
+        if self._size and ((self.max_bytes and self._size + len(text) > self.max_bytes)
+                           or (self._rotate_at is not None and time.time() >= self._rotate_at)):
+            self.rotate()
+        self._file.write(text)
+        self._file.flush()
+        self._size += len(text)
+
+    def rotate(self) -> None:
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                older = f"{self.path}.{index}"
+                if os.path.exists(older):
+                    os.replace(older, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.rotations += 1
+        self._open()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Enqueues without blocking; records that do not fit are counted."""
+
+    def __init__(self, pipeline: "LogPipeline") -> None:
+        super().__init__(pipeline.queue)
+        self._pipeline = pipeline
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments now since they may change before the writer
+        # gets to them; the timestamp and the rest are formatted there
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._pipeline.formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._pipeline.dropped += 1
+
+
+class LogPipeline:
+    """
+    Bounded record queue drained by one background writer thread.
+
+    ``handler`` is attached to the loggers; the writer formats up to
+    *batch_size* queued records at a time and writes them to the
+    RotatingFile at *path* and to *stream* (the console; None for none).
+    """
+
+    def __init__(self, path: Optional[str], formatter: logging.Formatter, stream: Optional[TextIO] = None,
+                 queue_size: int = LOG_QUEUE_SIZE, batch_size: int = LOG_BATCH_SIZE,
+                 max_bytes: int = LOG_MAX_BYTES, rotate_interval: float = LOG_ROTATE_INTERVAL,
+                 backup_count: int = LOG_BACKUP_COUNT) -> None:
+        self.formatter = formatter
+        self.queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(maxsize=queue_size)
+        self.batch_size = max(1, batch_size)
+        self.stream = stream
+        self.file = RotatingFile(path, max_bytes, rotate_interval, backup_count) if path else None
+        self.handler = _QueueHandler(self)
+        self.dropped = 0
+        self.counters = {"written": 0, "batches": 0, "write_errors": 0}
+        self._reported_dropped = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "LogPipeline":
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write everything queued so far, then stop the writer."""
+        if self._thread is None:
+            return
+        thread, self._thread = self._thread, None
+        atexit.unregister(self.stop)
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout)
+        if self.file is not None:
+            self.file.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {**self.counters, "queued": self.queue.qsize(), "dropped": self.dropped,
+                "rotations": self.file.rotations if self.file is not None else 0}
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Optional[logging.LogRecord]] = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = batch[-1] is None
+            self._write([record for record in batch if record is not None])
+            if stopping:
+                return
+
+    def _write(self, records: List[logging.LogRecord]) -> None:
+        lines = []
+        dropped = self.dropped - self._reported_dropped
+        if dropped:
+            self._reported_dropped += dropped
+            lines.append(self.formatter.format(logging.LogRecord(
+                __name__, logging.WARNING, __file__, 0,
+                f"{dropped} log records dropped: logging queue full", None, None)))
+        for record in records:
+            try:
+                lines.append(self.formatter.format(record))
+            except Exception:
+                self.counters["write_errors"] += 1
+        if not lines:
+            return
+        text = "\n".join(lines) + "\n"
+        for destination in (self.file, self.stream):
+            if destination is None:
+                continue
+            try:
+                destination.write(text)
+                if destination is self.stream:
+                    destination.flush()
+            except Exception:
+                self.counters["write_errors"] += 1
+        self.counters["written"] += len(records)
+        self.counters["batches"] += 1
+
+
+def configure_logging(path: Optional[str], use_queue: bool = True, fmt: str = LOG_FORMAT,
+                      sampling: str = "", stream: Optional[TextIO] = None,
+                      force: bool = False) -> Optional[LogPipeline]:
+    """
+    Send INFO and above to the console and to *path*.
+
+    With *use_queue* the records go through a started LogPipeline, which is
+    returned; otherwise handlers write synchronously on the logging thread.
+    Like logging.basicConfig, nothing is changed when the root logger
+    already has handlers, unless *force* replaces them.
+
+    Args:
+        path: Log file, or None for the console only
+        use_queue: Write from a background thread instead of the caller
+        fmt: 'text' or 'json'
+        sampling: Per-level rates for sampled requests, e.g. 'INFO=10'
+        stream: Console stream (default stderr)
+        force: Replace the root logger's handlers
+    """
+    root = logging.getLogger()
+    if root.handlers and not force:
+        return None
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+    formatter = make_formatter(fmt)
+    request_sampler.rates = parse_sampling(sampling)
+    stream = stream if stream is not None else sys.stderr
+    pipeline = None
+    if use_queue:
+        pipeline = LogPipeline(path, formatter, stream).start()
+        handlers: List[logging.Handler] = [pipeline.handler]
+    else:
+        handlers = [logging.StreamHandler(stream)]
+        if path:
+            handlers.append(logging.FileHandler(path))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        handler.addFilter(request_sampler)
+        root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    return pipeline
@@ -0,0 +1,262 @@
+"""Small in-process metric helpers shared by the SSH layer.
+
+Besides the rolling latency summaries used by the stats endpoints, this
+module holds a minimal metrics registry rendered in the Prometheus text
+exposition format: labelled counters, histograms and scrape-time gauges.
+Recording is a dict lookup and a few integer updates under a lock, so it
+can sit on the command path.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Samples kept per window for the percentile summary
+DEFAULT_WINDOW = 512
+# Upper bounds (seconds) of the histogram buckets, Prometheus style
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of *values* (None when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 4)
+
+
+class LatencyWindow:
+    """Thread-safe rolling window of durations with a count/mean/p50/p95 summary."""
+
+    def __init__(self, maxlen: int = DEFAULT_WINDOW) -> None:
+        self._lock = threading.Lock()
+        self._values = deque(maxlen=maxlen)
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._values.append(seconds)
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        with self._lock:
+            values = list(self._values)
+        return {
+            "count": len(values),
+            "mean_s": round(sum(values) / len(values), 4) if values else None,
+            "p50_s": percentile(values, 50),
+            "p95_s": percentile(values, 95),
+        }
+
+
+class LatencyHistogram:
+    """Thread-safe cumulative histogram of durations over fixed buckets.
+
+    Every observation is counted, so the buckets describe all traffic since
+    start; percentiles come from a rolling window of the latest samples.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, window: int = DEFAULT_WINDOW) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # One count per bucket plus the overflow (+Inf) bucket
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._max = 0.0
+        self._window = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += seconds
+            if seconds > self._max:
+                self._max = seconds
+            self._window.append(seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        """Count, sum, max, p50/p95/p99 and cumulative bucket counts ("le_<bound>")."""
+        with self._lock:
+            counts = list(self._counts)
+            total, largest = self._sum, self._max
+            values = list(self._window)
+        cumulative, running = {}, 0
+        for bound, count in zip((*self.buckets, "+Inf"), counts):
+            running += count
+            cumulative[f"le_{bound}"] = running
+        return {
+            "count": running,
+            "sum_s": round(total, 4),
+            "max_s": round(largest, 4),
+            "p50_s": percentile(values, 50),
+            "p95_s": percentile(values, 95),
+            "p99_s": percentile(values, 99),
+            "buckets": cumulative,
+        }
+
+    def cumulative(self) -> Tuple[List[int], float]:
+        """Cumulative count per bucket (the last is +Inf) and the sum of observations."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        running = 0
+        for index, count in enumerate(counts):
+            running += count
+            counts[index] = running
+        return counts, total
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[object], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Family:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class CounterFamily(_Family):
+    """Monotonic counters, one per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: Dict[tuple, float] = {}
+
+    def inc(self, *label_values: object, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: object) -> float:
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def values(self) -> Dict[tuple, float]:
+        """Every counter, keyed by label values."""
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items(), key=lambda item: tuple(map(str, item[0])))
+        name = f"{self.name}_total"
+        return ([f"# HELP {name} {self.documentation}", f"# TYPE {name} counter"]
+                + [f"{name}{_labels(self.label_names, key)} {_number(value)}" for key, value in values])
+
+
+class HistogramFamily(_Family):
+    """Latency histograms over shared buckets, one per label combination."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, window: int = DEFAULT_WINDOW) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._window = window
+        self._children: Dict[tuple, LatencyHistogram] = {}
+
+    def labels(self, *label_values: object) -> LatencyHistogram:
+        """The histogram for *label_values*, created on first use."""
+        child = self._children.get(label_values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(label_values, LatencyHistogram(self.buckets, self._window))
+        return child
+
+    def observe(self, seconds: float, *label_values: object) -> None:
+        child = self._children.get(label_values)
+        (child if child is not None else self.labels(*label_values)).add(seconds)
+
+    def children(self) -> Dict[tuple, LatencyHistogram]:
+        """Every histogram, keyed by label values."""
+        with self._lock:
+            return dict(self._children)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            children = sorted(self._children.items(), key=lambda item: tuple(map(str, item[0])))
+        lines = self.header()
+        bounds = [_number(bound) for bound in self.buckets] + ["+Inf"]
+        for key, child in children:
+            counts, total = child.cumulative()
+            for bound, count in zip(bounds, counts):
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, key, le)} {count}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, key)} {counts[-1]}")
+        return lines
+
+
+class GaugeFamily(_Family):
+    """Values read at scrape time from *collect*, keyed by label values."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str],
+                 collect: Callable[[], Dict[tuple, float]]) -> None:
+        super().__init__(name, documentation, labels)
+        self._collect = collect
+
+    def render(self) -> List[str]:
+        values = sorted(self._collect().items(), key=lambda item: tuple(map(str, item[0])))
+        return self.header() + [f"{self.name}{_labels(self.label_names, key)} {_number(value)}"
+                                for key, value in values]
+
+
+class MetricsRegistry:
+    """Named metric families rendered together in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._families: Dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, family: _Family) -> _Family:
+        with self._lock:
+            if family.name in self._families:
+                raise ValueError(f"Metric {family.name} is already registered")
+            self._families[family.name] = family
+        return family
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> CounterFamily:
+        return self._register(CounterFamily(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS, window: int = DEFAULT_WINDOW) -> HistogramFamily:
+        return self._register(HistogramFamily(name, documentation, labels, buckets, window))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str],
+              collect: Callable[[], Dict[tuple, float]]) -> GaugeFamily:
+        return self._register(GaugeFamily(name, documentation, labels, collect))
+
+    def render(self) -> str:
+        with self._lock:
+            families = list(self._families.values())
+        lines = [line for family in families for line in family.render()]
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+# Metrics of the API process itself (HTTP handling and the service layer)
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,151 @@
+"""Bounded history of session-start phase timings.
+
+A session start runs through several phases (connect, authenticate,
+console launch, teleoperables, platform ready, grab) and takes tens of
+seconds in total.  The last start of each bot only says how that one
+attempt went; PhaseHistory keeps the last few hundred attempts per bot,
+failed ones included, so percentiles per phase and per bot show which
+phase is slow, and on which robots.
+
+Records are compact: the phase names of an attempt are an interned tuple
+shared by every attempt that went through the same phases, and the
+durations a float32 array.
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from App.utils.teleop_CLI_metrics import percentile
+
+# Attempt outcomes
+OK = "ok"
+FAILED = "failed"
+
+
+def _iso(wall: float) -> str:
+    return datetime.fromtimestamp(wall, timezone.utc).isoformat()
+
+
+class _Attempt:
+    __slots__ = ("started_at", "source", "outcome", "phases", "durations", "error")
+
+    def __init__(self, started_at: float, source: str, outcome: str, phases: Tuple[str, ...],
+                 durations: array, error: Optional[str]) -> None:
+        self.started_at = started_at
+        self.source = source
+        self.outcome = outcome
+        self.phases = phases
+        self.durations = durations
+        self.error = error
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The attempt with every phase's start offset and duration."""
+        offset, phases = 0.0, []
+        for phase, duration in zip(self.phases, self.durations):
+            phases.append({"phase": phase, "start_s": round(offset, 3), "duration_s": round(duration, 3)})
+            offset += duration
+        return {"started_at": _iso(self.started_at), "source": self.source, "outcome": self.outcome,
+                "total_s": round(offset, 3), "phases": phases, "error": self.error}
+
+
+class PhaseHistory:
+    """Last *per_bot* start attempts of each bot, with percentile summaries."""
+
+    def __init__(self, per_bot: int = 200) -> None:
+        self.per_bot = per_bot
+        self._lock = threading.Lock()
+        self._attempts: Dict[int, Deque[_Attempt]] = {}
+        self._phase_names: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    def record(self, bot_id: int, started_at: float, phases: Dict[str, float], source: str = "start",
+               error: Optional[str] = None) -> None:
+        """Store one attempt.
+
+        Args:
+            bot_id: Bot the attempt was for
+            started_at: Wall-clock time the attempt began
+            phases: Phase name -> duration (seconds), in the order they ran;
+                for a failed attempt the last one is the phase it failed in
+            source: What made the attempt ('start', 'reconnect', 'pool_fill')
+            error: Why the attempt failed; None if it succeeded
+        """
+        names = tuple(phases)
+        with self._lock:
+            names = self._phase_names.setdefault(names, names)
+            attempts = self._attempts.get(bot_id)
+            if attempts is None:
+                attempts = self._attempts[bot_id] = deque(maxlen=self.per_bot)
+            attempts.append(_Attempt(started_at, source, OK if error is None else FAILED, names,
+                                     array("f", phases.values()), error[:200] if error else None))
+
+    def history(self, bot_id: int, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Recorded attempts for *bot_id*, oldest first (the last *limit* of them)."""
+        with self._lock:
+            attempts = list(self._attempts.get(bot_id, ()))
+        if limit:
+            attempts = attempts[-limit:]
+        return [attempt.as_dict() for attempt in attempts]
+
+    def summary(self, bot_ids: Optional[Iterable[int]] = None, slowest: int = 3) -> Dict[str, Any]:
+        """Percentiles per phase across the fleet and per bot.
+
+        Args:
+            bot_ids: Bots to include; every recorded bot when None
+            slowest: How many bots to list per phase, slowest median first
+
+        Returns:
+            'phases': fleet-wide percentiles per phase (successful attempts
+            plus the failing phase of failed ones), each with its slowest
+            bots; 'bots': per-bot attempt counts and phase percentiles
+        """
+        with self._lock:
+            wanted = list(self._attempts) if bot_ids is None else [b for b in bot_ids if b in self._attempts]
+            attempts = {bot_id: list(self._attempts[bot_id]) for bot_id in wanted}
+
+        fleet: Dict[str, List[float]] = {}
+        bots: Dict[int, Dict[str, Any]] = {}
+        for bot_id, recorded in attempts.items():
+            samples: Dict[str, List[float]] = {}
+            failures: Dict[str, int] = {}
+            for attempt in recorded:
+                for phase, duration in zip(attempt.phases, attempt.durations):
+                    samples.setdefault(phase, []).append(duration)
+                    fleet.setdefault(phase, []).append(duration)
+                if attempt.outcome == FAILED and attempt.phases:
+                    failed_in = attempt.phases[-1]
+                    failures[failed_in] = failures.get(failed_in, 0) + 1
+            totals = [sum(attempt.durations) for attempt in recorded if attempt.outcome == OK]
+            if totals:
+                samples["total"] = totals
+                fleet.setdefault("total", []).extend(totals)
+            bots[bot_id] = {
+                "attempts": len(recorded),
+                "failures": sum(failures.values()),
+                "failed_in": failures,
+                "last_started_at": _iso(recorded[-1].started_at) if recorded else None,
+                "phases": {phase: _percentiles(values) for phase, values in samples.items()},
+            }
+
+        phases = {}
+        for phase, values in fleet.items():
+            ranked = sorted((bot for bot in bots if phase in bots[bot]["phases"]),
+                            key=lambda bot: bots[bot]["phases"][phase]["p50_s"], reverse=True)
+            phases[phase] = {**_percentiles(values),
+                             "slowest_bots": [{"bot_id": bot, "p50_s": bots[bot]["phases"][phase]["p50_s"]}
+                                              for bot in ranked[:slowest]]}
+        return {"per_bot_capacity": self.per_bot, "phases": phases, "bots": bots}
+
+
+def _percentiles(values: List[float]) -> Dict[str, Any]:
+    return {
+        "count": len(values),
+        "p50_s": percentile(values, 50),
+        "p95_s": percentile(values, 95),
+        "p99_s": percentile(values, 99),
+        "max_s": round(max(values), 4),
+    }
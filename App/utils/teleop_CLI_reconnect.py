@@ -0,0 +1,161 @@
+"""Background recovery of sessions whose transport was lost.
+
+When a session's SSH child dies the operator would otherwise have to start
+the session again by hand.  ReconnectSupervisor runs the reconnect on a
+per-bot thread instead: a first attempt straight away, then retries with
+exponential backoff until one succeeds, the attempts run out, or the
+recovery is cancelled.  While a bot is recovering, callers can ask how long
+to wait before retrying.
+
+Like the warm pool, the supervisor knows nothing about SSH: it is handed
+the reconnect attempt as a callable.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("SSH.reconnect")
+
+
+class _Recovery:
+    __slots__ = ("cancelled", "attempts", "next_attempt_at", "started", "last_error")
+
+    def __init__(self) -> None:
+        self.cancelled = threading.Event()
+        self.attempts = 0
+        self.next_attempt_at = time.monotonic()
+        self.started = time.monotonic()
+        self.last_error: Optional[str] = None
+
+
+class ReconnectSupervisor:
+    """Retries lost sessions in the background with exponential backoff."""
+
+    def __init__(self,
+                 on_gave_up: Optional[Callable[[int, str], None]] = None,
+                 max_attempts: int = 5,
+                 initial_backoff: float = 1.0,
+                 max_backoff: float = 30.0,
+                 expected_duration: float = 10.0) -> None:
+        """
+        Args:
+            on_gave_up: Called with the bot and last error once every attempt failed
+            max_attempts: Attempts per recovery, including the immediate first one
+            initial_backoff: Seconds before the second attempt; doubles after each failure
+            max_backoff: Upper bound on the delay between attempts
+            expected_duration: Assumed length of an attempt until one has been timed
+        """
+        self._on_gave_up = on_gave_up
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._recoveries: Dict[int, _Recovery] = {}
+        self._expected_duration = expected_duration
+        self._counters = {"started": 0, "recovered": 0, "gave_up": 0, "cancelled": 0}
+
+    def recover(self, bot_id: int, attempt: Callable[[threading.Event], None]) -> bool:
+        """Start recovering *bot_id* unless it already is.
+
+        *attempt* reconnects the session, raising on failure.  It is passed
+        the recovery's cancel event and must not install the session once
+        that is set.
+
+        Returns:
+            Whether a new recovery was started
+        """
+        with self._lock:
+            if bot_id in self._recoveries:
+                return False
+            recovery = self._recoveries[bot_id] = _Recovery()
+            self._counters["started"] += 1
+        threading.Thread(target=self._run, args=(bot_id, recovery, attempt),
+                         name=f"reconnect-bot-{bot_id}", daemon=True).start()
+        return True
+
+    def recovering(self, bot_id: int) -> bool:
+        return bot_id in self._recoveries
+
+    def cancel(self, bot_id: int) -> bool:
+        """Stop recovering *bot_id*; returns whether it was recovering."""
+        with self._lock:
+            recovery = self._recoveries.pop(bot_id, None)
+            if recovery is None:
+                return False
+            self._counters["cancelled"] += 1
+        recovery.cancelled.set()
+        logger.info("Recovery of bot %s cancelled", bot_id)
+        return True
+
+    def stop(self) -> None:
+        """Cancel every recovery in progress."""
+        for bot_id in list(self._recoveries):
+            self.cancel(bot_id)
+
+    def retry_after(self, bot_id: int) -> Optional[float]:
+        """Estimated seconds until *bot_id* is back, or None if it is not recovering."""
+        with self._lock:
+            recovery = self._recoveries.get(bot_id)
+            if recovery is None:
+                return None
+            wait = max(0.0, recovery.next_attempt_at - time.monotonic())
+            return round(wait + self._expected_duration, 1)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                **self._counters,
+                "recovering": {
+                    bot_id: {
+                        "attempts": recovery.attempts,
+                        "elapsed_s": round(now - recovery.started, 3),
+                        "last_error": recovery.last_error,
+                    }
+                    for bot_id, recovery in self._recoveries.items()
+                },
+            }
+
+    def _backoff(self, failures: int) -> float:
+        """Delay after the *failures*-th failed attempt, with +-20% jitter."""
+        delay = min(self.max_backoff, self.initial_backoff * 2 ** (failures - 1))
+        return delay * random.uniform(0.8, 1.2)
+
+    def _run(self, bot_id: int, recovery: _Recovery, attempt: Callable[[threading.Event], None]) -> None:
+        for number in range(1, self.max_attempts + 1):
+            if recovery.cancelled.wait(max(0.0, recovery.next_attempt_at - time.monotonic())):
+                return
+            recovery.attempts = number
+            started = time.monotonic()
+            try:
+                attempt(recovery.cancelled)
+            except Exception as e:
+                recovery.last_error = str(e)
+                delay = self._backoff(number)
+                recovery.next_attempt_at = time.monotonic() + delay
+                logger.warning("Reconnect attempt %d/%d for bot %s failed: %s",
+                               number, self.max_attempts, bot_id, e)
+                continue
+            with self._lock:
+                if recovery.cancelled.is_set():
+                    return
+                self._expected_duration = time.monotonic() - started
+                self._recoveries.pop(bot_id, None)
+                self._counters["recovered"] += 1
+            logger.info("Bot %s recovered after %d attempt(s) in %.2fs",
+                        bot_id, number, time.monotonic() - recovery.started)
+            return
+
+        with self._lock:
+            if recovery.cancelled.is_set():
+                return
+            self._recoveries.pop(bot_id, None)
+            self._counters["gave_up"] += 1
+        logger.error("Giving up on bot %s after %d attempts: %s", bot_id, self.max_attempts, recovery.last_error)
+        if self._on_gave_up is not None:
+            self._on_gave_up(bot_id, recovery.last_error or "unknown error")
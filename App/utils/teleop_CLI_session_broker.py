@@ -0,0 +1,533 @@
+"""Session broker: one process owning every SSH session, shared by API workers.
+
+SSHClient keeps its sessions in process memory, so with several uvicorn
+workers a move could land on a worker that never started the session.
+SessionBroker serves an SSHClient over a Unix domain socket instead; each
+worker talks to it through BrokerClient, which has SSHClient's public API
+and holds no session state of its own.
+
+Protocol: every frame is a 4-byte big-endian length followed by compact
+JSON.  Requests are ``{"id", "op", "args", "kwargs"}`` naming an SSHClient
+method; the reply carries the same id and either ``result`` or ``error``
+(exception type, message and, for SessionRecovering, bot and retry delay;
+CommandNotAcknowledged and StartCancelled also keep their type).
+Requests on one connection are answered as they complete, so a slow
+start_session does not hold up other calls.  ``subscribe_telemetry`` turns
+its connection into a stream of ``{"id", "event"}`` frames (``event`` null
+for a keepalive) ended by a ``result`` frame.
+
+Background session starts (StartJobs) are kept by the broker too, so a job
+started through one worker can be polled or cancelled through any other:
+``submit_job``, ``get_job`` and ``cancel_job`` are served by the broker's
+StartJobs rather than the SSHClient, and JobNotFound keeps its type.
+
+JSON object keys are strings; keys made only of digits are read back as
+ints, since every such key in this API is a bot id.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import json
+import logging
+import os
+import socket
+import struct
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from App.core.config import ESTOP_ACK_TIMEOUT, JOB_HISTORY, JOB_MAX_CONCURRENCY
+from App.utils.teleop_CLI_session_writer import LANE_MOTION
+from App.utils.teleop_CLI_SSH_helper import (CommandNotAcknowledged, SessionRecovering, SSHClient, SSHClientError,
+                                             StartCancelled)
+from App.utils.teleop_CLI_start_jobs import JobNotFound, StartJobs
+
+logger = logging.getLogger("SSH.broker")
+
+_HEADER = struct.Struct("!I")
+# Largest frame either side accepts (console tails are the biggest payloads)
+MAX_FRAME = 4 * 1024 * 1024
+
+# SSHClient methods a worker may call through the broker
+OPERATIONS = frozenset({
+    "start_session", "end_session", "send_command", "move", "rotate", "change_speed",
+    "get_speed", "get_session_status", "has_active_session", "require_session",
+    "list_active_sessions", "get_session_health", "get_session_events", "get_session_process_type",
+    "get_phase_timings", "get_pool_stats", "get_writer_stats", "get_console_tail",
+    "get_console_buffer_stats", "get_connection_stats", "release_all", "emergency_stop", "get_stop_stats",
+    "get_metrics", "get_phase_summary", "get_phase_history", "get_ack_stats", "get_start_progress",
+    "cancel_start",
+})
+
+# Operations served by the broker's StartJobs, and the method each calls
+JOB_OPERATIONS = {"submit_job": "submit", "get_job": "get", "cancel_job": "cancel"}
+
+
+class BrokerUnavailable(SSHClientError):
+    """The session broker could not be reached or went away mid-call."""
+
+
+# ----------------------------------------------------------------------
+# Framing
+# ----------------------------------------------------------------------
+def _int_keys(pairs):
+    return {int(key) if key.isdigit() else key: value for key, value in pairs}
+
+
+def encode_frame(message: Dict[str, Any]) -> bytes:
+    body = json.dumps(message, separators=(",", ":"), default=str).encode()
+    return _HEADER.pack(len(body)) + body
+
+
+def decode_frame(body: bytes) -> Dict[str, Any]:
+    return json.loads(body, object_pairs_hook=_int_keys)
+
+
+def _error_payload(exc: BaseException) -> Dict[str, Any]:
+    payload = {"type": type(exc).__name__, "message": str(exc)}
+    if isinstance(exc, SessionRecovering):
+        payload.update(bot_id=exc.bot_id, retry_after=exc.retry_after)
+    return payload
+
+
+def _raise_error(error: Dict[str, Any]) -> None:
+    if error["type"] == "SessionRecovering":
+        raise SessionRecovering(error["bot_id"], error["retry_after"])
+    if error["type"] == "CommandNotAcknowledged":
+        raise CommandNotAcknowledged(error["message"])
+    if error["type"] == "StartCancelled":
+        raise StartCancelled(error["message"])
+    if error["type"] == "JobNotFound":
+        raise JobNotFound(error["message"])
+    raise SSHClientError(error["message"])
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    try:
+        header = await reader.readexactly(_HEADER.size)
+        (length,) = _HEADER.unpack(header)
+        if length > MAX_FRAME:
+            raise ValueError(f"frame of {length} bytes exceeds {MAX_FRAME}")
+        return decode_frame(await reader.readexactly(length))
+    except asyncio.IncompleteReadError:
+        return None
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return bytes(data)
+
+
+# ----------------------------------------------------------------------
+# Broker (server side)
+# ----------------------------------------------------------------------
+class SessionBroker:
+    """Serves an SSHClient's public API on a Unix domain socket."""
+
+    def __init__(self, client: SSHClient, path: str, max_workers: int = 32) -> None:
+        """
+        Args:
+            client: Client owning the sessions
+            path: Socket path; a stale socket file there is replaced
+            max_workers: Calls into the client run at once (blocking calls
+                such as start_session occupy one each)
+        """
+        self.client = client
+        self.path = path
+        self.jobs = StartJobs(client, JOB_MAX_CONCURRENCY, JOB_HISTORY)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="broker")
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._counters = {"connections": 0, "calls": 0, "errors": 0, "streams": 0}
+
+    async def start_serving(self) -> None:
+        """Listen on the socket (on the running loop)."""
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._loop = asyncio.get_running_loop()
+        # Only the user running the API may drive the robots: the socket is
+        # created without group or other access, so no other user can connect
+        # before the chmod
+        umask = os.umask(0o077)
+        try:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+        finally:
+            os.umask(umask)
+        os.chmod(self.path, 0o600)
+        logger.info("Session broker listening on %s", self.path)
+
+    async def serve_forever(self) -> None:
+        await self.start_serving()
+        try:
+            await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._close_server()
+
+    def start(self) -> None:
+        """Serve on a background thread; returns once the socket is listening."""
+        ready = threading.Event()
+
+        def run() -> None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start_serving())
+            ready.set()
+            loop.run_forever()
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name="session-broker", daemon=True)
+        self._thread.start()
+        ready.wait(10)
+
+    def stop(self, job_timeout: float = 0) -> None:
+        """Stop accepting calls and cancel running start jobs, waiting up to
+        *job_timeout* seconds for them; the SSHClient itself is left to the
+        caller."""
+        self.jobs.close(job_timeout)
+        if self._thread is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._close_server)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(5)
+            self._thread = None
+        self._executor.shutdown(wait=False)
+
+    def _close_server(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._counters)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._counters["connections"] += 1
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    request = await _read_frame(reader)
+                except (ValueError, ConnectionError) as e:
+                    logger.warning("Dropping broker connection: %s", e)
+                    break
+                if request is None:
+                    break
+                task = asyncio.ensure_future(self._dispatch(request, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _send(self, writer: asyncio.StreamWriter, lock: asyncio.Lock, message: Dict[str, Any]) -> None:
+        async with lock:
+            writer.write(encode_frame(message))
+            await writer.drain()
+
+    async def _dispatch(self, request: Dict[str, Any], writer: asyncio.StreamWriter, lock: asyncio.Lock) -> None:
+        request_id = request.get("id")
+        op = request.get("op")
+        args = request.get("args") or []
+        kwargs = request.get("kwargs") or {}
+        try:
+            if op == "subscribe_telemetry":
+                await self._stream_telemetry(request_id, writer, lock, *args, **kwargs)
+                return
+            if op in JOB_OPERATIONS:
+                method = getattr(self.jobs, JOB_OPERATIONS[op])
+            elif op in OPERATIONS:
+                method = getattr(self.client, op)
+            else:
+                raise SSHClientError(f"Operation {op!r} is not supported by the session broker")
+            self._counters["calls"] += 1
+            call = functools.partial(method, *args, **kwargs)
+            reply = {"id": request_id, "result": await self._loop.run_in_executor(self._executor, call)}
+        except (ConnectionError, asyncio.CancelledError):
+            return
+        except Exception as e:
+            self._counters["errors"] += 1
+            reply = {"id": request_id, "error": _error_payload(e)}
+        try:
+            await self._send(writer, lock, reply)
+        except ConnectionError:
+            logger.info("Worker went away before %s (id %s) was answered", op, request_id)
+
+    async def _stream_telemetry(self, request_id, writer: asyncio.StreamWriter, lock: asyncio.Lock,
+                                bot_ids: Optional[List[int]] = None, keepalive: Optional[float] = None) -> None:
+        self._counters["streams"] += 1
+        subscription = self.client.subscribe_telemetry(bot_ids)
+        try:
+            async for event in subscription.events(keepalive):
+                await self._send(writer, lock, {"id": request_id, "event": event})
+            await self._send(writer, lock, {"id": request_id, "result": None})
+        finally:
+            subscription.close()
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+class BrokerTelemetrySubscription:
+    """Telemetry subscription relayed from the broker on its own connection."""
+
+    def __init__(self, path: str, bot_ids: Optional[Iterable[int]]) -> None:
+        self.path = path
+        self.bot_ids = list(bot_ids) if bot_ids else None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def events(self, keepalive: Optional[float] = None) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield the broker's events (None for a keepalive) until it ends the stream."""
+        try:
+            reader, self._writer = await asyncio.open_unix_connection(self.path)
+        except OSError as e:
+            raise BrokerUnavailable(f"Session broker unavailable at {self.path}: {e}")
+        self._writer.write(encode_frame({"id": 1, "op": "subscribe_telemetry",
+                                         "args": [self.bot_ids], "kwargs": {"keepalive": keepalive}}))
+        try:
+            while True:
+                frame = await _read_frame(reader)
+                if frame is None or "result" in frame:
+                    return
+                if "error" in frame:
+                    _raise_error(frame["error"])
+                yield frame["event"]
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class _Connection:
+    """One socket to the broker and the calls waiting on it."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.pending: Dict[int, Future] = {}
+
+
+class BrokerStartJobs:
+    """The broker's StartJobs, as seen from a worker."""
+
+    def __init__(self, client: "BrokerClient") -> None:
+        self._client = client
+
+    def submit(self, bot_id: int) -> Dict[str, Any]:
+        return self._client._call("submit_job", bot_id)
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        return self._client._call("get_job", job_id)
+
+    def cancel(self, job_id: str, timeout: float) -> Dict[str, Any]:
+        return self._client._call("cancel_job", job_id, timeout)
+
+    def close(self, timeout: float = 0) -> None:
+        """Nothing to do: the jobs belong to the broker and outlive a worker."""
+
+
+class BrokerClient:
+    """SSHClient's public API, forwarded to a SessionBroker.
+
+    Holds no session state, so any number of API workers can share one
+    broker.  Calls from many threads are multiplexed over a single
+    connection, which is reopened on the next call if the broker restarts.
+    """
+
+    # The broker owns the sessions and releases them when it stops
+    owns_sessions = False
+
+    def __init__(self, path: str, timeout: float = 120.0) -> None:
+        """
+        Args:
+            path: Broker socket path
+            timeout: Seconds to wait for any one call to be answered
+        """
+        self.path = path
+        self.timeout = timeout
+        # Background session starts, kept by the broker
+        self.jobs = BrokerStartJobs(self)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._connection: Optional[_Connection] = None
+
+    def _connect(self) -> _Connection:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+        except OSError as e:
+            sock.close()
+            raise BrokerUnavailable(f"Session broker unavailable at {self.path}: {e}")
+        connection = _Connection(sock)
+        threading.Thread(target=self._read_loop, args=(connection,), name="broker-client", daemon=True).start()
+        return connection
+
+    def _read_loop(self, connection: _Connection) -> None:
+        try:
+            while True:
+                header = _recv_exactly(connection.sock, _HEADER.size)
+                if header is None:
+                    break
+                body = _recv_exactly(connection.sock, _HEADER.unpack(header)[0])
+                if body is None:
+                    break
+                reply = decode_frame(body)
+                future = connection.pending.pop(reply.get("id"), None)
+                if future is not None:
+                    future.set_result(reply)
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                if self._connection is connection:
+                    self._connection = None
+            connection.sock.close()
+            for future in list(connection.pending.values()):
+                future.set_exception(BrokerUnavailable("Session broker connection lost"))
+            connection.pending.clear()
+
+    def _call(self, op: str, *args, **kwargs) -> Any:
+        future: Future = Future()
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._connect()
+            connection = self._connection
+            request_id = next(self._ids)
+            connection.pending[request_id] = future
+            try:
+                connection.sock.sendall(encode_frame({"id": request_id, "op": op, "args": args, "kwargs": kwargs}))
+            except OSError as e:
+                connection.pending.pop(request_id, None)
+                self._connection = None
+                connection.sock.close()
+                raise BrokerUnavailable(f"Session broker connection lost: {e}")
+        try:
+            reply = future.result(self.timeout)
+        except FutureTimeout:
+            connection.pending.pop(request_id, None)
+            raise SSHClientError(f"Session broker did not answer {op} within {self.timeout:.0f}s")
+        if "error" in reply:
+            _raise_error(reply["error"])
+        return reply["result"]
+
+    # --------------------------------------------------------------
+    # SSHClient API
+    # --------------------------------------------------------------
+    def start_session(self, bot_id: int) -> str:
+        return self._call("start_session", bot_id)
+
+    def get_start_progress(self, bot_id: int) -> Optional[Dict[str, object]]:
+        return self._call("get_start_progress", bot_id)
+
+    def cancel_start(self, bot_id: int) -> bool:
+        return self._call("cancel_start", bot_id)
+
+    def end_session(self, bot_id: int) -> str:
+        return self._call("end_session", bot_id)
+
+    def send_command(self, bot_id: int, command: str, wait: bool = False, lane: str = LANE_MOTION,
+                     ack: bool = False) -> str:
+        return self._call("send_command", bot_id, command, wait=wait, lane=lane, ack=ack)
+
+    def move(self, bot_id: int, direction: str, wait: bool = False, ack: bool = False) -> str:
+        return self._call("move", bot_id, direction, wait=wait, ack=ack)
+
+    def rotate(self, bot_id: int, direction: str, wait: bool = False, ack: bool = False) -> str:
+        return self._call("rotate", bot_id, direction, wait=wait, ack=ack)
+
+    def change_speed(self, bot_id: int, action: str, wait: bool = False, ack: bool = False) -> str:
+        return self._call("change_speed", bot_id, action, wait=wait, ack=ack)
+
+    def get_speed(self, bot_id: int) -> Dict[str, object]:
+        return self._call("get_speed", bot_id)
+
+    def emergency_stop(self, bot_ids: Optional[Iterable[int]] = None,
+                       timeout: float = ESTOP_ACK_TIMEOUT) -> Dict[str, object]:
+        return self._call("emergency_stop", None if bot_ids is None else list(bot_ids), timeout)
+
+    def subscribe_telemetry(self, bot_ids: Optional[Iterable[int]] = None) -> BrokerTelemetrySubscription:
+        return BrokerTelemetrySubscription(self.path, bot_ids)
+
+    def get_session_status(self, bot_id: int) -> str:
+        return self._call("get_session_status", bot_id)
+
+    def has_active_session(self, bot_id: int) -> bool:
+        return self._call("has_active_session", bot_id)
+
+    def require_session(self, bot_id: int) -> None:
+        self._call("require_session", bot_id)
+
+    def list_active_sessions(self):
+        return self._call("list_active_sessions")
+
+    def get_session_health(self, bot_id: int) -> Optional[Dict[str, object]]:
+        return self._call("get_session_health", bot_id)
+
+    def get_session_events(self, limit: Optional[int] = None) -> Dict[str, object]:
+        return self._call("get_session_events", limit)
+
+    def get_session_process_type(self, bot_id: int) -> Optional[str]:
+        return self._call("get_session_process_type", bot_id)
+
+    def get_phase_timings(self, bot_id: int) -> Dict[str, float]:
+        return self._call("get_phase_timings", bot_id)
+
+    def get_phase_summary(self, bot_ids: Optional[Iterable[int]] = None) -> Dict[str, object]:
+        return self._call("get_phase_summary", None if bot_ids is None else list(bot_ids))
+
+    def get_phase_history(self, bot_id: int, limit: Optional[int] = None) -> List[Dict[str, object]]:
+        return self._call("get_phase_history", bot_id, limit)
+
+    def get_pool_stats(self) -> Dict[str, object]:
+        return self._call("get_pool_stats")
+
+    def get_writer_stats(self) -> Dict[int, Dict[str, object]]:
+        return self._call("get_writer_stats")
+
+    def get_console_tail(self, bot_id: int, size: int = 2000) -> Optional[str]:
+        return self._call("get_console_tail", bot_id, size)
+
+    def get_console_buffer_stats(self) -> Dict[str, object]:
+        return self._call("get_console_buffer_stats")
+
+    def get_connection_stats(self) -> Dict[str, object]:
+        return self._call("get_connection_stats")
+
+    def get_stop_stats(self) -> Dict[str, object]:
+        return self._call("get_stop_stats")
+
+    def get_ack_stats(self) -> Dict[int, Dict[str, object]]:
+        return self._call("get_ack_stats")
+
+    def get_metrics(self) -> str:
+        return self._call("get_metrics")
+
+    def release_all(self, deadline: float) -> Dict[str, object]:
+        return self._call("release_all", deadline)
+
+    def close(self) -> None:
+        """Disconnect from the broker; its sessions stay up."""
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            connection.sock.close()
@@ -0,0 +1,252 @@
+"""Pool of pre-warmed teleop consoles.
+
+Most of a session start is spent logging in and bringing the console up;
+the grab itself takes well under a second.  WarmSessionPool keeps consoles
+for the configured bots logged in and platform-ready (but not grabbed) so
+start_session only has to press ``g``.
+
+The pool is agnostic of the SSH engine: it is given callables to open,
+health-check and close a console.  A background maintenance thread evicts
+entries that sat unused past the idle timeout, replaces ones that fail the
+health check, and fills bots that are wanted but not warm.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger("SSH.pool")
+
+
+class _WarmEntry:
+    __slots__ = ("child", "created")
+
+    def __init__(self, child: Any) -> None:
+        self.child = child
+        self.created = time.monotonic()
+
+
+class WarmSessionPool:
+    """Keeps logged-in, console-up (not grabbed) sessions ready per bot."""
+
+    def __init__(self,
+                 open_console: Callable[[int], Any],
+                 is_healthy: Callable[[Any], bool],
+                 close: Callable[[Any], None],
+                 bots: Iterable[int] = (),
+                 max_size: int = 10,
+                 idle_timeout: float = 1800.0,
+                 health_interval: float = 30.0,
+                 fill_workers: int = 4) -> None:
+        """
+        Args:
+            open_console: Logs in to a bot and returns a platform-ready console
+            is_healthy: Returns False if a warm console is no longer usable
+            close: Tears a console down
+            bots: Bots to keep warm
+            max_size: Maximum number of warm (plus filling) consoles
+            idle_timeout: Seconds an unused console is kept before eviction
+            health_interval: Seconds between maintenance passes
+            fill_workers: Consoles opened in parallel
+        """
+        self._open_console = open_console
+        self._is_healthy = is_healthy
+        self._close = close
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_interval = health_interval
+
+        self._lock = threading.Lock()
+        self._entries: Dict[int, _WarmEntry] = {}
+        # Bots the pool should keep warm, in priority order
+        self._wanted: List[int] = list(dict.fromkeys(bots))
+        # Bots evicted for idleness; re-armed on the next demand
+        self._cold: Set[int] = set()
+        # Bots with a grabbed session; never warmed twice
+        self._active: Set[int] = set()
+        self._filling: Set[int] = set()
+
+        self._executor = ThreadPoolExecutor(max_workers=fill_workers, thread_name_prefix="warm-pool")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "fills": 0,
+            "fill_failures": 0,
+            "evicted_idle": 0,
+            "evicted_unhealthy": 0,
+        }
+
+    # --------------------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------------------
+    def start(self) -> None:
+        """Start the maintenance thread (fills the pool straight away)."""
+        if self._thread is not None or not self._wanted:
+            return
+        self._thread = threading.Thread(target=self._run, name="warm-pool-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop maintenance and close every warm console."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.health_interval + 1)
+            self._thread = None
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            self._safe_close(entry.child)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.maintain()
+            except Exception:
+                logger.exception("Warm pool maintenance failed")
+            self._stop.wait(self.health_interval)
+
+    # --------------------------------------------------------------
+    # Session hand-off
+    # --------------------------------------------------------------
+    def checkout(self, bot_id: int) -> Optional[Any]:
+        """Take the warm console for *bot_id*, or None on a miss.
+
+        The bot is marked active either way so the pool will not warm a
+        second console for it until release() is called.
+        """
+        with self._lock:
+            self._active.add(bot_id)
+            self._cold.discard(bot_id)
+            entry = self._entries.pop(bot_id, None)
+
+        if entry is not None and self._check(entry.child):
+            with self._lock:
+                self._stats["hits"] += 1
+            logger.info("Warm pool hit for bot %s (warm for %.0fs)", bot_id, time.monotonic() - entry.created)
+            return entry.child
+
+        with self._lock:
+            self._stats["misses"] += 1
+            if entry is not None:
+                self._stats["evicted_unhealthy"] += 1
+        if entry is not None:
+            self._safe_close(entry.child)
+        logger.info("Warm pool miss for bot %s", bot_id)
+        return None
+
+    def release(self, bot_id: int) -> None:
+        """Record that *bot_id*'s session ended; it may be warmed again."""
+        with self._lock:
+            self._active.discard(bot_id)
+            self._cold.discard(bot_id)
+
+    # --------------------------------------------------------------
+    # Maintenance
+    # --------------------------------------------------------------
+    def maintain(self) -> None:
+        """One maintenance pass: evict idle, replace unhealthy, fill gaps."""
+        now = time.monotonic()
+        with self._lock:
+            idle = [bot for bot, e in self._entries.items() if now - e.created > self.idle_timeout]
+            evicted = [self._entries.pop(bot) for bot in idle]
+            self._cold.update(idle)
+            self._stats["evicted_idle"] += len(idle)
+            # Taken out while checked so checkout() never shares a console
+            # with the health check; a lookup in that window is a miss.
+            to_check = list(self._entries.items())
+            self._entries.clear()
+
+        for bot_id, entry in zip(idle, evicted):
+            logger.info("Evicting idle warm console for bot %s", bot_id)
+            self._safe_close(entry.child)
+
+        for bot_id, entry in to_check:
+            healthy = self._check(entry.child)
+            with self._lock:
+                keep = healthy and not self._stop.is_set() and bot_id not in self._active
+                if keep:
+                    self._entries[bot_id] = entry
+                elif not healthy:
+                    self._stats["evicted_unhealthy"] += 1
+            if not keep:
+                if not healthy:
+                    logger.warning("Warm console for bot %s failed health check; replacing", bot_id)
+                self._safe_close(entry.child)
+
+        self._schedule_fills()
+
+    def _schedule_fills(self) -> None:
+        with self._lock:
+            room = self.max_size - len(self._entries) - len(self._filling)
+            todo = [bot for bot in self._wanted
+                    if bot not in self._entries and bot not in self._filling
+                    and bot not in self._active and bot not in self._cold][:max(room, 0)]
+            self._filling.update(todo)
+        for bot_id in todo:
+            self._executor.submit(self._fill, bot_id)
+
+    def _fill(self, bot_id: int) -> None:
+        try:
+            child = self._open_console(bot_id)
+        except Exception as e:
+            logger.warning("Could not warm console for bot %s: %s", bot_id, e)
+            with self._lock:
+                self._filling.discard(bot_id)
+                self._stats["fill_failures"] += 1
+            return
+
+        with self._lock:
+            self._filling.discard(bot_id)
+            keep = not self._stop.is_set() and bot_id not in self._active
+            if keep:
+                self._entries[bot_id] = _WarmEntry(child)
+                self._stats["fills"] += 1
+        if keep:
+            logger.info("Warmed console for bot %s", bot_id)
+        else:
+            self._safe_close(child)
+
+    def _check(self, child: Any) -> bool:
+        try:
+            return bool(self._is_healthy(child))
+        except Exception:
+            return False
+
+    def _safe_close(self, child: Any) -> None:
+        try:
+            self._close(child)
+        except Exception as e:
+            logger.debug("Error closing warm console: %s", e)
+
+    def warm_bots(self) -> List[int]:
+        """Bots with a warm console or one being opened."""
+        with self._lock:
+            return sorted(set(self._entries) | self._filling)
+
+    # --------------------------------------------------------------
+    # Metrics
+    # --------------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the current pool contents."""
+        now = time.monotonic()
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else None,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "filling": sorted(self._filling),
+                "warm_bots": {bot: round(now - e.created, 1) for bot, e in sorted(self._entries.items())},
+                "cold_bots": sorted(self._cold),
+                "configured_bots": list(self._wanted),
+            }
@@ -0,0 +1,188 @@
+"""Per-session keystroke writer.
+
+Writing to a console pty can block (a stalled SSH connection fills the pty
+buffer), and two requests writing to the same console at once interleave
+their bytes.  SessionWriter gives each session one writer thread fed by
+bounded queues: callers enqueue and get a Future back immediately, writes
+reach the console one at a time, and a full queue drops the new keystroke
+instead of blocking the caller.
+
+Writes are queued in priority lanes: stop/release first, then speed, then
+motion.  The writer always takes the oldest write of the highest lane that
+has one, so a stop never waits behind queued moves; a stop can also
+preempt, dropping the speed and motion writes still queued.  Dropped
+writes are failed by the writer thread after its next write, so a stop
+fanned out to many sessions is not held up failing their backlogs.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Tuple
+
+from App.utils.teleop_CLI_metrics import LatencyWindow
+
+logger = logging.getLogger("SSH.writer")
+
+LANE_STOP = "stop"
+LANE_SPEED = "speed"
+LANE_MOTION = "motion"
+# Highest priority first
+LANES = (LANE_STOP, LANE_SPEED, LANE_MOTION)
+
+
+class WriterQueueFull(Exception):
+    """The session's write queue is full; the keystroke was dropped."""
+
+
+class WriterClosed(Exception):
+    """The session writer has been closed."""
+
+
+class WritePreempted(Exception):
+    """A queued write was dropped by a preempting stop."""
+
+
+class SessionWriter:
+    """Serialises writes to one console through prioritised queues and a thread."""
+
+    def __init__(self, bot_id: int, write: Callable[[str], Any], max_depth: int = 64) -> None:
+        """
+        Args:
+            bot_id: Bot the session belongs to (thread name and logs)
+            write: Sends data to the console; may block
+            max_depth: Writes that may wait in each lane before new ones are dropped
+        """
+        self.bot_id = bot_id
+        self.max_depth = max_depth
+        self._write = write
+        self._lanes: Dict[str, Deque[Tuple[Any, Future, float]]] = {lane: deque() for lane in LANES}
+        self._closed = False
+        # Set once close() gave up waiting: the thread exits after its current write
+        self._abandoned = False
+        # Writes dropped by a preempting stop, failed by the writer thread
+        self._preempted: list = []
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._counters = {"submitted": 0, "written": 0, "dropped": 0, "write_errors": 0, "preempted": 0}
+        self._queue_wait = {lane: LatencyWindow() for lane in LANES}
+        self._write_latency = LatencyWindow()
+        self._thread = threading.Thread(target=self._run, name=f"writer-bot-{bot_id}", daemon=True)
+        self._thread.start()
+
+    def submit(self, data: str, lane: str = LANE_MOTION, preempt: bool = False) -> Future:
+        """Queue *data* for writing in *lane*.
+
+        Args:
+            data: Keystrokes to write
+            lane: One of LANES; higher lanes are written first
+            preempt: Drop the writes still queued in lower lanes
+
+        Returns:
+            Future resolved once the data has been written (or the write failed)
+
+        Raises:
+            WriterQueueFull: The lane is at max_depth; *data* was dropped
+            WriterClosed: The writer no longer accepts data
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise WriterClosed(f"Writer for bot {self.bot_id} is closed")
+            queue = self._lanes[lane]
+            if len(queue) >= self.max_depth:
+                self._counters["dropped"] += 1
+                raise WriterQueueFull(
+                    f"Write queue for bot {self.bot_id} is full ({self.max_depth}); keystroke dropped")
+            if preempt:
+                for lower in LANES[LANES.index(lane) + 1:]:
+                    self._counters["preempted"] += len(self._lanes[lower])
+                    self._preempted.extend(self._lanes[lower])
+                    self._lanes[lower].clear()
+            queue.append((data, future, time.monotonic()))
+            self._counters["submitted"] += 1
+            self._ready.notify()
+        return future
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Stop accepting data, let queued writes finish for up to *timeout*
+        seconds, and fail whatever is still queued after that."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._ready.notify()
+        self._thread.join(timeout)
+        with self._lock:
+            self._abandoned = True
+            leftovers = [item for lane in LANES for item in self._lanes[lane]]
+            for lane in LANES:
+                self._lanes[lane].clear()
+        self._fail_preempted()
+        for _, future, _ in leftovers:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(WriterClosed(f"Writer for bot {self.bot_id} closed before write"))
+
+    def _fail_preempted(self) -> None:
+        with self._lock:
+            preempted, self._preempted = self._preempted, []
+        for _, future, _ in preempted:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(WritePreempted(f"Write to bot {self.bot_id} dropped by a stop"))
+
+    def _next(self):
+        """Oldest write of the highest non-empty lane, or None once closed and drained."""
+        with self._lock:
+            while True:
+                if self._abandoned:
+                    return None
+                for lane in LANES:
+                    if self._lanes[lane]:
+                        return (lane, *self._lanes[lane].popleft())
+                if self._closed:
+                    return None
+                self._ready.wait()
+
+    def _run(self) -> None:
+        while True:
+            if self._preempted:
+                self._fail_preempted()
+            item = self._next()
+            if item is None:
+                self._fail_preempted()
+                return
+            lane, data, future, enqueued = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            started = time.monotonic()
+            self._queue_wait[lane].add(started - enqueued)
+            try:
+                self._write(data)
+            except Exception as e:
+                with self._lock:
+                    self._counters["write_errors"] += 1
+                logger.warning("Write to bot %s failed: %s", self.bot_id, e)
+                future.set_exception(e)
+                continue
+            self._write_latency.add(time.monotonic() - started)
+            with self._lock:
+                self._counters["written"] += 1
+            future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth per lane, counters and latency summaries."""
+        with self._lock:
+            counters = dict(self._counters)
+            lanes = {lane: len(queue) for lane, queue in self._lanes.items()}
+        return {
+            "depth": sum(lanes.values()),
+            "lanes": lanes,
+            "max_depth": self.max_depth,
+            **counters,
+            "queue_wait": {lane: window.summary() for lane, window in self._queue_wait.items()},
+            "write_latency": self._write_latency.summary(),
+        }
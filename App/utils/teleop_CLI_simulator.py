@@ -0,0 +1,351 @@
+"""Simulated bots for local load testing.
+
+Each SimulatedBot is a small SSH server that behaves like a robot's login
+and ``robohive_keyboard_teleop_console``:
+
+* password login as ``hive`` / ``robohive``, the Ubuntu banner and the
+  ``hive@wemoNNNN:~$`` prompt
+* ``robohive_keyboard_teleop_console`` prints "Available teleoperables",
+  lists the bot once its teleoperables have "loaded", waits for Enter and
+  reports "Platform ready"
+* ``g`` grabs (the WATCH OUT warning) and releases control; the numpad
+  arrows, ``<`` / ``>`` and ``+`` / ``-`` are accepted while grabbed, and
+  each redraws the speed limits in place on the status line
+* Ctrl+C returns to the shell, ``exit`` logs out
+
+How long each step takes, how much that varies and how often the bot
+misbehaves is set by a ConsoleProfile.  Several sessions may share one
+connection, as a multiplexed ssh client does.
+
+Serve a fleet with ``python -m App.simulator`` (see there for pointing the
+API at it).  Requires paramiko.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import socket
+import threading
+import time
+from typing import Dict, Mapping, Optional
+
+import paramiko
+
+logger = logging.getLogger("SSH.simulator")
+
+USERNAME = "hive"
+PASSWORD = "robohive"
+
+# Keystrokes the console acts on
+_MOVE_KEYS = (b"\x1bOA", b"\x1bOB", b"\x1bOC", b"\x1bOD")
+_ROTATE_KEYS = (b"<", b">")
+
+
+class ConsoleProfile:
+    """Timing and failure behaviour of simulated bots.
+
+    Delays are in seconds and varied by up to +/- *jitter* (a fraction of
+    the delay); rates are probabilities per connection or per console.
+    """
+
+    # Field -> environment variable read by from_env
+    ENV = {
+        "login_delay": "SIM_LOGIN_DELAY",
+        "launch_delay": "SIM_LAUNCH_DELAY",
+        "load_delay": "SIM_LOAD_DELAY",
+        "ready_delay": "SIM_READY_DELAY",
+        "jitter": "SIM_JITTER",
+        "reject_rate": "SIM_REJECT_RATE",
+        "auth_failure_rate": "SIM_AUTH_FAILURE_RATE",
+        "hang_rate": "SIM_HANG_RATE",
+        "grab_failure_rate": "SIM_GRAB_FAILURE_RATE",
+        "drop_rate": "SIM_DROP_RATE",
+        "drop_after": "SIM_DROP_AFTER",
+        "redraw_interval": "SIM_REDRAW_INTERVAL",
+        "release_line_rate": "SIM_RELEASE_LINE_RATE",
+    }
+
+    def __init__(self, login_delay: float = 0.0, launch_delay: float = 0.0, load_delay: float = 0.0,
+                 ready_delay: float = 0.0, jitter: float = 0.0, reject_rate: float = 0.0,
+                 auth_failure_rate: float = 0.0, hang_rate: float = 0.0, grab_failure_rate: float = 0.0,
+                 drop_rate: float = 0.0, drop_after: float = 30.0, redraw_interval: float = 0.0,
+                 release_line_rate: float = 1.0, seed: Optional[int] = None) -> None:
+        """
+        Args:
+            login_delay: Before the password prompt and before the shell prompt
+            launch_delay: From launching the console to "Available teleoperables"
+            load_delay: Until the teleoperables list appears
+            ready_delay: From selecting the teleoperable to "Platform ready"
+            jitter: Fraction each delay varies by, uniformly (0.2 = +/- 20 %)
+            reject_rate: Connections closed before the SSH handshake
+            auth_failure_rate: Correct passwords rejected anyway
+            hang_rate: Consoles that never report "Platform ready"
+            grab_failure_rate: Consoles where ``g`` is ignored (another operator)
+            drop_rate: Grabbed consoles whose connection drops after *drop_after*
+            drop_after: Seconds after the grab a dropping console goes away
+            redraw_interval: Also redraw the status line this often (0 = only on change)
+            release_line_rate: Consoles that print "Control released" when ``g``
+                gives control up; the others only redraw the status line
+            seed: Seed for delays and failures, for repeatable runs
+        """
+        self.login_delay = login_delay
+        self.launch_delay = launch_delay
+        self.load_delay = load_delay
+        self.ready_delay = ready_delay
+        self.jitter = jitter
+        self.reject_rate = reject_rate
+        self.auth_failure_rate = auth_failure_rate
+        self.hang_rate = hang_rate
+        self.grab_failure_rate = grab_failure_rate
+        self.drop_rate = drop_rate
+        self.drop_after = drop_after
+        self.redraw_interval = redraw_interval
+        self.release_line_rate = release_line_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ, **overrides: float) -> "ConsoleProfile":
+        """Profile from the SIM_* variables in *environ*; *overrides* win."""
+        values = {field: float(environ[name]) for field, name in cls.ENV.items() if environ.get(name)}
+        if environ.get("SIM_SEED"):
+            values["seed"] = int(environ["SIM_SEED"])
+        values.update({field: value for field, value in overrides.items() if value is not None})
+        return cls(**values)
+
+    def delay(self, seconds: float) -> float:
+        """*seconds* with jitter applied."""
+        if seconds <= 0:
+            return 0.0
+        with self._lock:
+            return max(0.0, seconds * (1 + self._random.uniform(-self.jitter, self.jitter)))
+
+    def chance(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < rate
+
+    def as_dict(self) -> Dict[str, float]:
+        return {field: getattr(self, field) for field in self.ENV}
+
+
+class _Server(paramiko.ServerInterface):
+    def __init__(self, profile: ConsoleProfile) -> None:
+        self._profile = profile
+
+    def check_auth_password(self, username, password):
+        time.sleep(self._profile.delay(self._profile.login_delay))
+        if username == USERNAME and password == PASSWORD and not self._profile.chance(
+                self._profile.auth_failure_rate):
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED_OPEN_REQUEST
+
+    def check_channel_pty_request(self, *args):
+        return True
+
+    def check_channel_shell_request(self, channel):
+        return True
+
+    def check_global_request(self, kind, msg):
+        return False
+
+
+class SimulatedBot:
+    """Threaded SSH server simulating one bot; use as a context manager."""
+
+    # Generated once per process: every simulated bot shares it
+    _shared_host_key: Optional[paramiko.RSAKey] = None
+
+    def __init__(self, bot_id: int = 1, host: str = "127.0.0.1", port: int = 0,
+                 profile: Optional[ConsoleProfile] = None) -> None:
+        self.bot_id = bot_id
+        self.profile = profile or ConsoleProfile()
+        self.prompt = f"hive@wemo{bot_id:04d}:~$ "
+        self.connections = 0
+        # Keystroke counters, for checking what reached the "robot"
+        self.counters = {"grabs": 0, "releases": 0, "moves": 0, "rotations": 0, "speed_changes": 0,
+                         "rejected": 0, "hung": 0, "grab_failures": 0, "dropped": 0}
+        self._counters_lock = threading.Lock()
+        if SimulatedBot._shared_host_key is None:
+            SimulatedBot._shared_host_key = paramiko.RSAKey.generate(2048)
+        self._host_key = SimulatedBot._shared_host_key
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind((host, port))
+        self._sock.listen(64)
+        self.host, self.port = self._sock.getsockname()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "SimulatedBot":
+        self._thread = threading.Thread(target=self._accept_loop, name=f"sim-bot-{self.bot_id}", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._closed.set()
+        self._sock.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._counters_lock:
+            return {"connections": self.connections, **self.counters}
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._counters_lock:
+            self.counters[counter] += amount
+
+    def _accept_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            if self.profile.chance(self.profile.reject_rate):
+                self._count("rejected")
+                conn.close()
+                continue
+            threading.Thread(target=self._serve_transport, args=(conn,), daemon=True).start()
+
+    def _serve_transport(self, conn: socket.socket) -> None:
+        transport = paramiko.Transport(conn)
+        transport.add_server_key(self._host_key)
+        try:
+            transport.start_server(server=_Server(self.profile))
+        except (paramiko.SSHException, EOFError, OSError):
+            return
+        # One transport, many channels: each session gets its own shell
+        while transport.is_active() and not self._closed.is_set():
+            channel = transport.accept(timeout=1)
+            if channel is not None:
+                threading.Thread(target=self._shell, args=(channel,), daemon=True).start()
+
+    def _shell(self, channel: paramiko.Channel) -> None:
+        try:
+            channel.sendall(b"Welcome to Ubuntu 22.04 LTS\r\n\r\n")
+            time.sleep(self.profile.delay(self.profile.login_delay))
+            channel.sendall(self.prompt.encode())
+            line = b""
+            while True:
+                data = channel.recv(1024)
+                if not data:
+                    break
+                channel.sendall(data)
+                line += data
+                if b"\r" in line or b"\n" in line:
+                    command = line.strip().decode(errors="replace")
+                    line = b""
+                    if command == "exit":
+                        channel.sendall(b"\r\nlogout\r\n")
+                        break
+                    if command == "robohive_keyboard_teleop_console":
+                        channel.sendall(b"\r\n")
+                        if not self._console(channel):
+                            break
+                    channel.sendall(b"\r\n" + self.prompt.encode())
+        except (OSError, EOFError):
+            pass
+        finally:
+            try:
+                channel.send_exit_status(0)
+            except (OSError, EOFError, paramiko.SSHException):
+                pass
+            channel.close()
+
+    def _status_line(self, linear: float, angular: float) -> bytes:
+        # Redrawn in place, like the real console's screen updates
+        return (b"\x1b7\x1b[1;1H\x1b[2KLinear speed limit: %.3f m/s   Angular speed limit: %.3f rad/s\x1b8"
+                % (linear, angular))
+
+    def _console(self, channel: paramiko.Channel) -> bool:
+        """Teleop console until Ctrl+C (True) or the channel closes (False)."""
+        profile = self.profile
+        time.sleep(profile.delay(profile.launch_delay))
+        channel.sendall(b"Available teleoperables:\r\n")
+        time.sleep(profile.delay(profile.load_delay))
+        channel.sendall(b"  [0] wemo%04d\r\n" % self.bot_id)
+        # Select the default teleoperable
+        while True:
+            data = channel.recv(1)
+            if not data:
+                return False
+            if data in (b"\r", b"\n"):
+                break
+        if profile.chance(profile.hang_rate):
+            self._count("hung")
+        else:
+            time.sleep(profile.delay(profile.ready_delay))
+            channel.sendall(b"Platform ready\r\n")
+        grab_blocked = profile.chance(profile.grab_failure_rate)
+        release_line = profile.chance(profile.release_line_rate)
+        drop_at = (time.monotonic() + profile.delay(profile.drop_after)
+                   if profile.chance(profile.drop_rate) else None)
+
+        grabbed = False
+        linear, angular = 0.125, 0.5
+        redraw_at = None
+        while True:
+            now = time.monotonic()
+            if grabbed and drop_at is not None and now >= drop_at:
+                self._count("dropped")
+                channel.get_transport().close()
+                return False
+            if grabbed and redraw_at is not None and now >= redraw_at:
+                channel.sendall(self._status_line(linear, angular))
+                redraw_at = now + profile.redraw_interval
+            # Block for input, waking only for a due drop or redraw
+            deadlines = [at for at in (drop_at, redraw_at) if grabbed and at is not None]
+            channel.settimeout(max(0.001, min(deadlines) - now) if deadlines else None)
+            try:
+                data = channel.recv(1024)
+            except socket.timeout:
+                continue
+            if not data:
+                return False
+            if b"\x03" in data:
+                channel.sendall(b"^C")
+                return True
+            output = b""
+            redraw = False
+            if b"g" in data:
+                if grabbed:
+                    grabbed = False
+                    self._count("releases")
+                    if release_line:
+                        output += b"Control released\r\n"
+                    else:
+                        redraw = True
+                elif grab_blocked:
+                    self._count("grab_failures")
+                else:
+                    grabbed = True
+                    self._count("grabs")
+                    output += b"| WARNING - WATCH OUT FOR MOVING ROBOT\r\n"
+                    redraw = True
+                    if profile.redraw_interval > 0:
+                        redraw_at = time.monotonic() + profile.redraw_interval
+            if grabbed:
+                moves = sum(data.count(key) for key in _MOVE_KEYS)
+                rotations = sum(data.count(key) for key in _ROTATE_KEYS)
+                speed_changes = data.count(b"+") + data.count(b"-")
+                self._count("moves", moves)
+                self._count("rotations", rotations)
+                if speed_changes:
+                    self._count("speed_changes", speed_changes)
+                    linear = max(0.025, linear + 0.025 * (data.count(b"+") - data.count(b"-")))
+                redraw = redraw or bool(moves or rotations or speed_changes)
+            if redraw:
+                output += self._status_line(linear, angular)
+            if output:
+                channel.sendall(output)
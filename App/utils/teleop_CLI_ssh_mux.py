@@ -0,0 +1,177 @@
+"""OpenSSH connection multiplexing (ControlMaster) for bot sessions.
+
+Without multiplexing every session start repeats the TCP connect, key
+exchange and password authentication, even when the same bot was reached a
+minute ago.  With ``ControlMaster=auto`` the first ``ssh`` to a bot leaves an
+authenticated master connection behind (kept for ``ControlPersist`` seconds
+after its last client exits); later sessions to that bot open a new channel
+on it and land directly at the shell prompt.
+
+SSHMultiplexer builds the ssh command line, tracks which masters were used
+recently, closes them on cleanup/shutdown and keeps connect-phase latency
+statistics split by fresh vs reused connections.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shlex
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from App.utils.teleop_CLI_metrics import LatencyWindow
+
+logger = logging.getLogger("SSH.mux")
+
+
+class SSHMultiplexer:
+    """Builds multiplexed ssh commands and manages their master connections."""
+
+    def __init__(self, control_dir: str, persist: float = 300.0, enabled: bool = True,
+                 ssh_binary: str = "ssh", ssh_options: Sequence[str] = ()) -> None:
+        """
+        Args:
+            control_dir: Directory for the control sockets (kept short: unix
+                socket paths are limited to ~100 characters)
+            persist: Seconds a master stays up after its last session exits
+            enabled: When False, commands are plain ``ssh -tt`` invocations
+            ssh_binary: ssh executable
+            ssh_options: Further ssh arguments for every command (port, host
+                key checking)
+        """
+        self.control_dir = control_dir
+        self.persist = persist
+        self.enabled = enabled
+        self.ssh_binary = ssh_binary
+        self.ssh_options = list(ssh_options)
+
+        self._lock = threading.Lock()
+        # destination -> monotonic time of the last session opened through it
+        self._last_used: Dict[str, float] = {}
+        self._latency = {"fresh": LatencyWindow(), "reused": LatencyWindow()}
+        self._stop = threading.Event()
+        self._janitor: Optional[threading.Thread] = None
+
+        if self.enabled:
+            os.makedirs(self.control_dir, mode=0o700, exist_ok=True)
+
+    # --------------------------------------------------------------
+    # Command construction
+    # --------------------------------------------------------------
+    def options(self) -> List[str]:
+        """ssh ``-o`` options enabling multiplexing (empty when disabled)."""
+        if not self.enabled:
+            return []
+        return [
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={os.path.join(self.control_dir, '%C')}",
+            "-o", f"ControlPersist={int(self.persist)}",
+        ]
+
+    def command(self, destination: str, extra: Sequence[str] = ()) -> str:
+        """Interactive ssh command line for *destination*."""
+        argv = [self.ssh_binary, "-tt", *self.ssh_options, *self.options(), *extra, destination]
+        with self._lock:
+            self._last_used[destination] = time.monotonic()
+        return " ".join(shlex.quote(arg) for arg in argv)
+
+    # --------------------------------------------------------------
+    # Master management
+    # --------------------------------------------------------------
+    def _control(self, destination: str, operation: str, extra: Sequence[str] = ()) -> bool:
+        if not self.enabled:
+            return False
+        try:
+            result = subprocess.run(
+                [self.ssh_binary, *self.ssh_options, *self.options(), *extra, "-O", operation, destination],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug("ssh -O %s %s failed: %s", operation, destination, e)
+            return False
+        return result.returncode == 0
+
+    def master_alive(self, destination: str, extra: Sequence[str] = ()) -> bool:
+        """Whether an authenticated master is up for *destination*."""
+        return self._control(destination, "check", extra)
+
+    def close(self, destination: str, extra: Sequence[str] = ()) -> None:
+        """Close the master for *destination* (sessions on it are dropped)."""
+        with self._lock:
+            self._last_used.pop(destination, None)
+        if self._control(destination, "exit", extra):
+            logger.info("Closed SSH master for %s", destination)
+
+    def cleanup(self, in_use: Iterable[str] = ()) -> List[str]:
+        """Close masters unused for longer than the persistence window.
+
+        ControlPersist expires idle masters on its own; this also covers
+        masters kept alive by a leftover client and forgets their
+        bookkeeping.  Destinations in *in_use* (live sessions) are touched
+        instead of closed.
+
+        Returns:
+            Destinations that were closed
+        """
+        now = time.monotonic()
+        with self._lock:
+            for destination in in_use:
+                self._last_used[destination] = now
+            stale = [dest for dest, used in self._last_used.items() if used < now - self.persist]
+        for destination in stale:
+            self.close(destination)
+        return stale
+
+    def start(self, in_use: Callable[[], Iterable[str]], interval: Optional[float] = None) -> None:
+        """Run cleanup() in the background every *interval* seconds."""
+        if not self.enabled or self._janitor is not None:
+            return
+        interval = interval or max(self.persist / 2, 1.0)
+
+        def run() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    self.cleanup(in_use())
+                except Exception:
+                    logger.exception("SSH master cleanup failed")
+
+        self._janitor = threading.Thread(target=run, name="ssh-mux-cleanup", daemon=True)
+        self._janitor.start()
+
+    def stop(self) -> None:
+        """Stop background cleanup and close every master."""
+        self._stop.set()
+        if self._janitor is not None:
+            self._janitor.join(timeout=1)
+            self._janitor = None
+        self.close_all()
+
+    def close_all(self) -> None:
+        """Close every master this process opened (shutdown)."""
+        with self._lock:
+            destinations = list(self._last_used)
+        for destination in destinations:
+            self.close(destination)
+
+    # --------------------------------------------------------------
+    # Connect latency
+    # --------------------------------------------------------------
+    def record_connect(self, destination: str, seconds: float, reused: bool) -> None:
+        """Record how long connect + authentication took for one session."""
+        self._latency["reused" if reused else "fresh"].add(seconds)
+        logger.debug("Connect to %s took %.3fs (%s)", destination, seconds, "reused" if reused else "fresh")
+
+    def stats(self) -> Dict[str, object]:
+        """Connect-phase latency by kind plus the masters currently tracked."""
+        now = time.monotonic()
+        with self._lock:
+            masters = {dest: round(now - used, 1) for dest, used in self._last_used.items()}
+        return {
+            "enabled": self.enabled,
+            "persist_s": self.persist,
+            "connect_latency": {kind: window.summary() for kind, window in self._latency.items()},
+            "masters_idle_s": masters,
+        }
@@ -0,0 +1,164 @@
+"""Session starts run in the background as jobs.
+
+A session start takes tens of seconds, most of it waiting on the bot.
+StartJobs runs start_session on a bounded pool of threads and keeps each
+start as a job that can be polled for the phase it is in and cancelled
+mid-handshake.
+
+Jobs live with the SSHClient that runs them: in the API process, or in the
+session broker when SESSION_BROKER_SOCKET is set, so every worker sees the
+same jobs.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Dict, Optional
+
+from App.utils.teleop_CLI_SSH_helper import SSHClient, SSHClientError, StartCancelled
+
+logger = logging.getLogger("SSH.jobs")
+
+
+class JobNotFound(SSHClientError):
+    """No job has this ID, or it finished long enough ago to be forgotten."""
+
+
+class StartJobs:
+    """
+    Session starts run in the background and tracked as jobs.
+
+    A job is ``queued`` until one of *max_concurrency* workers takes it,
+    ``running`` while start_session is in progress (reporting the phase the
+    start is in), then ``succeeded``, ``failed`` or ``cancelled``.  Asking
+    to start a bot that already has a queued or running job returns that
+    job.  The *history* most recently finished jobs are kept.
+    """
+
+    ACTIVE = ("queued", "running")
+    # What start_session returns when it found the bot's session open
+    ALREADY_ACTIVE = "Session already active"
+
+    def __init__(self, ssh_client: SSHClient, max_concurrency: int, history: int):
+        self._ssh_client = ssh_client
+        self.history = history
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="start-job")
+        self._lock = threading.Lock()
+        # job_id -> job, oldest first
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._futures: Dict[str, Future] = {}
+
+    def submit(self, bot_id: int) -> Dict[str, Any]:
+        """Queue a start for *bot_id*, or return the one already under way."""
+        with self._lock:
+            for job in self._jobs.values():
+                if job["bot_id"] == bot_id and job["state"] in self.ACTIVE:
+                    return dict(job)
+            job = {"job_id": uuid.uuid4().hex, "action": "start_session", "bot_id": bot_id, "state": "queued",
+                   "phase": None, "phases": {}, "status": None, "error": None, "cancel_requested": False,
+                   "created_at": round(time.time(), 3), "started_at": None, "finished_at": None}
+            self._jobs[job["job_id"]] = job
+            self._futures[job["job_id"]] = self._pool.submit(self._run, job)
+            return dict(job)
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        """The job, with the current phase of its start while it runs."""
+        with self._lock:
+            job = self._job(job_id)
+            snapshot = dict(job)
+        if snapshot["state"] == "running":
+            progress = self._ssh_client.get_start_progress(snapshot["bot_id"])
+            if progress is not None:
+                snapshot.update(phase=progress["phase"], phases=progress["phases"], elapsed_s=progress["elapsed_s"])
+        return snapshot
+
+    def cancel(self, job_id: str, timeout: float) -> Dict[str, Any]:
+        """Cancel the job; a running start is aborted and, when it got as
+        far as starting the session anyway, the session is ended (not one
+        that was already active).  Waits up to *timeout* seconds for the
+        job to finish."""
+        with self._lock:
+            job = self._job(job_id)
+            if job["state"] not in self.ACTIVE:
+                return dict(job)
+            job["cancel_requested"] = True
+            future = self._futures.get(job_id)
+            if job["state"] == "queued" and future is not None and future.cancel():
+                self._finish(job, "cancelled", None, "Cancelled before it started")
+                return dict(job)
+        self._ssh_client.cancel_start(job["bot_id"])
+        if future is not None:
+            try:
+                future.result(timeout=timeout)
+            except FutureTimeout:
+                logger.warning(f"Job {job_id} still running {timeout:.0f}s after being cancelled")
+        return self.get(job_id)
+
+    def close(self, timeout: float = 0) -> None:
+        """Cancel every queued and running job, waiting up to *timeout*
+        seconds for the running ones (and any session a start got as far as
+        opening) to wind down."""
+        with self._lock:
+            active = [job_id for job_id, job in self._jobs.items() if job["state"] in self.ACTIVE]
+            futures = [self._futures[job_id] for job_id in active if job_id in self._futures]
+        for job_id in active:
+            self.cancel(job_id, timeout=0)
+        if futures and timeout > 0:
+            _, running = wait(futures, timeout)
+            if running:
+                logger.warning(f"{len(running)} start jobs still running {timeout:.0f}s after being cancelled")
+        self._pool.shutdown(wait=False)
+
+    def _job(self, job_id: str) -> Dict[str, Any]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFound(f"No job {job_id}")
+        return job
+
+    def _run(self, job: Dict[str, Any]) -> None:
+        bot_id = job["bot_id"]
+        with self._lock:
+            job["state"] = "running"
+            job["started_at"] = round(time.time(), 3)
+        try:
+            status = self._ssh_client.start_session(bot_id)
+            if job["cancel_requested"]:
+                # Cancelled too early or too late to abort the handshake.
+                # A session that was already active belongs to someone else
+                if status != self.ALREADY_ACTIVE:
+                    self._ssh_client.end_session(bot_id)
+                raise StartCancelled(f"Session start for bot {bot_id} cancelled")
+        except StartCancelled as e:
+            outcome = ("cancelled", None, str(e))
+        except Exception as e:
+            outcome = ("failed", None, str(e))
+        else:
+            outcome = ("succeeded", status, None)
+        phases = self._final_phases(bot_id)
+        with self._lock:
+            job["phases"] = phases
+            self._finish(job, *outcome)
+        logger.info(f"Job {job['job_id']} (start bot {bot_id}) {outcome[0]}")
+
+    def _final_phases(self, bot_id: int) -> Dict[str, float]:
+        """Phase durations of the attempt the job just made, as recorded."""
+        try:
+            attempts = self._ssh_client.get_phase_history(bot_id, 1)
+        except SSHClientError:
+            return {}
+        if not attempts or attempts[-1]["source"] != "start":
+            return {}
+        return {entry["phase"]: entry["duration_s"] for entry in attempts[-1]["phases"]}
+
+    def _finish(self, job: Dict[str, Any], state: str, status: Optional[str], error: Optional[str]) -> None:
+        job.update(state=state, phase=None, status=status, error=error, finished_at=round(time.time(), 3))
+        self._futures.pop(job["job_id"], None)
+        finished = [job_id for job_id, entry in self._jobs.items() if entry["state"] not in self.ACTIVE]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
@@ -0,0 +1,168 @@
+"""Fan-out of per-bot console state to telemetry subscribers.
+
+Session threads publish state parsed from the teleop consoles (speed
+limits, whether control is grabbed, the latest warning, session
+lifecycle).  TelemetryHub keeps the current state of every bot and hands
+each subscriber only the fields that changed, as "state" events, after an
+initial "snapshot" of everything the subscriber asked for.
+
+Subscribers live on an asyncio loop and publishers on plain threads, so
+events cross over with call_soon_threadsafe into a bounded queue per
+subscriber.  A subscriber too slow to keep up is not allowed to hold up
+publishers: its queue is dropped and it is sent a fresh snapshot instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+
+logger = logging.getLogger("SSH.telemetry")
+
+# Queued to a subscription to end its event stream
+_CLOSED: Dict[str, Any] = {"event": "closed"}
+
+
+class TelemetrySubscription:
+    """One subscriber's queue of telemetry events."""
+
+    def __init__(self, hub: "TelemetryHub", bot_ids: Optional[Set[int]],
+                 loop: asyncio.AbstractEventLoop, max_queue: int) -> None:
+        self.bot_ids = bot_ids
+        self._hub = hub
+        self._loop = loop
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max_queue)
+        self._lagged = False
+        self._closed = False
+        self.dropped = 0
+
+    def wants(self, bot_id: int) -> bool:
+        return self.bot_ids is None or bot_id in self.bot_ids
+
+    def _push(self, event: Dict[str, Any]) -> None:
+        """Called from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._offer, event)
+        except RuntimeError:
+            # The subscriber's loop has shut down; nothing will read this.
+            pass
+
+    def _offer(self, event: Dict[str, Any]) -> None:
+        if event is _CLOSED:
+            self._closed = True
+            if self._queue.full():
+                self._queue.get_nowait()
+            self._queue.put_nowait(_CLOSED)
+            return
+        if self._lagged or self._closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._lagged = True
+            self.dropped += 1
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next event, or None if nothing arrived within *timeout* seconds.
+
+        A subscriber that fell behind gets a new snapshot in place of the
+        events it missed.  Once the hub closes, this returns the "closed"
+        event.
+        """
+        if self._lagged and not self._closed:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._lagged = False
+            logger.info("Telemetry subscriber fell behind; resending snapshot")
+            return {"event": "snapshot", "data": self._hub.snapshot(self.bot_ids)}
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def events(self, keepalive: Optional[float] = None) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield events until the hub closes, and None after every
+        *keepalive* seconds without one."""
+        while True:
+            event = await self.get(keepalive)
+            if event is _CLOSED:
+                return
+            yield event
+
+    def close(self) -> None:
+        self._closed = True
+        self._hub._unsubscribe(self)
+
+
+class TelemetryHub:
+    """Current console state per bot, and the subscribers watching it."""
+
+    def __init__(self, max_queue: int = 256) -> None:
+        """
+        Args:
+            max_queue: Events a subscriber may have unread before it is
+                considered lagged and resynchronised with a snapshot
+        """
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._state: Dict[int, Dict[str, Any]] = {}
+        self._subscribers: Set[TelemetrySubscription] = set()
+
+    def publish(self, bot_id: int, changes: Dict[str, Any]) -> None:
+        """Merge *changes* into the bot's state and send subscribers the
+        fields whose value actually changed.  Safe to call from any thread."""
+        with self._lock:
+            state = self._state.setdefault(bot_id, {})
+            delta = {key: value for key, value in changes.items()
+                     if key not in state or state[key] != value}
+            if not delta:
+                return
+            state.update(delta)
+            event = {"event": "state", "data": {"bot_id": bot_id, **delta}}
+            subscribers = [sub for sub in self._subscribers if sub.wants(bot_id)]
+        for subscriber in subscribers:
+            subscriber._push(event)
+
+    def snapshot(self, bot_ids: Optional[Iterable[int]] = None) -> Dict[int, Dict[str, Any]]:
+        """Full state of *bot_ids* (every bot seen so far by default)."""
+        with self._lock:
+            return self._snapshot_locked(bot_ids)
+
+    def _snapshot_locked(self, bot_ids: Optional[Iterable[int]]) -> Dict[int, Dict[str, Any]]:
+        if bot_ids is None:
+            return {bot_id: dict(state) for bot_id, state in self._state.items()}
+        return {bot_id: dict(self._state.get(bot_id, {})) for bot_id in bot_ids}
+
+    def subscribe(self, bot_ids: Optional[Iterable[int]] = None) -> TelemetrySubscription:
+        """Start receiving events for *bot_ids* (every bot by default).
+
+        Must be called from the event loop the subscriber reads on.  The
+        first event is a snapshot of the requested bots.
+        """
+        wanted = set(bot_ids) if bot_ids else None
+        subscription = TelemetrySubscription(self, wanted, asyncio.get_running_loop(), self.max_queue)
+        with self._lock:
+            # Taken under the lock so no state event can slip in before it.
+            subscription._queue.put_nowait({"event": "snapshot", "data": self._snapshot_locked(wanted)})
+            self._subscribers.add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: TelemetrySubscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def close(self) -> None:
+        """End every subscriber's event stream."""
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, set()
+        for subscriber in subscribers:
+            subscriber._push(_CLOSED)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "bots": len(self._state),
+            }
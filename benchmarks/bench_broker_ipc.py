@@ -0,0 +1,158 @@
+"""Per-command overhead of going through the session broker.
+
+Starts stand-in bots and a broker process owning a session to each, then
+times the same calls made directly on an in-process SSHClient (sessions to
+the same stand-ins) and through BrokerClient:
+
+  get_session_status   cached lookup: pure IPC overhead
+  move                 keystroke queued on the session writer
+  move (wait)          keystroke written to the session channel
+
+Each call is timed sequentially and from --threads threads at once.
+
+    python -m benchmarks.bench_broker_ipc --bots 4 --calls 2000 --threads 8
+
+Both sides use the channel transport so no ssh binary is needed.  Requires
+paramiko.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+os.environ.setdefault("WEMOIP", "127.0.0")
+os.environ.setdefault("WEMOPORT", "22")
+os.environ.setdefault("RECONNECT_ENABLED", "0")
+# Queued moves outpace the stand-in console; don't drop them mid-benchmark
+os.environ.setdefault("WRITER_QUEUE_DEPTH", "100000")
+
+from App.utils.teleop_CLI_metrics import percentile  # noqa: E402
+
+
+def _client(ports: Dict[int, int]):
+    from App.utils.teleop_CLI_channel_SSH_helper import ChannelSSHClient
+
+    class Client(ChannelSSHClient):
+        def _address(self, bot_id):
+            return "127.0.0.1", ports[bot_id]
+
+    # Stand-in host keys are generated per run, never in known_hosts
+    return Client(strict_host_keys=False)
+
+
+def _serve(path: str, ports: Dict[int, int]) -> None:
+    """Broker process: a session per bot, served until stdin closes."""
+    from App.utils.teleop_CLI_session_broker import SessionBroker
+
+    client = _client(ports)
+    for bot_id in ports:
+        client.start_session(bot_id)
+    broker = SessionBroker(client, path)
+    broker.start()
+    print("ready", flush=True)
+    sys.stdin.read()
+    broker.stop()
+    client.release_all(10)
+    client.close()
+
+
+def _time(call: Callable[[int], object], bots: List[int], calls: int, threads: int) -> dict:
+    def timed(i: int) -> float:
+        started = time.perf_counter()
+        call(bots[i % len(bots)])
+        return (time.perf_counter() - started) * 1e6
+
+    started = time.perf_counter()
+    if threads == 1:
+        latencies = [timed(i) for i in range(calls)]
+    else:
+        with ThreadPoolExecutor(threads) as pool:
+            latencies = list(pool.map(timed, range(calls)))
+    elapsed = time.perf_counter() - started
+    return {
+        "calls_per_s": round(calls / elapsed),
+        "p50_us": round(percentile(latencies, 50), 1),
+        "p95_us": round(percentile(latencies, 95), 1),
+        "p99_us": round(percentile(latencies, 99), 1),
+    }
+
+
+def _measure(client, bots: List[int], calls: int, threads: int) -> dict:
+    operations = {
+        "get_session_status": client.get_session_status,
+        "move": lambda bot_id: client.move(bot_id, "up"),
+        "move (wait)": lambda bot_id: client.move(bot_id, "up", wait=True),
+    }
+    report = {}
+    for name, call in operations.items():
+        call(bots[0])  # warm up (connects the broker client)
+        report[name] = {
+            "sequential": _time(call, bots, calls, 1),
+            f"{threads} threads": _time(call, bots, calls, threads),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bots", type=int, default=4)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--serve", help=argparse.SUPPRESS)
+    parser.add_argument("--ports", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve, {int(bot_id): port for bot_id, port in json.loads(args.ports).items()})
+        return
+
+    from App.utils.teleop_CLI_session_broker import BrokerClient
+
+    standin = subprocess.Popen([sys.executable, "-m", "benchmarks.ssh_standin", "--bots", str(args.bots)],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    with tempfile.TemporaryDirectory(prefix="broker") as tmp:
+        path = os.path.join(tmp, "broker.sock")
+        broker = None
+        try:
+            ports = {int(bot_id): port for bot_id, port in json.loads(standin.stdout.readline()).items()}
+            bots = list(ports)
+            broker = subprocess.Popen([sys.executable, "-m", "benchmarks.bench_broker_ipc", "--serve", path,
+                                       "--ports", json.dumps(ports)],
+                                      stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+            assert broker.stdout.readline().strip() == "ready"
+
+            direct = _client(ports)
+            for bot_id in bots:
+                direct.start_session(bot_id)
+            report = {"direct": _measure(direct, bots, args.calls, args.threads)}
+            direct.release_all(10)
+            direct.close()
+
+            remote = BrokerClient(path)
+            report["broker"] = _measure(remote, bots, args.calls, args.threads)
+            remote.close()
+
+            report["overhead_p50_us"] = {
+                name: round(report["broker"][name]["sequential"]["p50_us"]
+                            - report["direct"][name]["sequential"]["p50_us"], 1)
+                for name in report["direct"]
+            }
+        finally:
+            if broker is not None:
+                broker.stdin.close()
+                broker.wait(timeout=30)
+            standin.stdin.close()
+            standin.wait(timeout=10)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Memory per session and sessions per host: ssh child processes vs channels.
+
+Starts the stand-in bots in a separate process, then, for each transport,
+a fresh worker process opens and grabs one session per bot and reports how
+much memory its process tree (the worker, its ssh children and any
+ControlMaster processes they left behind) gained.
+"sessions_per_host" divides a memory budget by that per-session cost.
+
+    python -m benchmarks.bench_channel_transport --bots 50 --budget-mb 1024
+
+Transports compared:
+  process       SSHClient, one ``ssh -tt`` child per session (SSH_MULTIPLEX=0)
+  process+mux   SSHClient with ControlMaster: also a master process per bot
+  channel       ChannelSSHClient, shell channels on in-process transports
+
+Memory is proportional set size (PSS, shared pages split between the
+processes mapping them) where /proc/<pid>/smaps_rollup is readable, else
+RSS.  Requires paramiko, an OpenSSH client and Linux /proc.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List
+
+TRANSPORTS = {
+    "process": {"SSH_TRANSPORT": "process", "SSH_MULTIPLEX": "0"},
+    "process+mux": {"SSH_TRANSPORT": "process", "SSH_MULTIPLEX": "1"},
+    "channel": {"SSH_TRANSPORT": "channel", "SSH_MULTIPLEX": "0"},
+}
+_SSH_OPTIONS = ["-o", "StrictHostKeyChecking=no", "-o", "UserKnownHostsFile=/dev/null", "-o", "LogLevel=ERROR"]
+
+
+# ----------------------------------------------------------------------
+# Process tree accounting
+# ----------------------------------------------------------------------
+def _descendants(root: int) -> List[int]:
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces; ppid follows its ")"
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    tree, pending = [], [root]
+    while pending:
+        pid = pending.pop()
+        tree.append(pid)
+        pending.extend(children.get(pid, []))
+    return tree
+
+
+def _mux_masters(control_dir: str) -> List[int]:
+    """ControlMaster processes for *control_dir*; they detach from the tree that started them."""
+    masters, own = [], set(_descendants(os.getpid()))
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read().decode(errors="replace")
+        except OSError:
+            continue
+        if control_dir in cmdline and int(entry) not in own:
+            masters.append(int(entry))
+    return masters
+
+
+def _field(path: str, name: str) -> int:
+    """First integer after *name* in a /proc key-value file (0 if absent)."""
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith(name):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _tree_usage(root: int, extra: Iterable[int] = ()) -> Dict[str, int]:
+    usage = {"memory_kb": 0, "processes": 0, "fds": 0, "threads": 0}
+    for pid in [*_descendants(root), *extra]:
+        usage["memory_kb"] += (_field(f"/proc/{pid}/smaps_rollup", "Pss:")
+                               or _field(f"/proc/{pid}/status", "VmRSS:"))
+        usage["threads"] += _field(f"/proc/{pid}/status", "Threads:")
+        usage["processes"] += 1
+        try:
+            usage["fds"] += len(os.listdir(f"/proc/{pid}/fd"))
+        except OSError:
+            pass
+    return usage
+
+
+# ----------------------------------------------------------------------
+# Worker: one transport, one session per stand-in bot
+# ----------------------------------------------------------------------
+def _worker(transport: str, ports: Dict[int, int], parallel: int) -> dict:
+    from App.utils.teleop_CLI_SSH_helper import SSHClient
+
+    if transport == "channel":
+        from App.utils.teleop_CLI_channel_SSH_helper import ChannelSSHClient
+
+        class Client(ChannelSSHClient):
+            def _address(self, bot_id):
+                return "127.0.0.1", ports[bot_id]
+    else:
+        class Client(SSHClient):
+            def _destination(self, bot_id):
+                return "hive@127.0.0.1"
+
+            def _spawn_console(self, bot_id, destination):
+                import pexpect
+                command = self._mux.command(destination, ["-p", str(ports[bot_id]), *_SSH_OPTIONS])
+                return pexpect.spawn(command, timeout=30, encoding="utf-8")
+
+    # Stand-in host keys are generated per run, never in known_hosts
+    client = Client(strict_host_keys=False) if transport == "channel" else Client()
+    time.sleep(0.5)
+    before = _tree_usage(os.getpid())
+    started = time.perf_counter()
+    with ThreadPoolExecutor(parallel) as pool:
+        list(pool.map(client.start_session, ports))
+    open_s = time.perf_counter() - started
+    time.sleep(1.0)
+    masters = _mux_masters(os.environ["SSH_CONTROL_DIR"]) if client._mux.enabled else []
+    after = _tree_usage(os.getpid(), masters)
+    active = len(client.list_active_sessions())
+    teardown = client.release_all(30)
+    client.close()
+
+    sessions = len(ports)
+    delta = {key: after[key] - before[key] for key in before}
+    return {
+        "sessions": sessions,
+        "active": active,
+        "open_all_s": round(open_s, 2),
+        "baseline": before,
+        "with_sessions": after,
+        "memory_per_session_kb": round(delta["memory_kb"] / sessions, 1),
+        "processes_per_session": round(delta["processes"] / sessions, 2),
+        "fds_per_session": round(delta["fds"] / sessions, 2),
+        "threads_per_session": round(delta["threads"] / sessions, 2),
+        "released_cleanly": len(teardown["released"]),
+    }
+
+
+def run(transport: str, ports: Dict[int, int], parallel: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="mux") as control_dir:
+        env = dict(os.environ, **TRANSPORTS[transport], SSH_CONTROL_DIR=control_dir,
+                   WEMOIP=os.environ.get("WEMOIP", "127.0.0"), WEMOPORT=os.environ.get("WEMOPORT", "22"),
+                   RECONNECT_ENABLED="0", WARM_POOL_BOTS="")
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_channel_transport", "--worker", transport,
+             "--ports", json.dumps(ports), "--parallel", str(parallel)],
+            env=env, capture_output=True, text=True, timeout=600,
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f"{transport} worker failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bots", type=int, default=50)
+    parser.add_argument("--parallel", type=int, default=8, help="sessions started at once")
+    parser.add_argument("--budget-mb", type=float, default=1024, help="memory set aside for sessions")
+    parser.add_argument("--transports", default=",".join(TRANSPORTS))
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--ports", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        ports = {int(bot_id): port for bot_id, port in json.loads(args.ports).items()}
+        print(json.dumps(_worker(args.worker, ports, args.parallel)))
+        return
+
+    standin = subprocess.Popen([sys.executable, "-m", "benchmarks.ssh_standin", "--bots", str(args.bots)],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    try:
+        ports = {int(bot_id): port for bot_id, port in json.loads(standin.stdout.readline()).items()}
+        report = {}
+        for transport in args.transports.split(","):
+            result = run(transport, ports, args.parallel)
+            per_session = max(result["memory_per_session_kb"], 1.0)
+            result["sessions_per_host"] = int(args.budget_mb * 1024 // per_session)
+            report[transport] = result
+    finally:
+        standin.stdin.close()
+        standin.wait(timeout=10)
+    print(json.dumps({"budget_mb": args.budget_mb, **report}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
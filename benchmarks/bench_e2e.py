@@ -0,0 +1,387 @@
+"""End-to-end command throughput and latency, saved and compared as baselines.
+
+Drives the real application (App.main.app: middleware, router,
+TeleopService and SSHClient) through httpx's ASGI transport against a
+simulated fleet (python -m App.simulator) in a separate process, sweeping
+bot count x command rate x client concurrency.  At each point sessions are
+open on the first N bots and move / rotate / speed commands go round-robin
+across them:
+
+  bots         sessions the commands are spread over
+  rate         commands per second offered (0 = as fast as responses allow)
+  concurrency  requests in flight at most
+
+Latency is measured from when a command was due rather than when it was
+sent, so a stack that falls behind the offered rate shows it as latency
+instead of quietly sending less (coordinated omission).  Each point runs
+--repeat times and keeps the median of every metric, which steadies p99
+enough to compare runs.
+
+    python -m benchmarks.bench_e2e run --bots 1,10,25 --rate 100,500,0 --concurrency 1,16 \\
+        --save benchmarks/baselines/e2e.json
+    python -m benchmarks.bench_e2e run --quick --compare benchmarks/baselines/e2e_quick.json
+    python -m benchmarks.bench_e2e compare benchmarks/baselines/e2e.json results.json
+
+compare matches points by (bots, rate, concurrency) and flags those whose
+throughput fell, whose p50 / p99 rose by more than --tolerance (and by at
+least --min-delta-ms, so sub-millisecond noise is not a regression) or
+whose error rate went up; it exits 1 when anything regressed.  Results
+record the host they were measured on: compare against a baseline taken on
+the same machine.
+
+The simulated consoles answer immediately unless SIM_* variables are set
+(see ConsoleProfile.ENV).  Requires paramiko; --transport process also
+needs an OpenSSH client.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from App.utils.teleop_CLI_metrics import percentile
+
+_QUICK = {"bots": "1,5", "rate": "200,0", "concurrency": "1,8", "duration": 2.0}
+_MOVES = ("up", "right", "down", "left")
+
+
+# ----------------------------------------------------------------------
+# Simulated fleet
+# ----------------------------------------------------------------------
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_fleet(bots: int, port: int, log_path: str) -> subprocess.Popen:
+    """Simulator process serving bots 1..*bots*, once every bot listens."""
+    with open(log_path, "w") as log:
+        fleet = subprocess.Popen([sys.executable, "-m", "App.simulator", "--bots", f"1-{bots}", "--port", str(port)],
+                                 stdout=log, stderr=log)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        with open(log_path) as log:
+            if "Serving" in log.read():
+                return fleet
+        if fleet.poll() is not None:
+            break
+        time.sleep(0.05)
+    fleet.kill()
+    with open(log_path) as log:
+        raise RuntimeError(f"simulator did not start:\n{log.read()}")
+
+
+def _stop_fleet(fleet: subprocess.Popen) -> None:
+    fleet.send_signal(signal.SIGINT)
+    try:
+        fleet.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        fleet.kill()
+
+
+# ----------------------------------------------------------------------
+# Load generation
+# ----------------------------------------------------------------------
+def _command(i: int, bots: List[int], wait: bool) -> Tuple[str, dict]:
+    """The i-th command: seven moves, two rotations and a speed change in ten."""
+    bot_id = bots[i % len(bots)]
+    step = i // len(bots)
+    kind = step % 10
+    if kind < 7:
+        return "/api/move", {"bot_id": bot_id, "direction": _MOVES[step % 4], "wait": wait}
+    if kind < 9:
+        return "/api/rotate", {"bot_id": bot_id, "direction": "left" if kind == 7 else "right", "wait": wait}
+    return "/api/speed", {"bot_id": bot_id, "action": "increase" if step % 20 < 10 else "decrease", "wait": wait}
+
+
+def _latency_summary(latencies: List[float]) -> Dict[str, Optional[float]]:
+    if not latencies:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    latencies_ms = [latency * 1000 for latency in latencies]
+    return {
+        "p50_ms": round(percentile(latencies_ms, 50), 3),
+        "p95_ms": round(percentile(latencies_ms, 95), 3),
+        "p99_ms": round(percentile(latencies_ms, 99), 3),
+        "max_ms": round(max(latencies_ms), 3),
+    }
+
+
+async def _drive(client, bots: List[int], rate: float, concurrency: int, duration: float, wait: bool) -> dict:
+    """Offer commands for *duration* seconds and summarise the responses."""
+    total = int(rate * duration) if rate else None
+    indexes = itertools.count()
+    latencies: List[float] = []
+    outcomes: Counter = Counter()
+    started = time.perf_counter()
+
+    async def worker() -> None:
+        for i in indexes:
+            if rate:
+                if i >= total:
+                    return
+                due = started + i / rate
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                due = time.perf_counter()
+                if due - started >= duration:
+                    return
+            path, body = _command(i, bots, wait)
+            try:
+                response = await client.post(path, json=body)
+                outcomes[str(response.status_code)] += 1
+            except Exception as e:  # noqa: BLE001 - counted, not fatal
+                outcomes[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - due)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    ok = outcomes.pop("200", 0)
+    return {
+        "bots": len(bots),
+        "rate": rate,
+        "concurrency": concurrency,
+        "commands": len(latencies),
+        "ok": ok,
+        "errors": dict(outcomes),
+        "throughput_per_s": round(ok / elapsed, 1),
+        **_latency_summary(latencies),
+    }
+
+
+def _combine(runs: List[dict]) -> dict:
+    """One point from repeated runs: counts summed, rates and latencies their median."""
+    point = dict(runs[0])
+    for field in ("commands", "ok"):
+        point[field] = sum(run[field] for run in runs)
+    point["errors"] = dict(sum((Counter(run["errors"]) for run in runs), Counter()))
+    for field in ("throughput_per_s", "p50_ms", "p95_ms", "p99_ms", "max_ms"):
+        values = sorted(run[field] for run in runs if run[field] is not None)
+        point[field] = values[len(values) // 2] if values else None
+    point["runs"] = len(runs)
+    return point
+
+
+async def _sweep(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from App.main import app
+    from App.routers import teleop_CLI_endpoints
+    from App.routers.teleop_CLI_endpoints import teleop_service_singleton
+
+    # The request log is part of the per-request cost; its console output is not
+    devnull = open(os.devnull, "w")
+    for handler in logging.getLogger().handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setStream(devnull)
+    if teleop_CLI_endpoints.log_pipeline is not None:
+        teleop_CLI_endpoints.log_pipeline.stream = devnull
+
+    bot_counts = sorted(_ints(args.bots))
+    session_starts: List[float] = []
+    points = []
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            started: List[int] = []
+            for bots in bot_counts:
+                for bot_id in range(len(started) + 1, bots + 1):
+                    began = time.perf_counter()
+                    response = await client.post("/api/startsession", json={"bot_id": bot_id})
+                    if response.status_code != 200:
+                        raise RuntimeError(f"bot {bot_id} did not start: {response.text}")
+                    session_starts.append(time.perf_counter() - began)
+                    started.append(bot_id)
+                for rate in _floats(args.rate):
+                    for concurrency in _ints(args.concurrency):
+                        runs = []
+                        for _ in range(args.repeat):
+                            runs.append(await _drive(client, started[:bots], rate, concurrency, args.duration,
+                                                     args.wait))
+                            # Let queued keystrokes drain before the next run
+                            await asyncio.sleep(args.settle)
+                        point = _combine(runs)
+                        print(json.dumps(point), file=sys.stderr, flush=True)
+                        points.append(point)
+    finally:
+        await asyncio.get_running_loop().run_in_executor(None, teleop_service_singleton.shutdown, 10)
+        devnull.close()
+    return {"session_start": {"count": len(session_starts), **_latency_summary(session_starts)}, "points": points}
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.quick:
+        for name, value in _QUICK.items():
+            setattr(args, name, value)
+    port = _free_port()
+    # The application reads these at import, so they are set before it is imported
+    os.environ.update({"WEMOIP": "127.0.0", "WEMOPORT": "22", "SSH_PORT": str(port),
+                       "SSH_STRICT_HOST_KEYS": "0", "SSH_TRANSPORT": args.transport})
+    os.environ.setdefault("RECONNECT_ENABLED", "0")
+
+    with tempfile.TemporaryDirectory(prefix="bench-e2e") as tmp:
+        fleet = _start_fleet(max(_ints(args.bots)), port, os.path.join(tmp, "simulator.log"))
+        try:
+            measured = asyncio.run(_sweep(args))
+        finally:
+            _stop_fleet(fleet)
+
+    result = {
+        "suite": "e2e",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "host": _host(),
+        "config": {
+            "transport": args.transport,
+            "duration_s": args.duration,
+            "repeat": args.repeat,
+            "wait": args.wait,
+            "simulator": {name: value for name, value in os.environ.items() if name.startswith("SIM_")},
+        },
+        **measured,
+    }
+    print(json.dumps(result, indent=2))
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+    if args.compare:
+        with open(args.compare) as f:
+            return _report_comparison(json.load(f), result, args.tolerance, args.min_delta_ms)
+    return 0
+
+
+# ----------------------------------------------------------------------
+# Baselines
+# ----------------------------------------------------------------------
+def _host() -> Dict[str, object]:
+    return {"node": platform.node(), "platform": platform.platform(), "python": platform.python_version(),
+            "cpus": os.cpu_count()}
+
+
+def _key(point: dict) -> Tuple[int, float, int]:
+    return point["bots"], float(point["rate"]), point["concurrency"]
+
+
+def _error_rate(point: dict) -> float:
+    return sum(point["errors"].values()) / point["commands"] if point["commands"] else 0.0
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.2, min_delta_ms: float = 1.0) -> List[dict]:
+    """Per-point differences between two results.
+
+    Args:
+        baseline: Result saved by ``run --save``
+        current: Result to check against it
+        tolerance: Relative change allowed before a metric counts as regressed
+        min_delta_ms: Latency increases smaller than this never count
+
+    Returns:
+        One row per current point: its key, the changed metrics as
+        (baseline, current) pairs, and which of them regressed; points
+        missing from the baseline have 'baseline' None
+    """
+    reference = {_key(point): point for point in baseline["points"]}
+    rows = []
+    for point in current["points"]:
+        before = reference.get(_key(point))
+        row = {"bots": point["bots"], "rate": point["rate"], "concurrency": point["concurrency"],
+               "baseline": before is not None, "metrics": {}, "regressed": []}
+        rows.append(row)
+        if before is None:
+            continue
+        for metric in ("p50_ms", "p99_ms"):
+            old, new = before[metric], point[metric]
+            row["metrics"][metric] = (old, new)
+            if old is not None and new is not None and new > old * (1 + tolerance) and new - old >= min_delta_ms:
+                row["regressed"].append(metric)
+        old, new = before["throughput_per_s"], point["throughput_per_s"]
+        row["metrics"]["throughput_per_s"] = (old, new)
+        if new < old * (1 - tolerance):
+            row["regressed"].append("throughput_per_s")
+        old, new = _error_rate(before), _error_rate(point)
+        row["metrics"]["error_rate"] = (round(old, 4), round(new, 4))
+        if new > old + 0.01:
+            row["regressed"].append("error_rate")
+    return rows
+
+
+def _report_comparison(baseline: dict, current: dict, tolerance: float, min_delta_ms: float) -> int:
+    if baseline.get("host") != current.get("host"):
+        print(f"warning: baseline measured on {baseline.get('host')}, not this host", file=sys.stderr)
+    if baseline.get("config") != current.get("config"):
+        print(f"warning: baseline config {baseline.get('config')} differs", file=sys.stderr)
+    rows = compare(baseline, current, tolerance, min_delta_ms)
+    for row in rows:
+        label = f"bots={row['bots']:<4} rate={row['rate']:<7g} concurrency={row['concurrency']:<4}"
+        if not row["baseline"]:
+            print(f"{label} not in baseline", file=sys.stderr)
+            continue
+        changes = "  ".join(f"{metric} {old} -> {new}" for metric, (old, new) in row["metrics"].items())
+        verdict = "REGRESSED " + ",".join(row["regressed"]) if row["regressed"] else "ok"
+        print(f"{label} {changes}  {verdict}", file=sys.stderr)
+    regressed = sum(1 for row in rows if row["regressed"])
+    print(f"{regressed} of {len(rows)} points regressed (tolerance {tolerance:.0%})", file=sys.stderr)
+    return 1 if regressed else 0
+
+
+def _ints(spec: str) -> List[int]:
+    return [int(value) for value in str(spec).split(",")]
+
+
+def _floats(spec: str) -> List[float]:
+    return [float(value) for value in str(spec).split(",")]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the sweep")
+    run_parser.add_argument("--bots", default="1,10,25", help="bot counts (default: 1,10,25)")
+    run_parser.add_argument("--rate", default="100,500,0", help="commands/s offered, 0 = unthrottled")
+    run_parser.add_argument("--concurrency", default="1,16", help="requests in flight (default: 1,16)")
+    run_parser.add_argument("--duration", type=float, default=5.0, help="seconds per point (default: 5)")
+    run_parser.add_argument("--repeat", type=int, default=3,
+                            help="runs per point; the median of each metric is kept (default: 3)")
+    run_parser.add_argument("--settle", type=float, default=0.5, help="pause between points (default: 0.5)")
+    run_parser.add_argument("--wait", action="store_true", help="wait for each keystroke to be written")
+    run_parser.add_argument("--transport", choices=("channel", "process"), default="channel")
+    run_parser.add_argument("--quick", action="store_true", help="small sweep: 1,5 bots, 200,0 rate, 1,8 concurrency, 2 s")
+    run_parser.add_argument("--save", help="write the result to this baseline file")
+    run_parser.add_argument("--compare", help="compare the result with this baseline")
+
+    compare_parser = commands.add_parser("compare", help="compare a result with a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--tolerance", type=float, default=0.2, help="relative change allowed (default: 0.2)")
+        sub.add_argument("--min-delta-ms", type=float, default=1.0,
+                         help="smallest latency increase that counts (default: 1.0)")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        return run(args)
+    with open(args.baseline) as f, open(args.current) as g:
+        return _report_comparison(json.load(f), json.load(g), args.tolerance, args.min_delta_ms)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Emergency stop latency with motion keystrokes queued on every session.
+
+Starts stand-in bots, opens a session to each and grabs control, then per
+round queues --backlog motion keystrokes on every bot and stops them all:
+
+  fifo      release sent per bot in the motion lane, behind the backlog
+  estop     SSHClient.emergency_stop: stop lane, preempting the backlog
+
+and reports fan-out (all stops enqueued), write (stop reached the session)
+and ack percentiles per mode: for fifo until the console shows control
+released, for estop until the console redraws after the release (what
+emergency_stop waits on).  Control is re-grabbed between rounds.
+
+    python -m benchmarks.bench_estop --bots 20 --rounds 20 --backlog 500
+
+Uses the channel transport so no ssh binary is needed.  Requires paramiko.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+os.environ.setdefault("WEMOIP", "127.0.0")
+os.environ.setdefault("WEMOPORT", "22")
+os.environ.setdefault("RECONNECT_ENABLED", "0")
+# The backlog is the point of the benchmark; don't drop any of it
+os.environ.setdefault("WRITER_QUEUE_DEPTH", "100000")
+
+from App.utils.teleop_CLI_metrics import percentile  # noqa: E402
+from App.utils.teleop_CLI_session_writer import LANE_MOTION  # noqa: E402
+
+
+def _client(ports: Dict[int, int]):
+    from App.utils.teleop_CLI_channel_SSH_helper import ChannelSSHClient
+
+    class Client(ChannelSSHClient):
+        def _address(self, bot_id):
+            return "127.0.0.1", ports[bot_id]
+
+    # Stand-in host keys are generated per run, never in known_hosts
+    return Client(strict_host_keys=False)
+
+
+def _grab(client, bots: List[int]) -> None:
+    for bot_id in bots:
+        if client._monitors[bot_id].state()["grabbed"] is not True:
+            client.send_command(bot_id, "g", wait=True)
+            if client._monitors[bot_id].wait_for("grabbed", True, 5) is None:
+                raise RuntimeError(f"bot {bot_id} did not take control")
+
+
+def _flood(client, bots: List[int], backlog: int) -> None:
+    for bot_id in bots:
+        for _ in range(backlog):
+            client.move(bot_id, "up")
+
+
+def _fifo_round(client, bots: List[int], timeout: float) -> Dict[str, List[float]]:
+    """Release in the motion lane: it waits behind everything queued."""
+    started = time.monotonic()
+    futures = {bot_id: (client._writers[bot_id].submit("g", lane=LANE_MOTION), time.monotonic())
+               for bot_id in bots}
+    samples = {"fanout": [time.monotonic() - started], "write": [], "ack": []}
+    for bot_id, (future, submitted) in futures.items():
+        future.result(timeout)
+        samples["write"].append(time.monotonic() - submitted)
+        acked_at = client._monitors[bot_id].wait_for("grabbed", False, timeout)
+        if acked_at is not None:
+            samples["ack"].append(acked_at - submitted)
+    return samples
+
+
+def _estop_round(client, bots: List[int], timeout: float) -> Dict[str, List[float]]:
+    result = client.emergency_stop(bots, timeout=timeout)
+    if result["unacknowledged"] or result["failed"]:
+        raise RuntimeError(f"emergency stop incomplete: {result}")
+    return {
+        "fanout": [result["fanout_s"]],
+        "write": [report["write_s"] for report in result["reports"]],
+        "ack": [report["ack_s"] for report in result["reports"]],
+    }
+
+
+def _summary(samples: List[float]) -> dict:
+    latencies_ms = [sample * 1000 for sample in samples]
+    return {
+        "count": len(latencies_ms),
+        "p50_ms": round(percentile(latencies_ms, 50), 2),
+        "p95_ms": round(percentile(latencies_ms, 95), 2),
+        "p99_ms": round(percentile(latencies_ms, 99), 2),
+        "max_ms": round(max(latencies_ms), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bots", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--backlog", type=int, default=500, help="motion keystrokes queued per bot per round")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    standin = subprocess.Popen([sys.executable, "-m", "benchmarks.ssh_standin", "--bots", str(args.bots)],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    client = None
+    try:
+        ports = {int(bot_id): port for bot_id, port in json.loads(standin.stdout.readline()).items()}
+        bots = list(ports)
+        client = _client(ports)
+        for bot_id in bots:
+            client.start_session(bot_id)
+
+        report = {}
+        for mode, stop in (("fifo", _fifo_round), ("estop", _estop_round)):
+            samples = {"fanout": [], "write": [], "ack": []}
+            for _ in range(args.rounds):
+                _grab(client, bots)
+                _flood(client, bots, args.backlog)
+                for stage, values in stop(client, bots, args.timeout).items():
+                    samples[stage].extend(values)
+                # Let the rest of a fifo backlog drain before the next round
+                for bot_id in bots:
+                    client.send_command(bot_id, "", wait=True)
+            report[mode] = {stage: _summary(values) for stage, values in samples.items()}
+        report["estop_fanout_under_100ms"] = report["estop"]["fanout"]["max_ms"] < 100
+        report["stop_stats"] = client.get_stop_stats()
+    finally:
+        if client is not None:
+            client.release_all(10)
+            client.close()
+        standin.stdin.close()
+        standin.wait(timeout=10)
+    print(json.dumps({"bots": args.bots, "rounds": args.rounds, "backlog": args.backlog, **report}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Per-request cost of API logging: synchronous handlers vs the queued writer.
+
+Drives POST /api/move through the real application (App.main.app:
+middleware, router and TeleopService) over httpx's ASGI transport; only the
+SSH client is replaced by an instant stand-in, so what differs between
+modes is the logging a request does (about five records per move).
+
+  none      INFO disabled: the floor
+  sync      console and file handlers writing on the request's thread
+            (the event loop for middleware and router records)
+  queue     records queued and written by the background writer
+  sampled   queue, keeping the INFO records of 1 in 10 move requests
+
+--sink-latency-ms makes every console write take that long, as a slow
+terminal, pipe or log collector would; the file is a real file in a
+temporary directory.  Each mode sends --requests moves one at a time
+(latency) and then --requests more with --concurrency in flight
+(throughput).
+
+    python -m benchmarks.bench_logging --requests 2000 --sink-latency-ms 0,1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+os.environ.setdefault("WEMOIP", "10.0.0")
+os.environ.setdefault("WEMOPORT", "22")
+
+import httpx  # noqa: E402
+
+from App.main import app  # noqa: E402
+from App.routers import teleop_CLI_endpoints  # noqa: E402
+from App.services.teleop_CLI_services import TeleopService  # noqa: E402
+from App.utils.teleop_CLI_logging import LogPipeline, configure_logging, request_sampler  # noqa: E402
+from App.utils.teleop_CLI_metrics import percentile  # noqa: E402
+
+MODES = ("none", "sync", "queue", "sampled")
+DIRECTIONS = ("up", "right", "down", "left")
+
+
+class InstantSSHClient:
+    """Accepts every keystroke immediately."""
+
+    owns_sessions = True
+
+    def require_session(self, bot_id: int) -> None:
+        pass
+
+    def _send(self, *args, **kwargs) -> str:
+        return "Command sent successfully"
+
+    move = rotate = change_speed = _send
+
+
+class SlowSink:
+    """Console stand-in whose writes take *latency* seconds."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def _configure(mode: str, path: str, sink: SlowSink) -> Optional[LogPipeline]:
+    pipeline = configure_logging(path, use_queue=mode in ("queue", "sampled"),
+                                 sampling="INFO=10" if mode == "sampled" else "", stream=sink, force=True)
+    logging.getLogger().setLevel(logging.WARNING if mode == "none" else logging.INFO)
+    return pipeline
+
+
+async def _sequential(client: httpx.AsyncClient, requests: int) -> list:
+    latencies = []
+    for i in range(requests):
+        started = time.perf_counter()
+        response = await client.post("/api/move", json={"bot_id": 1, "direction": DIRECTIONS[i % 4]})
+        latencies.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.text
+    return latencies
+
+
+async def _concurrent(client: httpx.AsyncClient, requests: int, concurrency: int) -> float:
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for i in remaining:
+            response = await client.post("/api/move", json={"bot_id": 1 + i % concurrency,
+                                                            "direction": DIRECTIONS[i % 4]})
+            assert response.status_code == 200, response.text
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+
+async def _run_mode(mode: str, latency: float, args: argparse.Namespace, directory: str) -> dict:
+    sink = SlowSink(latency)
+    pipeline = _configure(mode, os.path.join(directory, f"{mode}.log"), sink)
+    request_sampler.sampled_out = 0
+    service = TeleopService(InstantSSHClient())
+    app.dependency_overrides[teleop_CLI_endpoints.get_teleop_service] = lambda: service
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _sequential(client, min(100, args.requests))  # warm up
+            latencies = await _sequential(client, args.requests)
+            elapsed = await _concurrent(client, args.requests, args.concurrency)
+    finally:
+        app.dependency_overrides.clear()
+        service.mailbox.close()
+    drained = time.perf_counter()
+    if pipeline is not None:
+        pipeline.stop(timeout=600)
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "throughput_per_s": round(args.requests / elapsed, 1),
+        "console_writes": sink.writes,
+        "sampled_out": request_sampler.sampled_out,
+        "drain_after_s": round(time.perf_counter() - drained, 3),
+        "dropped": pipeline.stats()["dropped"] if pipeline is not None else 0,
+    }
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    if teleop_CLI_endpoints.log_pipeline is not None:
+        teleop_CLI_endpoints.log_pipeline.stop()
+    report = {}
+    with tempfile.TemporaryDirectory(prefix="bench-logging-") as directory:
+        for latency_ms in (float(value) for value in args.sink_latency_ms.split(",")):
+            results = {mode: await _run_mode(mode, latency_ms / 1000, args, directory) for mode in MODES}
+            floor = results["none"]["p50_ms"]
+            for result in results.values():
+                result["p50_overhead_ms"] = round(result["p50_ms"] - floor, 3)
+            report[f"sink_latency_{latency_ms:g}ms"] = results
+    configure_logging(None, use_queue=False, force=True)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--sink-latency-ms", default="0,1", help="comma separated, one run of every mode each")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(_main(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Connect-phase latency with and without SSH connection multiplexing.
+
+Runs the system ``ssh`` client against the in-process stand-in server and
+times what SSHClient._open_console calls connect + authenticate: spawn to
+shell prompt, typing the password when asked.  "before" runs every session
+on a fresh connection; "after" uses SSHMultiplexer, so only the first
+session pays for the handshake.
+
+    python -m benchmarks.bench_ssh_connect --sessions 20
+
+Requires paramiko and an OpenSSH client (POSIX).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import tempfile
+import time
+
+import pexpect
+
+from App.utils.teleop_CLI_metrics import percentile
+from App.utils.teleop_CLI_ssh_mux import SSHMultiplexer
+from benchmarks.ssh_standin import PASSWORD, SSHStandIn
+
+
+def _connect(command: str, prompt: str) -> float:
+    started = time.perf_counter()
+    child = pexpect.spawn(command, encoding="utf-8", timeout=20)
+    try:
+        if child.expect(["password: ", prompt]) == 0:
+            child.sendline(PASSWORD)
+            child.expect(prompt)
+        elapsed = time.perf_counter() - started
+        child.sendline("exit")
+        child.expect(pexpect.EOF)
+    finally:
+        child.close(force=True)
+    return elapsed
+
+
+def run(sessions: int, multiplex: bool, server: SSHStandIn) -> dict:
+    with tempfile.TemporaryDirectory(prefix="mux") as control_dir:
+        mux = SSHMultiplexer(control_dir, persist=60, enabled=multiplex)
+        extra = ["-p", str(server.port), "-o", "StrictHostKeyChecking=no",
+                 "-o", "UserKnownHostsFile=/dev/null", "-o", "LogLevel=ERROR"]
+        connections_before = server.connections
+        latencies = [_connect(mux.command("hive@127.0.0.1", extra), re.escape(server.prompt)) for _ in range(sessions)]
+        mux.close("hive@127.0.0.1", extra)
+    return {
+        "sessions": sessions,
+        "tcp_connections": server.connections - connections_before,
+        "first_s": round(latencies[0], 4),
+        "mean_s": round(sum(latencies) / len(latencies), 4),
+        "p50_s": percentile(latencies, 50),
+        "p95_s": percentile(latencies, 95),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    args = parser.parse_args()
+
+    with SSHStandIn() as server:
+        report = {
+            "before (fresh connection per session)": run(args.sessions, False, server),
+            "after (ControlMaster reuse)": run(args.sessions, True, server),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
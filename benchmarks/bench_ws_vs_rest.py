@@ -0,0 +1,132 @@
+"""Movement command throughput and latency: REST /api/move vs the WebSocket channel.
+
+Both paths run in-process against the real router, middleware and
+TeleopService; only the SSH client is replaced by an instant stand-in, so
+the numbers are the API overhead per command.  Logging stays enabled (its
+console output is discarded) since it is part of the per-request cost.
+
+Modes:
+  rest      POST /api/move, one request after another
+  ws-ack    one frame with an id, wait for its ack, repeat
+  ws-burst  frames without acks; throughput only
+
+    python -m benchmarks.bench_ws_vs_rest --commands 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import time
+
+os.environ.setdefault("WEMOIP", "10.0.0")
+os.environ.setdefault("WEMOPORT", "22")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from App.routers import teleop_CLI_endpoints  # noqa: E402
+from App.routers.teleop_CLI_endpoints import app, get_teleop_service  # noqa: E402
+from App.services.teleop_CLI_services import TeleopService  # noqa: E402
+from App.utils.teleop_CLI_metrics import percentile  # noqa: E402
+
+DIRECTIONS = ["up", "right", "down", "left"]
+
+
+class InstantSSHClient:
+    """Accepts every keystroke immediately."""
+
+    owns_sessions = True
+
+    def __init__(self) -> None:
+        self.sent = 0
+
+    def has_active_session(self, bot_id: int) -> bool:
+        return True
+
+    def require_session(self, bot_id: int) -> None:
+        pass
+
+    def _send(self, *args, **kwargs) -> str:
+        self.sent += 1
+        return "Command sent successfully"
+
+    move = rotate = change_speed = _send
+
+
+def _report(latencies, elapsed, commands):
+    return {
+        "commands": commands,
+        "throughput_per_s": round(commands / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+    }
+
+
+def bench_rest(client: TestClient, commands: int) -> dict:
+    latencies = []
+    started = time.perf_counter()
+    for i in range(commands):
+        t0 = time.perf_counter()
+        response = client.post("/api/move", json={"bot_id": 1, "direction": DIRECTIONS[i % 4]})
+        latencies.append(time.perf_counter() - t0)
+        assert response.status_code == 200, response.text
+    return _report(latencies, time.perf_counter() - started, commands)
+
+
+def bench_ws_ack(client: TestClient, commands: int) -> dict:
+    latencies = []
+    with client.websocket_connect("/api/ws/teleop/1") as ws:
+        started = time.perf_counter()
+        for i in range(commands):
+            t0 = time.perf_counter()
+            ws.send_text(f"move {DIRECTIONS[i % 4]} {i}")
+            ack = ws.receive_json()
+            latencies.append(time.perf_counter() - t0)
+            assert ack["ok"], ack
+        elapsed = time.perf_counter() - started
+    return _report(latencies, elapsed, commands)
+
+
+def bench_ws_burst(client: TestClient, commands: int) -> dict:
+    with client.websocket_connect("/api/ws/teleop/1") as ws:
+        started = time.perf_counter()
+        for i in range(commands - 1):
+            ws.send_text(f"move {DIRECTIONS[i % 4]}")
+        # Frames are handled in order, so this ack means all were processed.
+        ws.send_text("move up last")
+        assert ws.receive_json()["ok"]
+        elapsed = time.perf_counter() - started
+    return _report([], elapsed, commands)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=2000)
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w")
+    for handler in logging.getLogger().handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setStream(devnull)
+    if teleop_CLI_endpoints.log_pipeline is not None:
+        teleop_CLI_endpoints.log_pipeline.stream = devnull
+
+    service = TeleopService(InstantSSHClient())
+    app.dependency_overrides[get_teleop_service] = lambda: service
+    client = TestClient(app)
+    try:
+        report = {
+            "rest": bench_rest(client, args.commands),
+            "ws-ack": bench_ws_ack(client, args.commands),
+            "ws-burst": bench_ws_burst(client, args.commands),
+        }
+    finally:
+        app.dependency_overrides.clear()
+        service.mailbox.close()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
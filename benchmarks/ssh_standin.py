@@ -0,0 +1,43 @@
+"""In-process SSH server standing in for a bot (benchmarks only).
+
+A SimulatedBot (App/utils/teleop_CLI_simulator.py) on 127.0.0.1 with an
+ephemeral port and no delays or failures, so benchmarks measure the client.
+
+Run as a module to serve several bots from a separate process; the port of
+each bot is printed as one JSON line and the servers stop when stdin closes:
+
+    python -m benchmarks.ssh_standin --bots 50
+
+Requires paramiko.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from App.utils.teleop_CLI_simulator import PASSWORD, USERNAME, SimulatedBot  # noqa: F401
+
+
+class SSHStandIn(SimulatedBot):
+    """Simulated bot on 127.0.0.1 that answers immediately."""
+
+    def __init__(self, bot_id: int = 1, port: int = 0) -> None:
+        super().__init__(bot_id, "127.0.0.1", port)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve stand-in bots until stdin closes")
+    parser.add_argument("--bots", type=int, default=1)
+    args = parser.parse_args()
+
+    servers = [SSHStandIn(bot_id).__enter__() for bot_id in range(1, args.bots + 1)]
+    print(json.dumps({server.bot_id: server.port for server in servers}), flush=True)
+    sys.stdin.read()
+    for server in servers:
+        server.__exit__(None, None, None)
+
+
+if __name__ == "__main__":
+    main()